@@ -13,7 +13,7 @@ root_modules = [
 core_modules = [
     "monad_properties", "sv_custom_exceptions",
     "node_id_dict", "links", "sockets",
-    "handlers", "update_system", "upgrade_nodes",
+    "handlers", "tree_graph", "parallel_update", "update_system", "upgrade_nodes",
     "monad", "events", "node_group", "group_handlers"
 ]
 
@@ -6,11 +6,12 @@ from bpy.app.handlers import persistent
 from sverchok import old_nodes
 from sverchok import data_structure
 from sverchok.core import upgrade_nodes, undo_handler_node_count
-from sverchok.core.update_system import set_first_run, clear_system_cache
+from sverchok.core.update_system import set_first_run, clear_system_cache, invalidate_tree_graph
 from sverchok.core.events import CurrentEvents, BlenderEventsTypes
 from sverchok.ui import color_def, bgl_callback_nodeview, bgl_callback_3dview
 from sverchok.utils import app_handler_ops
 from sverchok.utils.logging import debug
+from sverchok.utils.mesh_inside import clear_mesh_inside_testers
 from sverchok.utils import dummy_nodes
 
 _state = {'frame': None}
@@ -89,6 +90,7 @@ def sv_handler_undo_post(scene):
         for ng in sverchok_trees():
             ng.nodes_dict.load_nodes(ng)
             ng.has_changed = True
+            invalidate_tree_graph(ng)
         sv_main_handler(scene)
 
     undo_handler_node_count['sv_groups'] = 0
@@ -180,6 +182,7 @@ def sv_post_load(scene):
     """
 
     set_first_run(False)
+    clear_mesh_inside_testers()
 
     # ensure current nodeview view scale / location parameters reflect users' system settings
     from sverchok import node_tree
@@ -0,0 +1,130 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Scheduler which executes nodes of a tree on a thread pool.
+
+A node is started as soon as all nodes it depends on are done, so independent
+subtrees and independent branches of one subtree are processed concurrently.
+This pays off when nodes spend most of their time in NumPy / SciPy code,
+which releases the GIL. Nodes which must run on the main thread (for example,
+the ones working with Blender data) are executed by the calling thread.
+This module does not depend on Blender API.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+class SvParallelUpdateError(Exception):
+    """
+    Raised when some of nodes failed. The first failed node and its exception
+    are stored in `name` and `error` attributes, the exception is also the
+    __cause__ of this one. `errors` is the list of (node name, exception) for
+    all failed nodes, and `timings` are timings of nodes which were processed.
+    """
+    def __init__(self, errors, timings):
+        self.errors = errors
+        self.timings = timings
+        self.name, self.error = errors[0]
+        super().__init__(f"Node {self.name} had exception: {self.error}")
+
+
+def _timed(process, name):
+    start = time.perf_counter()
+    process(name)
+    return start, time.perf_counter() - start
+
+
+def execute_parallel(order, upstream, process, is_main_thread_only, max_workers=None):
+    """
+    order: list of node names sorted topologically.
+    upstream: dictionary {node name: set of names of nodes it depends on};
+        dependencies which are not in `order` are ignored.
+    process: function, which takes a node name and processes the node.
+    is_main_thread_only: function, which takes a node name and returns True
+        if the node must be processed by the calling thread.
+    max_workers: number of worker threads, None means the default of ThreadPoolExecutor.
+
+    Returns: dictionary {node name: (start time, duration)}.
+    Raises SvParallelUpdateError if some of nodes failed. Nodes which depend
+    on a failed node are not processed, but all other nodes are, so that
+    independent parts of the tree are updated as in sequential mode.
+    """
+    names = set(order)
+    waiting = {name: len(upstream.get(name, set()) & names) for name in order}
+    downstream = {name: [] for name in order}
+    for name in order:
+        for dep in upstream.get(name, ()):
+            if dep in names:
+                downstream[dep].append(name)
+
+    ready = [name for name in order if waiting[name] == 0]
+    timings = {}
+    running = {}
+    errors = []
+
+    def finish(name):
+        for other in downstream[name]:
+            waiting[other] -= 1
+            if waiting[other] == 0:
+                ready.append(other)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while ready or running:
+            main_thread = []
+            while ready:
+                name = ready.pop()
+                if is_main_thread_only(name):
+                    main_thread.append(name)
+                else:
+                    running[executor.submit(_timed, process, name)] = name
+
+            # Nodes pinned to the main thread run while workers are busy
+            for name in main_thread:
+                try:
+                    timings[name] = _timed(process, name)
+                except Exception as e:
+                    errors.append((name, e))
+                else:
+                    finish(name)
+
+            if not running:
+                continue
+
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    timings[name] = future.result()
+                except Exception as e:
+                    errors.append((name, e))
+                else:
+                    finish(name)
+
+    if errors:
+        raise SvParallelUpdateError(errors, timings) from errors[0][1]
+    return timings
+
+
+def branch_wall_times(branches, timings):
+    """
+    branches: list of lists of node names.
+    timings: dictionary returned by execute_parallel.
+    Returns: list of wall times, from start of the first node of a branch
+    till the end of the last one; 0.0 for branches where nothing was processed.
+    """
+    result = []
+    for branch in branches:
+        spans = [timings[name] for name in branch if name in timings]
+        if spans:
+            start = min(s for s, _ in spans)
+            end = max(s + d for s, d in spans)
+            result.append(end - start)
+        else:
+            result.append(0.0)
+    return result
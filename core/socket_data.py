@@ -16,8 +16,13 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import sys
+
+import numpy as np
+
 from sverchok import data_structure
 from sverchok.utils.logging import warning, info, debug
+from sverchok.utils.disk_cache import data_digest
 
 #####################################
 # socket data cache                 #
@@ -28,6 +33,14 @@ sentinel = object()
 # socket cache
 socket_data_cache = {}
 
+# amount of bytes copied by SvGetSocket during last update
+# {tree_id: {socket_id: bytes}}
+socket_copy_stats = {}
+
+# digests of data of output sockets, used in keys of disk cache
+# {tree_id: {socket_id: (data, digest)}}
+socket_digests = {}
+
 # faster than builtin deep copy for us.
 # useful for our limited case
 # we should be able to specify vectors here to get them create
@@ -43,6 +56,59 @@ def sv_deep_copy(lst):
     return lst
 
 
+def sv_deep_copy_counted(lst):
+    """
+    The same as sv_deep_copy, but also returns the number of copied bytes.
+    Writeable NumPy arrays are shared, as in sv_deep_copy, but read-only ones
+    (see sv_readonly_view) are copied, because the caller is going to modify them.
+    """
+    size = 0
+    getsizeof = sys.getsizeof
+
+    def copy(lst):
+        nonlocal size
+        if isinstance(lst, (list, tuple)):
+            if lst and not isinstance(lst[0], (list, tuple, np.ndarray)):
+                result = lst[:]
+            else:
+                result = [copy(l) for l in lst]
+            if result is not lst:  # slicing of tuple does not copy it
+                size += getsizeof(result)
+            return result
+        if isinstance(lst, np.ndarray) and not lst.flags.writeable:
+            size += lst.nbytes
+            return lst.copy()
+        return lst
+
+    return copy(lst), size
+
+
+def _has_arrays(data):
+    # Only the first item of each level is checked,
+    # so the check does not depend on the size of data
+    while isinstance(data, (list, tuple)) and data:
+        data = data[0]
+    return isinstance(data, np.ndarray)
+
+
+def sv_readonly_view(data):
+    """
+    Return data which can be shared between nodes without copying.
+    NumPy arrays are replaced with non-writeable views of the same memory,
+    so that in-place modification raises an error instead of silently
+    changing data of upstream node. Lists are returned as they are.
+    """
+    if isinstance(data, np.ndarray):
+        if not data.flags.writeable:
+            return data
+        view = data.view()
+        view.flags.writeable = False
+        return view
+    if not _has_arrays(data):
+        return data
+    return [sv_readonly_view(item) for item in data]
+
+
 # Build string for showing in socket label
 def SvGetSocketInfo(socket):
     """returns string to show in socket label"""
@@ -78,6 +144,7 @@ def SvForgetSocket(socket):
         socket_data_cache[s_ng].pop(s_id, None)
     except KeyError:
         debug("it was never there")
+    socket_digests.get(s_ng, {}).pop(s_id, None)
 
 def SvSetSocket(socket, out):
     """sets socket data for socket"""
@@ -92,26 +159,81 @@ def SvSetSocket(socket, out):
         socket_data_cache[s_ng][s_id] = out
 
 
-def SvGetSocket(socket, other=None, deepcopy=True):
+def SvGetSocket(socket, other=None, deepcopy=True, readonly=False):
     """gets socket data from socket,
-    if deep copy is True a deep copy is make_dep_dict,
-    to increase performance if the node doesn't mutate input
-    set to False and increase performance substanstilly
+    if deep copy is True a deep copy is made and its size is recorded
+    in socket_copy_stats, to increase performance if the node doesn't mutate
+    input set to False and get the shared data instead;
+    if readonly is True, NumPy arrays of shared data are returned as
+    read-only views (see sv_readonly_view)
     """
     global socket_data_cache
     try:
         s_id = other.socket_id
         s_ng = other.id_data.tree_id
         out = socket_data_cache[s_ng][s_id]
-        if deepcopy:
-            return sv_deep_copy(out)
-        return out
-
     except Exception as e:
         if data_structure.DEBUG_MODE:
             debug(f"cache miss: {socket.node.name} -> {socket.name} from: {other.node.name} -> {other.name}")
         raise SvNoDataError(socket)
 
+    if deepcopy:
+        out, size = sv_deep_copy_counted(out)
+        stats = socket_copy_stats.setdefault(s_ng, {})
+        stats[s_id] = stats.get(s_id, 0) + size
+        return out
+    if readonly:
+        return sv_readonly_view(out)
+    return out
+
+
+def SvSetSocketDigest(socket, digest):
+    """
+    Remember digest of data currently stored for output socket, so
+    that it is not computed from the data by SvGetSocketDigest.
+    """
+    s_ng = socket.id_data.tree_id
+    data = socket_data_cache.get(s_ng, {}).get(socket.socket_id, sentinel)
+    if data is not sentinel:
+        socket_digests.setdefault(s_ng, {})[socket.socket_id] = (data, digest)
+
+
+def SvGetSocketDigest(other):
+    """
+    Digest of data stored for output socket (see utils/disk_cache.py).
+    Returns None if the socket has no data or if the data can not be serialized.
+    """
+    s_ng = other.id_data.tree_id
+    s_id = other.socket_id
+    data = socket_data_cache.get(s_ng, {}).get(s_id, sentinel)
+    if data is sentinel:
+        return None
+    known = socket_digests.get(s_ng, {}).get(s_id)
+    if known is not None and known[0] is data:
+        return known[1]
+    digest = data_digest(data)
+    if digest is not None:
+        socket_digests.setdefault(s_ng, {})[s_id] = (data, digest)
+    return digest
+
+
+def get_node_outputs(node):
+    """Data of output sockets of the node, {socket identifier: data}"""
+    tree_cache = socket_data_cache.get(node.id_data.tree_id, {})
+    outputs = {}
+    for socket in node.outputs:
+        data = tree_cache.get(socket.socket_id, sentinel)
+        if data is not sentinel:
+            outputs[socket.identifier] = data
+    return outputs
+
+
+def set_node_outputs(node, outputs):
+    """Set data of output sockets of the node from {socket identifier: data}"""
+    for socket in node.outputs:
+        if socket.identifier in outputs:
+            SvSetSocket(socket, outputs[socket.identifier])
+
 
 class SvNoDataError(LookupError):
     def __init__(self, socket=None, node=None, msg=None):
@@ -170,6 +292,8 @@ def reset_socket_cache(ng):
     """
     global socket_data_cache
     socket_data_cache[ng.tree_id] = {}
+    socket_copy_stats.pop(ng.tree_id, None)
+    socket_digests.pop(ng.tree_id, None)
 
 def clear_all_socket_cache():
     """
@@ -177,3 +301,18 @@ def clear_all_socket_cache():
     """
     global socket_data_cache
     socket_data_cache.clear()
+    socket_copy_stats.clear()
+    socket_digests.clear()
+
+def get_socket_copy_stats(ng):
+    """
+    Number of bytes copied from each output socket of the tree
+    during last update: {socket_id: bytes}.
+    """
+    return dict(socket_copy_stats.get(ng.tree_id, {}))
+
+def reset_socket_copy_stats(ng):
+    """
+    Reset counters of copied bytes, it is called before each update of the tree.
+    """
+    socket_copy_stats.pop(ng.tree_id, None)
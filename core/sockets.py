@@ -389,7 +389,7 @@ class SvSocketCommon(SvSocketProcessing):
 
         self.hide = value
 
-    def sv_get(self, default=sentinel, deepcopy=True, implicit_conversions=None):
+    def sv_get(self, default=sentinel, deepcopy=None, implicit_conversions=None):
         """
         The method is used for getting input socket data
         In most cases the method should not be overridden
@@ -403,6 +403,8 @@ class SvSocketCommon(SvSocketProcessing):
         5. Raise no data error
         :param default: script default property
         :param deepcopy: in most cases should be False for efficiency but not in cases if input data will be modified
+            if None, the `sv_mutates_inputs` attribute of the node is used; nodes which set it to False
+            get NumPy arrays of shared data as read-only views
         :param implicit_conversions: if needed automatic conversion data from one socket type to another
         :return: data bound to the socket
         """
@@ -415,7 +417,12 @@ class SvSocketCommon(SvSocketProcessing):
                 else:
                     implicit_conversions = DEFAULT_CONVERSION
 
-            return self.convert_data(SvGetSocket(self, other, deepcopy), implicit_conversions, other)
+            readonly = False
+            if deepcopy is None:
+                deepcopy = getattr(self.node, 'sv_mutates_inputs', True)
+                readonly = not deepcopy
+
+            return self.convert_data(SvGetSocket(self, other, deepcopy, readonly), implicit_conversions, other)
 
         prop_name = self.get_prop_name()
         if prop_name:
@@ -0,0 +1,238 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Dependency graph of node tree, which is kept between updates.
+
+The graph is built from the dependency dictionary (see make_dep_dict() in
+update_system.py) and then patched when nodes or links are added or removed,
+instead of being rebuilt from scratch on each change of the tree.
+This module does not depend on Blender API.
+"""
+
+import collections
+
+
+class SvTreeGraph:
+    """
+    Dependency graph of nodes, identified by names.
+
+    It stores upstream and downstream adjacency, and lazily calculated
+    topological order and connected components, which are invalidated only
+    when a change of the graph can make them wrong.
+    """
+    def __init__(self):
+        self.upstream = collections.defaultdict(set)  # node -> nodes it depends on
+        self.downstream = collections.defaultdict(set)  # node -> nodes depending on it
+        self.nodes = set()
+        self._order = None  # list of node names in topological order
+        self._order_index = None  # node name -> index in self._order
+        self._components = None  # list of sets of node names
+        self.is_valid = True  # False if the graph has cycles
+
+    @classmethod
+    def from_dependencies(cls, nodes, dependencies):
+        """
+        nodes: iterable of node names
+        dependencies: dictionary {node name: set of names of nodes it depends on}
+        """
+        graph = cls()
+        graph.nodes.update(nodes)
+        for name, deps in dependencies.items():
+            for dep in deps:
+                graph.add_link(dep, name)
+        return graph
+
+    def links(self):
+        return {(from_node, to_node) for to_node, deps in self.upstream.items() for from_node in deps}
+
+    def add_node(self, name):
+        if name not in self.nodes:
+            self.nodes.add(name)
+            if self._order is not None:
+                self._order_index[name] = len(self._order)
+                self._order.append(name)
+            self._components = None
+
+    def remove_node(self, name):
+        if name not in self.nodes:
+            return
+        for dep in list(self.upstream.get(name, ())):
+            self.remove_link(dep, name)
+        for dep in list(self.downstream.get(name, ())):
+            self.remove_link(name, dep)
+        self.upstream.pop(name, None)
+        self.downstream.pop(name, None)
+        self.nodes.discard(name)
+        self._order = None
+        self._components = None
+
+    def add_link(self, from_node, to_node):
+        self.add_node(from_node)
+        self.add_node(to_node)
+        if from_node in self.upstream[to_node]:
+            return
+        self.upstream[to_node].add(from_node)
+        self.downstream[from_node].add(to_node)
+        # The topological order is still valid if the new link goes forward
+        if self._order is not None and self._order_index[from_node] > self._order_index[to_node]:
+            self._order = None
+        self._components = None
+
+    def remove_link(self, from_node, to_node):
+        if from_node not in self.upstream.get(to_node, ()):
+            return
+        self.upstream[to_node].discard(from_node)
+        self.downstream[from_node].discard(to_node)
+        # Removing a link never breaks the topological order,
+        # but it can split a component into two.
+        self._components = None
+        if not self.is_valid:
+            self._order = None
+
+    def update(self, nodes, dependencies):
+        """
+        Patch the graph so that it corresponds to new set of nodes and
+        new dependencies. Only differences are applied.
+        Returns: set of names of nodes, whose links were changed.
+        """
+        nodes = set(nodes)
+        new_links = {(dep, name) for name, deps in dependencies.items() for dep in deps}
+        old_links = self.links()
+        affected = set()
+        for name in self.nodes - nodes:
+            self.remove_node(name)
+        for from_node, to_node in old_links - new_links:
+            self.remove_link(from_node, to_node)
+            affected.add(to_node)
+        for name in nodes - self.nodes:
+            self.add_node(name)
+        for from_node, to_node in new_links - old_links:
+            self.add_link(from_node, to_node)
+            affected.add(to_node)
+        return affected & self.nodes
+
+    def _walk(self, names, adjacency):
+        # Depth-first walk over adjacency, visiting only reachable nodes
+        result = set(names)
+        stack = list(result)
+        while stack:
+            name = stack.pop()
+            for other in adjacency.get(name, ()):
+                if other not in result:
+                    result.add(other)
+                    stack.append(other)
+        return result
+
+    def downstream_of(self, names):
+        """
+        Set of given nodes and all nodes that depend on them, directly or not.
+        Only affected nodes are visited.
+        """
+        return self._walk(names, self.downstream)
+
+    def upstream_of(self, names):
+        """
+        Set of given nodes and all nodes they depend on, directly or not.
+        """
+        return self._walk(names, self.upstream)
+
+    def feeding_only(self, names):
+        """
+        Set of nodes which are needed only to compute given nodes: all nodes
+        depending on them are either given nodes or such nodes themselves.
+        Given nodes are not included.
+        """
+        names = set(names)
+        result = set()
+        for name in reversed(self.topological_order()):
+            if name in names:
+                continue
+            downstream = self.downstream.get(name)
+            if downstream and all(other in names or other in result for other in downstream):
+                result.add(name)
+        return result
+
+    def topological_order(self):
+        """
+        List of all node names, such that each node goes after all nodes it depends on.
+        Returns an empty list if the graph has cycles.
+        """
+        if self._order is None:
+            in_degree = {name: len(self.upstream.get(name, ())) for name in self.nodes}
+            queue = collections.deque(name for name, degree in in_degree.items() if degree == 0)
+            order = []
+            while queue:
+                name = queue.popleft()
+                order.append(name)
+                for other in self.downstream.get(name, ()):
+                    in_degree[other] -= 1
+                    if in_degree[other] == 0:
+                        queue.append(other)
+            self.is_valid = len(order) == len(self.nodes)
+            if not self.is_valid:
+                return []
+            self._order = order
+            self._order_index = {name: i for i, name in enumerate(order)}
+        return self._order
+
+    def sort(self, names):
+        """
+        Sort given node names topologically.
+        Returns an empty list if there are cycles among given nodes;
+        cycles elsewhere in the graph do not matter.
+        """
+        self.topological_order()
+        if not self.is_valid:
+            return self._sort_subset(names)
+        index = self._order_index
+        return sorted(names, key=index.__getitem__)
+
+    def _sort_subset(self, names):
+        # The same as topological_order, for the subgraph of given nodes only
+        names = set(names)
+        in_degree = {name: len(self.upstream.get(name, set()) & names) for name in names}
+        queue = collections.deque(name for name, degree in in_degree.items() if degree == 0)
+        order = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for other in self.downstream.get(name, ()):
+                if other in names:
+                    in_degree[other] -= 1
+                    if in_degree[other] == 0:
+                        queue.append(other)
+        if len(order) != len(names):
+            return []
+        return order
+
+    def components(self):
+        """
+        List of sets of names of nodes which are not connected to each other.
+        """
+        if self._components is None:
+            components = []
+            visited = set()
+            for name in self.nodes:
+                if name in visited:
+                    continue
+                component = {name}
+                stack = [name]
+                while stack:
+                    current = stack.pop()
+                    for other in self._neighbours(current):
+                        if other not in component:
+                            component.add(other)
+                            stack.append(other)
+                visited.update(component)
+                components.append(component)
+            self._components = components
+        return self._components
+
+    def _neighbours(self, name):
+        yield from self.upstream.get(name, ())
+        yield from self.downstream.get(name, ())
@@ -24,13 +24,20 @@ import bpy
 from mathutils import Vector
 
 from sverchok import data_structure
-from sverchok.core.socket_data import SvNoDataError, reset_socket_cache
+from sverchok.core.socket_data import SvNoDataError, reset_socket_cache, reset_socket_copy_stats
 from sverchok.utils.logging import debug, info, warning, error, exception
 from sverchok.utils.profile import profile
+from sverchok.utils import node_stats
 from sverchok.utils.exception_drawing_with_bgl import clear_exception_drawing_with_bgl, start_exception_drawing_with_bgl
-from sverchok.core.socket_data import clear_all_socket_cache
+from sverchok.core.socket_data import clear_all_socket_cache, socket_data_cache
+from sverchok.core.socket_data import SvGetSocketDigest, SvSetSocketDigest, get_node_outputs, set_node_outputs
+from sverchok.utils import disk_cache
+from sverchok.utils.disk_cache import combine_digests, get_disk_cache
+from sverchok.utils.frame_cache import clear_frame_caches
 from sverchok.core.node_id_dict import clear_nodes_id_dict
 from sverchok.core.links import clear_link_memory
+from sverchok.core.tree_graph import SvTreeGraph
+from sverchok.core.parallel_update import execute_parallel, branch_wall_times, SvParallelUpdateError
 import sverchok
 
 import traceback
@@ -38,6 +45,23 @@ import ast
 
 graphs = []
 
+# tree name -> list of wall times of branches (subtrees) during last parallel update
+branch_timings = {}
+
+# categories of nodes which work with Blender data and so
+# can not be processed outside of the main thread
+MAIN_THREAD_CATEGORIES = {
+    'exchange', 'layout', 'logic', 'network', 'object_nodes',
+    'scene', 'script', 'solid', 'svg', 'text', 'viz'}
+
+# categories of nodes which read Blender data or have side effects,
+# so they are always processed, even if disk cache is enabled
+# (solid nodes are in the main thread only because FreeCAD is not thread-safe)
+NOT_CACHED_CATEGORIES = MAIN_THREAD_CATEGORIES - {'solid'}
+
+# properties which do not influence results of nodes and sockets
+NOT_CACHED_PROPERTIES = {'n_id', 'objects_number'}
+
 no_data_color = (1, 0.3, 0)
 exception_color = (0.8, 0.0, 0)
 
@@ -56,6 +80,10 @@ def clear_system_cache():
     clear_all_socket_cache()
     clear_nodes_id_dict()
     clear_link_memory()
+    tree_graphs.clear()
+    outdated_tree_graphs.clear()
+    branch_timings.clear()
+    clear_frame_caches()
 
 def update_error_colors(self, context):
     global no_data_color
@@ -63,10 +91,18 @@ def update_error_colors(self, context):
     no_data_color = self.no_data_color[:]
     exception_color = self.exception_color[:]
 
+def update_disk_cache_settings(self, context):
+    disk_cache.cache_directory = bpy.path.abspath(self.disk_cache_directory)
+    disk_cache.cache_size = self.disk_cache_size
+
 # cache node group update trees
 update_cache = {}
 # cache for partial update lists
 partial_update_cache = {}
+# cache node group dependency graphs
+tree_graphs = {}
+# names of trees which nodes or links have changed since their graphs were synchronized
+outdated_tree_graphs = set()
 
 
 def make_dep_dict(node_tree, down=False):
@@ -117,6 +153,33 @@ def make_dep_dict(node_tree, down=False):
     return deps
 
 
+def invalidate_tree_graph(ng):
+    """
+    Mark the cached dependency graph of the node group as outdated.
+    Should be called on each topology update of the tree (nodes or links
+    were added, removed or relinked).
+    """
+    outdated_tree_graphs.add(ng.name)
+
+
+def get_tree_graph(ng, refresh=False):
+    """
+    Get dependency graph of the node group (an instance of SvTreeGraph).
+    The graph is cached between updates. It is synchronized with current
+    nodes and links of the tree if refresh=True or if it was marked as
+    outdated by invalidate_tree_graph(); only added or removed nodes and
+    links are applied to the cached graph.
+    """
+    graph = tree_graphs.get(ng.name)
+    if graph is None:
+        graph = SvTreeGraph.from_dependencies(ng.nodes.keys(), make_dep_dict(ng))
+    elif refresh or ng.name in outdated_tree_graphs:
+        graph.update(ng.nodes.keys(), make_dep_dict(ng))
+    outdated_tree_graphs.discard(ng.name)
+    tree_graphs[ng.name] = graph
+    return graph
+
+
 def make_update_list(node_tree, node_set=None, dependencies=None):
     """
     Makes a update list from a node_group
@@ -179,35 +242,10 @@ def separate_nodes(ng, links=None):
     Arguments: Node group
     Returns: A list of sets with separate node groups
     '''
-    nodes = set(ng.nodes.keys())
-    if not nodes:
+    if not ng.nodes:
         return []
-    node_links = make_dep_dict(ng)
-    down = make_dep_dict(ng, down=True)
-    for name, links in down.items():
-        node_links[name].update(links)
-    n = nodes.pop()
-    node_set_list = [set([n])]
-    node_stack = collections.deque()
-
-    # find separate sets
-    node_stack_append = node_stack.append
-    node_stack_pop = node_stack.pop
-
-    while nodes:
-        for node in node_links[n]:
-            if node not in node_set_list[-1]:
-                node_stack_append(node)
-        if not node_stack:  # new part
-            n = nodes.pop()
-            node_set_list.append(set([n]))
-        else:
-            while n in node_set_list[-1] and node_stack:
-                n = node_stack_pop()
-            nodes.discard(n)
-            node_set_list[-1].add(n)
-
-    found_node_sets = [ns for ns in node_set_list if len(ns) > 1]
+    graph = get_tree_graph(ng, refresh=True)
+    found_node_sets = [ns for ns in graph.components() if len(ns) > 1]
   
     if hasattr(ng, "sv_subtree_evaluation_order"):
         sorting_type = ng.sv_subtree_evaluation_order
@@ -224,32 +262,25 @@ def make_tree_from_nodes(node_names, tree, down=True):
     drives change for the tree
     """
     ng = tree
-    nodes = ng.nodes
     if not node_names:
         warning("No nodes!")
         return make_update_list(ng)
 
-    out_set = set(node_names)
-
-    out_stack = collections.deque(node_names)
-    current_node = out_stack.pop()
+    graph = get_tree_graph(ng)
+    if not graph.nodes.issuperset(node_names):
+        graph = get_tree_graph(ng, refresh=True)
 
-    # build downwards links, this should be cached perhaps
-    node_links = make_dep_dict(ng, down)
-    while current_node:
-        for node in node_links[current_node]:
-            if node not in out_set:
-                out_set.add(node)
-                out_stack.append(node)
-        if out_stack:
-            current_node = out_stack.pop()
-        else:
-            current_node = ''
+    if down:
+        out_set = graph.downstream_of(node_names)
+    else:
+        out_set = graph.upstream_of(node_names)
 
     if len(out_set) == 1:
         return list(out_set)
-    else:
-        return make_update_list(ng, out_set)
+    update_list = graph.sort(out_set)
+    if not update_list:
+        error("Invalid node tree!")
+    return update_list
 
 
 # to make update tree based on node types and node names bases
@@ -358,6 +389,47 @@ def reset_error_nodes(ng):
         del ng["error nodes"]
 
 
+def start_node_stats(ng):
+    """
+    Statistics object of the tree (see utils/node_stats.py) with new update started,
+    or None if gathering of statistics is disabled.
+    """
+    if not node_stats.is_enabled:
+        return None
+    stats = node_stats.get_tree_stats(ng.name)
+    stats.new_update()
+    return stats
+
+def record_node_stats(stats, node, start, duration, err=None):
+    """
+    Add record about processed node into tree statistics.
+    """
+    tree_cache = socket_data_cache.get(node.id_data.tree_id, {})
+    items_in = {}
+    hits = misses = 0
+    for socket in node.inputs:
+        if not socket.is_linked:
+            continue
+        other = getattr(socket, 'other', None)
+        data = tree_cache.get(getattr(other, 'socket_id', None), None)
+        if data is None:
+            misses += 1
+        else:
+            hits += 1
+            items_in[socket.name] = node_stats.count_items(data)
+    items_out = {}
+    bytes_out = 0
+    for socket in node.outputs:
+        data = tree_cache.get(getattr(socket, 'socket_id', None), None)
+        if data is not None:
+            items_out[socket.name] = node_stats.count_items(data)
+            bytes_out += node_stats.estimate_size(data)
+    stats.add({"name": node.name, "bl_idname": node.bl_idname,
+               "start": start, "duration": duration,
+               "items_in": items_in, "items_out": items_out, "bytes_out": bytes_out,
+               "cache_hits": hits, "cache_misses": misses,
+               "error": None if err is None else repr(err)})
+
 @profile(section="UPDATE")
 def do_update_general(node_list, nodes, procesed_nodes=set()):
     """
@@ -373,43 +445,50 @@ def do_update_general(node_list, nodes, procesed_nodes=set()):
 
     # this is a no-op if no bgl being drawn.
     clear_exception_drawing_with_bgl(nodes)
+    reset_socket_copy_stats(nodes.id_data)
+    stats = start_node_stats(nodes.id_data)
+    cache = get_node_disk_cache(nodes.id_data)
 
     for node_name in node_list:
         if node_name in done_nodes:
             continue
+        start = time.perf_counter()
+        node_error = None
         try:
             node = nodes[node_name]
-            start = time.perf_counter()
-            if hasattr(node, "process"):
-                node.process()
-
-            delta = time.perf_counter() - start
-            total_time += delta
-
-            if data_structure.DEBUG_MODE:
-                debug("Processed  %s in: %.4f", node_name, delta)
-
-            timings.append(delta)
-            gather({"name" : node_name, "bl_idname": node.bl_idname, "start": start, "duration": delta})
+            process_node(node, cache)
+        except Exception as err:
+            node_error = err
 
-            # probably it's not grate place for doing it
-            # reroute nodes can be in node variable
-            [s.update_objects_number() for s in chain(node.inputs, node.outputs) if hasattr(s, 'update_objects_number')]
+        delta = time.perf_counter() - start
+        if stats is not None and node_name in nodes:
+            record_node_stats(stats, nodes[node_name], start, delta, node_error)
 
-        except Exception as err:
+        if node_error is not None:
             ng = nodes.id_data
-            update_error_nodes(ng, node_name, err)
-            #traceback.print_tb(err.__traceback__)
-            exception("Node %s had exception: %s", node_name, err)
+            update_error_nodes(ng, node_name, node_error)
+            exception("Node %s had exception: %s", node_name, node_error, exc_info=node_error)
             
             if hasattr(ng, "sv_show_error_in_tree"):
                 # not yet supported in monad trees..
                 if ng.sv_show_error_in_tree:
-                    error_text = traceback.format_exc()
-                    start_exception_drawing_with_bgl(ng, node_name, error_text, err)
+                    error_text = "".join(traceback.format_exception(type(node_error), node_error, node_error.__traceback__))
+                    start_exception_drawing_with_bgl(ng, node_name, error_text, node_error)
             
             return None
 
+        total_time += delta
+
+        if data_structure.DEBUG_MODE:
+            debug("Processed  %s in: %.4f", node_name, delta)
+
+        timings.append(delta)
+        gather({"name" : node_name, "bl_idname": node.bl_idname, "start": start, "duration": delta})
+
+        # probably it's not grate place for doing it
+        # reroute nodes can be in node variable
+        [s.update_objects_number() for s in chain(node.inputs, node.outputs) if hasattr(s, 'update_objects_number')]
+
     graphs.append(graph)
     if data_structure.DEBUG_MODE:
         debug("Node set updated in: %.4f seconds", total_time)
@@ -417,9 +496,218 @@ def do_update_general(node_list, nodes, procesed_nodes=set()):
     return timings
 
 
+def is_main_thread_only(node):
+    """
+    Whether the node can't be processed by worker thread in parallel update mode.
+    It is defined by `sv_main_thread_only` attribute of the node; if the attribute
+    is not set, nodes from categories working with Blender data, group nodes,
+    monads and nodes which are not Sverchok nodes are kept in the main thread.
+    """
+    flag = getattr(node, 'sv_main_thread_only', None)
+    if flag is not None:
+        return flag
+    module = type(node).__module__.split('.')
+    if len(module) < 3 or module[1] != 'nodes':
+        return True
+    return module[2] in MAIN_THREAD_CATEGORIES
+
+
+@profile(section="UPDATE")
+def do_update_parallel(node_lists, nodes):
+    """
+    Update function for several independent node sets, which processes
+    nodes on a thread pool. Each list of node_lists is a branch, for which
+    wall time is recorded in branch_timings.
+    """
+    global graphs
+    ng = nodes.id_data
+    clear_exception_drawing_with_bgl(nodes)
+    reset_socket_copy_stats(ng)
+    stats = start_node_stats(ng)
+
+    order = list(chain.from_iterable(node_lists))
+    tree_graph = get_tree_graph(ng)
+    if not tree_graph.nodes.issuperset(order):
+        tree_graph = get_tree_graph(ng, refresh=True)
+
+    cache = get_node_disk_cache(ng)
+
+    def process(node_name):
+        process_node(nodes[node_name], cache)
+
+    pinned = {name for name in order if name not in nodes or is_main_thread_only(nodes[name])}
+    max_workers = getattr(ng, "sv_parallel_workers", 0) or None
+
+    errors = []
+    try:
+        timings = execute_parallel(order, tree_graph.upstream, process, pinned.__contains__, max_workers)
+    except SvParallelUpdateError as err:
+        # nodes independent of failed ones are processed anyway
+        timings = err.timings
+        errors = err.errors
+
+    for node_name, err in errors:
+        if stats is not None:
+            record_node_stats(stats, nodes[node_name], 0.0, 0.0, err)
+        update_error_nodes(ng, node_name, err)
+        exception("Node %s had exception: %s", node_name, err)
+    if errors and getattr(ng, "sv_show_error_in_tree", False):
+        node_name, err = errors[0]
+        error_text = "".join(traceback.format_exception(type(err), err, err.__traceback__))
+        start_exception_drawing_with_bgl(ng, node_name, error_text, err)
+
+    graph = []
+    for node_name in order:
+        if node_name not in timings:
+            continue
+        node = nodes[node_name]
+        start, delta = timings[node_name]
+        graph.append({"name" : node_name, "bl_idname": node.bl_idname, "start": start, "duration": delta})
+        if stats is not None:
+            record_node_stats(stats, node, start, delta)
+        [s.update_objects_number() for s in chain(node.inputs, node.outputs) if hasattr(s, 'update_objects_number')]
+    graphs.append(graph)
+
+    branch_timings[ng.name] = branch_wall_times(node_lists, timings)
+    if data_structure.DEBUG_MODE:
+        for i, wall_time in enumerate(branch_timings[ng.name]):
+            debug("Branch %s of %s updated in: %.4f seconds", i, ng.name, wall_time)
+
+    if errors:
+        return None
+    return [timings[name][1] for name in order if name in timings]
+
+
+def is_disk_cacheable(node):
+    """
+    Whether outputs of the node can be stored in disk cache and loaded
+    instead of processing the node. It is defined by `sv_disk_cacheable`
+    attribute of the node; if the attribute is not set, Sverchok nodes are
+    cacheable unless they are from categories working with Blender data.
+    """
+    flag = getattr(node, 'sv_disk_cacheable', None)
+    if flag is not None:
+        return flag
+    module = type(node).__module__.split('.')
+    if len(module) < 3 or module[1] != 'nodes':
+        return False
+    return module[2] not in NOT_CACHED_CATEGORIES
+
+
+_base_properties = {}
+
+def rna_values(data, base_type=None):
+    """
+    Values of RNA properties of a node, socket or property group, except ones
+    defined by base Blender type. Returns None if some property points to
+    a data-block, because its content is not known.
+    """
+    skip = _base_properties.get(base_type)
+    if skip is None:
+        skip = NOT_CACHED_PROPERTIES | {'rna_type'}
+        if base_type is not None:
+            skip |= set(base_type.bl_rna.properties.keys())
+        _base_properties[base_type] = skip
+    values = []
+    for prop in data.bl_rna.properties:
+        name = prop.identifier
+        if name in skip:
+            continue
+        value = getattr(data, name)
+        if prop.type == 'POINTER':
+            if value is not None:
+                if isinstance(value, bpy.types.ID):
+                    return None
+                value = rna_values(value)
+                if value is None:
+                    return None
+        elif prop.type == 'COLLECTION':
+            value = [rna_values(item) for item in value]
+            if None in value:
+                return None
+        elif getattr(prop, 'is_array', False):
+            value = tuple(value)
+        values.append((name, value))
+    return values
+
+
+def disk_cache_key(node):
+    """
+    Key of outputs of the node in disk cache. It is a digest of node type,
+    values of properties of the node and of its sockets and digests of data
+    of linked inputs. Returns None if the node can't be cached.
+    """
+    parts = [sverchok.bl_info['version'], node.bl_idname, getattr(node.id_data, 'sv_draft', False)]
+    properties = rna_values(node, bpy.types.Node)
+    if properties is None:
+        return None
+    parts.append(properties)
+    for socket in node.inputs:
+        properties = rna_values(socket, bpy.types.NodeSocket)
+        if properties is None:
+            return None
+        digest = None
+        if socket.is_linked:
+            other = socket.other
+            digest = SvGetSocketDigest(other) if hasattr(other, 'socket_id') else None
+            if digest is None:
+                return None
+        parts.append((socket.identifier, properties, digest))
+    for socket in node.outputs:
+        if socket.is_linked:
+            parts.append((socket.identifier, rna_values(socket, bpy.types.NodeSocket)))
+    return combine_digests(*parts)
+
+
+def get_node_disk_cache(ng):
+    """Disk cache used by the tree, or None if it is disabled"""
+    if getattr(ng, 'sv_disk_cache', False):
+        return get_disk_cache()
+    return None
+
+
+def process_node(node, cache=None):
+    """
+    Process the node. If disk cache is passed and it has outputs of the node
+    with the same key, they are loaded instead. Otherwise outputs are stored
+    into the cache, if processing took longer than sv_disk_cache_min_time
+    of the tree.
+    """
+    if not hasattr(node, "process"):
+        return
+    key = None
+    if cache is not None and is_disk_cacheable(node):
+        key = disk_cache_key(node)
+    if key is not None:
+        outputs = cache.get(key)
+        if outputs is not None:
+            set_node_outputs(node, outputs)
+            for socket in node.outputs:
+                SvSetSocketDigest(socket, combine_digests(key, socket.identifier))
+            return
+
+    start = time.perf_counter()
+    node.process()
+    if key is None:
+        return
+    duration = time.perf_counter() - start
+
+    # data of the outputs is defined by the key, so it is not necessary to hash it
+    for socket in node.outputs:
+        SvSetSocketDigest(socket, combine_digests(key, socket.identifier))
+    if duration >= getattr(node.id_data, 'sv_disk_cache_min_time', 0.0):
+        if not cache.put(key, get_node_outputs(node)):
+            debug("Outputs of node %s can't be stored in disk cache", node.name)
+
+
+def use_parallel_update(nodes):
+    return not data_structure.HEAT_MAP and getattr(nodes.id_data, "sv_parallel_update", False)
+
 def do_update(node_list, nodes):
     if data_structure.HEAT_MAP:
         do_update_heat_map(node_list, nodes)
+    elif use_parallel_update(nodes):
+        do_update_parallel([node_list], nodes)
     else:
         do_update_general(node_list, nodes)
 
@@ -438,8 +726,10 @@ def build_update_list(ng=None):
             build_update_list(ng)
     else:
         node_sets = separate_nodes(ng)
-        deps = make_dep_dict(ng)
-        out = [make_update_list(ng, s, deps) for s in node_sets]
+        graph = get_tree_graph(ng)
+        out = [graph.sort(s) for s in node_sets]
+        if not all(out):
+            error("Invalid node tree!")
         update_cache[ng.name] = out
         partial_update_cache[ng.name] = {}
         # reset_socket_cache(ng)
@@ -481,6 +771,29 @@ def process_from_nodes(nodes):
     do_update(update_list, ng.nodes)
 
 
+def process_animation(ng, nodes):
+    """
+    Process downstream from animated nodes on frame change.
+    Nodes which have data recorded for current frame (see `sv_load_frame`
+    method of Cache node) output it instead of processing, and nodes which
+    are needed only to compute inputs of such nodes are skipped.
+    """
+    if not nodes:
+        return
+    update_list = make_tree_from_nodes([node.name for node in nodes], ng)
+    frame = bpy.context.scene.frame_current
+    loaded = set()
+    for name in update_list:
+        node = ng.nodes[name]
+        if hasattr(node, 'sv_load_frame') and node.sv_load_frame(frame):
+            loaded.add(name)
+    if loaded:
+        skipped = loaded | get_tree_graph(ng).feeding_only(loaded)
+        update_list = [name for name in update_list if name not in skipped]
+    reset_error_some_nodes(ng, update_list)
+    do_update(update_list, ng.nodes)
+
+
 def process_from_node(node):
     """
     Process downstream from a given node
@@ -533,8 +846,11 @@ def process_tree(ng=None):
         if not update_list:
             build_update_list(ng)
             update_list = update_cache.get(ng.name)
-        for l in update_list:
-            do_update(l, ng.nodes)
+        if use_parallel_update(ng.nodes):
+            do_update_parallel(update_list, ng.nodes)
+        else:
+            for l in update_list:
+                do_update(l, ng.nodes)
     else:
         pass
 
@@ -560,3 +876,4 @@ def register():
     addon = bpy.context.preferences.addons.get(addon_name)
     if addon:
         update_error_colors(addon.preferences, [])
+        update_disk_cache_settings(addon.preferences, [])
@@ -32,9 +32,11 @@ from numpy import (
     repeat as np_repeat,
     concatenate as np_concatenate,
     tile as np_tile,
+    arange as np_arange,
     float64,
     int32, int64)
 from sverchok.utils.logging import info
+from sverchok.utils.ragged import SvRaggedArray
 from sverchok.core.events import CurrentEvents, BlenderEventsTypes
 
 DEBUG_MODE = False
@@ -186,18 +188,20 @@ def fullList(l, count):
 
 def fullList_np(l, count):
     """extends list l so len is at least count if needed with the
-    last element of l"""
+    last element of l; numpy arrays can not be extended in place,
+    so the result is returned"""
     n = len(l)
     if n == count:
-        return
+        return l
     d = count - n
     if d > 0:
         try:
             l.extend([l[-1] for a in range(d)])
-        except:
-            l = numpy_full_list(l, n)
+        except AttributeError:
+            l = numpy_full_list(l, count)
     else:
         l = l[:count]
+    return l
 
 
 def fullList_deep_copy(l, count):
@@ -365,10 +369,33 @@ def numpy_match_short(list_of_arrays):
         out.append(array)
     return out
 
+def numpy_match_cross(list_of_arrays):
+    '''cross match numpy arrays, the last array cycles fastest
+    [[1,2], [5,6,7]] -> [[1,1,1,2,2,2], [5,6,7,5,6,7]]'''
+    lengths = [array.shape[0] for array in list_of_arrays]
+    out = []
+    for i, array in enumerate(list_of_arrays):
+        inner = 1
+        for length in lengths[i+1:]:
+            inner *= length
+        outer = 1
+        for length in lengths[:i]:
+            outer *= length
+        indices = np_tile(np_repeat(np_arange(lengths[i]), inner), outer)
+        out.append(array[indices])
+    return out
+
+def numpy_match_cross2(list_of_arrays):
+    '''cross match numpy arrays, the first array cycles fastest
+    [[1,2], [5,6,7]] -> [[1,2,1,2,1,2], [5,5,6,6,7,7]]'''
+    return list(reversed(numpy_match_cross(list(reversed(list_of_arrays)))))
+
 numpy_list_match_func = {
     "SHORT":  numpy_match_short,
     "CYCLE":  numpy_match_long_cycle,
     "REPEAT": numpy_match_long_repeat,
+    "XREF":   numpy_match_cross,
+    "XREF2":  numpy_match_cross2
     }
 
 def make_repeaters(lists):
@@ -480,6 +507,8 @@ def levels_of_list_or_np(lst):
             level += levels_of_list_or_np(n)
         elif isinstance(n, (ndarray)):
             level += len(n.shape)
+        elif isinstance(n, SvRaggedArray):
+            level += n.values.ndim + 1
 
         return level
     return 0
@@ -511,7 +540,7 @@ def get_data_nesting_level(data, data_types=SIMPLE_DATA_TYPES):
         """ Needed only for better error reporting. """
         if isinstance(data, data_types):
             return 0
-        elif isinstance(data, (list, tuple, ndarray)):
+        elif isinstance(data, (list, tuple, ndarray, SvRaggedArray)):
             if len(data) == 0:
                 return 1
             else:
@@ -720,6 +749,9 @@ def describe_data_shape_by_level(data, include_numpy_nesting=True):
                 else:
                     nesting = 0
                 return nesting, [type(data).__name__ + " of " + str(data.dtype) + " with shape " + str(data.shape)]
+            if isinstance(data, SvRaggedArray):
+                nesting = data.values.ndim + 1 if include_numpy_nesting else 0
+                return nesting, [f"{type(data).__name__} [{len(data)}] of {data.dtype}"]
             return 0, [type(data).__name__]
         else:
             result = [f"{type(data).__name__} [{len(data)}]"]
@@ -23,7 +23,7 @@ import textwrap
 from contextlib import contextmanager
 
 import bpy
-from bpy.props import StringProperty, BoolProperty, EnumProperty
+from bpy.props import StringProperty, BoolProperty, EnumProperty, IntProperty, FloatProperty
 from bpy.types import NodeTree
 
 from sverchok import data_structure
@@ -31,8 +31,8 @@ from sverchok.data_structure import classproperty, post_load_call
 
 from sverchok.core.update_system import (
     build_update_list,
-    process_from_node, process_from_nodes,
-    process_tree,
+    process_from_node, process_from_nodes, process_animation,
+    process_tree, invalidate_tree_graph,
     get_original_node_color,
     is_first_run,)
 from sverchok.core.links import (
@@ -113,7 +113,7 @@ class SvNodeTreeCommon(object):
             if hasattr(node, 'is_animatable'):
                 if node.is_animatable:
                     animated_nodes.append(node)
-        process_from_nodes(animated_nodes)
+        process_animation(self, animated_nodes)
 
     @contextmanager
     def throttle_update(self):
@@ -206,6 +206,42 @@ class SverchCustomTree(NodeTree, SvNodeTreeCommon):
         default="None", update=lambda s, c: process_tree(s), options=set()
     )
 
+    # nodes of disconnected subtrees and independent branches can be processed by several threads
+    sv_parallel_update: BoolProperty(
+        name="Parallel update",
+        description="Process independent branches of the tree in parallel threads (experimental)",
+        default=False, update=lambda s, c: process_tree(s), options=set())
+
+    sv_parallel_workers: IntProperty(
+        name="Threads",
+        description="Number of threads for parallel update, 0 means automatic",
+        default=0, min=0, options=set())
+
+    # outputs of nodes are stored on disk and loaded when node properties and inputs are unchanged
+    sv_disk_cache: BoolProperty(
+        name="Disk cache",
+        description="Store outputs of nodes on disk and load them instead of processing nodes "
+                    "which properties and input data did not change, also after reopening the file",
+        default=False, options=set())
+
+    sv_disk_cache_min_time: FloatProperty(
+        name="Min. time",
+        description="Store outputs only of nodes which processing takes at least this number of seconds",
+        default=0.1, min=0.0, precision=3, options=set())
+
+    # data recorded by Cache nodes for animation frames, see utils/frame_cache.py
+    sv_frame_cache_budget: IntProperty(
+        name="Frame cache (MB)",
+        description="Memory for data recorded by Cache nodes for animation frames, "
+                    "least recently used frames are removed (or written to disk) first",
+        default=512, min=1, options=set())
+
+    sv_frame_cache_spill: BoolProperty(
+        name="Spill frames to disk",
+        description="Write frames which do not fit into memory into temporary files "
+                    "instead of forgetting them",
+        default=False, options=set())
+
     # this mode will replace properties of some nodes so they could have lesser values for draft mode
     sv_draft: BoolProperty(
         name="Draft",
@@ -220,6 +256,7 @@ class SverchCustomTree(NodeTree, SvNodeTreeCommon):
         """
 
         CurrentEvents.new_event(BlenderEventsTypes.tree_update, self)
+        invalidate_tree_graph(self)
 
         # this is a no-op if there's no drawing
         clear_exception_drawing_with_bgl(self.nodes)
@@ -256,6 +293,26 @@ class UpdateNodes:
     # overriding the property without `skip_save` option can lead to wrong importing bgl viewer nodes
     n_id: StringProperty(options={'SKIP_SAVE'})
 
+    # whether the node can modify data received from input sockets in place
+    # if True, input sockets return deep copies of the data by default,
+    # otherwise they return read-only views of data of upstream nodes
+    sv_mutates_inputs = True
+
+    # whether the node can be processed only by the main thread in parallel update mode
+    # if None, it is decided by category of the node, see is_main_thread_only() in update_system.py
+    sv_main_thread_only = None
+
+    # whether outputs of the node can be stored in disk cache and loaded instead of processing
+    # if None, it is decided by category of the node, see is_disk_cacheable() in update_system.py;
+    # nodes which read Blender data by name, keep data between updates or have side effects
+    # must set it to False, because the disk cache key includes only properties and inputs
+    sv_disk_cacheable = None
+
+    # whether each object of output data depends only on the objects with the same index
+    # of input data (inputs with one object are repeated); For Each loops can pass
+    # several elements through such nodes at once, see SvLoopOutNode
+    sv_elementwise = False
+
     @property
     def node_id(self):
         """Identifier of the node"""
@@ -36,6 +36,7 @@ class SvAreaNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Area'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_AREA'
+    sv_mutates_inputs = False
 
     sum_faces: BoolProperty(name='sum faces', default=False, update=updateNode)
 
@@ -190,6 +190,9 @@ class SvImageComponentsNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Image Decompose'
     bl_icon = 'GROUP_VCOL'
 
+    # pixels are read from the image by name
+    sv_disk_cacheable = False
+
     # node storage, reference by the hash of self.
     node_dict = {}
 
@@ -64,6 +64,9 @@ class SvOBJInsolationNode(bpy.types.Node, SverchCustomTreeNode, SvAnimatableNode
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_INSOLATION'
 
+    # the node creates Blender materials
+    sv_disk_cacheable = False
+
     mode: BoolProperty(name='input mode', default=False, update=updateNode)
     #mode2 = BoolProperty(name='output mode', default=False, update=updateNode)
     sort_critical: IntProperty(name='sort_critical', default=12, min=1,max=24, update=updateNode)
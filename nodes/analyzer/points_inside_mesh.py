@@ -18,17 +18,19 @@
 
 
 from itertools import cycle
+
+import numpy as np
 import bpy
 from bpy.props import (IntProperty, FloatProperty, BoolProperty, EnumProperty, FloatVectorProperty)
 import bmesh
 from mathutils import Vector
-from mathutils.kdtree import KDTree
 from mathutils.bvhtree import BVHTree
 from mathutils.noise import seed_set, random_unit_vector
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, list_match_func, list_match_modes, throttle_and_update_node
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
+from sverchok.utils.mesh_inside import get_mesh_inside_tester
 
 
 def generate_random_unitvectors():
@@ -40,61 +42,50 @@ def generate_random_unitvectors():
 directions = generate_random_unitvectors()
 
 
-def get_points_in_mesh(verts, faces, points, eps=0.0, num_samples=3):
-    mask_inside = []
+# minimal number of rays (of given number) which should find the point inside;
+# exactly what the criteria should be here is not clear, this seems enough.
+min_votes = {1: 1, 2: 1, 3: 2, 4: 3, 5: 4, 6: 4}
 
-    bvh = BVHTree.FromPolygons(verts, faces, all_triangles=False, epsilon=eps)
 
+def get_points_in_mesh(verts, faces, points, eps=0.0, num_samples=3):
+    """
+    A point is inside if the nearest face hit by a ray from it is seen from
+    behind, for enough of num_samples rays in different directions.
+    eps is not used, it is kept for compatibility of the signature.
+    """
+    tester = get_mesh_inside_tester(verts, faces)
+    votes = np.zeros(len(points), dtype=np.int64)
     for direction in directions[:num_samples]:
-        samples = []
-        mask = samples.append
-
-        for point in points:
-            hit = bvh.ray_cast(point, direction)
-            if hit[0]:
-                v = hit[1].dot(direction)
-                mask(not v < 0.0)
-            else:
-                mask(False)
-
-        mask_inside.append(samples)
-
-    if len(mask_inside) == 1:
-        return mask_inside[0]
-    else:
-        mask_totals = []
-        oversample = mask_totals.append
-        num_points = len(points)
-
-        # exactly what the criteria should be here is not clear, this seems enough.
-        for i in range(num_points):
-            fsum = sum(mask_inside[j][i] for j in range(num_samples))
-
-            if num_samples == 2:
-                oversample(fsum >= 1)
-            elif num_samples == 3:
-                oversample(fsum >= 2)
-            elif num_samples == 4:
-                oversample(fsum >= 3)
-            elif num_samples == 5:
-                oversample(fsum >= 4)
-            elif num_samples == 6:
-                oversample(fsum >= 4)
-        return mask_totals
+        _, back_facing = tester.first_hits(points, direction)
+        votes += back_facing
+    return (votes >= min_votes[num_samples]).tolist()
 
 
 def are_inside(verts, faces, points, eps):
+    """
+    For closed meshes, a point is inside if a ray from it crosses the mesh
+    odd number of times. For other meshes, a point is inside if it is behind
+    the nearest face; eps is the BVH tree epsilon for this case.
+    """
+    tester = get_mesh_inside_tester(verts, faces)
+    if tester.is_closed:
+        return tester.contains(points).tolist()
+    return are_inside_nearest(verts, faces, points, eps)
+
+
+def are_inside_nearest(verts, faces, points, eps):
     bm = bmesh_from_pydata(verts, [], faces, normal_update=True)
     mask_inside = []
     mask = mask_inside.append
     bvh = BVHTree.FromBMesh(bm, epsilon=eps)
+    bm.free()
 
     # return points on polygons
     for point in points:
         fco, normal, _, _ = bvh.find_nearest(point)
         p2 = fco - Vector(point)
         v = p2.dot(normal)
-        mask(not v < 0.0)  # addp(v >= 0.0) ?
+        mask(not v < 0.0)
 
     return mask_inside
 
@@ -221,8 +212,7 @@ class SvPointInside(bpy.types.Node, SverchCustomTreeNode):
             layout.prop(self, 'limit_max_dist', expand=True)
         else:
             layout.prop(self, 'selected_algo', expand=True)
-            if self.selected_algo == 'algo 2':
-                layout.prop(self, 'epsilon_bvh', text='Epsilon')
+            if self.selected_algo == 'algo_2':
                 layout.prop(self, 'num_samples', text='Samples')
 
     def draw_buttons_ext(self, context, layout):
@@ -57,6 +57,9 @@ class SvColorRampNode(bpy.types.Node, SverchCustomTreeNode, SvAnimatableNode):
     bl_icon = 'COLOR'
     sv_icon = 'SV_COLOR_RAMP'
 
+    # ramp is kept in a hidden node group
+    sv_disk_cacheable = False
+
     value: FloatProperty(
         name='Value', description='Input value(s)',
         default=.5, update=updateNode)
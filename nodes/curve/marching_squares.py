@@ -9,6 +9,7 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, throttle_and_update_node, ensure_nesting_level, get_data_nesting_level
 from sverchok.utils.logging import info, exception
 from sverchok.utils.field.scalar import SvScalarField
+from sverchok.utils.field.evaluation import evaluate_scalar_field
 from sverchok.dependencies import skimage
 from sverchok.utils.dummy_nodes import add_dummy
 from sverchok.utils.marching_squares import make_contours
@@ -164,7 +165,7 @@ else:
                     xs, ys, zs = xs.flatten(), ys.flatten(), zs.flatten()
                     if has_matrix:
                         xs, ys, zs = self.apply_matrix(matrix, xs, ys, zs)
-                    field_values = field.evaluate_grid(xs, ys, zs)
+                    field_values = evaluate_scalar_field(field, xs, ys, zs)
                     field_values = field_values.reshape((samples, samples))
 
                     contours = measure.find_contours(field_values, level=value)
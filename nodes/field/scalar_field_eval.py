@@ -12,6 +12,7 @@ from sverchok.utils.math import from_cylindrical, from_spherical, to_cylindrical
 
 from sverchok.utils.math import coordinate_modes
 from sverchok.utils.field.scalar import SvScalarField
+from sverchok.utils.field.evaluation import evaluate_scalar_field
 
 class SvScalarFieldEvaluateNode(bpy.types.Node, SverchCustomTreeNode):
     """
@@ -53,7 +54,7 @@ class SvScalarFieldEvaluateNode(bpy.types.Node, SverchCustomTreeNode):
                     xs = XYZ[:,0]
                     ys = XYZ[:,1]
                     zs = XYZ[:,2]
-                    new_values = field.evaluate_grid(xs, ys, zs).tolist()
+                    new_values = evaluate_scalar_field(field, xs, ys, zs).tolist()
                 values_out.append(new_values)
 
         self.outputs['Value'].sv_set(values_out)
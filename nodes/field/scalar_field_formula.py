@@ -65,24 +65,24 @@ class SvScalarFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         compiled = sv_compile(self.formula)
 
         def carthesian(x, y, z, V):
-            variables.update(dict(x=x, y=y, z=z, V=V))
-            r = safe_eval_compiled(compiled, variables)
+            env = dict(variables, x=x, y=y, z=z, V=V)
+            r = safe_eval_compiled(compiled, env)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
 
         def cylindrical(x, y, z, V):
             rho, phi, z = to_cylindrical((x, y, z), mode='radians')
-            variables.update(dict(rho=rho, phi=phi, z=z, V=V))
-            r = safe_eval_compiled(compiled, variables)
+            env = dict(variables, rho=rho, phi=phi, z=z, V=V)
+            r = safe_eval_compiled(compiled, env)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
 
         def spherical(x, y, z, V):
             rho, phi, theta = to_spherical((x, y, z), mode='radians')
-            variables.update(dict(rho=rho, phi=phi, theta=theta, V=V))
-            r = safe_eval_compiled(compiled, variables)
+            env = dict(variables, rho=rho, phi=phi, theta=theta, V=V)
+            r = safe_eval_compiled(compiled, env)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
@@ -100,24 +100,24 @@ class SvScalarFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         compiled = sv_compile(self.formula)
 
         def carthesian(x, y, z, V):
-            variables.update(dict(x=x, y=y, z=z, V=V))
-            r = safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+            env = dict(variables, x=x, y=y, z=z, V=V)
+            r = safe_eval_compiled(compiled, env, allowed_names = safe_names_np)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
 
         def cylindrical(x, y, z, V):
             rho, phi, z = to_cylindrical_np((x, y, z), mode='radians')
-            variables.update(dict(rho=rho, phi=phi, z=z, V=V))
-            r = safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+            env = dict(variables, rho=rho, phi=phi, z=z, V=V)
+            r = safe_eval_compiled(compiled, env, allowed_names = safe_names_np)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
 
         def spherical(x, y, z, V):
             rho, phi, theta = to_spherical_np((x, y, z), mode='radians')
-            variables.update(dict(rho=rho, phi=phi, theta=theta, V=V))
-            r = safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+            env = dict(variables, rho=rho, phi=phi, theta=theta, V=V)
+            r = safe_eval_compiled(compiled, env, allowed_names = safe_names_np)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
@@ -48,6 +48,48 @@ vectorized_ops = {'SIN', 'COS', 'TAN', 'ASIN', 'ACOS', 'ATAN', 'EXP', 'LOG',
                     'SINH', 'COSH', 'TANH', 'ASINH', 'ACOSH', 'ATANH', 'INV',
                     'GAUSS', 'SQR', 'SQRT'}
 
+# Partial derivatives (fa, fb, faa, fab, fbb) of binary operations,
+# which allow to calculate derivatives of resulting fields by chain rule
+binary_partials = {
+    'ADD': lambda x, y: (1, 1, 0, 0, 0),
+    'SUB': lambda x, y: (1, -1, 0, 0, 0),
+    'MUL': lambda x, y: (y, x, 0, 1, 0),
+    'MIN': lambda x, y: ((x <= y) * 1.0, (x > y) * 1.0, 0, 0, 0),
+    'MAX': lambda x, y: ((x >= y) * 1.0, (x < y) * 1.0, 0, 0, 0),
+    'AVG': lambda x, y: (0.5, 0.5, 0, 0, 0),
+    'DIV': lambda x, y: (1/y, -x/(y*y), 0, -1/(y*y), 2*x/(y*y*y))
+}
+
+# First and second derivatives of functions of one variable
+def _gauss_derivatives(x):
+    g = np.exp(-x*x/2.0)
+    return -x*g, (x*x - 1)*g
+
+def _tanh_derivatives(x):
+    d = 1 - np.tanh(x)**2
+    return d, -2*np.tanh(x)*d
+
+function_derivatives = {
+    'SQR': lambda x: (2*x, 2),
+    'SQRT': lambda x: (0.5/np.sqrt(x), -0.25/(x*np.sqrt(x))),
+    'INV': lambda x: (-1/(x*x), 2/(x*x*x)),
+    'SIN': lambda x: (np.cos(x), -np.sin(x)),
+    'COS': lambda x: (-np.sin(x), -np.cos(x)),
+    'TAN': lambda x: (1/np.cos(x)**2, 2*np.tan(x)/np.cos(x)**2),
+    'ASIN': lambda x: (1/np.sqrt(1 - x*x), x/(1 - x*x)**1.5),
+    'ACOS': lambda x: (-1/np.sqrt(1 - x*x), -x/(1 - x*x)**1.5),
+    'ATAN': lambda x: (1/(1 + x*x), -2*x/(1 + x*x)**2),
+    'EXP': lambda x: (np.exp(x), np.exp(x)),
+    'LOG': lambda x: (1/x, -1/(x*x)),
+    'SINH': lambda x: (np.cosh(x), np.sinh(x)),
+    'COSH': lambda x: (np.sinh(x), np.cosh(x)),
+    'TANH': _tanh_derivatives,
+    'ASINH': lambda x: (1/np.sqrt(x*x + 1), -x/(x*x + 1)**1.5),
+    'ACOSH': lambda x: (1/np.sqrt(x*x - 1), -x/(x*x - 1)**1.5),
+    'ATANH': lambda x: (1/(1 - x*x), 2*x/(1 - x*x)**2),
+    'GAUSS': _gauss_derivatives
+}
+
 operation_modes = [ (id, name, name, i) for i, (id, name, fn) in enumerate(operations) ]
 
 def get_operation(op_id):
@@ -105,9 +147,11 @@ class SvScalarFieldMathNode(bpy.types.Node, SverchCustomTreeNode):
                 elif self.operation == 'ABS':
                     field_c = SvAbsScalarField(field_a)
                 elif self.operation in vectorized_ops:
-                    field_c = SvScalarFieldVectorizedFunction(field_a, operation)
+                    field_c = SvScalarFieldVectorizedFunction(field_a, operation,
+                                    derivatives = function_derivatives.get(self.operation))
                 elif self.operation in binary_ops:
-                    field_c = SvScalarFieldBinOp(field_a, field_b, operation)
+                    field_c = SvScalarFieldBinOp(field_a, field_b, operation,
+                                    partials = binary_partials.get(self.operation))
                 else:
                     raise Exception("Unsupported operation: " + self.operation)
                 fields_out.append(field_c)
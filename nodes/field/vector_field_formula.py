@@ -98,26 +98,26 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
                 return from_spherical(rho, phi, theta, mode='radians')
 
         def carthesian_in(x, y, z, V):
-            variables.update(dict(x=x, y=y, z=z, V=V))
-            v1 = safe_eval_compiled(compiled1, variables)
-            v2 = safe_eval_compiled(compiled2, variables)
-            v3 = safe_eval_compiled(compiled3, variables)
+            env = dict(variables, x=x, y=y, z=z, V=V)
+            v1 = safe_eval_compiled(compiled1, env)
+            v2 = safe_eval_compiled(compiled2, env)
+            v3 = safe_eval_compiled(compiled3, env)
             return out_coordinates(v1, v2, v3)
 
         def cylindrical_in(x, y, z, V):
             rho, phi, z = to_cylindrical((x, y, z), mode='radians')
-            variables.update(dict(rho=rho, phi=phi, z=z, V=V))
-            v1 = safe_eval_compiled(compiled1, variables)
-            v2 = safe_eval_compiled(compiled2, variables)
-            v3 = safe_eval_compiled(compiled3, variables)
+            env = dict(variables, rho=rho, phi=phi, z=z, V=V)
+            v1 = safe_eval_compiled(compiled1, env)
+            v2 = safe_eval_compiled(compiled2, env)
+            v3 = safe_eval_compiled(compiled3, env)
             return out_coordinates(v1, v2, v3)
 
         def spherical_in(x, y, z, V):
             rho, phi, theta = to_spherical((x, y, z), mode='radians')
-            variables.update(dict(rho=rho, phi=phi, theta=theta, V=V))
-            v1 = safe_eval_compiled(compiled1, variables)
-            v2 = safe_eval_compiled(compiled2, variables)
-            v3 = safe_eval_compiled(compiled3, variables)
+            env = dict(variables, rho=rho, phi=phi, theta=theta, V=V)
+            v1 = safe_eval_compiled(compiled1, env)
+            v2 = safe_eval_compiled(compiled2, env)
+            v3 = safe_eval_compiled(compiled3, env)
             return out_coordinates(v1, v2, v3)
 
         if self.input_mode == 'XYZ':
@@ -145,10 +145,10 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
                 return from_spherical_np(rho, phi, theta, mode='radians')
 
         def carthesian_in(x, y, z, V):
-            variables.update(dict(x=x, y=y, z=z, V=V))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
+            env = dict(variables, x=x, y=y, z=z, V=V)
+            v1 = safe_eval_compiled(compiled1, env, allowed_names = safe_names_np)
+            v2 = safe_eval_compiled(compiled2, env, allowed_names = safe_names_np)
+            v3 = safe_eval_compiled(compiled3, env, allowed_names = safe_names_np)
             if not isinstance(v1, np.ndarray):
                 v1 = np.full_like(x, v1)
             if not isinstance(v2, np.ndarray):
@@ -159,10 +159,10 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
         def cylindrical_in(x, y, z, V):
             rho, phi, z = to_cylindrical_np((x, y, z), mode='radians')
-            variables.update(dict(rho=rho, phi=phi, z=z, V=V))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
+            env = dict(variables, rho=rho, phi=phi, z=z, V=V)
+            v1 = safe_eval_compiled(compiled1, env, allowed_names = safe_names_np)
+            v2 = safe_eval_compiled(compiled2, env, allowed_names = safe_names_np)
+            v3 = safe_eval_compiled(compiled3, env, allowed_names = safe_names_np)
             if not isinstance(v1, np.ndarray):
                 v1 = np.full_like(x, v1)
             if not isinstance(v2, np.ndarray):
@@ -173,10 +173,10 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
         def spherical_in(x, y, z, V):
             rho, phi, theta = to_spherical_np((x, y, z), mode='radians')
-            variables.update(dict(rho=rho, phi=phi, theta=theta, V=V))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
+            env = dict(variables, rho=rho, phi=phi, theta=theta, V=V)
+            v1 = safe_eval_compiled(compiled1, env, allowed_names = safe_names_np)
+            v2 = safe_eval_compiled(compiled2, env, allowed_names = safe_names_np)
+            v3 = safe_eval_compiled(compiled3, env, allowed_names = safe_names_np)
             if not isinstance(v1, np.ndarray):
                 v1 = np.full_like(x, v1)
             if not isinstance(v2, np.ndarray):
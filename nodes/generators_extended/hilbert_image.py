@@ -30,6 +30,9 @@ class HilbertImageNode(bpy.types.Node, SverchCustomTreeNode):
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_HILBERT_IMAGE'
 
+    # pixels are read from the image by name
+    sv_disk_cacheable = False
+
     name_image: StringProperty(
         name='image_name', description='image name', update=updateNode)
 
@@ -33,6 +33,9 @@ class SvWFCTextureNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'WFC Texture'
     bl_icon = 'FORCE_FORCE'
 
+    # pixels are read from the image by name
+    sv_disk_cacheable = False
+
     image_name: bpy.props.StringProperty(name="Image", default="", update=updateNode, description="Sample image")
     height: bpy.props.IntProperty(default=10, min=1, max=100, update=updateNode, description="For output image")
     width: bpy.props.IntProperty(default=10, min=1, max=100, update=updateNode, description="For output image")
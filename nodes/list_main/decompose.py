@@ -20,7 +20,7 @@ import bpy
 from bpy.props import BoolProperty, IntProperty, StringProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import (levelsOflist, multi_socket, changable_sockets,
+from sverchok.data_structure import (levels_of_list_or_np, multi_socket, changable_sockets,
                                      updateNode, get_other_socket)
 
 from sverchok.core import update_system
@@ -45,7 +45,7 @@ class SvListDecomposeNode(bpy.types.Node, SverchCustomTreeNode):
             update_system.process_to_node(other.node)
             data = self.inputs['data'].sv_get()
 
-        leve = levelsOflist(data)
+        leve = levels_of_list_or_np(data)
         if leve+1 < self.level:
             self.level = leve+1
         result = self.beat(data, self.level)
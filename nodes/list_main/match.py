@@ -18,10 +18,13 @@
 
 import bpy
 from bpy.props import IntProperty, EnumProperty
+from numpy import ndarray
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (match_short, match_long_cycle, updateNode,
-                                     match_long_repeat, match_cross2)
+                                     match_long_repeat, match_cross2,
+                                     numpy_match_short, numpy_match_long_cycle,
+                                     numpy_match_long_repeat, numpy_match_cross2)
 
 #
 # List Match Node by Linus Yng
@@ -34,6 +37,21 @@ func_dict = {
     'XREF': match_cross2
 }
 
+numpy_func_dict = {
+    'SHORT': numpy_match_short,
+    'CYCLE': numpy_match_long_cycle,
+    'REPEAT': numpy_match_long_repeat,
+    'XREF': numpy_match_cross2
+}
+
+
+def match_lists(mode, lsts):
+    # NumPy arrays are matched without converting them into lists
+    if lsts and all(isinstance(l, ndarray) and l.ndim for l in lsts):
+        return numpy_func_dict[mode](lsts)
+    return func_dict[mode](lsts)
+
+
 class ListMatchNode(bpy.types.Node, SverchCustomTreeNode):
     ''' Stream Matching node '''
     bl_idname = 'ListMatchNode'
@@ -70,16 +88,17 @@ class ListMatchNode(bpy.types.Node, SverchCustomTreeNode):
 # matches until the chosen level
 # f2 is applied to the final level of matching,
 # f1 is applied to every level until the final, where f2 is used.
+# f1 and f2 are keys of func_dict
 
     def match(self, lsts, level, f1, f2):
         level -= 1
         if level:
-            tmp = [self.match(obj, level, f1, f2) for obj in zip(*f1(lsts))]
+            tmp = [self.match(obj, level, f1, f2) for obj in zip(*match_lists(f1, lsts))]
             return list(map(list, zip(*tmp)))
         elif type(lsts) == list:
-            return f2(lsts)
+            return match_lists(f2, lsts)
         elif type(lsts) == tuple:
-            return tuple(f2(list(lsts)))
+            return tuple(match_lists(f2, list(lsts)))
         return None
 
     def sv_update(self):
@@ -121,7 +140,7 @@ class ListMatchNode(bpy.types.Node, SverchCustomTreeNode):
                 if socket.is_linked:
                     lsts.append(socket.sv_get())
 
-            out = self.match(lsts, self.level, func_dict[self.mode], func_dict[self.mode_final])
+            out = self.match(lsts, self.level, self.mode, self.mode_final)
 
             # output into linked sockets s
             for i, socket in enumerate(self.outputs):
@@ -18,6 +18,7 @@
 
 import bpy
 from bpy.props import EnumProperty, IntProperty, FloatProperty, BoolProperty
+from numpy import ndarray
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, match_long_repeat
@@ -158,9 +159,12 @@ class SvListStatisticsNode(bpy.types.Node, SverchCustomTreeNode):
         allNames = []
         allValues = []
         for functionName in functionNames:
-            statistics_function = functions[functionName][1]
             quantityList = []
             for d, p, b, s in zip(*params):
+                if isinstance(d, ndarray) and d.ndim == 1:
+                    statistics_function = numpy_functions[functions[functionName][1]]
+                else:
+                    statistics_function = functions[functionName][1]
                 if functionName == "PERCENTILE":
                     quantity = statistics_function(d, p)
                 elif functionName == "HISTOGRAM":
@@ -17,9 +17,10 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import bpy
+from numpy import ndarray
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import levelsOflist, updateNode
+from sverchok.data_structure import levels_of_list_or_np, updateNode
 from bpy.props import IntProperty
 
 
@@ -44,7 +45,7 @@ class ListSumNodeMK2(bpy.types.Node, SverchCustomTreeNode):
         if self.outputs['Sum'].is_linked and self.inputs['Data'].is_linked:
             data = self.inputs['Data'].sv_get()
 
-            lol = levelsOflist(data) - 1
+            lol = levels_of_list_or_np(data) - 1
             level = min(lol, self.level)
             out = self.summ(data, level, lol)
 
@@ -53,10 +54,14 @@ class ListSumNodeMK2(bpy.types.Node, SverchCustomTreeNode):
             self.outputs['Sum'].sv_set(out)
 
     def summ(self, data, level, lol):
+        if isinstance(data, ndarray):
+            # the same as for nested lists, items are summed over remaining axes
+            if level == 0:
+                return data.sum()
+            return data.sum(axis=tuple(range(level, data.ndim)))
         out = []
         if level == 0  and lol > 0:
             for obj in data:
-                print(obj)
                 out.append(self.summ(obj,level,lol-1))
             return sum(out)
         elif level == 0 and lol == 0:
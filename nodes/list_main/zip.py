@@ -18,10 +18,11 @@
 
 import bpy
 from bpy.props import BoolProperty, IntProperty, StringProperty
+from numpy import ndarray
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import changable_sockets, multi_socket, updateNode
-from sverchok.utils.listutils import preobrazovatel
+from sverchok.utils.listutils import preobrazovatel, zip_arrays
 
 
 class ZipNode(bpy.types.Node, SverchCustomTreeNode):
@@ -79,11 +80,16 @@ class ZipNode(bpy.types.Node, SverchCustomTreeNode):
 
     def myZip(self, list_all, level, level2=0):
         if level == level2:
-            if isinstance(list_all, (list, tuple)):
+            if isinstance(list_all, (list, tuple, ndarray)):
+                if len(list_all) and all(isinstance(l, ndarray) and l.ndim for l in list_all):
+                    # pairs of items of arrays are kept in one array
+                    zipped = zip_arrays(list_all)
+                    if zipped is not None:
+                        return zipped
                 list_lens = []
                 list_res = []
                 for l in list_all:
-                    if isinstance(l, (list, tuple)):
+                    if isinstance(l, (list, tuple, ndarray)):
                         list_lens.append(len(l))
                     else:
                         list_lens.append(0)
@@ -99,14 +105,14 @@ class ZipNode(bpy.types.Node, SverchCustomTreeNode):
             else:
                 return False
         elif level > level2:
-            if isinstance(list_all, (list, tuple)):
+            if isinstance(list_all, (list, tuple, ndarray)):
                 list_res = []
                 list_tr = self.myZip(list_all, level, level2+1)
                 if list_tr is False:
                     list_tr = list_all
                 t = []
                 for tr in list_tr:
-                    if isinstance(list_tr, (list, tuple)):
+                    if isinstance(list_tr, (list, tuple, ndarray)):
                         list_tl = self.myZip(tr, level, level2+1)
                         if list_tl is False:
                             list_tl = list_tr
@@ -52,6 +52,9 @@ class SvMultiCacheNode(bpy.types.Node, SverchCustomTreeNode):
     bl_icon = 'RNA'
     sv_icon = 'SV_MULTI_CACHE'
 
+    # the node keeps data between updates
+    sv_disk_cacheable = False
+
     in_bucket: IntProperty(
         name='In Bucket', description="Identifier of the bucket where data will be strored",
         default=0,
@@ -17,6 +17,7 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import ast
+import os
 import random
 import time
 from collections import namedtuple
@@ -31,6 +32,7 @@ from mathutils.noise import seed_set, random
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from sverchok.core.update_system import make_tree_from_nodes, do_update
+from sverchok.utils.fitness_cache import SvFitnessCache
 from sverchok.utils.listutils import (
     listinput_getI,
     listinput_getF,
@@ -76,6 +78,9 @@ class NumberGene(NamedTuple):
         gene = cls(name=node.name, g_type=num_type, min_n=min_n, max_n=max_n, range=max_n-min_n, init_val=initial_value)
         return gene
 
+    def signature(self):
+        return [self.name, self.g_type, self.min_n, self.max_n]
+
     def set_node_with_gene(self, tree, agent_gene):
         if self.g_type == 'float':
             tree.nodes[self.name].float_ = agent_gene
@@ -132,6 +137,9 @@ class ListInputGene(NamedTuple):
         gene = cls(name=node.name, g_type=num_type, num_length=num_length, init_val=init_val, values=values)
         return gene
 
+    def signature(self):
+        return [self.name, self.g_type, self.num_length, self.values]
+
     def set_node_with_gene(self, tree, agent_gene):
         if self.g_type == 'int_list':
             node = tree.nodes[self.name]
@@ -203,6 +211,11 @@ class NumberMultiGene(NamedTuple):
             values=values)
         return gene
 
+    def signature(self):
+        # in range mode values are the current state of the node, not a part of genotype
+        values = self.values if self.mode != 'range' else None
+        return [self.name, self.mode, self.num_type, self.mins, self.maxs, self.num_length, values]
+
     def set_node_with_gene(self, tree, agent_gene):
 
         tree.nodes[self.name].fill_from_data(agent_gene)
@@ -289,6 +302,7 @@ class NumberMultiGene(NamedTuple):
 
 
 evolver_mem = {}
+evolver_cache = {}
 
 GENE_NODES = ["SvNumberNode", "SvListInputNode", "SvGenesHolderNode"]
 
@@ -322,6 +336,22 @@ def genes_to_string(genes):
         text += gene.name + ','
     return text
 
+def genes_signature(genes):
+    return repr([gene.signature() for gene in genes])
+
+def get_fitness_cache(node, genes):
+    '''fitness cache of the node; it is kept between runs only if the genotype is not changed'''
+    signature = genes_signature(genes)
+    cache = evolver_cache.get(node.node_id)
+    if cache is None or not node.keep_cache or cache.signature != signature:
+        cache = SvFitnessCache(node.cache_size, signature)
+        if node.keep_cache and node.cache_file:
+            cache.load(bpy.path.abspath(node.cache_file))
+    cache.resize(node.cache_size)
+    cache.reset_stats()
+    evolver_cache[node.node_id] = cache
+    return cache
+
 def build_genes_from_name(genes_names, tree):
     g_names = genes_names.split(',')[:-1]
 
@@ -351,6 +381,7 @@ class DNA:
         self.genes_def = genes_def
         self.genes = []
         self.fitness = 0
+        self.evaluated = False
         if empty:
             return
         self.fill_genes(random_val=random_val)
@@ -379,6 +410,7 @@ class DNA:
             if isinstance(agent_fitness, list):
                 agent_fitness = agent_fitness[0]
             self.fitness = agent_fitness
+            self.evaluated = True
         finally:
             tree.sv_process = True
 
@@ -414,6 +446,7 @@ class Population:
         self.time_start = time.time()
         self.genes = get_genes(tree, genotype_frame)
         self.update_list = make_tree_from_nodes([g.name for g in self.genes], tree)
+        self.cache = get_fitness_cache(node, self.genes)
         self.population_g = []
         self.init_population(node.population_n)
 
@@ -439,9 +472,18 @@ class Population:
                 self.population_g.append(DNA(self.genes))
 
     def  evaluate_fitness_g(self):
+        '''evaluates agents with unknown fitness, known gene combinations are taken from cache'''
         try:
             for agent in self.population_g:
+                if agent.evaluated:
+                    continue
+                fitness = self.cache.get(agent.genes, default=None)
+                if fitness is not None:
+                    agent.fitness = fitness
+                    agent.evaluated = True
+                    continue
                 agent.evaluate_fitness(self.tree, self.update_list, self.node)
+                self.cache.put(agent.genes, agent.fitness)
         finally:
             self.tree.sv_process = True
     def population_genes(self):
@@ -458,9 +500,10 @@ class Population:
             weights = 1/np.power(np.array(fitness), self.node.fitness_booster)
         weights = weights/np.sum(weights)
 
-        parents_id = np.random.choice(len(self.population_g), [len(self.population_g)-1, 2], replace=True, p=weights)
-        # we keep the fittest for the next generation
-        new_population = [self.population_g[0]]
+        elite_n = min(self.node.elitism, len(self.population_g))
+        parents_id = np.random.choice(len(self.population_g), [len(self.population_g)-elite_n, 2], replace=True, p=weights)
+        # we keep the fittest for the next generation, their fitness is already known
+        new_population = self.population_g[:elite_n]
         mutation = self.node.mutation
 
         for ancestors in  parents_id:
@@ -497,7 +540,7 @@ class Population:
     def evolve(self):
         population_all = []
         fitness_all = []
-        info = "Evolver Runned"
+        info = "Evolver Runned "
         goal_achieved = False
         iterations = self.node.iterations
         mode = self.node.mode
@@ -534,7 +577,15 @@ class Population:
             fitness_all.append(self.population_fitness())
 
         self.store_data(population_all, fitness_all)
-        self.node.info_label = info
+        self.save_cache()
+        self.node.info_label = info + "(%s evaluated, %s cached)" % (self.cache.misses, self.cache.hits)
+
+    def save_cache(self):
+        if self.node.keep_cache and self.node.cache_file:
+            try:
+                self.cache.save(bpy.path.abspath(self.node.cache_file))
+            except OSError as err:
+                print("Evolver: can not save fitness cache:", err)
 
 
 class SvEvolverRun(bpy.types.Operator):
@@ -595,6 +646,25 @@ class SvEvolverSetFittest(bpy.types.Operator):
         set_fittest(tree, genes, population[0], update_list)
         return {'FINISHED'}
 
+class SvEvolverClearCache(bpy.types.Operator):
+
+    bl_idname = "node.evolver_clear_cache"
+    bl_label = "Evolver Clear Cache"
+    bl_description = "Forget stored fitness values (needed if the tree was changed outside of genotype)"
+
+    idtree: bpy.props.StringProperty(default='')
+    idname: bpy.props.StringProperty(default='')
+
+    def execute(self, context):
+        node = bpy.data.node_groups[self.idtree].nodes[self.idname]
+        evolver_cache.pop(node.node_id, None)
+        if node.cache_file:
+            path = bpy.path.abspath(node.cache_file)
+            if os.path.exists(path):
+                os.remove(path)
+        node.info_label = "Fitness cache cleared"
+        return {'FINISHED'}
+
 def get_framenodes(base_node, _):
 
     items = [
@@ -703,6 +773,31 @@ class SvEvolverNode(bpy.types.Node, SverchCustomTreeNode):
         name='Max Seconds', description='Maximum execution Time',
         update=props_changed)
 
+    elitism: IntProperty(
+        default=1,
+        min=0,
+        name='Elitism', description='Number of fittest agents passed to the next generation without changes',
+        update=props_changed)
+
+    cache_size: IntProperty(
+        default=10000,
+        min=1,
+        name='Cache Size', description='Maximum number of fitness values remembered by gene combination',
+        update=props_changed)
+
+    keep_cache: BoolProperty(
+        name="Keep Fitness Cache",
+        description="Re-use fitness values of previous runs (if genotype is identical). Clear the cache if the tree was changed",
+        default=False,
+        update=props_changed
+        )
+
+    cache_file: StringProperty(
+        name="Cache File",
+        description="JSON file to store fitness cache between sessions (optional)",
+        default="", subtype='FILE_PATH',
+        update=props_changed)
+
     info_label: StringProperty(default="Not Executed")
 
     memory: StringProperty(default="")
@@ -744,6 +839,18 @@ class SvEvolverNode(bpy.types.Node, SverchCustomTreeNode):
             self.wrapper_tracked_ui_draw_op(layout, "node.evolver_set_fittest", icon='RNA_ADD', text="Set Fittest")
             layout.prop(self, "output_all")
 
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.prop(self, "elitism")
+        layout.prop(self, "cache_size")
+        layout.prop(self, "keep_cache")
+        if self.keep_cache:
+            layout.prop(self, "cache_file")
+            self.wrapper_tracked_ui_draw_op(layout, "node.evolver_clear_cache", icon='X', text="Clear Cache")
+
+    def sv_free(self):
+        evolver_cache.pop(self.node_id, None)
+
     def has_been_runned(self):
         if self.node_id in evolver_mem and 'genes' in evolver_mem[self.node_id]:
             return True
@@ -784,5 +891,5 @@ class SvEvolverNode(bpy.types.Node, SverchCustomTreeNode):
 
 
 
-classes = [SvEvolverRun, SvEvolverSetFittest, SvEvolverNode]
+classes = [SvEvolverRun, SvEvolverSetFittest, SvEvolverClearCache, SvEvolverNode]
 register, unregister = bpy.utils.register_classes_factory(classes)
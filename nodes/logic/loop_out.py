@@ -16,8 +16,10 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import time
+
 import bpy
-from bpy.props import EnumProperty, BoolProperty
+from bpy.props import EnumProperty, BoolProperty, IntProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 
@@ -34,6 +36,9 @@ def process_looped_nodes(node_list, tree_nodes, process_name, iteration):
 
 socket_labels = {'Range': 'Break', 'For_Each': 'Skip'}
 
+# node_id: timings of the last execution of the loop, see SvLoopOutNode.get_timings()
+loop_timings = {}
+
 class SvUpdateLoopOutSocketLabels(bpy.types.Operator):
     '''Update Loop Out socket Labels'''
     bl_idname = "node.update_loop_out_socket_labels"
@@ -60,6 +65,12 @@ class SvLoopOutNode(SverchCustomTreeNode, bpy.types.Node):
         items=enum_item_4(['Range', 'For Each']), default='Range',
         )
 
+    batch_size: IntProperty(
+        name='Batch Size',
+        description='In For Each mode, number of elements passed through the loop at once; '
+                    'used only if all nodes inside the loop are element-wise',
+        default=1, min=1, update=updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvLoopControlSocket', 'Loop In')
         self.inputs.new('SvStringsSocket', 'Break')
@@ -68,6 +79,17 @@ class SvLoopOutNode(SverchCustomTreeNode, bpy.types.Node):
         self.outputs.new('SvStringsSocket', 'Data 0')
 
     def draw_buttons_ext(self, context, layout):
+        if self.mode == 'For_Each':
+            layout.prop(self, 'batch_size')
+        timings = self.get_timings()
+        if timings:
+            box = layout.box()
+            box.label(text=f"Last run: {timings['elements']} elements, {timings['total']:.4f}s")
+            if timings['iterations']:
+                durations = timings['iterations']
+                box.label(text=f"{len(durations)} iterations ({timings['method']}), "
+                               f"mean {sum(durations) / len(durations) * 1000:.3f}ms, "
+                               f"max {max(durations) * 1000:.3f}ms")
         if self.mode == 'For_Each':
             socket_labels_box = layout.box()
             socket_labels_box.label(text="Socket Labels")
@@ -198,6 +220,9 @@ class SvLoopOutNode(SverchCustomTreeNode, bpy.types.Node):
 
         return intersection, related_nodes
 
+    def sv_free(self):
+        loop_timings.pop(self.node_id, None)
+
     def ready(self):
         if not self.inputs[0].is_linked:
             print("Inner Loop not connected")
@@ -231,11 +256,115 @@ class SvLoopOutNode(SverchCustomTreeNode, bpy.types.Node):
             for inp, out in zip(self.inputs[2:len(self.outputs)+2], out_data):
                 out.append(inp.sv_get(deepcopy=False, default=[[]])[0])
 
+    def get_timings(self):
+        """
+        Timings of the last execution of the loop:
+        dictionary with "method" ("per element", "batched" or "range"),
+        "elements" - number of elements or iterations,
+        "iterations" - list of durations of passes through the loop body, in seconds,
+        "batch_sizes" - number of elements processed by each pass,
+        "total" - duration of the whole loop.
+        """
+        return loop_timings.get(self.node_id)
+
+    def can_batch(self, body_nodes, loop_in_node):
+        """
+        Whether elements can be passed through the loop body in batches:
+        all nodes in it must be element-wise, and data coming into the loop body
+        from outside must contain only one object (so that it is repeated
+        for all elements, as in the case of processing one element at once).
+        """
+        tree_nodes = self.id_data.nodes
+        body = set(body_nodes)
+        for name in body_nodes:
+            node = tree_nodes[name]
+            if not getattr(node, 'sv_elementwise', False):
+                return False
+            for socket in node.inputs:
+                if not socket.is_linked:
+                    continue
+                other = socket.other
+                if other is None:
+                    continue
+                from_node = other.node
+                if from_node.name in body or from_node.name == loop_in_node.name:
+                    continue
+                if len(socket.sv_get(deepcopy=False, default=[])) > 1:
+                    return False
+        return True
+
+    @staticmethod
+    def from_body(socket, body):
+        """Whether data of the socket is produced by one of given nodes"""
+        return socket.is_linked and socket.other is not None and socket.other.node.name in body
+
+    def skip_mask(self, count, body):
+        """
+        Whether each element of a batch is skipped, or None if loop body
+        did not produce one Skip value per element. As in the case of processing
+        one element at once, only the first value is used if it does not
+        come from the loop body.
+        """
+        socket = self.inputs['Break']
+        stop_ = socket.sv_get(deepcopy=False, default=[[False]])
+        if not self.from_body(socket, body):
+            return [stop_[0][0]] * count
+        if len(stop_) != count:
+            return None
+        return [stop_[i][0] for i in range(count)]
+
+    def collect_batch(self, count, body):
+        """
+        Lists of output objects of a batch for each data socket,
+        or None if loop body did not produce one object per element.
+        """
+        batch_data = []
+        for inp in self.inputs[2:len(self.outputs)+2]:
+            data = inp.sv_get(deepcopy=False, default=[[]])
+            if not self.from_body(inp, body):
+                if not data:
+                    return None
+                batch_data.append([data[0]] * count)
+            elif len(data) == count:
+                batch_data.append(list(data))
+            else:
+                return None
+        return batch_data
+
+    def process_element(self, loop_in_node, body_nodes, item_params, idx, out_data):
+        for j, data in enumerate(item_params):
+            loop_in_node.outputs[j+3].sv_set([data])
+        loop_in_node.outputs['Loop Number'].sv_set([[idx]])
+        process_looped_nodes(body_nodes, self.id_data.nodes, 'Element', idx)
+        self.append_data(out_data)
+
+    def process_batch(self, loop_in_node, body_nodes, batch_params, first_idx, out_data):
+        """
+        Pass several elements through the loop body at once.
+        Returns False if nodes did not produce one object per element;
+        in this case nothing is added to out_data.
+        """
+        count = len(batch_params[0])
+        for j, data in enumerate(batch_params):
+            loop_in_node.outputs[j+3].sv_set(list(data))
+        loop_in_node.outputs['Loop Number'].sv_set([[first_idx + i] for i in range(count)])
+        process_looped_nodes(body_nodes, self.id_data.nodes, 'Batch starting with element', first_idx)
+        # outputs of Loop In node are per element as well
+        body = set(body_nodes) | {loop_in_node.name}
+        batch_data = self.collect_batch(count, body)
+        skip = self.skip_mask(count, body)
+        if batch_data is None or skip is None:
+            return False
+        for out, data in zip(out_data, batch_data):
+            out.extend(item for item, skipped in zip(data, skip) if not skipped)
+        return True
+
     def for_each_mode(self, loop_in_node):
 
         list_match = list_match_func[loop_in_node.list_match]
         params = list_match([inp.sv_get(deepcopy=False, default=[]) for inp in loop_in_node.inputs[1:-1]])
 
+        start = time.perf_counter()
         if len(params[0]) == 1:
             if not self.break_loop():
                 for inp, outp in zip(self.inputs[2:], self.outputs):
@@ -243,33 +372,46 @@ class SvLoopOutNode(SverchCustomTreeNode, bpy.types.Node):
             else:
                 for outp in self.outputs:
                     outp.sv_set([])
+            loop_timings[self.node_id] = dict(method = "per element", elements = 1,
+                    iterations = [], batch_sizes = [], total = time.perf_counter() - start)
         else:
             intersection, related_nodes = self.get_affected_nodes(loop_in_node)
             if self.bad_inner_loops(intersection):
                 raise Exception("Loops inside not well connected")
 
             tree_nodes = self.id_data.nodes
+            body_nodes = intersection[1:-1]
             do_print = loop_in_node.print_to_console
-            idx = 0
             out_data = [[] for inp in self.inputs[2:]]
             do_update(intersection[:-1], tree_nodes)
             self.append_data(out_data)
-            for item_params in zip(*params):
-                if idx == 0:
-                    idx += 1
-                    continue
-                for j, data in enumerate(item_params):
-                    loop_in_node.outputs[j+3].sv_set([data])
-                loop_in_node.outputs['Loop Number'].sv_set([[idx]])
-                idx += 1
+
+            n_items = len(params[0])
+            batch_size = self.batch_size if self.can_batch(body_nodes, loop_in_node) else 1
+            method = "batched" if batch_size > 1 else "per element"
+            durations = []
+            batch_sizes = []
+            idx = 1
+            while idx < n_items:
+                count = min(batch_size, n_items - idx)
                 if do_print:
-                    print(f"Looping Object Number {idx}")
-                process_looped_nodes(intersection[1:-1], tree_nodes, 'Element', idx)
-                self.append_data(out_data)
+                    print(f"Looping Object Number {idx+1}" + (f" (+{count-1})" if count > 1 else ""))
+                iteration_start = time.perf_counter()
+                if count == 1 or not self.process_batch(loop_in_node, body_nodes, [p[idx:idx+count] for p in params], idx, out_data):
+                    # one element at once, or the batch has to be processed element by element
+                    for i in range(idx, idx + count):
+                        self.process_element(loop_in_node, body_nodes, [p[i] for p in params], i, out_data)
+                durations.append(time.perf_counter() - iteration_start)
+                batch_sizes.append(count)
+                idx += count
 
             for inp, outp in zip(out_data, self.outputs):
                 outp.sv_set(inp)
 
+            loop_timings[self.node_id] = dict(method = method, elements = n_items,
+                    iterations = durations, batch_sizes = batch_sizes,
+                    total = time.perf_counter() - start)
+
             do_update(related_nodes, self.id_data.nodes)
 
     def range_mode(self, loop_in_node):
@@ -290,11 +432,14 @@ class SvLoopOutNode(SverchCustomTreeNode, bpy.types.Node):
             do_print = loop_in_node.print_to_console
             iterations = min(int(loop_in_node.inputs['Iterations'].sv_get()[0][0]), loop_in_node.max_iterations)
             tree_nodes = self.id_data.nodes
+            start = time.perf_counter()
             do_update(intersection[:-1], tree_nodes)
 
+            durations = []
             for i in range(iterations-1):
                 if self.break_loop():
                     break
+                iteration_start = time.perf_counter()
                 for j, socket in enumerate(self.inputs[2:]):
                     data = socket.sv_get(deepcopy=False, default=[])
                     loop_in_node.outputs[j+3].sv_set(data)
@@ -302,6 +447,11 @@ class SvLoopOutNode(SverchCustomTreeNode, bpy.types.Node):
                 if do_print:
                     print(f"Looping iteration Number {i+1}")
                 process_looped_nodes(intersection[1:-1], tree_nodes, 'Iteration', i+1)
+                durations.append(time.perf_counter() - iteration_start)
+
+            loop_timings[self.node_id] = dict(method = "range", elements = iterations,
+                    iterations = durations, batch_sizes = [1] * len(durations),
+                    total = time.perf_counter() - start)
 
 
             for inp, outp in zip(self.inputs[2:], self.outputs):
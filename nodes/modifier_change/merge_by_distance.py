@@ -16,17 +16,20 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 from itertools import chain, repeat
+import numpy as np
+
 import bpy
-from bpy.props import FloatProperty
+from bpy.props import FloatProperty, EnumProperty
 import bmesh
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, Vector_generate, repeat_last, zip_long_repeat
+from sverchok.data_structure import updateNode, numpy_full_list
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata, face_data_from_bmesh_faces, vert_data_from_bmesh_verts
+from sverchok.utils.mesh_weld import weld_mesh, take_data
 from sverchok.utils.logging import info, debug
 from sverchok.utils.nodes_mixins.recursive_nodes import SvRecursiveNode
 
-def remove_doubles(vertices, faces, distance, face_data=None, find_doubles=False, mask=[], output_mask=False):
+def remove_doubles_bmesh(vertices, faces, distance, face_data=None, find_doubles=False, mask=[], output_mask=False):
     if faces:
         edge_mode = (len(faces[0]) == 2)
     else:
@@ -78,6 +81,48 @@ def remove_doubles(vertices, faces, distance, face_data=None, find_doubles=False
     bm.free()
     return (verts, edges, faces, face_data_out, doubles, mask_out)
 
+def remove_doubles_numpy(vertices, faces, distance, face_data=None, find_doubles=False, mask=[], output_mask=False):
+    if len(faces):
+        edge_mode = (len(faces[0]) == 2)
+    else:
+        edge_mode = False
+
+    if len(mask):
+        vert_mask = numpy_full_list(np.asarray(mask, dtype=bool), len(vertices))
+    else:
+        vert_mask = None
+
+    new_verts, edges, faces, data = weld_mesh(
+        vertices,
+        faces if edge_mode else [],
+        [] if edge_mode else faces,
+        distance,
+        mask=vert_mask)
+
+    verts = list(map(tuple, new_verts.tolist()))
+    if find_doubles:
+        vert_index = data['vert_index']
+        merged = data['vert_init_index'][vert_index] != np.arange(len(vert_index))
+        doubles = list(map(tuple, np.asarray(vertices, dtype=np.float64)[merged].tolist()))
+    else:
+        doubles = []
+
+    if face_data:
+        face_data_out = take_data(face_data, data['face_init_index'])
+    else:
+        face_data_out = []
+    if vert_mask is not None and output_mask:
+        mask_out = take_data(mask, data['vert_init_index'])
+    else:
+        mask_out = []
+
+    return (verts, edges.tolist(), faces.to_lists(), face_data_out, doubles, mask_out)
+
+def remove_doubles(vertices, faces, distance, face_data=None, find_doubles=False, mask=[], output_mask=False, implementation='BMESH'):
+    if implementation == 'NUMPY':
+        return remove_doubles_numpy(vertices, faces, distance, face_data, find_doubles, mask, output_mask)
+    return remove_doubles_bmesh(vertices, faces, distance, face_data, find_doubles, mask, output_mask)
+
 
 class SvMergeByDistanceNode(bpy.types.Node, SverchCustomTreeNode, SvRecursiveNode):
     """
@@ -93,6 +138,16 @@ class SvMergeByDistanceNode(bpy.types.Node, SverchCustomTreeNode, SvRecursiveNod
         name='Distance', description='Remove distance',
         default=0.001, precision=3, min=0, update=updateNode)
 
+    implementations = [
+        ('BMESH', "Blender", "Blender's bmesh implementation", 0),
+        ('NUMPY', "NumPy", "Faster implementation for big meshes; order of edges and faces, "
+                           "and which of merged vertices is kept, can differ from Blender's", 1)
+    ]
+
+    implementation: EnumProperty(
+        name='Implementation', items=implementations,
+        default='BMESH', update=updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', 'Vertices')
         self.inputs.new('SvStringsSocket', 'PolyEdge')
@@ -114,6 +169,7 @@ class SvMergeByDistanceNode(bpy.types.Node, SverchCustomTreeNode, SvRecursiveNod
         pass
 
     def draw_buttons_ext(self, context, layout):
+        layout.prop(self, 'implementation')
         layout.prop(self, 'list_match')
 
     def rclick_menu(self, context, layout):
@@ -152,7 +208,8 @@ class SvMergeByDistanceNode(bpy.types.Node, SverchCustomTreeNode, SvRecursiveNod
                                  face_data=face_data,
                                  find_doubles=has_double_out,
                                  mask=mask,
-                                 output_mask=has_mask_out)
+                                 output_mask=has_mask_out,
+                                 implementation=self.implementation)
             [r.append(rl) for r, rl in zip(result, res)]
 
         return result
@@ -32,6 +32,9 @@ class SvSweepModulator(bpy.types.Node, SverchCustomTreeNode, SvAnimatableNode):
     bl_label = 'Sweep Modulator'
     bl_icon = 'GP_MULTIFRAME_EDITING'
 
+    # the node creates Blender objects
+    sv_disk_cacheable = False
+
     construct_name: bpy.props.StringProperty(name="construct_name", update=updateNode)
     active: bpy.props.BoolProperty(name="active", update=updateNode)
     modifying_factors: bpy.props.BoolProperty(name="modifying_factors")
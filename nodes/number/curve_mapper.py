@@ -61,6 +61,9 @@ class SvCurveMapperNode(bpy.types.Node, SverchCustomTreeNode, SvAnimatableNode):
     bl_label = 'Curve Mapper'
     bl_icon = 'NORMALIZE_FCURVES'
 
+    # curve is kept in a hidden node group
+    sv_disk_cacheable = False
+
     value: FloatProperty(
         name='Value', description='New Max',
         default=.5, update=updateNode)
@@ -145,6 +145,9 @@ class SvEasingNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Easing 0..1'
     sv_icon = 'SV_EASING'
 
+    # the node draws in the node editor
+    sv_disk_cacheable = False
+
     n_id: StringProperty(default='')
 
     activate: BoolProperty(
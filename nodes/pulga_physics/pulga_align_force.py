@@ -47,7 +47,7 @@ class SvPulgaAlignForceNode(bpy.types.Node, SverchCustomTreeNode):
     mode: EnumProperty(
         name='Mode',
         description='Algorithm used for calculation',
-        items=enum_item_4(['Brute Force', 'Kd-tree']),
+        items=enum_item_4(['Brute Force', 'Kd-tree', 'Cell List']),
         default='Kd-tree', update=updateNode)
 
 
@@ -59,8 +59,7 @@ class SvPulgaAlignForceNode(bpy.types.Node, SverchCustomTreeNode):
         self.outputs.new('SvPulgaForceSocket', "Force")
 
     def draw_buttons(self, context, layout):
-        if scipy is not None and Cython is not None:
-            layout.prop(self, 'mode')
+        layout.prop(self, 'mode')
 
     def process(self):
 
@@ -70,12 +69,13 @@ class SvPulgaAlignForceNode(bpy.types.Node, SverchCustomTreeNode):
         decay = self.inputs["Decay"].sv_get(deepcopy=False)
         max_distance = self.inputs["Max. Distance"].sv_get(deepcopy=False)
         use_kdtree = self.mode in "Kd-tree" and scipy is not None and Cython is not None
+        use_cell_list = not use_kdtree and self.mode != "Brute Force"
 
         forces_out = []
 
         for force in zip_long_repeat(strength, decay, max_distance):
 
-            forces_out.append(SvAlignForce(*force, use_kdtree=use_kdtree))
+            forces_out.append(SvAlignForce(*force, use_kdtree=use_kdtree, use_cell_list=use_cell_list))
 
 
         self.outputs[0].sv_set([forces_out])
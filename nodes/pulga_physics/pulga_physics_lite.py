@@ -55,6 +55,9 @@ class SvPulgaPhysicsNode(bpy.types.Node, SverchCustomTreeNode, SvAnimatableNode)
     bl_label = 'Pulga Physics Lite'
     bl_icon = 'MOD_PHYSICS'
 
+    # the node keeps data between updates
+    sv_disk_cacheable = False
+
     n_id : StringProperty()
 
     iterations : IntProperty(
@@ -35,6 +35,9 @@ class SvPulgaPhysicsSolverNode(bpy.types.Node, SverchCustomTreeNode, SvAnimatabl
     bl_label = 'Pulga Physics Solver'
     bl_icon = 'MOD_PHYSICS'
 
+    # the node keeps data between updates
+    sv_disk_cacheable = False
+
     iterations: IntProperty(
         name='Iterations', description='Number of Iterations',
         default=1, min=1, update=updateNode)
@@ -16,13 +16,23 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
-from ast import literal_eval
-
 import bpy
-from bpy.props import BoolProperty, StringProperty, IntProperty
+from bpy.props import BoolProperty, StringProperty, IntProperty, EnumProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, node_id, changable_sockets
+from sverchok.data_structure import updateNode, changable_sockets
+from sverchok.utils.frame_cache import get_tree_frame_cache
+
+# node_id -> frame which the node is going to record on frame change
+# (or on baking); any other update of a node in FRAMES mode means that
+# its input was changed, so recorded frames are outdated
+_recording_frames = {}
+
+
+def get_frame_cache(ng):
+    """Frame cache of the tree, with memory budget defined by the tree settings"""
+    budget = getattr(ng, 'sv_frame_cache_budget', 512) * 1024 * 1024
+    return get_tree_frame_cache(ng.tree_id, budget, getattr(ng, 'sv_frame_cache_spill', False))
 
 
 class SvCacheNode(bpy.types.Node, SverchCustomTreeNode):
@@ -32,39 +42,103 @@ class SvCacheNode(bpy.types.Node, SverchCustomTreeNode):
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_CACHE'
 
+    sv_mutates_inputs = False
 
     n_id: StringProperty()
-    
+
+    modes = [
+        ('OFFSET', "Offset", "Output data recorded for frame current - offset", 0),
+        ('FRAMES', "Frames", "Output data of current frame. On frame change, recorded frames are "
+                             "output without processing nodes which are needed only for this node", 1)
+    ]
+
+    mode: EnumProperty(name="Mode", items=modes, default='OFFSET', update=updateNode)
     cache_amount: IntProperty(default=1, min=0)
     cache_offset: IntProperty(default=1, min=0)
-    node_dict = {}
-    
+
     def sv_init(self, context):
         self.inputs.new("SvStringsSocket", "Data")
         self.outputs.new("SvStringsSocket", "Data")
 
     def draw_buttons(self, context, layout):
-        layout.prop(self, "cache_offset")
+        layout.prop(self, "mode", expand=True)
+        if self.mode == 'OFFSET':
+            layout.prop(self, "cache_offset")
+        frames = get_frame_cache(self.id_data).frames(self.node_id)
+        if frames:
+            layout.label(text=f"Frames: {len(frames)} ({frames[0]}-{frames[-1]})")
+        else:
+            layout.label(text="No frames recorded")
+        row = layout.row(align=True)
+        for operation, text in [('BAKE', "Bake"), ('FREE', "Free")]:
+            op = row.operator(SvCacheNodeBake.bl_idname, text=text)
+            op.idtree = self.id_data.name
+            op.idname = self.name
+            op.operation = operation
 
     def sv_update(self):
         changable_sockets(self, "Data", ["Data"])
-        
+
+    def sv_load_frame(self, frame):
+        """
+        Output data recorded for the frame, called by the update system on frame change.
+        Returns False if there is no such data, then the node is processed as usual.
+        """
+        if self.mode != 'FRAMES':
+            return False
+        data = get_frame_cache(self.id_data).get(self.node_id, frame)
+        if data is None:
+            _recording_frames[self.node_id] = frame
+            return False
+        self.outputs[0].sv_set(data)
+        return True
+
+    def sv_free(self):
+        _recording_frames.pop(self.node_id, None)
+        get_frame_cache(self.id_data).remove(self.node_id)
+
     def process(self):
-        n_id = node_id(self)
-        data = self.node_dict.get(n_id)
-        if not data:
-            self.node_dict[n_id] = {}
-            data = self.node_dict.get(n_id)
-            
+        cache = get_frame_cache(self.id_data)
         frame_current = bpy.context.scene.frame_current
-        out_frame = frame_current - self.cache_offset
-        data[frame_current] = self.inputs[0].sv_get()
-        out_data = data.get(out_frame, [])
+        is_recording = _recording_frames.pop(self.node_id, None) == frame_current
+        if self.mode == 'FRAMES' and not is_recording:
+            cache.remove(self.node_id)
+        data = self.inputs[0].sv_get()
+        cache.put(self.node_id, frame_current, data)
+        if self.mode == 'FRAMES':
+            out_data = data
+        else:
+            out_data = cache.get(self.node_id, frame_current - self.cache_offset, [])
         self.outputs[0].sv_set(out_data)
 
-def register():
-    bpy.utils.register_class(SvCacheNode)
 
-def unregister():
-    bpy.utils.unregister_class(SvCacheNode)
+class SvCacheNodeBake(bpy.types.Operator):
+    """Record data of the Cache node for all frames of scene range, or forget recorded data"""
+    bl_idname = "node.sv_cache_node_bake"
+    bl_label = "Bake Cache node"
+
+    idtree: StringProperty(default='')
+    idname: StringProperty(default='')
+    operation: EnumProperty(items=[('BAKE', "Bake", ""), ('FREE', "Free", "")], default='BAKE')
+
+    def execute(self, context):
+        from sverchok.core.update_system import process_to_node
+        node = bpy.data.node_groups[self.idtree].nodes[self.idname]
+        cache = get_frame_cache(node.id_data)
+        cache.remove(node.node_id)
+        if self.operation == 'BAKE':
+            scene = context.scene
+            frame_current = scene.frame_current
+            for frame in range(scene.frame_start, scene.frame_end + 1):
+                scene.frame_set(frame)
+                if (node.node_id, frame) not in cache:
+                    # frame change handler did not process the node
+                    _recording_frames[node.node_id] = frame
+                    process_to_node(node)
+            scene.frame_set(frame_current)
+        return {'FINISHED'}
+
+
+classes = [SvCacheNode, SvCacheNodeBake]
 
+register, unregister = bpy.utils.register_classes_factory(classes)
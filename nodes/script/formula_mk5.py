@@ -6,6 +6,7 @@
 # License-Filename: LICENSE
 
 import ast
+from itertools import chain
 
 from mathutils import Vector
 import numpy as np
@@ -15,10 +16,10 @@ from bpy.props import BoolProperty, StringProperty, EnumProperty, IntProperty
 from sverchok.node_tree import SverchCustomTreeNode
 
 from sverchok.data_structure import (updateNode, throttle_and_update_node,
-                                     list_match_func, numpy_list_match_modes,
+                                     list_match_func, numpy_list_match_func, numpy_list_match_modes,
                                      enum_item_4)
 
-from sverchok.utils.modules.eval_formula import get_variables, safe_eval
+from sverchok.utils.modules.eval_formula import get_variables, safe_eval, compile_formula
 from sverchok.utils.sv_itertools import recurse_f_level_control
 
 def transform_data(data, transform):
@@ -41,22 +42,65 @@ def ensure_list(value):
         return value.tolist()
     return list(value)
 
+def numeric_columns(values):
+    """
+    Values of variables as 1D NumPy arrays of numbers,
+    or None if some of values are not plain numbers.
+    """
+    columns = []
+    for vals in values:
+        try:
+            column = np.asarray(vals)
+        except ValueError:
+            # lists of different length
+            return None
+        if column.ndim != 1 or column.dtype.kind not in 'iuf':
+            return None
+        columns.append(column)
+    return columns
+
 def formula_func(parameters, constant, matching_f):
 
-    formulas, separate, var_names, transformations, as_list = constant
+    formulas, separate, var_names, transformations, as_list, numpy_matching_f = constant
+
+    compiled = [compile_formula(formula) for formula in formulas if formula]
+
+    columns = None
+    if all(tr == 'As_is' for tr in transformations) and any(f.is_vectorizable for f in compiled):
+        columns = numeric_columns(parameters)
+    if columns is not None and all(len(column) for column in columns):
+        # each formula is evaluated for all values at once, if possible
+        columns = numpy_matching_f(columns)
+        count = len(columns[0])
+        variables = dict(zip(var_names, columns))
+        formula_results = []
+        value_lists = None
+        for formula in compiled:
+            result = formula.evaluate_vectorized(variables, count)
+            if result is not None:
+                formula_results.append(result.tolist())
+            else:
+                if value_lists is None:
+                    value_lists = [column.tolist() for column in columns]
+                values = [formula.evaluate(dict(zip(var_names, vals))) for vals in zip(*value_lists)]
+                formula_results.append([ensure_list(value) for value in values] if as_list else values)
+        if separate:
+            return [list(vector) for vector in zip(*formula_results)]
+        if len(formula_results) == 1:
+            return formula_results[0]
+        return list(chain.from_iterable(zip(*formula_results)))
 
     object_results = []
     for values in zip(*matching_f(parameters)):
         vals = [transform_data(d, tr) for d, tr in zip(values, transformations)]
         variables = dict(zip(var_names, vals))
         vector = []
-        for formula in formulas:
-            if formula:
-                value = safe_eval(formula, variables)
-                if as_list:
-                    vector.append(ensure_list(value))
-                else:
-                    vector.append(value)
+        for formula in compiled:
+            value = formula.evaluate(variables)
+            if as_list:
+                vector.append(ensure_list(value))
+            else:
+                vector.append(value)
         if separate:
             object_results.append(vector)
         else:
@@ -310,7 +354,8 @@ class SvFormulaNodeMk5(bpy.types.Node, SverchCustomTreeNode):
             matching_f = list_match_func[self.list_match]
             parameters = matching_f(input_values)
             desired_levels = [s.depth for s in self.inputs]
-            ops = [self.formulas(), self.separate, var_names, [s.transform for s in self.inputs], self.as_list]
+            ops = [self.formulas(), self.separate, var_names, [s.transform for s in self.inputs], self.as_list,
+                   numpy_list_match_func[self.list_match]]
 
             results = recurse_f_level_control(parameters, ops, formula_func, matching_f, desired_levels)
 
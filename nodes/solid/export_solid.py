@@ -78,6 +78,9 @@ else:
         solid_catergory = "Outputs"
         # sv_icon = 'SV_VORONOI'
 
+        # the node writes files
+        sv_disk_cacheable = False
+
         file_types = [
                 ("BREP", "BREP", "", 0),
                 ("IGES", "IGES", "", 1),
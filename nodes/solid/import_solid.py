@@ -18,6 +18,9 @@ else:
         bl_label = 'Import Solid'
         bl_icon = 'IMPORT'
         solid_catergory = "Inputs"
+
+        # the node reads files, which can be changed
+        sv_disk_cacheable = False
         
         def sv_init(self, context):
             self.inputs.new('SvFilePathSocket', "File Path")
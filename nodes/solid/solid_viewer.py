@@ -258,6 +258,10 @@ else:
         bl_icon = 'GREASEPENCIL'
         sv_icon = 'SV_DRAW_VIEWER'
         solid_catergory = "Outputs"
+
+        # the node draws in the viewport
+        sv_disk_cacheable = False
+
         node_dict = {}
 
         def wrapped_update(self, context=None):
@@ -13,6 +13,7 @@ from sverchok.data_structure import updateNode, ensure_nesting_level, zip_long_r
 from sverchok.utils.geom import center
 from sverchok.utils.voronoi import lloyd2d
 from sverchok.utils.field.scalar import SvScalarField
+from sverchok.dependencies import scipy
 
 class SvLloyd2dNode(bpy.types.Node, SverchCustomTreeNode):
     """
@@ -47,6 +48,17 @@ class SvLloyd2dNode(bpy.types.Node, SverchCustomTreeNode):
         default = 3,
         update = updateNode)
 
+    algorithms = [('PYTHON', "Python", "Pure Python implementation of Fortune's algorithm", 0)]
+    if scipy is not None:
+        algorithms.append(('SCIPY', "SciPy", "Use scipy.spatial.Voronoi; much faster for big number of points", 1))
+
+    algorithm: EnumProperty(
+        name = "Algorithm",
+        description = "Implementation used to calculate Voronoi diagrams",
+        items = algorithms,
+        default = 'PYTHON',
+        update = updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', "Vertices")
         self.inputs.new('SvStringsSocket', 'Iterations').prop_name = 'iterations'
@@ -60,6 +72,7 @@ class SvLloyd2dNode(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons_ext(self, context, layout):
         self.draw_buttons(context, layout)
         layout.prop(self, "clip", text="Clipping")
+        layout.prop(self, "algorithm")
 
     def process(self):
 
@@ -83,7 +96,8 @@ class SvLloyd2dNode(bpy.types.Node, SverchCustomTreeNode):
             new_verts = []
             for verts, iterations, weights in zip_long_repeat(*params):
                 iter_verts = lloyd2d(self.bound_mode, verts, iterations,
-                                clip = self.clip, weight_field = weights)
+                                clip = self.clip, weight_field = weights,
+                                algorithm = self.algorithm)
                 new_verts.append(iter_verts)
             if nested_output:
                 verts_out.append(new_verts)
@@ -13,13 +13,13 @@ import numpy as np
 
 import bpy
 from mathutils import Vector
-from mathutils.bvhtree import BVHTree
 from mathutils.geometry import tessellate_polygon, area_tri
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, throttle_and_update_node
 from sverchok.utils.geom import calc_bounds
-from sverchok.utils.sv_mesh_utils import point_inside_mesh
+from sverchok.utils.mesh_inside import get_mesh_inside_tester
+from sverchok.utils.poisson_disk import SvPoissonDiskGrid
 
 class SocketProperties(NamedTuple):
     name: str
@@ -50,15 +50,19 @@ INPUT_CONFIG = [
 class NodeProperties(NamedTuple):
     proportional: bool
     mode : str
+    min_r: float = 0.0
 
 MAX_ITERATIONS = 1000
+BATCH_SIZE = 100
 
-def populate_mesh(verts, faces, count, seed):
-    bvh = BVHTree.FromPolygons(verts, faces)
+def populate_mesh(verts, faces, count, seed, min_r=0.0):
+    tester = get_mesh_inside_tester(verts, faces)
     np.random.seed(seed)
     x_min, x_max, y_min, y_max, z_min, z_max = calc_bounds(verts)
     low = np.array([x_min, y_min, z_min])
     high = np.array([x_max, y_max, z_max])
+    if min_r > 0:
+        return populate_mesh_min_distance(tester, low, high, count, min_r), []
     result = []
     done = 0
     iterations = 0
@@ -66,8 +70,8 @@ def populate_mesh(verts, faces, count, seed):
         if iterations > MAX_ITERATIONS:
             raise Exception("Iterations limit is reached")
         max_pts = max(count, count-done)
-        points = np.random.uniform(low, high, size=(max_pts,3)).tolist()
-        points = [p for p in points if point_inside_mesh(bvh, p)]
+        points = np.random.uniform(low, high, size=(max_pts,3))
+        points = points[tester.contains(points)].tolist()
         n = len(points)
         result.extend(points)
         done += n
@@ -76,6 +80,24 @@ def populate_mesh(verts, faces, count, seed):
             break
     return result, []
 
+def populate_mesh_min_distance(tester, low, high, count, min_r):
+    grid = SvPoissonDiskGrid(min_r = min_r)
+    result = []
+    iterations = 0
+    while len(result) < count:
+        if iterations > MAX_ITERATIONS:
+            raise Exception("Iterations limit is reached")
+        iterations += 1
+        left = count - len(result)
+        points = np.random.uniform(low, high, size=(min(max(BATCH_SIZE, len(result)), left), 3))
+
+        def check(idxs):
+            return tester.contains(points[idxs])
+
+        good = grid.add(points, predicate=check)
+        result.extend(points[good].tolist())
+    return result
+
 def node_process(inputs: InputData, properties: NodeProperties):
     if properties.mode == 'SURFACE':
         me = TriangulatedMesh([Vector(co) for co in inputs.verts], inputs.faces)
@@ -83,9 +105,11 @@ def node_process(inputs: InputData, properties: NodeProperties):
             me.use_even_points_distribution()
         if inputs.face_weight:
             me.set_custom_face_weights(inputs.face_weight)
+        if properties.min_r > 0:
+            return me.generate_random_points_min_distance(inputs.number[0], inputs.seed[0], properties.min_r)
         return me.generate_random_points(inputs.number[0], inputs.seed[0])  # todo [0] <-- ?!
     else:
-        return populate_mesh(inputs.verts, inputs.faces, inputs.number[0], inputs.seed[0])
+        return populate_mesh(inputs.verts, inputs.faces, inputs.number[0], inputs.seed[0], properties.min_r)
 
 class TriangulatedMesh:
     def __init__(self, verts: List[Vector], faces: List[List[int]]):
@@ -122,6 +146,39 @@ class TriangulatedMesh:
             old_face_indexes_per_point.extend([face_index for _ in range(len(tri_random_points))])
         return [v[:] for v in random_points], old_face_indexes_per_point
 
+    def generate_random_points_min_distance(self, random_points_total: int, seed: int, min_r: float) -> Tuple[list, list]:
+        # Faces are chosen with the same weights as in generate_random_points,
+        # but points which are too close to already generated ones are rejected
+        rng = np.random.default_rng(seed)
+        tris = np.array([[self._verts[i][:] for i in f] for f in self._tri_faces])
+        weights = None
+        if self._face_weights:
+            weights = np.array(self._face_weights, dtype=np.float64)
+            weights = weights / weights.sum()
+        old_face_indexes = np.array(self._old_face_indexes_per_tri)
+        grid = SvPoissonDiskGrid(min_r = min_r)
+        random_points = []
+        old_face_indexes_per_point = []
+        iterations = 0
+        while len(random_points) < random_points_total:
+            if iterations > MAX_ITERATIONS:
+                raise Exception("Iterations limit is reached")
+            iterations += 1
+            left = random_points_total - len(random_points)
+            size = min(max(BATCH_SIZE, len(random_points)), left)
+            chosen = rng.choice(len(tris), size=size, p=weights)
+            u1 = rng.random(size)
+            u2 = rng.random(size)
+            outside = u1 + u2 > 1
+            u1[outside] = 1 - u1[outside]
+            u2[outside] = 1 - u2[outside]
+            v1, v2, v3 = tris[chosen, 0], tris[chosen, 1], tris[chosen, 2]
+            points = v1 + (v2 - v1) * u1[:, np.newaxis] + (v3 - v1) * u2[:, np.newaxis]
+            good = grid.add(points)
+            random_points.extend(points[good].tolist())
+            old_face_indexes_per_point.extend(old_face_indexes[chosen[good]].tolist())
+        return random_points, old_face_indexes_per_point
+
     @property
     def tri_face_areas(self):
         if not self._tri_face_areas:
@@ -185,6 +242,12 @@ class SvRandomPointsOnMesh(bpy.types.Node, SverchCustomTreeNode):
             default=True,
             update=updateNode)
 
+    min_r: bpy.props.FloatProperty(
+            name="Min. Distance",
+            description="Minimum distance between generated points; 0 to disable the check",
+            default=0.0, min=0.0,
+            update=updateNode)
+
     @throttle_and_update_node
     def update_sockets(self, context):
         self.outputs['Face index'].hide_safe = self.mode != 'SURFACE'
@@ -204,6 +267,7 @@ class SvRandomPointsOnMesh(bpy.types.Node, SverchCustomTreeNode):
         layout.prop(self, "mode", text='')
         if self.mode == 'SURFACE':
             layout.prop(self, "proportional")
+        layout.prop(self, "min_r")
 
     def sv_init(self, context):
         [self.inputs.new(p.socket_type, p.name) for p in INPUT_CONFIG]
@@ -216,7 +280,7 @@ class SvRandomPointsOnMesh(bpy.types.Node, SverchCustomTreeNode):
         if not all([self.inputs['Verts'].is_linked, self.inputs['Faces'].is_linked]):
             return
 
-        props = NodeProperties(self.proportional, self.mode)
+        props = NodeProperties(self.proportional, self.mode, self.min_r)
         out = [node_process(inputs, props) for inputs in self.get_input_data_iterator(INPUT_CONFIG)]
         [s.sv_set(data) for s, data in zip(self.outputs, zip(*out))]
 
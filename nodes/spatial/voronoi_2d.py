@@ -26,6 +26,7 @@ from sverchok.data_structure import updateNode, zip_long_repeat, throttle_and_up
 from sverchok.utils.voronoi import voronoi_bounded
 from sverchok.utils.geom import center, LineEquation2D, CircleEquation2D
 from sverchok.utils.logging import debug, info
+from sverchok.dependencies import scipy
 
 class Voronoi2DNode(bpy.types.Node, SverchCustomTreeNode):
     """
@@ -91,6 +92,17 @@ class Voronoi2DNode(bpy.types.Node, SverchCustomTreeNode):
         min=3,
         update=updateNode)
 
+    algorithms = [('PYTHON', "Python", "Pure Python implementation of Fortune's algorithm", 0)]
+    if scipy is not None:
+        algorithms.append(('SCIPY', "SciPy", "Use scipy.spatial.Voronoi; much faster for big number of points", 1))
+
+    algorithm: EnumProperty(
+        name = "Algorithm",
+        description = "Implementation used to calculate the diagram",
+        items = algorithms,
+        default = 'PYTHON',
+        update = updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', "Vertices")
         self.inputs.new('SvStringsSocket', 'MaxSides').prop_name = 'max_sides'
@@ -110,6 +122,7 @@ class Voronoi2DNode(bpy.types.Node, SverchCustomTreeNode):
 
     def draw_buttons_ext(self, context, layout):
         self.draw_buttons(context, layout)
+        layout.prop(self, "algorithm")
         if self.make_faces:
             layout.prop(self, 'ordered_faces')
 
@@ -141,7 +154,8 @@ class Voronoi2DNode(bpy.types.Node, SverchCustomTreeNode):
                         draw_hangs = self.draw_hangs,
                         make_faces = self.make_faces,
                         ordered_faces = self.ordered_faces,
-                        max_sides = max_sides)
+                        max_sides = max_sides,
+                        algorithm = self.algorithm)
 
             pts_out.append(new_vertices)
             edges_out.append(edges)
@@ -9,6 +9,7 @@ from sverchok.core.sockets import setup_new_node_location
 from sverchok.data_structure import updateNode, throttle_and_update_node, match_long_repeat
 from sverchok.utils.logging import info, exception
 from sverchok.utils.marching_cubes import isosurface_np
+from sverchok.utils.field.evaluation import evaluate_scalar_field
 from sverchok.dependencies import mcubes, skimage
 from sverchok.utils.nodes_mixins.draft_mode import DraftMode
 
@@ -112,7 +113,7 @@ class SvExMarchingCubesNode(DraftMode, bpy.types.Node, SverchCustomTreeNode):
             modes.append(("skimage", "SciKit-Image", "SciKit-Image", 0))
         if mcubes is not None:
             modes.append(("mcubes", "PyMCubes", "PyMCubes", 1))
-        modes.append(('python', "Pure Python", "Pure Python implementation", 2))
+        modes.append(('python', "Pure Python", "Pure Python (NumPy) implementation", 2))
         return modes
 
     implementation : EnumProperty(
@@ -228,7 +229,7 @@ class SvExMarchingCubesNode(DraftMode, bpy.types.Node, SverchCustomTreeNode):
                 y_range = np.linspace(b1[1], b2[1], num=samples_y)
                 z_range = np.linspace(b1[2], b2[2], num=samples_z)
                 xs, ys, zs = np.meshgrid(x_range, y_range, z_range, indexing='ij')
-                func_values = field.evaluate_grid(xs.flatten(), ys.flatten(), zs.flatten())
+                func_values = evaluate_scalar_field(field, xs.flatten(), ys.flatten(), zs.flatten())
                 func_values = func_values.reshape((samples_x, samples_y, samples_z))
 
             if self.implementation == 'mcubes':
@@ -249,7 +250,7 @@ class SvExMarchingCubesNode(DraftMode, bpy.types.Node, SverchCustomTreeNode):
             else: # python
                 new_verts, new_faces = isosurface_np(func_values, value)
                 new_verts = self.scale_back(b1n, b2n, samples_x, samples_y, samples_z, new_verts)
-                new_verts = new_verts.tolist()
+                new_verts, new_faces = new_verts.tolist(), new_faces.tolist()
                 new_normals = []
 
             prev_field = field
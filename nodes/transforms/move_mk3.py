@@ -57,6 +57,7 @@ class SvMoveNodeMk3(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Move'
     bl_icon = 'ORIENTATION_VIEW'
     sv_icon = 'SV_MOVE'
+    sv_elementwise = True
 
 
     movement_vectors: FloatVectorProperty(
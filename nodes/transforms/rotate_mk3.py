@@ -166,6 +166,7 @@ class SvRotationNodeMk3(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Rotate'
     bl_icon = 'NONE'
     sv_icon = 'SV_ROTATE'
+    sv_elementwise = True
 
 
     centers_: FloatVectorProperty(
@@ -16,9 +16,7 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
-from itertools import cycle
 from mathutils import Vector, Matrix
-from mathutils.geometry import tessellate_polygon as tessellate, normal
 from mathutils.noise import random, seed_set
 import bpy
 from bpy.props import StringProperty, FloatProperty, IntProperty, EnumProperty, BoolProperty, FloatVectorProperty
@@ -27,7 +25,6 @@ import bgl
 import gpu
 from gpu_extras.batch import batch_for_shader
 import sverchok
-from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
 from sverchok.utils.sv_mesh_utils import polygons_to_edges_np
 from sverchok.core.socket_data import SvGetSocketInfo
 from sverchok.data_structure import updateNode, node_id, match_long_repeat, enum_item_5
@@ -36,6 +33,7 @@ from sverchok.ui.bgl_callback_3dview import callback_disable, callback_enable
 from sverchok.utils.sv_batch_primitives import MatrixDraw28
 from sverchok.utils.sv_shader_sources import dashed_vertex_shader, dashed_fragment_shader
 from sverchok.utils.geom import multiply_vectors_deep
+from sverchok.utils.mesh_draw_buffers import build_mesh_buffers
 
 
 socket_dict = {
@@ -69,55 +67,6 @@ default_fragment_shader = '''
     }
 '''
 
-def ensure_triangles(coords, indices, handle_concave_quads):
-    """
-    this fully tesselates the incoming topology into tris,
-    not optimized for meshes that don't contain ngons
-    """
-    new_indices = []
-    face_index = []
-    concat = new_indices.append
-    concat2 = new_indices.extend
-    for idf, idxset in enumerate(indices):
-        num_verts = len(idxset)
-        if num_verts == 3:
-            concat(tuple(idxset))
-            face_index.append(idf)
-        elif num_verts == 4 and not handle_concave_quads:
-            # a b c d  ->  [a, b, c], [a, c, d]
-            concat2([(idxset[0], idxset[1], idxset[2]), (idxset[0], idxset[2], idxset[3])])
-            face_index.extend([idf, idf])
-        else:
-            subcoords = [Vector(coords[idx]) for idx in idxset]
-            for pol in tessellate([subcoords]):
-                concat([idxset[i] for i in pol])
-                face_index.append(idf)
-    return new_indices, face_index
-
-
-def fill_points_colors(vectors_color, data, color_per_point, random_colors):
-    points_color = []
-    if color_per_point:
-        for cols, sub_data in zip(cycle(vectors_color), data):
-            if random_colors:
-                for  n in sub_data:
-                    points_color.append([random(), random(), random(), 1])
-            else:
-                for col, n in zip(cycle(cols), sub_data):
-                    points_color.append(col)
-
-    else:
-        for nums, col in zip(data, cycle(vectors_color[0])):
-            if random_colors:
-                r_color = [random(), random(), random(), 1]
-                for n in nums:
-                    points_color.append(r_color)
-            else:
-                for n in nums:
-                    points_color.append(col)
-
-    return points_color
-
 def draw_matrix(context, args):
     """ this takes one or more matrices packed into an iterable """
     matrices, scale = args
@@ -208,256 +157,33 @@ def view_3d_geom(context, args):
     bgl.glEnable(bgl.GL_BLEND)
 
 
-def splitted_polygons_geom(polygon_indices, original_idx, v_path, cols, idx_offset):
-    '''geometry of the splitted polygons (splitted to assign colors)'''
-    total_p_verts = 0
-    p_vertices, vertex_colors, indices = [], [], []
-
-    for pol, idx in zip(polygon_indices, original_idx):
-        p_vertices.extend([v_path[c] for c in pol])
-
-        vertex_colors.extend([cols[idx % len(cols)] for c in pol])
-        pol_offset = idx_offset + total_p_verts
-        indices.append(list(range(pol_offset, pol_offset + len(pol))))
-        total_p_verts += len(pol)
-
-    return p_vertices, vertex_colors, indices, total_p_verts
-
-
-def splitted_facet_polygons_geom(polygon_indices, original_idx, v_path, cols, idx_offset, normals, light):
-    '''geometry of the splitted polygons (splitted to assign colors* normals)'''
-    total_p_verts = 0
-    p_vertices, vertex_colors, indices = [], [], []
-
-    for pol, idx in zip(polygon_indices, original_idx):
-        p_vertices.extend([v_path[c] for c in pol])
-        factor = (normals[idx].dot(light))*0.5+0.5
-        col = cols[idx % len(cols)]
-        col_pol = [col[0] * factor, col[1] * factor, col[2] * factor, col[3]]
-        colors = [col_pol for c in pol]
-
-        vertex_colors.extend(colors)
-        pol_offset = idx_offset + total_p_verts
-        indices.append(list(range(pol_offset, pol_offset + len(pol))))
-
-        total_p_verts += len(pol)
-
-    return p_vertices, vertex_colors, indices, total_p_verts
-
-
-def splitted_facet_polygons_geom_v_cols(polygon_indices, original_idx, v_path, cols, idx_offset, normals, light):
-    '''geometry of the splitted polygons (splitted to assign vertex_colors * face_normals)'''
-
-    total_p_verts = 0
-    p_vertices, vertex_colors, indices = [], [], []
-
-    for pol, idx in zip(polygon_indices, original_idx):
-        p_vertices.extend([v_path[c] for c in pol])
-        factor = (normals[idx].dot(light)) * 0.5 + 0.5
-        colors = []
-
-        for c in pol:
-            col = cols[c % len(cols)]
-            colors.append([col[0] * factor, col[1] * factor, col[2] * factor, col[3]])
-
-        vertex_colors.extend(colors)
-        pol_offset = idx_offset + total_p_verts
-        indices.append(list(range(pol_offset, pol_offset + len(pol))))
-        total_p_verts += len(pol)
-
-    return p_vertices, vertex_colors, indices, total_p_verts
-
-
-def splitted_smooth_polygons_geom(polygon_indices, original_idx, v_path, cols, idx_offset, normals, light):
-    '''geometry of the splitted polygons (splitted to assign face_colors * vertex_normals)'''
-
-    total_p_verts = 0
-    p_vertices, vertex_colors, indices = [], [], []
-
-    for pol, idx in zip(polygon_indices, original_idx):
-        p_vertices.extend([v_path[c] for c in pol])
-        colors = []
-        col = cols[idx % len(cols)]
-        for c in pol:
-            factor = (normals[c].dot(light)) * 0.5 + 0.5
-            colors.append([col[0] * factor, col[1] * factor, col[2] * factor, col[3]])
-
-        vertex_colors.extend(colors)
-        pol_offset = idx_offset + total_p_verts
-        indices.append(list(range(pol_offset, pol_offset + len(pol))))
-        total_p_verts += len(pol)
-
-    return p_vertices, vertex_colors, indices, total_p_verts
-
-
-def get_vertex_normals(vecs, polygons):
-    mesh = bmesh_from_pydata(vecs, [], polygons, normal_update=True)
-    return [Vector(vert.normal) for vert in mesh.verts]
-
-
-def polygons_geom(config, vecs, polygons, p_vertices, p_vertex_colors, p_indices, v_path, p_cols, idx_p_offset, points_colors):
-    '''generates polygons geometry'''
-
-    if (config.color_per_polygon and not config.polygon_use_vertex_color) or config.shade_mode == 'facet':
-
-        polygon_indices, original_idx = ensure_triangles(vecs, polygons, config.handle_concave_quads)
-
-        if config.shade_mode == 'facet':
-            normals = [normal(*[Vector(vecs[c]) for c in p]) for p in polygons]
-
-            if config.polygon_use_vertex_color:
-                p_v, v_c, idx, total_p_verts = splitted_facet_polygons_geom_v_cols(polygon_indices, original_idx, v_path, points_colors, idx_p_offset[0], normals, config.vector_light)
-            else:
-                p_v, v_c, idx, total_p_verts = splitted_facet_polygons_geom(polygon_indices, original_idx, v_path, p_cols, idx_p_offset[0], normals, config.vector_light)
-
-        elif config.shade_mode == 'smooth':
-            normals = get_vertex_normals(vecs, polygons)
-            p_v, v_c, idx, total_p_verts = splitted_smooth_polygons_geom(polygon_indices, original_idx, v_path, p_cols, idx_p_offset[0], normals, config.vector_light)
-
-        else:
-            p_v, v_c, idx, total_p_verts = splitted_polygons_geom(polygon_indices, original_idx, v_path, p_cols, idx_p_offset[0])
-
-        p_vertices.extend(p_v)
-        p_vertex_colors.extend(v_c)
-        p_indices.extend(idx)
-    else:
-        polygon_indices, original_idx = ensure_triangles(vecs, polygons, config.handle_concave_quads)
-        p_vertices.extend(v_path)
-
-        if config.shade_mode == 'smooth':
-            normals = get_vertex_normals(v_path, polygons)
-            colors = []
-            if config.polygon_use_vertex_color:
-                for normal_v, col in zip(normals, points_colors):
-
-                    factor = normal_v.dot(config.vector_light)*0.5+0.5
-                    colors.append([col[0]*factor, col[1]*factor, col[2]*factor, col[3]])
-            else:
-                col = p_cols
-                for normal_v in normals:
-                    factor = normal_v.dot(config.vector_light)*0.5+0.5
-                    colors.append([col[0]*factor, col[1]*factor, col[2]*factor, col[3]])
-            p_vertex_colors.extend(colors)
-        else:
-            if not config.uniform_pols:
-                p_vertex_colors.extend([p_cols for v in v_path])
-        if idx_p_offset[0]:
-            p_indices.extend([[c + idx_p_offset[0] for c in p] for p in polygon_indices])
-        else:
-            p_indices.extend(polygon_indices)
-        total_p_verts = len(vecs)
-    idx_p_offset[0] += total_p_verts
-
-
-def edges_geom(config, edges, e_col, v_path, e_vertices, e_vertex_colors, e_indices, idx_e_offset):
-    '''generates edges geometry'''
-    if config.color_per_edge and not config.edges_use_vertex_color:
-        for (idx0, idx1), col in zip(edges, cycle(e_col)):
-            e_vertices.extend([v_path[idx0], v_path[idx1]])
-            e_vertex_colors.extend([col, col])
-            e_indices.append([len(e_vertices)-2, len(e_vertices)-1])
-
-    else:
-        e_vertices.extend(v_path)
-        if not config.edges_use_vertex_color or not config.uniform_edges:
-            e_vertex_colors.extend([e_col for v in v_path])
-        if idx_e_offset[0]:
-            offset = idx_e_offset[0]
-            e_indices.extend([[c + offset for c in e] for e in edges])
-        else:
-            e_indices.extend(edges)
-
-        idx_e_offset[0] += len(v_path)
-
-
 def generate_mesh_geom(config, vecs_in):
     '''generates drawing from mesh data'''
-    geom = lambda: None
-
-    if not config.color_per_point and len(config.vector_color) == 1 and len(config.vector_color[0]) == 1:
-        config.uniform_verts = True
-    else:
-        config.uniform_verts = False
-
-    config.uniform_pols = False
-    if config.color_per_polygon:
-        pol_color = config.poly_color
-    else:
-        if config.shade_mode == 'facet':
-            pol_color = [[c] for c in config.poly_color[0]]
-        else:
-            pol_color = config.poly_color[0]
-            if config.shade_mode == 'flat' and len(pol_color) == 1:
-                config.uniform_pols = True
-
-    config.uniform_edges = False
-    if config.color_per_edge:
-        edge_color = config.edge_color
-    else:
-        edge_color = config.edge_color[0]
-        if len(edge_color) == 1:
-            config.uniform_edges = True
 
-    edges_s = config.edges
-    polygons_s = config.polygons
-
-    v_vertices = []
-    e_vertices, e_vertex_colors, e_indices = [], [], []
-    p_vertices, p_vertex_colors, p_indices = [], [], []
-
-    idx_p_offset = [0]
-    idx_e_offset = [0]
-
-    if config.matrix[0]:
-        vecs_in, mats_in = match_long_repeat([vecs_in, config.matrix])
-        use_matrix = True
+    if len(config.matrix[0]):
+        vecs_in, matrices = match_long_repeat([vecs_in, config.matrix])
     else:
-        mats_in = cycle(config.matrix)
-        use_matrix = False
+        matrices = None
 
-
-
-    if (config.draw_verts and not config.uniform_verts) or (config.draw_edges and config.edges_use_vertex_color) or (config.draw_polys and config.polygon_use_vertex_color):
-        points_color = fill_points_colors(config.vector_color, vecs_in, config.color_per_point, config.random_colors)
-    else:
-        points_color = []
-
-    for vecs, mat, polygons, edges, p_cols, e_col in zip(vecs_in, mats_in, cycle(polygons_s), cycle(edges_s), cycle(pol_color), cycle(edge_color)):
-        if use_matrix:
-            v_path = [(mat @ Vector(v))[:] for v in vecs]
-        else:
-            v_path = vecs
-        v_vertices.extend(v_path)
-        if config.draw_edges:
-            edges_geom(config, edges, e_col, v_path, e_vertices, e_vertex_colors, e_indices, idx_e_offset)
-        if config.draw_polys:
-            polygons_geom(config, vecs, polygons, p_vertices, p_vertex_colors, p_indices, v_path, p_cols, idx_p_offset, points_color)
+    geom = build_mesh_buffers(config, vecs_in, matrices, random=random)
 
     if config.draw_verts:
         if config.uniform_verts:
             config.v_shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
         else:
             config.v_shader = gpu.shader.from_builtin('3D_SMOOTH_COLOR')
-        geom.v_vertices, geom.points_color = v_vertices, points_color
 
     if config.draw_edges:
-        if config.edges_use_vertex_color and e_vertices:
-            e_vertex_colors = points_color
         if config.uniform_edges:
             config.e_shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
         else:
             config.e_shader = gpu.shader.from_builtin('3D_SMOOTH_COLOR')
-        geom.e_vertices, geom.e_vertex_colors, geom.e_indices = e_vertices, e_vertex_colors, e_indices
-
 
     if config.draw_polys and config.shade_mode != 'fragment':
         if config.uniform_pols:
             config.p_shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
         else:
-            if config.polygon_use_vertex_color and config.shade_mode not in ['facet', 'smooth']:
-                p_vertex_colors = points_color
             config.p_shader = gpu.shader.from_builtin('3D_SMOOTH_COLOR')
-        geom.p_vertices, geom.p_vertex_colors, geom.p_indices = p_vertices, p_vertex_colors, p_indices
 
     elif config.shade_mode == 'fragment' and config.draw_polys:
 
@@ -475,7 +201,6 @@ def generate_mesh_geom(config, vecs_in):
             config.p_shader = gpu.types.GPUShader(config.node.custom_vertex_shader, config.node.custom_fragment_shader)
         else:
             config.p_shader = gpu.types.GPUShader(default_vertex_shader, default_fragment_shader)
-        geom.p_vertices, geom.p_vertex_colors, geom.p_indices = p_vertices, p_vertex_colors, p_indices
 
     return geom
 
@@ -532,7 +257,7 @@ class SvViewerDrawMk4(bpy.types.Node, SverchCustomTreeNode):
 
     handle_concave_quads: BoolProperty(
         name='Handle Concave Quads', default=False, update=updateNode,
-        description='tessellate quads using geometry.tessellate_polygon, expect some speed impact')
+        description='check quads for concavity and triangulate concave ones properly, expect some speed impact')
 
     point_size: IntProperty(
         min=1, default=4, name='Verts Size',
@@ -195,6 +195,21 @@ class SverchokPreferences(AddonPreferences):
         size=3, min=0.0, max=1.0,
         default=(1, 1, 1), subtype='COLOR')
 
+    # disk cache of node outputs, see utils/disk_cache.py
+    disk_cache_directory: StringProperty(
+        name="Disk cache folder",
+        description="Folder for stored outputs of nodes of trees with enabled disk cache; "
+                    "a folder in Blender user data directory is used if empty. "
+                    "The folder must belong to the current user and must not be writable by others",
+        default="", subtype='DIR_PATH',
+        update=update_system.update_disk_cache_settings)
+
+    disk_cache_size: IntProperty(
+        name="Disk cache size (MB)",
+        description="Maximum size of the disk cache, least recently used outputs are removed first",
+        default=1024, min=1,
+        update=update_system.update_disk_cache_settings)
+
     # Profiling settings
     profiling_sections = [
         ("NONE", "Disable", "Disable profiling", 0),
@@ -448,6 +463,11 @@ class SverchokPreferences(AddonPreferences):
         col2box.prop(self, "heat_map")
         col2box.prop(self, "developer_mode")
 
+        cache_box = col2.box()
+        cache_box.label(text="Disk cache:")
+        cache_box.prop(self, "disk_cache_directory", text="Folder")
+        cache_box.prop(self, "disk_cache_size", text="Size (MB)")
+
         log_box = col2.box()
         log_box.label(text="Logging:")
         log_box.prop(self, "log_level")
@@ -0,0 +1,49 @@
+from runner import benchmark
+
+from sverchok.data_structure import (match_long_repeat, match_long_cycle, match_cross,
+        repeat_last_for_length, fullList, get_data_nesting_level)
+
+
+def make_lists(size):
+    verts = [(float(i), float(i), 0.0) for i in range(size)]
+    radii = [0.5, 1.0, 1.5]
+    counts = list(range(size // 2))
+    return [verts, radii, counts]
+
+
+@benchmark("match_long_repeat", sizes=[1000, 100000, 1000000])
+def bench_match_long_repeat(size):
+    lists = make_lists(size)
+    return lambda: match_long_repeat(lists)
+
+
+@benchmark("match_long_cycle", sizes=[1000, 100000, 1000000])
+def bench_match_long_cycle(size):
+    lists = make_lists(size)
+    return lambda: match_long_cycle(lists)
+
+
+@benchmark("match_cross", sizes=[100, 300])
+def bench_match_cross(size):
+    lists = [list(range(size)), list(range(size))]
+    return lambda: match_cross(lists)
+
+
+@benchmark("repeat_last_for_length", sizes=[1000, 100000, 1000000])
+def bench_repeat_last_for_length(size):
+    data = list(range(size // 10))
+    return lambda: repeat_last_for_length(data, size)
+
+
+@benchmark("full_list", sizes=[1000, 100000, 1000000])
+def bench_full_list(size):
+    data = list(range(size // 10))
+    def run():
+        fullList(list(data), size)
+    return run
+
+
+@benchmark("get_data_nesting_level", sizes=[1000, 100000])
+def bench_get_data_nesting_level(size):
+    data = [[(0.0, 0.0, 0.0)] * size] * 10
+    return lambda: get_data_nesting_level(data)
@@ -0,0 +1,116 @@
+import numpy as np
+
+from runner import benchmark
+
+from sverchok.utils.field.scalar import (SvScalarFieldPointDistance, SvScalarFieldLambda, SvScalarFieldBinOp,
+            ScalarFieldCurvatureCalculator, SvScalarFieldMeanCurvature)
+from sverchok.utils.field.vector import SvVectorFieldPointDistance, SvScalarFieldGradient
+from sverchok.utils.marching_cubes import isosurface_np
+from sverchok.utils.field.evaluation import evaluate_scalar_field
+
+
+def make_grid(n_points, seed=1):
+    rng = np.random.default_rng(seed)
+    points = rng.random((n_points, 3)) * 2.0 - 1.0
+    return points[:, 0], points[:, 1], points[:, 2]
+
+
+def gyroid(xs, ys, zs, vs):
+    return np.sin(xs) * np.cos(ys) + np.sin(ys) * np.cos(zs) + np.sin(zs) * np.cos(xs) + vs
+
+
+def make_formula_field():
+    distance = SvScalarFieldPointDistance(np.array([0.0, 0.0, 0.0]))
+    return SvScalarFieldLambda(None, dict(), distance, function_numpy=gyroid)
+
+
+@benchmark("scalar_field_distance", sizes=[10000, 100000, 1000000])
+def scalar_field_distance(size):
+    field = SvScalarFieldPointDistance(np.array([0.1, 0.2, 0.3]))
+    xs, ys, zs = make_grid(size)
+    return lambda: field.evaluate_grid(xs, ys, zs)
+
+
+@benchmark("scalar_field_formula", sizes=[10000, 100000, 1000000])
+def scalar_field_formula(size):
+    field = make_formula_field()
+    xs, ys, zs = make_grid(size)
+    return lambda: field.evaluate_grid(xs, ys, zs)
+
+
+def make_deep_field(depth=10):
+    field = make_formula_field()
+    for i in range(depth):
+        distance = SvScalarFieldPointDistance(np.array([0.1 * i, 0.0, 0.0]))
+        field = SvScalarFieldBinOp(field, distance, lambda a, b: np.minimum(a, b) + 0.5 * np.abs(a - b))
+    return field
+
+
+@benchmark("scalar_field_deep", sizes=[10000, 100000, 1000000])
+def scalar_field_deep(size):
+    field = make_deep_field()
+    xs, ys, zs = make_grid(size)
+    return lambda: field.evaluate_grid(xs, ys, zs)
+
+
+@benchmark("scalar_field_deep_chunked", sizes=[10000, 100000, 1000000])
+def scalar_field_deep_chunked(size):
+    field = make_deep_field()
+    xs, ys, zs = make_grid(size)
+    return lambda: evaluate_scalar_field(field, xs, ys, zs)
+
+
+@benchmark("scalar_field_deep_threads", sizes=[10000, 100000, 1000000])
+def scalar_field_deep_threads(size):
+    field = make_deep_field()
+    xs, ys, zs = make_grid(size)
+    return lambda: evaluate_scalar_field(field, xs, ys, zs, threads=4)
+
+
+@benchmark("scalar_field_gradient", sizes=[10000, 100000, 1000000])
+def scalar_field_gradient(size):
+    field = SvScalarFieldGradient(make_formula_field(), 0.001)
+    xs, ys, zs = make_grid(size)
+    return lambda: field.evaluate_grid(xs, ys, zs)
+
+
+def make_analytic_field(depth=5):
+    field = SvScalarFieldPointDistance(np.array([0.0, 0.0, 0.0]), falloff=lambda rs: np.exp(-rs))
+    for i in range(depth):
+        distance = SvScalarFieldPointDistance(np.array([0.1 * i, 0.0, 0.0]))
+        field = SvScalarFieldBinOp(field, distance, lambda a, b: a * b, partials=lambda a, b: (b, a, 0, 1, 0))
+    return field
+
+
+@benchmark("scalar_field_gradient_analytic", sizes=[10000, 100000, 1000000])
+def scalar_field_gradient_analytic(size):
+    field = SvScalarFieldGradient(make_analytic_field(), 0.001)
+    xs, ys, zs = make_grid(size)
+    return lambda: field.evaluate_grid(xs, ys, zs)
+
+
+@benchmark("scalar_field_curvature", sizes=[10000, 100000])
+def scalar_field_curvature(size):
+    field = make_formula_field()
+    xs, ys, zs = make_grid(size)
+    def run():
+        calculator = ScalarFieldCurvatureCalculator(field, 0.001)
+        SvScalarFieldMeanCurvature(field, calculator).evaluate_grid(xs, ys, zs)
+    return run
+
+
+@benchmark("vector_field_attractor", sizes=[10000, 100000, 1000000])
+def vector_field_attractor(size):
+    field = SvVectorFieldPointDistance(np.array([0.1, 0.2, 0.3]), falloff=lambda rs: np.exp(-rs))
+    xs, ys, zs = make_grid(size)
+    return lambda: field.evaluate_grid(xs, ys, zs)
+
+
+@benchmark("marching_cubes", sizes=[32, 64, 128])
+def marching_cubes(size):
+    # size is the number of samples along each axis
+    field = make_formula_field()
+    coords = np.linspace(-3.0, 3.0, size)
+    xs, ys, zs = np.meshgrid(coords, coords, coords, indexing='ij')
+    data = field.evaluate_grid(xs.ravel(), ys.ravel(), zs.ravel()).reshape((size, size, size))
+    return lambda: isosurface_np(data, 1.0)
@@ -0,0 +1,25 @@
+import numpy as np
+
+from runner import benchmark
+
+from sverchok.utils.modules.eval_formula import compile_formula, safe_eval
+
+
+def make_values(size, seed=1):
+    rng = np.random.default_rng(seed)
+    return rng.random(size) * 2.0 - 1.0, rng.random(size)
+
+
+@benchmark("formula_vectorized", sizes=[1000, 100000, 1000000])
+def bench_formula_vectorized(size):
+    xs, ys = make_values(size)
+    formula = compile_formula("sin(x) * y + x ** 2 if x > 0 else sqrt(y)")
+    return lambda: formula.evaluate_vectorized(dict(x=xs, y=ys), size).tolist()
+
+
+@benchmark("formula_element_wise", sizes=[1000, 100000])
+def bench_formula_element_wise(size):
+    xs, ys = make_values(size)
+    xs, ys = xs.tolist(), ys.tolist()
+    string = "sin(x) * y + x ** 2 if x > 0 else sqrt(y)"
+    return lambda: [safe_eval(string, dict(x=x, y=y)) for x, y in zip(xs, ys)]
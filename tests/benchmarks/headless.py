@@ -0,0 +1,128 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Support for importing Sverchok modules outside of Blender.
+
+setup() does two things:
+
+* if Blender modules (bpy, mathutils, bmesh...) can not be imported, it
+  installs an import hook, which creates stub modules for them. Any attribute
+  of a stub module is a stub class, which can be subclassed, called, used as
+  a decorator and so on; so modules which only declare operators, properties
+  and so on at import time can be imported. Of course, any code which really
+  calls Blender API will not work with these stubs.
+* if `sverchok` package is not imported yet, it registers an empty package
+  pointing to the addon directory, so `sverchok.utils.*` modules can be
+  imported without registering the whole addon.
+
+Inside Blender, with the addon enabled, setup() does nothing.
+"""
+
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import types
+
+BLENDER_MODULES = ["bpy", "bpy_extras", "bpy_types", "mathutils", "bmesh",
+                   "bgl", "blf", "gpu", "gpu_extras", "nodeitems_utils", "aud", "idprop"]
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Whether stubs are used instead of real Blender modules
+is_stubbed = False
+
+
+class _StubMeta(type):
+    def __getattr__(cls, name):
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+        return _stub_class(name)
+
+    def __call__(cls, *args, **kwargs):
+        return _stub_class(cls.__name__)
+
+    def __iter__(cls):
+        return iter(())
+
+    def __len__(cls):
+        return 0
+
+    def __getitem__(cls, key):
+        return _stub_class(str(key))
+
+    def __contains__(cls, item):
+        return False
+
+    def __or__(cls, other):
+        return cls
+
+    __ror__ = __or__
+
+
+def _stub_class(name):
+    return _StubMeta(name, (), {"__module__": "headless_stub"})
+
+
+class _StubModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+        value = _stub_class(name)
+        setattr(self, name, value)
+        return value
+
+
+class _StubLoader(importlib.abc.Loader):
+    def create_module(self, spec):
+        module = _StubModule(spec.name)
+        module.__path__ = []
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+class _StubFinder(importlib.abc.MetaPathFinder):
+    def __init__(self, names):
+        self.names = set(names)
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname.split('.')[0] in self.names:
+            return importlib.machinery.ModuleSpec(fullname, _StubLoader(), is_package=True)
+        return None
+
+
+def _missing_modules():
+    missing = []
+    for name in BLENDER_MODULES:
+        if name in sys.modules:
+            continue
+        if importlib.util.find_spec(name) is None:
+            missing.append(name)
+    return missing
+
+
+def setup():
+    """
+    Make Sverchok modules importable. Returns True if Blender modules are stubbed.
+    """
+    global is_stubbed
+    missing = _missing_modules()
+    if missing and not any(isinstance(f, _StubFinder) for f in sys.meta_path):
+        sys.meta_path.append(_StubFinder(missing))
+        is_stubbed = "bpy" in missing or is_stubbed
+
+    if "sverchok" not in sys.modules:
+        package = types.ModuleType("sverchok")
+        package.__file__ = os.path.join(ADDON_DIR, "__init__.py")
+        package.__path__ = [ADDON_DIR]
+        package.__package__ = "sverchok"
+        sys.modules["sverchok"] = package
+    return is_stubbed
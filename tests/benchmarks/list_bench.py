@@ -0,0 +1,57 @@
+import numpy as np
+
+from runner import benchmark
+
+from sverchok.data_structure import numpy_match_long_repeat, numpy_match_cross2
+from sverchok.utils.listutils import preobrazovatel, joiner, myZip_2, zip_arrays
+from sverchok.utils.modules.statistics_functions import get_median_np, get_histogram_np
+
+
+def make_objects(size, n_objects=10, dims=(3,)):
+    rng = np.random.default_rng(1)
+    return [rng.random((size // n_objects,) + dims) for _ in range(n_objects)]
+
+
+@benchmark("list_match_arrays", sizes=[1000, 100000, 1000000])
+def bench_list_match_arrays(size):
+    arrays = [np.arange(size, dtype=np.float64), np.arange(size // 3, dtype=np.float64)]
+    return lambda: numpy_match_long_repeat(arrays)
+
+
+@benchmark("list_match_cross_arrays", sizes=[1000, 100000, 1000000])
+def bench_list_match_cross_arrays(size):
+    arrays = [np.arange(size // 100, dtype=np.float64), np.arange(100, dtype=np.float64)]
+    return lambda: numpy_match_cross2(arrays)
+
+
+@benchmark("list_zip_arrays", sizes=[1000, 100000, 1000000])
+def bench_list_zip_arrays(size):
+    arrays = [np.arange(size, dtype=np.float64), np.arange(size, dtype=np.float64)]
+    return lambda: zip_arrays(arrays)
+
+
+@benchmark("list_join_arrays", sizes=[1000, 100000, 1000000])
+def bench_list_join_arrays(size):
+    slots = [make_objects(size // 2), make_objects(size // 2)]
+    return lambda: joiner(slots, 2)
+
+
+@benchmark("list_mix_arrays", sizes=[1000, 100000, 1000000])
+def bench_list_mix_arrays(size):
+    slots = [make_objects(size // 2), make_objects(size // 2)]
+    return lambda: myZip_2(slots, 2)
+
+
+@benchmark("list_levels_arrays", sizes=[1000, 100000, 1000000])
+def bench_list_levels_arrays(size):
+    data = [make_objects(size)]
+    return lambda: preobrazovatel(data, [1, 3])
+
+
+@benchmark("list_statistics_arrays", sizes=[1000, 100000, 1000000])
+def bench_list_statistics_arrays(size):
+    values = np.random.default_rng(2).random(size)
+    def run():
+        get_median_np(values)
+        get_histogram_np(values, 10)
+    return run
@@ -0,0 +1,156 @@
+import numpy as np
+
+from runner import benchmark
+
+from sverchok.dependencies import scipy
+from sverchok.utils.kdtree import SvKdTree
+from sverchok.utils.voronoi import voronoi_bounded, lloyd2d
+from sverchok.utils.relax_mesh import lloyd_relax, edges_relax, NONE, AVERAGE
+from sverchok.utils.sv_mesh_utils import polygons_to_edges, pols_to_edges_irregular_mesh, mesh_join
+from sverchok.utils.mesh_weld import weld_mesh
+from sverchok.utils.mesh_inside import SvMeshInsideTester
+from sverchok.utils.poisson_disk import SvPoissonDiskGrid
+
+
+def make_sites(n, seed=1):
+    rng = np.random.default_rng(seed)
+    return [(x, y, 0.0) for x, y in rng.random((n, 2))]
+
+
+def make_noisy_grid(side, seed=1):
+    rng = np.random.default_rng(seed)
+    coords = np.linspace(0.0, 1.0, side)
+    xs, ys = np.meshgrid(coords, coords, indexing='ij')
+    zs = rng.random(xs.shape) * 0.05
+    verts = np.stack((xs, ys, zs), axis=-1).reshape((-1, 3)).tolist()
+    idx = np.arange(side * side).reshape((side, side))
+    faces = np.stack((idx[:-1, :-1], idx[1:, :-1], idx[1:, 1:], idx[:-1, 1:]), axis=-1).reshape((-1, 4)).tolist()
+    return verts, faces
+
+
+@benchmark("voronoi_2d_scipy", sizes=[1000, 10000], requires=[scipy])
+def voronoi_2d_scipy(size):
+    sites = make_sites(size)
+    return lambda: voronoi_bounded(sites, bound_mode='BOX', clip=0.1, make_faces=True,
+                        ordered_faces=True, max_sides=20, algorithm='SCIPY')
+
+
+@benchmark("voronoi_2d_python", sizes=[100, 1000], blender=True)
+def voronoi_2d_python(size):
+    sites = make_sites(size)
+    return lambda: voronoi_bounded(sites, bound_mode='BOX', clip=0.1, make_faces=True,
+                        ordered_faces=True, max_sides=20, algorithm='PYTHON')
+
+
+# lloyd2d() looks for coinciding points with mathutils.kdtree
+@benchmark("lloyd_2d_scipy", sizes=[100, 1000], blender=True, requires=[scipy])
+def lloyd_2d_scipy(size):
+    sites = make_sites(size)
+    return lambda: lloyd2d('BOX', sites, 3, clip=0.1, algorithm='SCIPY')
+
+
+@benchmark("relax_mesh_lloyd", sizes=[10, 30], blender=True)
+def relax_mesh_lloyd(size):
+    verts, faces = make_noisy_grid(size)
+    return lambda: lloyd_relax(verts, faces, 3, method=NONE)
+
+
+@benchmark("relax_mesh_edges", sizes=[10, 30], blender=True)
+def relax_mesh_edges(size):
+    verts, faces = make_noisy_grid(size)
+    edges = polygons_to_edges([faces], unique_edges=True)[0]
+    return lambda: edges_relax(verts, edges, faces, 3, 0.5, method=NONE, target=AVERAGE)
+
+
+@benchmark("kdtree_scipy_query", sizes=[1000, 10000, 100000], requires=[scipy])
+def kdtree_scipy_query(size):
+    rng = np.random.default_rng(1)
+    points = rng.random((size, 3))
+    needles = rng.random((size, 3))
+    def run():
+        tree = SvKdTree.new(SvKdTree.SCIPY, points)
+        tree.query_array(needles, count=5)
+    return run
+
+
+@benchmark("kdtree_blender_query", sizes=[1000, 10000, 100000], blender=True)
+def kdtree_blender_query(size):
+    rng = np.random.default_rng(1)
+    points = rng.random((size, 3))
+    needles = rng.random((size, 3))
+    def run():
+        tree = SvKdTree.new(SvKdTree.BLENDER, points)
+        tree.query_array(needles, count=5)
+    return run
+
+
+@benchmark("poisson_disk_grid", sizes=[1000, 10000, 100000])
+def poisson_disk_grid(size):
+    # size candidates in a box where about half of them fit
+    points = np.random.default_rng(1).random((size, 3))
+    min_r = 0.7 / size ** (1.0 / 3.0)
+    def run():
+        grid = SvPoissonDiskGrid(min_r = min_r)
+        for i in range(0, size, 1000):
+            grid.add(points[i:i+1000])
+    return run
+
+
+def make_mixed_faces(n_faces, seed=1):
+    rng = np.random.default_rng(seed)
+    return [rng.integers(0, n_faces, int(k)).tolist() for k in rng.integers(3, 7, n_faces)]
+
+
+@benchmark("pols_to_edges_irregular", sizes=[1000, 10000, 100000])
+def pols_to_edges_irregular(size):
+    faces = make_mixed_faces(size)
+    return lambda: pols_to_edges_irregular_mesh(faces, unique_edges=True)
+
+
+@benchmark("mesh_join", sizes=[100, 1000, 10000])
+def bench_mesh_join(size):
+    verts, faces = make_noisy_grid(5)
+    edges = [(f[0], f[1]) for f in faces]
+    return lambda: mesh_join([verts] * size, [edges] * size, [faces] * size)
+
+
+def make_separate_quads(side, seed=1):
+    """Quads of a grid, each with its own vertices, slightly displaced"""
+    coords = np.arange(side, dtype=np.float64)
+    xs, ys = np.meshgrid(coords, coords, indexing='ij')
+    corners = np.stack((xs, ys, np.zeros_like(xs)), axis=-1).reshape((-1, 1, 3))
+    quad = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=np.float64)
+    verts = (corners + quad).reshape((-1, 3))
+    verts += np.random.default_rng(seed).random(verts.shape) * 1e-5
+    return verts, np.arange(len(verts)).reshape((-1, 4))
+
+
+@benchmark("merge_by_distance", sizes=[10000, 100000, 1000000])
+def bench_merge_by_distance(size):
+    verts, faces = make_separate_quads(int((size / 4) ** 0.5))
+    return lambda: weld_mesh(verts, [], faces, 1e-3)
+
+
+def make_uv_sphere(n_faces):
+    """Closed UV sphere of about n_faces quads, without poles"""
+    side = int(np.sqrt(n_faces / 2))
+    us = np.linspace(0, 2 * np.pi, 2 * side, endpoint=False)
+    vs = np.linspace(0.05, np.pi - 0.05, side)
+    vs, us = np.meshgrid(vs, us, indexing='ij')
+    verts = np.stack((np.sin(vs) * np.cos(us), np.sin(vs) * np.sin(us), np.cos(vs)), axis=-1).reshape((-1, 3))
+    idx = np.arange(len(verts)).reshape((side, 2 * side))
+    next_idx = np.roll(idx, -1, axis=1)
+    faces = np.stack((idx[:-1], idx[1:], next_idx[1:], next_idx[:-1]), axis=-1).reshape((-1, 4)).tolist()
+    # caps
+    faces.append(idx[0].tolist()[::-1])
+    faces.append(idx[-1].tolist())
+    return verts, faces
+
+
+@benchmark("points_inside_mesh", sizes=[10000, 100000, 1000000])
+def bench_points_inside_mesh(size):
+    verts, faces = make_uv_sphere(100000)
+    points = np.random.default_rng(1).uniform(-1.1, 1.1, size=(size, 3))
+    tester = SvMeshInsideTester(verts, faces)
+    tester.grid()
+    return lambda: tester.contains(points)
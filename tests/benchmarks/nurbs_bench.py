@@ -0,0 +1,59 @@
+import numpy as np
+
+from runner import benchmark
+
+from sverchok.utils.nurbs_common import SvNurbsMaths
+from sverchok.utils.curve import knotvector as sv_knotvector
+from sverchok.utils.curve.nurbs import SvNurbsCurve
+from sverchok.utils.surface.nurbs import SvNurbsSurface
+
+
+def make_curve(n_points, degree=3, seed=1):
+    rng = np.random.default_rng(seed)
+    control_points = rng.random((n_points, 3))
+    weights = rng.random(n_points) + 0.5
+    knotvector = sv_knotvector.generate(degree, n_points)
+    return SvNurbsCurve.build(SvNurbsMaths.NATIVE, degree, knotvector, control_points, weights)
+
+
+def make_surface(n_points, degree=3, seed=1):
+    rng = np.random.default_rng(seed)
+    control_points = rng.random((n_points, n_points, 3))
+    weights = rng.random((n_points, n_points)) + 0.5
+    knotvector = sv_knotvector.generate(degree, n_points)
+    return SvNurbsSurface.build(SvNurbsMaths.NATIVE, degree, degree,
+                knotvector, knotvector, control_points, weights)
+
+
+@benchmark("nurbs_curve_evaluate", sizes=[1000, 10000, 100000])
+def nurbs_curve_evaluate(size):
+    curve = make_curve(20)
+    t_min, t_max = curve.get_u_bounds()
+    ts = np.linspace(t_min, t_max, size)
+    return lambda: curve.evaluate_array(ts)
+
+
+@benchmark("nurbs_curve_tangent", sizes=[1000, 10000, 100000])
+def nurbs_curve_tangent(size):
+    curve = make_curve(20)
+    t_min, t_max = curve.get_u_bounds()
+    ts = np.linspace(t_min, t_max, size)
+    return lambda: curve.tangent_array(ts)
+
+
+@benchmark("nurbs_surface_evaluate", sizes=[1000, 10000, 100000])
+def nurbs_surface_evaluate(size):
+    surface = make_surface(10)
+    rng = np.random.default_rng(2)
+    us = rng.random(size)
+    vs = rng.random(size)
+    return lambda: surface.evaluate_array(us, vs)
+
+
+@benchmark("nurbs_surface_normal", sizes=[1000, 10000, 100000])
+def nurbs_surface_normal(size):
+    surface = make_surface(10)
+    rng = np.random.default_rng(2)
+    us = rng.random(size)
+    vs = rng.random(size)
+    return lambda: surface.normal_array(us, vs)
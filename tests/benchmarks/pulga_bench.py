@@ -0,0 +1,50 @@
+import numpy as np
+
+from runner import benchmark
+
+from sverchok.dependencies import scipy
+
+ITERATIONS = 10
+
+
+def make_particles(n, seed=1):
+    # about two particles per unit of volume
+    rng = np.random.default_rng(seed)
+    side = (n / 2.0) ** (1.0 / 3.0)
+    return rng.random((n, 3)) * side
+
+
+def pairwise_simulation(size, use_kdtree=False, use_cell_list=False):
+    # pulga_physics_modular_core imports node modules, so it needs Blender
+    from sverchok.utils.pulga_physics_modular_core import (
+            PulgaSystem, SvCollisionForce, SvAttractionForce, SvAlignForce)
+
+    verts = make_particles(size)
+
+    def simulate():
+        modes = dict(use_kdtree=use_kdtree, use_cell_list=use_cell_list)
+        forces = [SvCollisionForce([0.1], **modes),
+                  SvAttractionForce([0.0001], [2.0], [0.8], **modes),
+                  SvAlignForce([0.01], [1.0], [0.5], **modes)]
+        ps = PulgaSystem([verts.copy(), [ITERATIONS], [0.3], [[0, 0, 0]], [0.02], [1.0], forces])
+        ps.setup_forces()
+        for _ in range(ITERATIONS):
+            ps.iterate()
+        return ps.verts
+
+    return simulate
+
+
+@benchmark("pulga_pairwise_brute_force", sizes=[300, 1000], blender=True)
+def pulga_pairwise_brute_force(size):
+    return pairwise_simulation(size)
+
+
+@benchmark("pulga_pairwise_kdtree", sizes=[1000, 10000, 100000], blender=True, requires=[scipy])
+def pulga_pairwise_kdtree(size):
+    return pairwise_simulation(size, use_kdtree=True)
+
+
+@benchmark("pulga_pairwise_cell_list", sizes=[1000, 10000, 100000], blender=True)
+def pulga_pairwise_cell_list(size):
+    return pairwise_simulation(size, use_cell_list=True)
@@ -0,0 +1,279 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Performance benchmarks of computational kernels of Sverchok.
+
+Benchmarks are declared in *_bench.py files of this directory (these are not
+picked up by run_tests.sh, which looks for *_tests.py). Each benchmark is a
+function decorated with @benchmark; it takes data size, prepares input data
+and returns a function without arguments, which is timed:
+
+    @benchmark("nurbs_curve_evaluate", sizes=[1000, 100000])
+    def nurbs_curve_evaluate(size):
+        curve = ...
+        ts = np.linspace(0, 1, size)
+        return lambda: curve.evaluate_array(ts)
+
+Run outside of Blender; Blender modules are replaced with stubs (see
+headless.py), and benchmarks declared with blender=True are skipped:
+
+    $ python tests/benchmarks/runner.py
+    $ python tests/benchmarks/runner.py -k nurbs --save-baseline
+    $ python tests/benchmarks/runner.py --compare
+
+Or inside Blender, to run all benchmarks:
+
+    $ blender -b --addons sverchok --python tests/benchmarks/runner.py -- --compare
+
+Results are stored as JSON:
+
+    {"machine": {...}, "created": "...",
+     "results": {"name[size]": {"name": ..., "size": ..., "min": ..., "median": ...,
+                                "mean": ..., "stddev": ..., "rounds": ..., "loops": ...}}}
+
+With --compare, median times are compared with the baseline file; benchmarks
+which became slower by more than --tolerance are reported as regressions,
+and the script exits with code 1.
+"""
+
+import argparse
+import datetime
+import fnmatch
+import glob
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baselines", "baseline.json")
+
+if BENCH_DIR not in sys.path:
+    sys.path.insert(0, BENCH_DIR)
+
+import headless
+
+# *_bench.py modules import this module as `runner`, also when it is run as a script
+sys.modules.setdefault("runner", sys.modules[__name__])
+
+_benchmarks = []
+
+
+class Benchmark(object):
+    def __init__(self, name, function, sizes, blender=False, requires=()):
+        self.name = name
+        self.function = function
+        self.sizes = list(sizes)
+        self.blender = blender
+        self.requires = list(requires)
+
+    def skip_reason(self):
+        if self.blender and headless.is_stubbed:
+            return "requires Blender"
+        for module in self.requires:
+            if module is None:
+                return "requires a module which is not currently available"
+        return None
+
+
+def benchmark(name, sizes, blender=False, requires=()):
+    """
+    Decorator, which registers a benchmark.
+    name: unique benchmark name.
+    sizes: list of data sizes, the function is called for each of them.
+    blender: True if the kernel needs real Blender API (bpy, bmesh, mathutils).
+    requires: list of optional modules (as imported from sverchok.dependencies);
+        the benchmark is skipped if any of them is None.
+    """
+    def decorator(function):
+        _benchmarks.append(Benchmark(name, function, sizes, blender=blender, requires=requires))
+        return function
+    return decorator
+
+
+def result_key(name, size):
+    return f"{name}[{size}]"
+
+
+def load_benchmarks(pattern="*_bench.py"):
+    for path in sorted(glob.glob(os.path.join(BENCH_DIR, pattern))):
+        module_name = os.path.splitext(os.path.basename(path))[0]
+        if module_name in sys.modules:
+            continue
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return list(_benchmarks)
+
+
+def measure(function, rounds=5, min_time=0.05):
+    """
+    Time `function`. The function is called once to warm up, then the number
+    of loops per round is chosen so that one round takes at least `min_time`.
+    Returns dictionary with per-call statistics over `rounds` rounds.
+    """
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    loops = 1
+    if 0 < elapsed < min_time:
+        loops = min(1000, int(min_time / elapsed) + 1)
+
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        times.append((time.perf_counter() - start) / loops)
+
+    return dict(min = min(times), median = statistics.median(times),
+                mean = statistics.mean(times),
+                stddev = statistics.stdev(times) if len(times) > 1 else 0.0,
+                rounds = rounds, loops = loops)
+
+
+def run_benchmarks(benchmarks, keyword=None, max_size=None, rounds=5, min_time=0.05, log=print):
+    results = {}
+    for bench in benchmarks:
+        if keyword is not None and not fnmatch.fnmatch(bench.name, f"*{keyword}*"):
+            continue
+        reason = bench.skip_reason()
+        if reason is not None:
+            log(f"{bench.name}: skipped, {reason}")
+            continue
+        for size in bench.sizes:
+            if max_size is not None and size > max_size:
+                continue
+            function = bench.function(size)
+            stats = measure(function, rounds=rounds, min_time=min_time)
+            stats.update(name = bench.name, size = size)
+            results[result_key(bench.name, size)] = stats
+            log(f"{result_key(bench.name, size):<48} median {stats['median']*1000:>10.3f} ms"
+                f"  min {stats['min']*1000:>10.3f} ms  ({stats['rounds']} x {stats['loops']})")
+    return results
+
+
+def machine_info():
+    import numpy
+    info = dict(platform = platform.platform(), processor = platform.processor(),
+                python = platform.python_version(), numpy = numpy.__version__,
+                blender = not headless.is_stubbed)
+    try:
+        import scipy
+        info["scipy"] = scipy.__version__
+    except ImportError:
+        info["scipy"] = None
+    return info
+
+
+def save_results(path, results):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    data = dict(machine = machine_info(),
+                created = datetime.datetime.now().isoformat(timespec='seconds'),
+                results = results)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(results, baseline, tolerance=0.2, min_delta=1e-4):
+    """
+    Compare median times with the baseline.
+    tolerance: relative slowdown which is still considered as noise.
+    min_delta: absolute difference in seconds below which timings are
+        considered equal, so that very fast benchmarks do not flap.
+    Returns list of tuples (key, baseline median, current median, ratio, status),
+    where status is one of "regression", "improvement", "ok", "new".
+    """
+    comparison = []
+    for key, stats in results.items():
+        old = baseline.get(key)
+        if old is None:
+            comparison.append((key, None, stats["median"], None, "new"))
+            continue
+        old_median, new_median = old["median"], stats["median"]
+        ratio = new_median / old_median if old_median > 0 else float('inf')
+        if abs(new_median - old_median) < min_delta:
+            status = "ok"
+        elif ratio > 1.0 + tolerance:
+            status = "regression"
+        elif ratio < 1.0 / (1.0 + tolerance):
+            status = "improvement"
+        else:
+            status = "ok"
+        comparison.append((key, old_median, new_median, ratio, status))
+    return comparison
+
+
+def format_comparison(comparison):
+    lines = [f"{'Benchmark':<48} {'Baseline, ms':>14} {'Current, ms':>14} {'Ratio':>8}  Status"]
+    for key, old, new, ratio, status in comparison:
+        old_text = f"{old*1000:>14.3f}" if old is not None else f"{'-':>14}"
+        ratio_text = f"{ratio:>8.2f}" if ratio is not None else f"{'-':>8}"
+        lines.append(f"{key:<48} {old_text} {new*1000:>14.3f} {ratio_text}  {status.upper() if status == 'regression' else status}")
+    return "\n".join(lines)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Run Sverchok performance benchmarks")
+    parser.add_argument('-k', '--keyword', help="Run only benchmarks with names containing this text (wildcards allowed)")
+    parser.add_argument('--max-size', type=int, help="Skip data sizes bigger than this")
+    parser.add_argument('--rounds', type=int, default=5, help="Number of timed rounds (default 5)")
+    parser.add_argument('--min-time', type=float, default=0.05, help="Minimum duration of one round in seconds (default 0.05)")
+    parser.add_argument('-o', '--output', help="Save results to this JSON file")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true', help="Save results as the baseline")
+    parser.add_argument('--compare', action='store_true', help="Compare results with the baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed relative slowdown (default 0.2)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+        # Inside Blender, script arguments follow "--"
+        if '--' in argv:
+            argv = argv[argv.index('--')+1:]
+    args = parse_args(argv)
+
+    headless.setup()
+    benchmarks = load_benchmarks()
+    results = run_benchmarks(benchmarks, keyword=args.keyword, max_size=args.max_size,
+                             rounds=args.rounds, min_time=args.min_time)
+
+    if args.output:
+        save_results(args.output, results)
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"Baseline file {args.baseline} does not exist")
+            return 2
+        comparison = compare(results, load_results(args.baseline), tolerance=args.tolerance)
+        print(format_comparison(comparison))
+        regressions = [item for item in comparison if item[4] == "regression"]
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import types
+
+import numpy as np
+
+from runner import benchmark
+
+from sverchok.utils.mesh_draw_buffers import build_mesh_buffers
+
+
+def make_triangle_grid(n_tris, seed=1):
+    side = max(2, int(np.sqrt(n_tris / 2)) + 1)
+    rng = np.random.default_rng(seed)
+    coords = np.linspace(0.0, 1.0, side)
+    xs, ys = np.meshgrid(coords, coords, indexing='ij')
+    zs = rng.random(xs.shape) * 0.05
+    verts = np.stack((xs, ys, zs), axis=-1).reshape((-1, 3)).tolist()
+    idx = np.arange(side * side).reshape((side, side))
+    a, b, c, d = idx[:-1, :-1].ravel(), idx[1:, :-1].ravel(), idx[1:, 1:].ravel(), idx[:-1, 1:].ravel()
+    tris = np.concatenate((np.stack((a, b, c), axis=-1), np.stack((a, c, d), axis=-1))).tolist()
+    return verts, tris
+
+
+def make_config(polygons, shade_mode='flat', color_per_polygon=False):
+    return types.SimpleNamespace(
+            draw_verts=False, draw_edges=False, draw_polys=True, shade_mode=shade_mode,
+            color_per_point=False, color_per_edge=False, color_per_polygon=color_per_polygon,
+            edges_use_vertex_color=False, polygon_use_vertex_color=False, random_colors=False,
+            handle_concave_quads=False, vector_light=(0.2, 0.3, 0.9),
+            vector_color=[[(1, 1, 1, 1)]], edge_color=[[(1, 1, 1, 1)]],
+            poly_color=[[(1, 0, 0, 1), (0, 1, 0, 1), (0, 0, 1, 1)]] if color_per_polygon else [[(1, 1, 1, 1)]],
+            edges=[[]], polygons=[polygons], matrix=[[]])
+
+
+def viewer_geometry(size, shade_mode, color_per_polygon=False, use_matrix=False):
+    verts, tris = make_triangle_grid(size)
+    config = make_config(tris, shade_mode, color_per_polygon)
+    matrices = [np.diag([2.0, 2.0, 2.0, 1.0])] if use_matrix else None
+    return lambda: build_mesh_buffers(config, [verts], matrices)
+
+
+@benchmark("viewer_buffers_flat", sizes=[10000, 100000, 1000000])
+def viewer_buffers_flat(size):
+    return viewer_geometry(size, 'flat', use_matrix=True)
+
+
+@benchmark("viewer_buffers_facet", sizes=[10000, 100000, 1000000])
+def viewer_buffers_facet(size):
+    return viewer_geometry(size, 'facet')
+
+
+@benchmark("viewer_buffers_smooth", sizes=[10000, 100000, 1000000])
+def viewer_buffers_smooth(size):
+    return viewer_geometry(size, 'smooth')
+
+
+@benchmark("viewer_buffers_polygon_colors", sizes=[10000, 100000])
+def viewer_buffers_polygon_colors(size):
+    return viewer_geometry(size, 'flat', color_per_polygon=True)
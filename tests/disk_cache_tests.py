@@ -0,0 +1,54 @@
+import os
+import tempfile
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.disk_cache import SvDiskCache, data_digest, combine_digests
+
+
+class DiskCacheTests(SverchokTestCase):
+    def test_digests(self):
+        data = [[(0.0, 1.0, 2.0)], [np.arange(5)]]
+        self.assertEqual(data_digest(data), data_digest([[(0.0, 1.0, 2.0)], [np.arange(5)]]))
+        self.assertNotEqual(data_digest(data), data_digest([[(0.0, 1.0, 2.5)], [np.arange(5)]]))
+        self.assertIsNone(data_digest([lambda x: x]))
+        self.assertNotEqual(combine_digests("a", 1), combine_digests("a", 2))
+
+    def test_put_get(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SvDiskCache(directory)
+            self.assertTrue(cache.put("key", {"Vertices": [[(1, 2, 3)]]}))
+            self.assertEqual(cache.get("key"), {"Vertices": [[(1, 2, 3)]]})
+            self.assertIsNone(cache.get("other"))
+            self.assertFalse(cache.put("lambda", {"Data": [lambda x: x]}))
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            SvDiskCache(directory).put("key", [np.arange(10)])
+            cache = SvDiskCache(directory)
+            self.assertIn("key", cache)
+            self.assert_numpy_arrays_equal(cache.get("key")[0], np.arange(10))
+
+    def test_eviction(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SvDiskCache(directory)
+            for key in "abc":
+                cache.put(key, np.zeros(1000))
+            cache.get("a")
+            cache.resize(2 * cache.total_size // 3 + 100)
+            self.assertEqual([key in cache for key in "abc"], [True, False, True])
+            self.assertFalse(os.path.exists(os.path.join(directory, "b.pickle")))
+
+    def test_untrusted_directory(self):
+        if not hasattr(os, 'getuid'):
+            self.skipTest("POSIX permissions are required")
+        with tempfile.TemporaryDirectory() as directory:
+            os.chmod(directory, 0o777)
+            cache = SvDiskCache(directory)
+            self.assertFalse(cache.enabled)
+            self.assertFalse(cache.put("key", [1, 2, 3]))
+            self.assertEqual(os.listdir(directory), [])
+            os.chmod(directory, 0o700)
+            self.assertTrue(SvDiskCache(directory).enabled)
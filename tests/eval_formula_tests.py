@@ -0,0 +1,85 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.modules.eval_formula import compile_formula, safe_eval
+from sverchok.data_structure import list_match_func, numpy_list_match_func
+from sverchok.nodes.script.formula_mk5 import formula_func
+
+
+class CompiledFormulaTests(SverchokTestCase):
+    xs = [0.5, 1.5, 2.0, 3.25]
+    ys = [1.0, -2.0, 0.5, 3.25]
+
+    def evaluate(self, string, xs, ys):
+        formula = compile_formula(string)
+        variables = dict(x=np.array(xs), y=np.array(ys))
+        return formula.evaluate_vectorized(variables, len(xs))
+
+    def expected(self, string, xs, ys):
+        return [safe_eval(string, dict(x=x, y=y)) for x, y in zip(xs, ys)]
+
+    def test_vectorized(self):
+        for string in ["x + y * 2", "sin(x) * cos(y)", "sqrt(x) ** 2", "x if x > y else y",
+                       "0 < x < 2 and not y > 0", "max(x, y, 1)", "atan2(y, x)", "floor(x) + sign(y)",
+                       "np.hypot(x, y) * pi", "2"]:
+            with self.subTest(formula=string):
+                self.assertTrue(compile_formula(string).is_vectorizable)
+                result = self.evaluate(string, self.xs, self.ys)
+                self.assertEqual(len(result), len(self.xs))
+                self.assert_numpy_arrays_equal(result, np.array(self.expected(string, self.xs, self.ys)), precision=8)
+
+    def test_literals(self):
+        # numeric literals are ast.Num nodes in Python 3.7 and ast.Constant ones since 3.8
+        for string in ["x * 2", "1.5 + x", "-1", "x ** 2 / 3"]:
+            with self.subTest(formula=string):
+                self.assertTrue(compile_formula(string).is_vectorizable)
+        for string in ["x + 1j", "'a'", "x * None"]:
+            with self.subTest(formula=string):
+                self.assertFalse(compile_formula(string).is_vectorizable)
+
+    def test_integer_results(self):
+        result = self.evaluate("floor(x) + sign(y)", self.xs, self.ys).tolist()
+        self.assertEqual(result, self.expected("floor(x) + sign(y)", self.xs, self.ys))
+        self.assertTrue(all(isinstance(value, int) for value in result))
+
+    def test_not_vectorizable(self):
+        for string in ["[x, y]", "sum(x)", "max(x)", "log(x, 2)", "x and y", "np.sum(x)", "x is y", "Vector((x, y, 0))"]:
+            with self.subTest(formula=string):
+                self.assertFalse(compile_formula(string).is_vectorizable)
+
+    def test_errors_fall_back(self):
+        # errors are raised by element-wise evaluation, as before
+        self.assertIsNone(self.evaluate("1 / y", [1.0, 2.0], [1.0, 0.0]))
+        self.assertIsNone(self.evaluate("sqrt(x)", [-1.0, 2.0], [1.0, 0.0]))
+        self.assertIsNone(self.evaluate("x ** 70", [3, 2], [1, 0]))
+        result = self.evaluate("1 / y if y != 0 else 0", [1.0, 2.0], [1.0, 0.0])
+        self.assertIsNone(result)
+
+    def test_max_min_nan(self):
+        nan = float('nan')
+        xs, ys = [1.0, nan, nan, 2.0], [nan, 1.0, nan, 3.0]
+        for string in ["max(x, y)", "min(x, y)", "max(y, x, 0)", "min(1, x, y)"]:
+            with self.subTest(formula=string):
+                result = self.evaluate(string, xs, ys)
+                np.testing.assert_array_equal(result, np.array(self.expected(string, xs, ys), dtype=np.float64))
+
+    def test_cache(self):
+        self.assertIs(compile_formula("x * 3 + y"), compile_formula("x * 3 + y"))
+
+
+class FormulaFuncTests(SverchokTestCase):
+    def run_formulas(self, formulas, xs, ys, separate=False, transform='As_is'):
+        constant = [formulas, separate, ['x', 'y'], [transform, transform], False, numpy_list_match_func['REPEAT']]
+        return formula_func([xs, ys], constant, list_match_func['REPEAT'])
+
+    def test_same_as_element_wise(self):
+        xs, ys = [1.0, 2.0, 3.0], [4.0, 5.0]
+        pairs = list(zip(*list_match_func['REPEAT']([xs, ys])))
+        formulas = ["x + y", "x * y", "", "[x, y]"]
+        expected = [[safe_eval(f, dict(x=x, y=y)) for f in formulas if f] for x, y in pairs]
+        self.assertEqual(self.run_formulas(formulas, xs, ys, separate=True), expected)
+        self.assertEqual(self.run_formulas(formulas, xs, ys), [v for vector in expected for v in vector])
+
+    def test_errors(self):
+        with self.assertRaises(ZeroDivisionError):
+            self.run_formulas(["x / y"], [1, 2], [1, 0])
@@ -0,0 +1,72 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.field.scalar import (SvScalarFieldPointDistance, SvScalarFieldBinOp,
+            SvCoordinateScalarField, SvScalarFieldLambda, SvScalarFieldVectorizedFunction,
+            SvPlaneAttractorScalarField, SvScalarFieldLaplacian,
+            ScalarFieldCurvatureCalculator, SvScalarFieldGaussCurvature, SvScalarFieldMeanCurvature)
+from sverchok.utils.field.differential import finite_gradient, finite_derivatives, stencil_evaluate, LAPLACIAN_STENCIL
+
+
+def formula(xs, ys, zs, vs):
+    return np.sin(xs) * np.cos(ys) + zs * zs * xs
+
+
+class CountingField(SvScalarFieldLambda):
+    def __init__(self):
+        super().__init__(None, dict(), None, function_numpy=formula)
+        self.calls = 0
+
+    def evaluate_grid(self, xs, ys, zs):
+        self.calls += 1
+        return super().evaluate_grid(xs, ys, zs)
+
+
+class FieldDerivativesTests(SverchokTestCase):
+    def setUp(self):
+        points = np.random.default_rng(2).random((3, 200)) * 2.0 - 1.2
+        self.xs, self.ys, self.zs = points
+
+    def make_fields(self):
+        falloff = lambda rs: np.exp(-rs * rs)
+        distance = SvScalarFieldPointDistance(np.array([0.1, 0.2, 0.3]), falloff=falloff)
+        x = SvCoordinateScalarField('X')
+        product = SvScalarFieldBinOp(distance, x, lambda a, b: a * b, partials=lambda a, b: (b, a, 0, 1, 0))
+        sine = SvScalarFieldVectorizedFunction(product, np.sin,
+                    derivatives=lambda v: (np.cos(v), -np.sin(v)))
+        return dict(distance = distance,
+                    manhattan = SvScalarFieldPointDistance(np.array([0.1, 0.2, 0.3]), metric='MANHATTAN'),
+                    phi = SvCoordinateScalarField('PHI'),
+                    plane = SvPlaneAttractorScalarField(np.array([0.0, 0.0, 0.1]), np.array([0.0, 1.0, 2.0])),
+                    sine = sine)
+
+    def test_analytic_gradients(self):
+        for name, field in self.make_fields().items():
+            with self.subTest(field=name):
+                gradient = field.gradient_grid(self.xs, self.ys, self.zs)
+                expected = finite_gradient(field, self.xs, self.ys, self.zs, 1e-5)
+                np.testing.assert_allclose(np.array(gradient), np.array(expected), atol=1e-3)
+
+    def test_analytic_hessians(self):
+        field = self.make_fields()['sine']
+        values, gradient, hessian = field.derivatives_grid(self.xs, self.ys, self.zs)
+        _, _, expected = finite_derivatives(field, self.xs, self.ys, self.zs, 1e-4)
+        np.testing.assert_allclose(values, field.evaluate_grid(self.xs, self.ys, self.zs), atol=1e-10)
+        np.testing.assert_allclose(np.array(hessian), np.array(expected), atol=1e-3)
+
+    def test_stencil_in_one_call(self):
+        field = CountingField()
+        values = stencil_evaluate(field, self.xs, self.ys, self.zs, LAPLACIAN_STENCIL, 0.01)
+        self.assertEqual(field.calls, 1)
+        self.assert_numpy_arrays_equal(values[1], formula(self.xs - 0.01, self.ys, self.zs, None))
+        SvScalarFieldLaplacian(field, 0.01).evaluate_grid(self.xs, self.ys, self.zs)
+        self.assertEqual(field.calls, 2)
+
+    def test_curvature_shared(self):
+        field = CountingField()
+        calculator = ScalarFieldCurvatureCalculator(field, 0.01)
+        SvScalarFieldGaussCurvature(field, calculator).evaluate_grid(self.xs, self.ys, self.zs)
+        SvScalarFieldMeanCurvature(field, calculator).evaluate_grid(self.xs, self.ys, self.zs)
+        self.assertEqual(field.calls, 1)
+        SvScalarFieldMeanCurvature(field, calculator).evaluate_grid(self.ys, self.xs, self.zs)
+        self.assertEqual(field.calls, 2)
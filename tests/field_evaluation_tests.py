@@ -0,0 +1,54 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.field.scalar import (SvScalarFieldPointDistance, SvScalarFieldBinOp,
+            SvMergedScalarField, SvCoordinateScalarField, SvScalarFieldLambda)
+from sverchok.utils.field.vector import SvVectorFieldPointDistance, SvVectorFieldMultipliedByScalar
+from sverchok.utils.field.evaluation import (walk_field, get_chunk_size,
+            evaluate_scalar_field, evaluate_vector_field, evaluate_field)
+
+
+def make_scalar_field():
+    distance = SvScalarFieldPointDistance(np.array([0.1, 0.2, 0.3]))
+    x = SvCoordinateScalarField('X')
+    product = SvScalarFieldBinOp(distance, x, lambda a, b: a * b)
+    formula = SvScalarFieldLambda(None, dict(), product,
+                                  function_numpy=lambda xs, ys, zs, vs: np.sin(xs) * vs + ys)
+    return SvMergedScalarField('MAX', [formula, distance, x])
+
+
+class FieldEvaluationTests(SverchokTestCase):
+    def make_points(self, n):
+        points = np.random.default_rng(1).random((3, n)) * 2.0 - 1.0
+        return points[0], points[1], points[2]
+
+    def test_walk_field(self):
+        field = make_scalar_field()
+        # distance field is used twice, but visited once
+        self.assertEqual(len(list(walk_field(field))), 5)
+        self.assertGreater(get_chunk_size(SvCoordinateScalarField('X')), get_chunk_size(field))
+
+    def test_scalar_chunks(self):
+        field = make_scalar_field()
+        xs, ys, zs = self.make_points(10001)
+        expected = field.evaluate_grid(xs, ys, zs)
+        for threads in [1, 3]:
+            with self.subTest(threads=threads):
+                result = evaluate_scalar_field(field, xs, ys, zs, chunk_size=1000, threads=threads)
+                self.assert_numpy_arrays_equal(result, expected, precision=12)
+
+    def test_vector_chunks(self):
+        field = SvVectorFieldMultipliedByScalar(SvVectorFieldPointDistance(np.array([0.0, 0.0, 1.0])),
+                                                make_scalar_field())
+        xs, ys, zs = self.make_points(5000)
+        expected = field.evaluate_grid(xs, ys, zs)
+        result = evaluate_vector_field(field, xs, ys, zs, chunk_size=777, threads=2)
+        self.assert_numpy_arrays_equal(np.array(result), np.array(expected), precision=12)
+
+    def test_shape(self):
+        field = make_scalar_field()
+        xs, ys, zs = np.meshgrid(*[np.linspace(-1, 1, 20)] * 3, indexing='ij')
+        result = evaluate_field(field, xs, ys, zs, chunk_size=500)
+        self.assertEqual(result.shape, (20, 20, 20))
+        expected = field.evaluate_grid(xs.ravel(), ys.ravel(), zs.ravel()).reshape((20, 20, 20))
+        self.assert_numpy_arrays_equal(result, expected, precision=12)
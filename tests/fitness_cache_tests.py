@@ -0,0 +1,48 @@
+import os
+import tempfile
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.fitness_cache import SvFitnessCache, gene_key
+
+
+class FitnessCacheTests(SverchokTestCase):
+    def test_gene_key(self):
+        self.assertEqual(gene_key([1.5, [1, 2]]), gene_key([np.float64(1.5), np.array([1, 2])]))
+        self.assertNotEqual(gene_key([1.5, [1, 2]]), gene_key([1.5, [2, 1]]))
+
+    def test_hits(self):
+        cache = SvFitnessCache(10)
+        self.assertIsNone(cache.get([0.5, [0, 1]]))
+        cache.put([0.5, [0, 1]], 3.0)
+        self.assertEqual(cache.get([0.5, [0, 1]]), 3.0)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_lru_eviction(self):
+        cache = SvFitnessCache(2)
+        cache.put([1], 1.0)
+        cache.put([2], 2.0)
+        cache.get([1])
+        cache.put([3], 3.0)
+        self.assertIn([1], cache)
+        self.assertNotIn([2], cache)
+        self.assertIn([3], cache)
+
+    def test_save_load(self):
+        cache = SvFitnessCache(10, signature="genes")
+        for i in range(5):
+            cache.put([i, [i, i]], float(i))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.json")
+            cache.save(path)
+
+            loaded = SvFitnessCache(3, signature="genes")
+            self.assertEqual(loaded.load(path), 5)
+            # only most recently used entries are kept
+            self.assertEqual([k for k in loaded.entries], [gene_key([i, [i, i]]) for i in range(2, 5)])
+            self.assertEqual(loaded.get([4, [4, 4]]), 4.0)
+
+            other = SvFitnessCache(10, signature="other genes")
+            self.assertEqual(other.load(path), 0)
+            self.assertEqual(len(other), 0)
@@ -0,0 +1,72 @@
+import os
+import tempfile
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.frame_cache import SvFrameCache, get_tree_frame_cache, clear_frame_caches
+from sverchok.utils.node_stats import estimate_size
+
+
+class FrameCacheTests(SverchokTestCase):
+    def test_get_put(self):
+        cache = SvFrameCache()
+        cache.put("node", 1, [[(0, 0, 0)]])
+        cache.put("node", 2, [[(1, 1, 1)]])
+        cache.put("other", 1, [[5]])
+        self.assertEqual(cache.get("node", 2), [[(1, 1, 1)]])
+        self.assertIsNone(cache.get("node", 3))
+        self.assertEqual(cache.frames("node"), [1, 2])
+        cache.remove("node")
+        self.assertEqual(len(cache), 1)
+
+    def test_budget(self):
+        frame_size = estimate_size([np.zeros(1000)])
+        cache = SvFrameCache(budget=3.5 * frame_size)
+        for frame in range(5):
+            cache.put("node", frame, [np.zeros(1000) + frame])
+        self.assertEqual(cache.frames("node"), [2, 3, 4])
+        self.assertLessEqual(cache.memory_size, 3.5 * frame_size)
+
+    def test_spill(self):
+        with tempfile.TemporaryDirectory() as directory:
+            def frame_data(frame):
+                return [[np.zeros(1000) + frame, [(frame, 0, 0)]]]
+            cache = SvFrameCache(budget=2.5 * estimate_size(frame_data(0)), spill_directory=directory)
+            for frame in range(5):
+                cache.put("node", frame, frame_data(frame))
+            self.assertEqual(cache.frames("node"), [0, 1, 2, 3, 4])
+            self.assertEqual(cache.spilled_count, 3)
+            data = cache.get("node", 1)
+            self.assertIsInstance(data[0][0], np.memmap)
+            self.assertFalse(data[0][0].flags.writeable)
+            self.assert_numpy_arrays_equal(data[0][0], np.ones(1000))
+            self.assertEqual(data[0][1], [(1, 0, 0)])
+            cache.remove()
+            self.assertEqual(len(cache), 0)
+
+    def test_failed_spill(self):
+        with tempfile.TemporaryDirectory() as directory:
+            def frame_data(frame):
+                # functions can't be pickled
+                return [[np.zeros(1000) + frame, [lambda: frame]]]
+            cache = SvFrameCache(budget=1.5 * estimate_size(frame_data(0)), spill_directory=directory)
+            for frame in range(3):
+                cache.put("node", frame, frame_data(frame))
+            self.assertEqual(cache.frames("node"), [2])
+            self.assertEqual(cache.spilled_count, 0)
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_spill_directory(self):
+        try:
+            cache = get_tree_frame_cache("tree", 1024, spill=True)
+            directory = cache.spill_directory
+            self.assertTrue(os.path.isdir(directory))
+            self.assertNotEqual(get_tree_frame_cache("other tree", 1024, spill=True).spill_directory, directory)
+            if hasattr(os, 'getuid'):
+                self.assertEqual(os.stat(directory).st_mode & 0o077, 0)
+            self.assertEqual(get_tree_frame_cache("tree", 2048, spill=True).spill_directory, directory)
+            self.assertIsNone(get_tree_frame_cache("tree", 2048).spill_directory)
+            self.assertFalse(os.path.exists(directory))
+        finally:
+            clear_frame_caches()
@@ -1,5 +1,62 @@
+import itertools
+import time
+
+import numpy as np
+
 from sverchok.core.update_system import process_tree
 from sverchok.utils.testing import *
+from sverchok.utils.intersect_edges import candidate_edge_pairs, intersect_edges_2d
+
+
+def random_edges(n_edges, seed=0):
+    # Short edges scattered over a square, about one edge per unit of area
+    rng = np.random.default_rng(seed)
+    starts = rng.random((n_edges, 2)) * np.sqrt(n_edges)
+    ends = starts + rng.random((n_edges, 2)) - 0.5
+    verts = np.concatenate([starts, ends])
+    verts = np.concatenate([verts, np.zeros((2 * n_edges, 1))], axis=1)
+    edges = np.stack([np.arange(n_edges), np.arange(n_edges) + n_edges], axis=1)
+    return verts.tolist(), edges.tolist()
+
+
+class CandidateEdgePairsTest(SverchokTestCase):
+    def brute_force(self, verts, edges):
+        verts = np.array(verts)
+        result = []
+        for i, j in itertools.combinations(range(len(edges)), 2):
+            if len(set(edges[i]) | set(edges[j])) < 4:
+                continue
+            ends_i, ends_j = verts[edges[i]], verts[edges[j]]
+            if np.all(ends_i.max(axis=0) >= ends_j.min(axis=0)) and np.all(ends_j.max(axis=0) >= ends_i.min(axis=0)):
+                result.append([i, j])
+        return result
+
+    def test_random(self):
+        rng = np.random.default_rng(1)
+        verts = rng.random((100, 3)).tolist()
+        edges = rng.integers(0, 100, (80, 2)).tolist()
+        self.assertEqual(candidate_edge_pairs(verts, edges).tolist(), self.brute_force(verts, edges))
+
+    def test_flat_grid(self):
+        verts = [(x, y, 0) for x in range(5) for y in range(5)]
+        edges = [(i, i + 1) for i in range(24)] + [(i, i + 5) for i in range(20)]
+        self.assertEqual(candidate_edge_pairs(verts, edges).tolist(), self.brute_force(verts, edges))
+
+    def test_single_edge(self):
+        self.assertEqual(candidate_edge_pairs([(0, 0, 0), (1, 0, 0)], [(0, 1)]).shape, (0, 2))
+
+    @manual_only
+    def test_benchmark(self):
+        for n_edges in [1000, 10000, 100000]:
+            verts, edges = random_edges(n_edges)
+            start = time.perf_counter()
+            pairs = candidate_edge_pairs(verts, edges)
+            broad_phase = time.perf_counter() - start
+            start = time.perf_counter()
+            verts_out, edges_out = intersect_edges_2d(verts, edges, 1e-5)
+            total = time.perf_counter() - start
+            info("%s edges: %s candidate pairs in %.3fs, intersect_edges_2d: %.3fs, %s edges out",
+                 n_edges, len(pairs), broad_phase, total, len(edges_out))
 
 
 class IntersectEdgesTest2(ReferenceTreeTestCase):
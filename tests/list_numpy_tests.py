@@ -0,0 +1,66 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.data_structure import (match_cross, match_cross2, numpy_match_cross, numpy_match_cross2)
+from sverchok.utils.listutils import preobrazovatel, joiner, myZip_2, wrapper_2, zip_arrays
+from sverchok.utils.modules import statistics_functions
+
+
+def to_lists(data):
+    if isinstance(data, np.ndarray):
+        return data.tolist()
+    if isinstance(data, (list, tuple)):
+        return [to_lists(item) for item in data]
+    if isinstance(data, np.generic):
+        return data.item()
+    return data
+
+
+class ListNumpyTests(SverchokTestCase):
+    """NumPy arrays in list helpers should give the same results as nested lists"""
+
+    def test_levels(self):
+        rng = np.random.default_rng(1)
+        data = [rng.integers(0, 10, (2, 3, 2)), rng.integers(0, 10, (4, 3, 2))]
+        for levels in [[0], [1], [2], [3], [1, 2], [1, 3], [2, 3], [1, 2, 3], [2, 4]]:
+            with self.subTest(levels=levels):
+                result = preobrazovatel(data, levels)
+                self.assertEqual(to_lists(result), preobrazovatel(to_lists(data), levels))
+
+    def test_join_and_mix(self):
+        rng = np.random.default_rng(2)
+        slots = [[rng.random((3, 2)), rng.random((2, 2))], [rng.random((4, 2)), rng.random((3, 2))]]
+        for level in [1, 2, 3]:
+            for function in [joiner, myZip_2]:
+                with self.subTest(level=level, function=function.__name__):
+                    result = function(slots, level)
+                    expected = function(to_lists(slots), level)
+                    self.assertEqual(to_lists(result), expected)
+                    wrapped = wrapper_2(slots, result, level)
+                    self.assertEqual(to_lists(wrapped), wrapper_2(to_lists(slots), expected, level))
+
+    def test_join_keeps_arrays(self):
+        slots = [[np.arange(6).reshape((3, 2))], [np.arange(4).reshape((2, 2))]]
+        result = joiner(slots, 2)
+        self.assertIsInstance(result[0], np.ndarray)
+        self.assertEqual(result[0].shape, (5, 2))
+
+    def test_zip_arrays(self):
+        result = zip_arrays([np.array([1, 2, 3]), np.array([10, 20])])
+        self.assertEqual(result.tolist(), [[1, 10], [2, 20]])
+        self.assertIsNone(zip_arrays([np.zeros((2, 3)), np.zeros((2, 2))]))
+
+    def test_match_cross(self):
+        arrays = [np.array([1, 2]), np.array([5, 6, 7]), np.array([8, 9])]
+        self.assertEqual(to_lists(numpy_match_cross(arrays)), match_cross(to_lists(arrays)))
+        self.assertEqual(to_lists(numpy_match_cross2(arrays)), match_cross2(to_lists(arrays)))
+
+    def test_statistics(self):
+        values = np.random.default_rng(3).random(101)
+        for function, numpy_function in statistics_functions.numpy_functions.items():
+            args = {'get_percentile': (0.3,), 'get_histogram': (7, True, 3)}.get(function.__name__, ())
+            with self.subTest(function=function.__name__):
+                expected = function(values.tolist(), *args)
+                result = numpy_function(values, *args)
+                self.assert_numpy_arrays_equal(np.array(result), np.array(expected), precision=8)
+        self.assertEqual(statistics_functions.get_median_np(np.array([4, 1, 3, 2])), 2.5)
@@ -0,0 +1,45 @@
+import numpy as np
+from collections import Counter
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.marching_cubes import isosurface_np
+
+class MarchingCubesTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.size = 15
+        self.center = (self.size - 1) / 2.0
+        self.radius = 5.0
+        xs, ys, zs = np.meshgrid(np.arange(self.size), np.arange(self.size), np.arange(self.size), indexing='ij')
+        self.data = np.sqrt((xs - self.center)**2 + (ys - self.center)**2 + (zs - self.center)**2)
+
+    def test_sphere(self):
+        verts, faces = isosurface_np(self.data, self.radius)
+        self.assertEqual(verts.shape[1], 3)
+        self.assertEqual(faces.shape[1], 3)
+        self.assertTrue(len(faces) > 0)
+        distances = np.linalg.norm(verts - self.center, axis=1)
+        self.assertTrue((abs(distances - self.radius) < 0.2).all())
+
+    def test_welded(self):
+        # Each edge of a closed welded surface is shared by two faces
+        verts, faces = isosurface_np(self.data, self.radius)
+        edges = Counter()
+        for face in faces.tolist():
+            for i, j in zip(face, face[1:] + face[:1]):
+                edges[(min(i,j), max(i,j))] += 1
+        self.assertEqual(set(edges.values()), {2})
+        self.assertEqual(len(np.unique(faces)), len(verts))
+
+    def test_chunks(self):
+        verts1, faces1 = isosurface_np(self.data, self.radius)
+        verts2, faces2 = isosurface_np(self.data, self.radius, chunk_size=2)
+        self.assertEqual(len(verts1), len(verts2))
+        tris1 = sorted(tuple(sorted(tuple(np.round(verts1[i], 8)) for i in face)) for face in faces1)
+        tris2 = sorted(tuple(sorted(tuple(np.round(verts2[i], 8)) for i in face)) for face in faces2)
+        self.assertEqual(tris1, tris2)
+
+    def test_empty(self):
+        verts, faces = isosurface_np(self.data, 100.0)
+        self.assertEqual(verts.shape, (0, 3))
+        self.assertEqual(faces.shape, (0, 3))
@@ -0,0 +1,64 @@
+import types
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.mesh_draw_buffers import (
+        PolygonLoops, face_normals, vertex_normals, triangulate, points_colors, build_mesh_buffers)
+
+
+def triangles_area(verts, tris):
+    a, b, c = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+    return (np.linalg.norm(np.cross(b - a, c - a), axis=1) / 2.0).sum()
+
+
+class MeshDrawBuffersTests(SverchokTestCase):
+    def test_triangulate_concave(self):
+        verts = np.array([[0, 0, 0], [2, 0, 0], [2, 2, 0], [1, 0.5, 0], [0, 2, 0]], dtype=np.float64)
+        loops = PolygonLoops.from_polygons([[0, 1, 2, 3, 4]])
+        tris, faces = triangulate(verts, loops)
+        self.assertEqual(faces.tolist(), [0, 0, 0])
+        self.assertAlmostEqual(triangles_area(verts, tris), 2.5)
+
+    def test_triangulate_mixed(self):
+        verts = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0.5, 2, 0]], dtype=np.float64)
+        loops = PolygonLoops.from_polygons([[0, 1, 2, 3], [3, 2, 4], [0, 1]])
+        tris, faces = triangulate(verts, loops)
+        self.assertEqual(faces.tolist(), [0, 0, 1])
+        self.assertEqual(tris.tolist(), [[0, 1, 2], [0, 2, 3], [3, 2, 4]])
+
+    def test_normals(self):
+        verts = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float64)
+        loops = PolygonLoops.from_polygons([[0, 1, 2, 3], [0, 4, 1]])
+        f_normals = face_normals(verts, loops)
+        self.assert_numpy_arrays_equal(f_normals, np.array([[0, 0, 1], [0, 1, 0]]), precision=8)
+        v_normals = vertex_normals(verts, loops, f_normals)
+        self.assertAlmostEqual(np.linalg.norm(v_normals[0]), 1.0)
+        self.assert_numpy_arrays_equal(v_normals[2], np.array([0, 0, 1]), precision=8)
+        self.assert_numpy_arrays_equal(v_normals[4], np.array([0, 1, 0]), precision=8)
+
+    def test_points_colors(self):
+        colors = points_colors([[(1, 0, 0, 1), (0, 1, 0, 1)], [(0, 0, 1, 1)]], [3, 2], True, False)
+        self.assertEqual(colors.tolist(), [[1, 0, 0, 1], [0, 1, 0, 1], [1, 0, 0, 1], [0, 0, 1, 1], [0, 0, 1, 1]])
+
+    def test_build_buffers(self):
+        config = types.SimpleNamespace(
+                draw_verts=True, draw_edges=True, draw_polys=True, shade_mode='facet',
+                color_per_point=False, color_per_edge=False, color_per_polygon=True,
+                edges_use_vertex_color=False, polygon_use_vertex_color=False, random_colors=False,
+                handle_concave_quads=False, vector_light=(0, 0, 1),
+                vector_color=[[(1, 1, 1, 1)]], edge_color=[[(1, 1, 1, 1)]],
+                poly_color=[[(1, 0, 0, 1)], [(0, 1, 0, 1)]],
+                edges=[[[0, 1]]], polygons=[[[0, 1, 2, 3]], [[0, 1, 2]]], matrix=[[]])
+        vecs = [[(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], [(0, 0, 0), (1, 0, 0), (0, 1, 0)]]
+        matrices = [np.eye(4), np.diag([1.0, 1.0, 1.0, 1.0])]
+        matrices[1][:3, 3] = (0, 0, 5)
+        geom = build_mesh_buffers(config, vecs, matrices)
+        self.assertEqual(geom.p_vertices.dtype, np.float32)
+        self.assertEqual(geom.p_indices.dtype, np.uint32)
+        self.assertEqual(len(geom.p_vertices), 9)
+        self.assertEqual(len(geom.p_vertices), len(geom.p_vertex_colors))
+        self.assertEqual(geom.p_vertex_colors[:6, 0].tolist(), [1.0] * 6)
+        self.assertEqual(geom.p_vertex_colors[6:, 1].tolist(), [1.0] * 3)
+        self.assertEqual(geom.p_vertices[6:, 2].tolist(), [5.0] * 3)
+        self.assertEqual(geom.e_indices.tolist(), [[0, 1], [4, 5]])
@@ -0,0 +1,62 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.dependencies import scipy
+from sverchok.utils.mesh_inside import (SvMeshInsideTester, get_mesh_inside_tester,
+        clear_mesh_inside_testers, triangulate_faces)
+
+CUBE_VERTS = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)]
+CUBE_FACES = [[0, 3, 2, 1], [4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
+
+
+def lattice(low, high, steps):
+    coords = np.linspace(low, high, steps)
+    return np.stack(np.meshgrid(coords, coords, coords, indexing='ij'), axis=-1).reshape((-1, 3))
+
+
+class MeshInsideTests(SverchokTestCase):
+    def test_triangulate(self):
+        triangles, face_index = triangulate_faces([[0, 1, 2], [3, 4, 5, 6, 7]])
+        self.assertEqual(triangles.tolist(), [[0, 1, 2], [3, 4, 5], [3, 5, 6], [3, 6, 7]])
+        self.assertEqual(face_index.tolist(), [0, 1, 1, 1])
+
+    def test_cube(self):
+        # rays of many of these points go exactly through edges and vertices of the cube
+        points = lattice(-0.5, 1.5, 9)
+        strictly_inside = ((points > 0) & (points < 1)).all(axis=1)
+        outside = ((points < 0) | (points > 1)).any(axis=1)
+        tester = SvMeshInsideTester(CUBE_VERTS, CUBE_FACES)
+        for direction in [(1, 0, 0), (0, -1, 0), (0.3, -0.5, 0.8)]:
+            with self.subTest(direction=direction):
+                inside = tester.contains(points, direction)
+                self.assertTrue(inside[strictly_inside].all())
+                self.assertFalse(inside[outside].any())
+
+    def test_first_hits(self):
+        tester = SvMeshInsideTester(CUBE_VERTS, CUBE_FACES)
+        faces, back_facing = tester.first_hits([(0.5, 0.5, 0.5), (0.5, 0.5, -1), (2, 2, 2)], (0, 0, 1))
+        self.assertEqual(faces.tolist(), [1, 0, -1])
+        self.assertEqual(back_facing.tolist(), [True, False, False])
+
+    def test_is_closed(self):
+        self.assertTrue(SvMeshInsideTester(CUBE_VERTS, CUBE_FACES).is_closed)
+        self.assertFalse(SvMeshInsideTester(CUBE_VERTS, CUBE_FACES[1:]).is_closed)
+
+    def test_clear_testers(self):
+        tester = get_mesh_inside_tester(CUBE_VERTS, CUBE_FACES)
+        clear_mesh_inside_testers()
+        self.assertIsNot(get_mesh_inside_tester(CUBE_VERTS, CUBE_FACES), tester)
+
+    @requires(scipy)
+    def test_convex_hull(self):
+        from scipy.spatial import ConvexHull
+        rng = np.random.default_rng(1)
+        directions = rng.normal(size=(2000, 3))
+        directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+        hull = ConvexHull(directions)
+        verts, faces = hull.points, hull.simplices.tolist()
+        points = rng.uniform(-1.1, 1.1, size=(5000, 3))
+        expected = np.all(hull.equations[:, :3] @ points.T + hull.equations[:, 3:] < 0, axis=0)
+        tester = get_mesh_inside_tester(verts, faces)
+        self.assertTrue((tester.contains(points) == expected).all())
+        self.assertIs(get_mesh_inside_tester(verts, faces), tester)
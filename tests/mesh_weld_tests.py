@@ -0,0 +1,94 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.mesh_weld import find_close_pairs, find_doubles, weld_mesh, take_data
+from sverchok.utils.sv_bmesh_utils import remove_doubles
+
+
+def brute_force_doubles(points, distance):
+    targets = list(range(len(points)))
+    merged = [False] * len(points)
+    for i in range(len(points)):
+        if merged[i]:
+            continue
+        for j in range(i + 1, len(points)):
+            if not merged[j] and np.linalg.norm(points[i] - points[j]) <= distance:
+                merged[j] = True
+                targets[j] = i
+    return targets
+
+
+def mesh_geometry(verts, edges, faces, face_data):
+    """Mesh as sets of coordinates, independent of order of elements"""
+    def face_key(face):
+        coords = [tuple(verts[i]) for i in face]
+        start = coords.index(min(coords))
+        return tuple(coords[start:] + coords[:start])
+    return (set(map(tuple, verts)),
+            {frozenset((tuple(verts[i]), tuple(verts[j]))) for i, j in edges},
+            {(face_key(face), item) for face, item in zip(faces, face_data)})
+
+
+class MeshWeldTests(SverchokTestCase):
+    def test_close_pairs(self):
+        points = np.round(np.random.default_rng(1).random((200, 3)) * 3, 1)
+        distances = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+        for distance in [0.0, 0.15, 0.33]:
+            with self.subTest(distance=distance):
+                i, j = find_close_pairs(points, distance)
+                expected_i, expected_j = np.nonzero(np.triu(distances <= distance, 1))
+                self.assertEqual(sorted(zip(i.tolist(), j.tolist())),
+                                 sorted(zip(expected_i.tolist(), expected_j.tolist())))
+
+    def test_doubles(self):
+        points = np.random.default_rng(2).random((300, 3))
+        self.assertEqual(find_doubles(points, 0.1).tolist(), brute_force_doubles(points, 0.1))
+        # points of a chain are merged without chains of merges
+        chain = np.zeros((20, 3))
+        chain[:, 0] = np.arange(20) * 0.4
+        self.assertEqual(find_doubles(chain, 1.0).tolist(), brute_force_doubles(chain, 1.0))
+
+    def test_mask(self):
+        points = np.zeros((4, 3))
+        targets = find_doubles(points, 0.01, mask=[True, False, True, True])
+        self.assertEqual(targets.tolist(), [0, 1, 0, 0])
+
+    def test_weld_mesh(self):
+        # two quads with coinciding vertices along the common side
+        verts = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (1, 0, 0), (2, 0, 0), (2, 1, 0), (1, 1, 0)]
+        faces = [[0, 1, 2, 3], [4, 5, 6, 7]]
+        new_verts, edges, new_faces, data = weld_mesh(verts, [], faces, 0.001)
+        self.assertEqual(len(new_verts), 6)
+        self.assertEqual(new_faces.to_lists(), [[0, 1, 2, 3], [1, 4, 5, 2]])
+        self.assertEqual(len(edges), 7)
+        self.assertEqual(data['vert_init_index'].tolist(), [0, 1, 2, 3, 5, 6])
+        self.assertEqual(data['face_init_index'].tolist(), [0, 1])
+
+    def test_degenerate_elements(self):
+        verts = [(0, 0, 0), (1, 0, 0), (1, 0.001, 0), (0, 1, 0), (0, 1, 0)]
+        edges = [[0, 3], [3, 4]]
+        faces = [[0, 1, 2], [0, 1, 3], [0, 2, 4]]
+        new_verts, new_edges, new_faces, data = weld_mesh(verts, edges, faces, 0.01)
+        # the first face collapses, the last one becomes equal to the second one
+        self.assertEqual(new_faces.to_lists(), [[0, 1, 2]])
+        self.assertEqual(data['face_init_index'].tolist(), [1])
+        self.assertEqual(new_edges.tolist(), [[0, 1], [1, 2], [2, 0]])
+        self.assertEqual(data['edge_init_index'].tolist(), [-1, -1, 0])
+        self.assertEqual(take_data(['a', 'b'], data['edge_init_index']), [None, None, 'a'])
+
+    def test_compare_with_bmesh(self):
+        # grid of quads, each with its own vertices, which coincide exactly
+        # with vertices of neighbours, so merged vertices have the same coordinates
+        verts = []
+        faces = []
+        for i in range(5):
+            for j in range(4):
+                corners = [(i, j, 0.0), (i + 1, j, 0.0), (i + 1, j + 1, 0.0), (i, j + 1, 0.0)]
+                faces.append(list(range(len(verts), len(verts) + 4)))
+                verts.extend(corners)
+        edges = [[0, 5], [1, 2]]
+        face_data = list(range(len(faces)))
+        expected = remove_doubles(verts, edges, faces, 0.001, face_data=face_data, implementation='BMESH')
+        result = remove_doubles(verts, edges, faces, 0.001, face_data=face_data, implementation='NUMPY')
+        self.assertEqual(mesh_geometry(*result[:3], result[3]['faces']),
+                         mesh_geometry(*expected[:3], expected[3]['faces']))
@@ -0,0 +1,68 @@
+import csv
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.node_stats import SvTreeStats, estimate_size
+
+
+def make_record(name, duration, error=None):
+    return {"name": name, "bl_idname": "SvTestNode", "start": 0.0, "duration": duration,
+            "items_in": {"Vertices": 1}, "items_out": {"Vertices": 1}, "bytes_out": 100,
+            "cache_hits": 1, "cache_misses": 0, "error": error}
+
+
+class NodeStatsTests(SverchokTestCase):
+    def make_stats(self):
+        stats = SvTreeStats("Tree", size=100)
+        for i in range(3):
+            stats.new_update()
+            stats.add(make_record("Fast", 0.01))
+            stats.add(make_record("Slow", 0.1 * (i + 1)))
+        stats.add(make_record("Broken", 0.0, error="ValueError()"))
+        return stats
+
+    def test_ring_buffer(self):
+        stats = SvTreeStats("Tree", size=5)
+        for i in range(10):
+            stats.add(make_record(f"Node.{i}", 0.1))
+        self.assertEqual([r["name"] for r in stats.records], [f"Node.{i}" for i in range(5, 10)])
+
+    def test_query(self):
+        stats = self.make_stats()
+        self.assertEqual(len(stats.query(name="Slow")), 3)
+        self.assertEqual(len(stats.query(last_updates=1)), 3)
+        self.assertEqual([r["name"] for r in stats.query(errors_only=True)], ["Broken"])
+
+    def test_top(self):
+        stats = self.make_stats()
+        top = stats.top(2)
+        self.assertEqual([item["name"] for item in top], ["Slow", "Fast"])
+        self.assertAlmostEqual(top[0]["total"], 0.6)
+        self.assertAlmostEqual(top[0]["max"], 0.3)
+        self.assertEqual(stats.top(1, key="mean")[0]["calls"], 3)
+
+    def test_export(self):
+        stats = self.make_stats()
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "stats.json")
+            stats.to_json(json_path)
+            with open(json_path) as f:
+                data = json.load(f)
+            self.assertEqual(len(data["records"]), 7)
+
+            csv_path = os.path.join(directory, "stats.csv")
+            stats.to_csv(csv_path)
+            with open(csv_path, newline='') as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(len(rows), 7)
+            self.assertEqual(json.loads(rows[0]["items_in"]), {"Vertices": 1})
+
+    def test_estimate_size(self):
+        array = np.zeros((100, 3))
+        self.assertEqual(estimate_size(array), array.nbytes)
+        verts = [[(0.0, 0.0, 0.0)] * 10] * 2
+        self.assertGreater(estimate_size(verts), 20 * 3 * 8)
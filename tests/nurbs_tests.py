@@ -1,16 +1,18 @@
 import numpy as np
 import unittest
+import time
 from math import pi
 
 from mathutils import Matrix
 
-from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.utils.testing import SverchokTestCase, requires, manual_only
+from sverchok.utils.logging import info
 from sverchok.utils.geom import circle_by_three_points
 from sverchok.utils.curve import knotvector as sv_knotvector
 from sverchok.utils.curve.primitives import SvCircle
 from sverchok.utils.curve.nurbs import SvGeomdlCurve, SvNativeNurbsCurve, SvNurbsBasisFunctions, SvNurbsCurve
 from sverchok.utils.curve.nurbs_algorithms import interpolate_nurbs_curve
-from sverchok.utils.nurbs_common import elevate_bezier_degree, from_homogenous
+from sverchok.utils.nurbs_common import elevate_bezier_degree, from_homogenous, basis_function_derivatives
 from sverchok.utils.surface.nurbs import SvGeomdlSurface, SvNativeNurbsSurface
 from sverchok.utils.surface.algorithms import SvCurveLerpSurface
 from sverchok.dependencies import geomdl
@@ -191,6 +193,85 @@ class NurbsCurveTests(SverchokTestCase):
         expected = np.array([1])
         self.assert_numpy_arrays_equal(ns, expected, precision=8)
 
+class SpanBasisTests(SverchokTestCase):
+    def to_dense(self, spans, values, degree, count):
+        # Convert values of non-zero basis functions to
+        # a dense (n, count) matrix
+        n = len(spans)
+        result = np.zeros((n, count))
+        for row in range(n):
+            for j in range(degree+1):
+                i = spans[row] - degree + j
+                if 0 <= i < count:
+                    result[row, i] = values[row, j]
+        return result
+
+    def check_knotvector(self, degree, knotvector):
+        knotvector = np.array(knotvector, dtype=np.float64)
+        count = len(knotvector) - degree - 1
+        ts = np.concatenate((np.linspace(knotvector[0] - 0.5, knotvector[-1] + 0.5, num=37), knotvector))
+        spans, values = basis_function_derivatives(knotvector, degree, ts, order=degree)
+        for order in range(degree+1):
+            with self.subTest(knotvector=knotvector, order=order):
+                functions = SvNurbsBasisFunctions(knotvector)
+                expected = np.array([functions.derivative(i, degree, order)(ts) for i in range(count)]).T
+                result = self.to_dense(spans, values[order], degree, count)
+                self.assert_numpy_arrays_equal(result, expected, precision=8)
+
+    def test_clamped(self):
+        self.check_knotvector(3, [0, 0, 0, 0, 0.5, 1, 1, 1, 1])
+
+    def test_unclamped(self):
+        self.check_knotvector(3, [0, 1, 2, 3, 4, 5, 6, 7])
+
+    def test_multiple_knots(self):
+        self.check_knotvector(2, [0, 0, 0, 0.3, 0.3, 0.3, 0.6, 1, 1, 1])
+
+    def test_curve_derivatives(self):
+        degree = 3
+        knotvector = [0, 0, 0, 0, 0.2, 0.5, 0.5, 0.7, 1, 1, 1, 1]
+        control_points = np.array([[0, 0, 0], [1, 2, 0], [2, 3, 1], [3, 0, 0],
+                        [4, 1, 2], [5, 2, 0], [6, 0, 1], [7, 1, 0]], dtype=np.float64)
+        weights = np.array([1, 2, 1, 0.5, 1, 3, 1, 1], dtype=np.float64)
+        curve = SvNativeNurbsCurve(degree, knotvector, control_points, weights)
+        ts = np.linspace(0, 1, num=50)
+        functions = SvNurbsBasisFunctions(knotvector)
+        for order in range(degree+1):
+            with self.subTest(order=order):
+                ns = np.array([functions.derivative(i, degree, order)(ts) for i in range(len(control_points))])
+                coeffs = ns * weights[np.newaxis].T
+                expected_numerator = (coeffs[np.newaxis].T * control_points).sum(axis=1)
+                expected_denominator = coeffs.sum(axis=0)[np.newaxis].T
+                numerator, denominator = curve.fraction(order, ts)
+                self.assert_numpy_arrays_equal(numerator, expected_numerator, precision=8)
+                self.assert_numpy_arrays_equal(denominator, expected_denominator, precision=8)
+
+    @manual_only
+    def test_benchmark(self):
+        degree = 3
+        n_points = 300
+        n_ts = 100000
+        knotvector = sv_knotvector.generate(degree, n_points)
+        control_points = np.random.rand(n_points, 3)
+        weights = np.random.rand(n_points) + 0.5
+        curve = SvNativeNurbsCurve(degree, knotvector, control_points, weights)
+        ts = np.linspace(0, 1, num=n_ts)
+
+        start = time.perf_counter()
+        functions = SvNurbsBasisFunctions(knotvector)
+        ns = np.array([functions.derivative(i, degree, 0)(ts) for i in range(n_points)])
+        coeffs = ns * weights[np.newaxis].T
+        expected = (coeffs[np.newaxis].T * control_points).sum(axis=1) / coeffs.sum(axis=0)[np.newaxis].T
+        dense_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = curve.evaluate_array(ts)
+        span_time = time.perf_counter() - start
+
+        info("NURBS curve (%s points, %s parameters): full basis matrix: %.3fs, span-based: %.3fs",
+                n_points, n_ts, dense_time, span_time)
+        self.assert_numpy_arrays_equal(result, expected, precision=8)
+
 class NurbsSurfaceTests(SverchokTestCase):
     def setUp(self):
         super().setUp()
@@ -292,6 +373,63 @@ class NurbsSurfaceTests(SverchokTestCase):
         vs2 = native_surface.gauss_curvature_array(self.us, self.vs)
         self.assert_numpy_arrays_equal(vs1, vs2, precision=8, fail_fast=False)
 
+    def test_fraction(self):
+        weights = [[1,1,1,1], [1,2,3,1], [1,3,4,1], [1,4,5,1], [1,1,1,1]]
+        surface = SvNativeNurbsSurface(self.degree_u, self.degree_v, self.knotvector_u, self.knotvector_v, self.control_points, weights)
+        surface.eval_chunk_size = 5
+        functions_u = SvNurbsBasisFunctions(self.knotvector_u)
+        functions_v = SvNurbsBasisFunctions(self.knotvector_v)
+        control_points = np.array(self.control_points)
+        weights = np.array(weights, dtype=np.float64)
+        ku, kv, _ = control_points.shape
+        for order_u in range(3):
+            for order_v in range(3):
+                with self.subTest(order_u=order_u, order_v=order_v):
+                    nsu = np.array([functions_u.derivative(i, self.degree_u, order_u)(self.us) for i in range(ku)]) # (ku, n)
+                    nsv = np.array([functions_v.derivative(i, self.degree_v, order_v)(self.vs) for i in range(kv)]) # (kv, n)
+                    coeffs = nsu[:,np.newaxis,:] * nsv[np.newaxis,:,:] * weights[:,:,np.newaxis] # (ku, kv, n)
+                    expected_numerator = np.einsum('ijn,ijc->nc', coeffs, control_points)
+                    expected_denominator = coeffs.sum(axis=(0,1))[np.newaxis].T
+                    numerator, denominator = surface.fraction(order_u, order_v, self.us, self.vs)
+                    self.assert_numpy_arrays_equal(numerator, expected_numerator, precision=8)
+                    self.assert_numpy_arrays_equal(denominator, expected_denominator, precision=8)
+
+    def test_eval_grid(self):
+        weights = [[1,1,1,1], [1,2,3,1], [1,3,4,1], [1,4,5,1], [1,1,1,1]]
+        surface = SvNativeNurbsSurface(self.degree_u, self.degree_v, self.knotvector_u, self.knotvector_v, self.control_points, weights)
+        us = np.linspace(0.0, 1.0, num=7)
+        vs = np.linspace(0.0, 1.0, num=5)
+        grid_us, grid_vs = np.meshgrid(us, vs)
+        expected = surface.evaluate_array(grid_us.flatten(), grid_vs.flatten()).reshape((5, 7, 3))
+        result = surface.evaluate_grid(us, vs)
+        self.assert_numpy_arrays_equal(result, expected, precision=8)
+        expected = surface.normal_array(grid_us.flatten(), grid_vs.flatten()).reshape((5, 7, 3))
+        result = surface.normal_grid(us, vs)
+        self.assert_numpy_arrays_equal(result, expected, precision=8)
+
+    @manual_only
+    def test_benchmark(self):
+        degree = 3
+        n_points = 200
+        n_samples = 500
+        knotvector = sv_knotvector.generate(degree, n_points)
+        control_points = np.random.rand(n_points, n_points, 3)
+        surface = SvNativeNurbsSurface(degree, degree, knotvector, knotvector, control_points, None)
+        ts = np.linspace(0, 1, num=n_samples)
+        us, vs = np.meshgrid(ts, ts)
+
+        start = time.perf_counter()
+        expected = surface.evaluate_array(us.flatten(), vs.flatten())
+        array_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = surface.evaluate_grid(ts, ts)
+        grid_time = time.perf_counter() - start
+
+        info("NURBS surface (%sx%s points, %sx%s samples): evaluate_array: %.3fs, evaluate_grid: %.3fs",
+                n_points, n_points, n_samples, n_samples, array_time, grid_time)
+        self.assert_numpy_arrays_equal(result.reshape((n_samples*n_samples, 3)), expected, precision=8)
+
 class OtherNurbsTests(SverchokTestCase):
     def test_ruled_surface_1(self):
         """
@@ -0,0 +1,107 @@
+import threading
+import time
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, manual_only
+from sverchok.utils.logging import info
+from sverchok.core.parallel_update import execute_parallel, branch_wall_times, SvParallelUpdateError
+
+
+def make_branches(n_branches, length):
+    # Each branch is a chain of nodes, plus one final node depending on all branches
+    upstream = {}
+    branches = []
+    for b in range(n_branches):
+        branch = [f"B{b}.{i}" for i in range(length)]
+        for prev, name in zip(branch, branch[1:]):
+            upstream[name] = {prev}
+        branches.append(branch)
+    upstream["Final"] = {branch[-1] for branch in branches}
+    order = [name for branch in branches for name in branch] + ["Final"]
+    return order, upstream, branches
+
+
+class ParallelUpdateTests(SverchokTestCase):
+    def test_dependencies(self):
+        order, upstream, _ = make_branches(4, 5)
+        done = []
+        lock = threading.Lock()
+
+        def process(name):
+            with lock:
+                for dep in upstream.get(name, ()):
+                    self.assertIn(dep, done)
+                done.append(name)
+
+        timings = execute_parallel(order, upstream, process, lambda name: False, max_workers=4)
+        self.assertEqual(set(done), set(order))
+        self.assertEqual(set(timings.keys()), set(order))
+
+    def test_main_thread(self):
+        order, upstream, _ = make_branches(3, 3)
+        main_thread = threading.current_thread()
+        pinned = {"B0.1", "B2.2", "Final"}
+        threads = {}
+
+        def process(name):
+            threads[name] = threading.current_thread()
+
+        execute_parallel(order, upstream, process, pinned.__contains__, max_workers=2)
+        for name in pinned:
+            self.assertIs(threads[name], main_thread)
+
+    def test_error(self):
+        order, upstream, _ = make_branches(3, 3)
+        done = set()
+
+        def process(name):
+            if name == "B1.1":
+                raise ValueError("test")
+            done.add(name)
+
+        with self.assertRaises(SvParallelUpdateError) as cm:
+            execute_parallel(order, upstream, process, lambda name: False, max_workers=2)
+        self.assertEqual(cm.exception.name, "B1.1")
+        self.assertIsInstance(cm.exception.error, ValueError)
+        self.assertNotIn("B1.2", done)
+        self.assertNotIn("Final", done)
+        # independent branches are processed completely
+        self.assertTrue({"B0.2", "B2.2"}.issubset(done))
+        self.assertEqual(set(cm.exception.timings), done)
+
+    def test_several_errors(self):
+        order, upstream, _ = make_branches(3, 3)
+        failing = {"B0.0", "B2.1"}
+
+        def process(name):
+            if name in failing:
+                raise ValueError(name)
+
+        with self.assertRaises(SvParallelUpdateError) as cm:
+            execute_parallel(order, upstream, process, "B1.1".__eq__, max_workers=2)
+        self.assertEqual({name for name, _ in cm.exception.errors}, failing)
+        self.assertEqual(set(cm.exception.timings), {"B1.0", "B1.1", "B1.2", "B2.0"})
+
+    def test_branch_wall_times(self):
+        timings = {"A": (0.0, 1.0), "B": (1.0, 2.0), "C": (0.5, 0.5)}
+        self.assertEqual(branch_wall_times([["A", "B"], ["C"], ["D"]], timings), [3.0, 0.5, 0.0])
+
+    @manual_only
+    def test_benchmark(self):
+        order, upstream, branches = make_branches(8, 4)
+        data = np.random.rand(2000000)
+
+        def process(name):
+            np.sort(data)
+
+        start = time.perf_counter()
+        for name in order:
+            process(name)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        timings = execute_parallel(order, upstream, process, lambda name: False)
+        parallel = time.perf_counter() - start
+        info("8 branches x 4 nodes: sequential %.3fs, parallel %.3fs, branch wall times %s",
+             sequential, parallel, ["%.3f" % t for t in branch_wall_times(branches, timings)])
@@ -0,0 +1,72 @@
+import random
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.poisson_disk import SvPoissonDiskGrid, SvSamplingRandom
+
+
+def greedy_min_distance(points, min_r):
+    accepted = []
+    for i, point in enumerate(points):
+        if all(np.linalg.norm(point - points[j]) >= min_r for j in accepted):
+            accepted.append(i)
+    return accepted
+
+
+def greedy_radiuses(points, radiuses):
+    accepted = []
+    for i, point in enumerate(points):
+        if all(np.linalg.norm(point - points[j]) > radiuses[i] + radiuses[j] for j in accepted):
+            accepted.append(i)
+    return accepted
+
+
+class PoissonDiskGridTests(SverchokTestCase):
+    def test_min_distance(self):
+        points = np.random.default_rng(1).random((1000, 3))
+        grid = SvPoissonDiskGrid(min_r = 0.1)
+        mask = np.concatenate([grid.add(points[i:i+300]) for i in range(0, len(points), 300)])
+        self.assertEqual(np.where(mask)[0].tolist(), greedy_min_distance(points, 0.1))
+        self.assertEqual(len(grid), mask.sum())
+
+    def test_radiuses(self):
+        rng = np.random.default_rng(2)
+        points = rng.random((1000, 3))
+        radiuses = rng.random(1000) * 0.05
+        grid = SvPoissonDiskGrid(use_radiuses = True)
+        # smaller spheres come first, so the grid has to grow
+        order = np.argsort(radiuses)
+        points, radiuses = points[order], radiuses[order]
+        mask = np.concatenate([grid.add(points[i:i+200], radiuses[i:i+200]) for i in range(0, len(points), 200)])
+        self.assertEqual(np.where(mask)[0].tolist(), greedy_radiuses(points, radiuses))
+
+    def test_predicate(self):
+        points = np.array([[0.0, 0.0, 0.0], [0.05, 0.0, 0.0], [1.0, 0.0, 0.0]])
+        grid = SvPoissonDiskGrid(min_r = 0.1)
+        # Rejected by predicate, the first point does not block the second one
+        mask = grid.add(points, predicate = lambda idxs: idxs != 0)
+        self.assertEqual(mask.tolist(), [False, True, True])
+
+    def test_insert(self):
+        grid = SvPoissonDiskGrid(min_r = 0.5)
+        grid.insert([[0.0, 0.0, 0.0]])
+        mask = grid.add([[0.3, 0.0, 0.0], [0.0, 0.6, 0.0]])
+        self.assertEqual(mask.tolist(), [False, True])
+
+    def test_legacy_random(self):
+        # legacy mode continues to give the same numbers for the same seed
+        points = SvSamplingRandom(12345).points((0.0, 1.0), (1.0, 3.0), 3)
+        random.seed(12345)
+        expected = [[random.uniform(0.0, 1.0), random.uniform(1.0, 3.0)] for i in range(3)]
+        self.assertEqual(points.tolist(), expected)
+        values = SvSamplingRandom(1).values(0.0, np.array([1.0, 2.0]))
+        random.seed(1)
+        self.assertEqual(values.tolist(), [random.uniform(0.0, 1.0), random.uniform(0.0, 2.0)])
+
+    def test_numpy_random(self):
+        rng = SvSamplingRandom(5, legacy=False)
+        points = rng.points((0.0, 0.0, 0.0), (1.0, 2.0, 3.0), 100)
+        self.assertEqual(points.shape, (100, 3))
+        self.assertTrue(((points >= 0) & (points <= (1.0, 2.0, 3.0))).all())
+        self.assertEqual(rng.values(0.0, 1.0, 4).shape, (4,))
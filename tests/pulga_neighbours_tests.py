@@ -0,0 +1,65 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.pulga_physics_modular_core import (
+        add_at, SvNeighbourList, PulgaSystem,
+        SvCollisionForce, SvAttractionForce, SvAlignForce, SvFitForce)
+
+
+def brute_force_pairs(verts, radius):
+    dif_v = verts[:, np.newaxis, :] - verts[np.newaxis, :, :]
+    i, j = np.where(np.linalg.norm(dif_v, axis=2) <= radius)
+    mask = i < j
+    return set(zip(i[mask].tolist(), j[mask].tolist()))
+
+
+class PulgaNeighboursTests(SverchokTestCase):
+    def test_add_at(self):
+        rng = np.random.default_rng(1)
+        indices = rng.integers(0, 10, 50)
+        values = rng.random((50, 3))
+        expected = np.zeros((10, 3))
+        np.add.at(expected, indices, values)
+        result = np.zeros((10, 3))
+        add_at(result, indices, values)
+        self.assert_numpy_arrays_equal(result, expected, precision=12)
+
+    def test_neighbour_pairs(self):
+        rng = np.random.default_rng(2)
+        # two clusters far from each other
+        verts = np.concatenate((rng.random((200, 3)), rng.random((200, 3)) + [100.0, -50.0, 30.0]))
+        neighbours = SvNeighbourList(skin=0.0)
+        indexes = neighbours.update(verts, 0.2)
+        pairs = set((min(i, j), max(i, j)) for i, j in indexes.tolist())
+        self.assertEqual(len(pairs), len(indexes))
+        self.assertEqual(pairs, brute_force_pairs(verts, 0.2))
+
+    def test_neighbour_list_reuse(self):
+        rng = np.random.default_rng(3)
+        verts = rng.random((100, 3))
+        neighbours = SvNeighbourList(skin=0.5)
+        neighbours.update(verts, 0.2)
+        neighbours.update(verts + 0.01, 0.2)
+        self.assertEqual(neighbours.builds, 1)
+        neighbours.update(verts + [0.1, 0.0, 0.0] * (verts[:, :1] > 0.5), 0.2)
+        self.assertEqual(neighbours.builds, 2)
+
+    def test_cell_list_forces(self):
+        def simulate(use_cell_list):
+            rng = np.random.default_rng(4)
+            verts = rng.random((300, 3)) * 4
+            rads = rng.random(300) * 0.2 + 0.05
+            forces = [SvCollisionForce([0.1], use_cell_list=use_cell_list),
+                      SvAttractionForce([0.001], [2.0], [0.6], stop_on_collide=True, use_cell_list=use_cell_list),
+                      SvAlignForce([0.01], [1.0], [0.4], use_cell_list=use_cell_list),
+                      SvFitForce([0.01], [0.01], [0.3], 'Relative', use_cell_list=use_cell_list)]
+            ps = PulgaSystem([verts, [20], rads, [[0, 0, 0]], [0.05], [1.0], forces])
+            ps.setup_forces()
+            for _ in range(20):
+                ps.iterate()
+            return ps.verts, ps.rads
+
+        verts, rads = simulate(False)
+        cell_verts, cell_rads = simulate(True)
+        self.assert_numpy_arrays_equal(cell_verts, verts, precision=8)
+        self.assert_numpy_arrays_equal(cell_rads, rads, precision=8)
@@ -0,0 +1,59 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.ragged import SvRaggedArray, join_ragged, ragged_polygons_to_edges, sorted_unique_edges
+
+
+class RaggedArrayTests(SverchokTestCase):
+    def test_lists_conversion(self):
+        faces = [[0, 1, 2], [2, 1, 3, 4], [], [4, 5, 6, 7, 8]]
+        ragged = SvRaggedArray.from_lists(faces)
+        self.assertEqual(ragged.offsets.tolist(), [0, 3, 7, 7, 12])
+        self.assertEqual(len(ragged), 4)
+        self.assertEqual(ragged.to_lists(), faces)
+        self.assertEqual([face.tolist() for face in ragged], faces)
+        self.assertEqual(ragged[-1].tolist(), faces[-1])
+        self.assertEqual(ragged[1:3].to_lists(), faces[1:3])
+        self.assertEqual(ragged[[3, 0]].to_lists(), [faces[3], faces[0]])
+
+    def test_vectors(self):
+        verts = [[(0, 0, 0), (1, 0, 0)], [(0, 1, 0)]]
+        ragged = SvRaggedArray.from_lists(verts, dtype=np.float64)
+        self.assertEqual(ragged.values.shape, (3, 3))
+        self.assert_numpy_arrays_equal(ragged.mean(), np.array([[0.5, 0, 0], [0, 1, 0]]))
+
+    def test_regular_array(self):
+        faces = np.arange(12).reshape((3, 4))
+        ragged = SvRaggedArray.from_data(faces)
+        self.assertTrue(np.shares_memory(ragged.values, faces))
+        self.assertTrue(ragged.is_regular())
+        self.assertTrue(np.shares_memory(ragged.to_array(), faces))
+        self.assert_numpy_arrays_equal(ragged.to_array(), faces)
+
+    def test_reductions(self):
+        verts = np.array([[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0], [4, 4, 4]], dtype=np.float64)
+        faces = SvRaggedArray.from_lists([[0, 1, 2, 3], [1, 4, 2], []])
+        centers = faces.mean(verts)
+        self.assert_numpy_arrays_equal(centers[:2], np.array([[1, 1, 0], [8 / 3, 2, 4 / 3]]), precision=8)
+        self.assertTrue(np.isnan(centers[2]).all())
+        self.assertEqual(faces.reduce(np.maximum).tolist()[:2], [3, 4])
+        self.assertEqual(faces.sum().tolist(), [6, 7, 0])
+
+    def test_join(self):
+        a = SvRaggedArray.from_lists([[0, 1, 2]])
+        b = SvRaggedArray.from_lists([[0, 1, 2, 3], [3, 2, 1]])
+        joined = join_ragged([a, b], index_offsets=[0, 3])
+        self.assertEqual(joined.to_lists(), [[0, 1, 2], [3, 4, 5, 6], [6, 5, 4]])
+
+    def test_polygons_to_edges(self):
+        faces = [[0, 1, 2], [2, 1, 3, 4]]
+        edges = ragged_polygons_to_edges(SvRaggedArray.from_lists(faces))
+        self.assertEqual(edges.tolist(), [[0, 1], [1, 2], [2, 0], [2, 1], [1, 3], [3, 4], [4, 2]])
+        unique_edges = ragged_polygons_to_edges(faces, unique_edges=True)
+        self.assertEqual(unique_edges.tolist(), [[0, 1], [0, 2], [1, 2], [1, 3], [2, 4], [3, 4]])
+
+    def test_sorted_unique_edges(self):
+        edges = np.random.default_rng(1).integers(0, 20, (200, 2)).astype(np.int32)
+        result = sorted_unique_edges(edges)
+        self.assertEqual(result.dtype, np.int32)
+        self.assert_numpy_arrays_equal(result, np.unique(np.sort(edges), axis=0))
@@ -0,0 +1,35 @@
+import sys
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core.socket_data import sv_deep_copy, sv_deep_copy_counted, sv_readonly_view
+
+
+class SocketDataCopyTests(SverchokTestCase):
+    def test_counted_copy(self):
+        data = [[(0, 0, 0), (1, 0, 0)], [(0, 1, 0)]]
+        copy, size = sv_deep_copy_counted(data)
+        self.assertEqual(copy, sv_deep_copy(data))
+        self.assertIsNot(copy[0], data[0])
+        expected = sys.getsizeof(copy) + sys.getsizeof(copy[0]) + sys.getsizeof(copy[1])
+        self.assertEqual(size, expected)
+
+    def test_readonly_view(self):
+        array = np.zeros((3, 3))
+        data = [array]
+        view = sv_readonly_view(data)
+        self.assertFalse(view[0].flags.writeable)
+        self.assertTrue(array.flags.writeable)
+        with self.assertRaises(ValueError):
+            view[0][0, 0] = 1.0
+
+    def test_readonly_lists(self):
+        data = [[(0, 0, 0), (1, 0, 0)]]
+        self.assertIs(sv_readonly_view(data), data)
+
+    def test_copy_readonly(self):
+        view = sv_readonly_view([np.zeros(3)])
+        copy, size = sv_deep_copy_counted(view)
+        self.assertTrue(copy[0].flags.writeable)
+        self.assertEqual(size, sys.getsizeof(copy) + copy[0].nbytes)
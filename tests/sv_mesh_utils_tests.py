@@ -0,0 +1,25 @@
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.sv_mesh_utils import mesh_join, pols_to_edges_irregular_mesh
+
+
+class MeshUtilsTests(SverchokTestCase):
+    def test_mesh_join(self):
+        verts_1 = [(0, 0, 0), (1, 0, 0), (0, 1, 0)]
+        verts_2 = [(0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)]
+        verts, edges, faces = mesh_join([verts_1, verts_2], [[(0, 1)], [(2, 3), (3, 0)]], [[[0, 1, 2]], [[0, 1, 2, 3], [2, 1, 0]]])
+        self.assertEqual(verts, verts_1 + verts_2)
+        self.assertEqual(edges, [(0, 1), (5, 6), (6, 3)])
+        self.assertEqual(faces, [[0, 1, 2], [3, 4, 5, 6], [5, 4, 3]])
+
+    def test_mesh_join_no_edges(self):
+        verts, edges, faces = mesh_join([[(0, 0, 0)], [(1, 1, 1)]], [], [[], [[0, 0, 0]]])
+        self.assertEqual(edges, [])
+        self.assertEqual(faces, [[1, 1, 1]])
+
+    def test_irregular_edges(self):
+        faces = [[0, 1, 2, 3], [1, 4, 2]]
+        edges = pols_to_edges_irregular_mesh(faces, unique_edges=False)
+        # grouped by number of sides, each vertex is connected with previous one
+        self.assertEqual(edges.tolist(), [[1, 2], [4, 1], [2, 4], [0, 3], [1, 0], [2, 1], [3, 2]])
+        unique_edges = pols_to_edges_irregular_mesh(faces, unique_edges=True)
+        self.assertEqual(unique_edges.tolist(), [[0, 1], [0, 3], [1, 2], [1, 4], [2, 3], [2, 4]])
@@ -0,0 +1,131 @@
+import collections
+import random
+import time
+
+from sverchok.utils.testing import SverchokTestCase, manual_only
+from sverchok.utils.logging import info
+from sverchok.core.tree_graph import SvTreeGraph
+from sverchok.core.update_system import make_update_list
+
+
+def make_synthetic_dependencies(n_nodes, n_branches, seed=0):
+    # Each node depends on one or two previous nodes of the same branch
+    rnd = random.Random(seed)
+    deps = collections.defaultdict(set)
+    branches = [[] for _ in range(n_branches)]
+    for i in range(n_nodes):
+        name = f"Node.{i:05}"
+        branch = branches[i % n_branches]
+        for dep in rnd.sample(branch[-5:], min(len(branch), 2)):
+            deps[name].add(dep)
+        branch.append(name)
+    return deps
+
+
+class TreeGraphTest(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        #  A----B-----C-----D
+        #            /
+        #  E---F----G
+        #
+        #  H---I
+        self.nodes = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I']
+        self.deps = {'B': {'A'}, 'C': {'B', 'G'}, 'D': {'C'}, 'F': {'E'}, 'G': {'F'}, 'I': {'H'}}
+        self.graph = SvTreeGraph.from_dependencies(self.nodes, self.deps)
+
+    def assert_topologically_sorted(self, order, deps):
+        for name, node_deps in deps.items():
+            for dep in node_deps:
+                if name in order and dep in order:
+                    self.assertLess(order.index(dep), order.index(name))
+
+    def test_topological_order(self):
+        order = self.graph.topological_order()
+        self.assertEqual(set(order), set(self.nodes))
+        self.assert_topologically_sorted(order, self.deps)
+
+    def test_downstream(self):
+        self.assertEqual(self.graph.downstream_of(['F']), {'F', 'G', 'C', 'D'})
+        self.assertEqual(self.graph.upstream_of(['C']), {'A', 'B', 'C', 'E', 'F', 'G'})
+
+    def test_feeding_only(self):
+        self.assertEqual(self.graph.feeding_only(['C']), {'A', 'B', 'E', 'F', 'G'})
+        self.assertEqual(self.graph.feeding_only(['B']), {'A'})
+        self.assertEqual(self.graph.feeding_only(['B', 'D']), {'A', 'C', 'E', 'F', 'G'})
+
+    def test_components(self):
+        components = sorted(sorted(c) for c in self.graph.components())
+        self.assertEqual(components, [['A', 'B', 'C', 'D', 'E', 'F', 'G'], ['H', 'I']])
+
+    def test_update(self):
+        self.graph.topological_order()
+        deps = dict(self.deps)
+        deps['C'] = {'B'}
+        deps['H'] = {'D'}
+        affected = self.graph.update(self.nodes, deps)
+        self.assertEqual(affected, {'C', 'H'})
+        self.assertEqual(self.graph.downstream_of(['A']), {'A', 'B', 'C', 'D', 'H', 'I'})
+        self.assert_topologically_sorted(self.graph.topological_order(), deps)
+        components = sorted(sorted(c) for c in self.graph.components())
+        self.assertEqual(components, [['A', 'B', 'C', 'D', 'H', 'I'], ['E', 'F', 'G']])
+
+    def test_remove_node(self):
+        nodes = [n for n in self.nodes if n != 'C']
+        deps = {n: d - {'C'} for n, d in self.deps.items() if n != 'C'}
+        self.graph.update(nodes, deps)
+        self.assertEqual(self.graph.downstream_of(['A']), {'A', 'B'})
+        self.assertEqual(len(self.graph.components()), 4)
+
+    def test_cycle(self):
+        self.graph.add_link('D', 'A')
+        self.assertEqual(self.graph.topological_order(), [])
+        self.assertFalse(self.graph.is_valid)
+        self.graph.remove_link('D', 'A')
+        self.assertEqual(len(self.graph.topological_order()), len(self.nodes))
+
+    def test_cycle_in_other_component(self):
+        self.graph.add_link('I', 'H')
+        self.assertEqual(self.graph.sort({'H', 'I'}), [])
+        order = self.graph.sort({'A', 'B', 'C', 'E', 'F', 'G'})
+        self.assertEqual(set(order), {'A', 'B', 'C', 'E', 'F', 'G'})
+        self.assert_topologically_sorted(order, self.deps)
+        # the cycle is outside of given nodes
+        self.graph.add_link('D', 'A')
+        self.assertEqual(self.graph.sort({'E', 'F', 'G'}), ['E', 'F', 'G'])
+        self.assertEqual(self.graph.sort({'A', 'B'}), ['A', 'B'])
+        self.assertEqual(self.graph.sort({'A', 'B', 'C', 'D'}), [])
+
+    @manual_only
+    def test_benchmark(self):
+        for n_nodes in [1000, 5000]:
+            deps = make_synthetic_dependencies(n_nodes, n_branches=10)
+            names = [f"Node.{i:05}" for i in range(n_nodes)]
+            links = [(dep, name) for name, node_deps in deps.items() for dep in node_deps]
+            graph = SvTreeGraph.from_dependencies(names, deps)
+            graph.topological_order()
+            changed = names[:20]
+
+            # What make_tree_from_nodes did before: rebuild downward
+            # links from the list of links, walk and sort
+            start = time.perf_counter()
+            for name in changed:
+                down = collections.defaultdict(set)
+                for from_node, to_node in links:
+                    down[from_node].add(to_node)
+                out_set = {name}
+                stack = [name]
+                while stack:
+                    for other in down[stack.pop()]:
+                        if other not in out_set:
+                            out_set.add(other)
+                            stack.append(other)
+                make_update_list(None, out_set, deps)
+            old_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for name in changed:
+                graph.sort(graph.downstream_of([name]))
+            new_time = time.perf_counter() - start
+
+            info("Partial update lists for %s nodes: rebuilt: %.4fs, cached graph: %.4fs", n_nodes, old_time, new_time)
@@ -0,0 +1,104 @@
+import time
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, requires, manual_only
+from sverchok.utils.logging import info
+from sverchok.utils.voronoi import voronoi_bounded
+from sverchok.dependencies import scipy
+
+
+def face_keys(verts, faces, low, high):
+    """
+    Faces lying within the box between low and high, as cycles of rounded
+    coordinates, independent of first vertex and orientation.
+    """
+    keys = set()
+    for face in faces:
+        coords = [tuple(np.round(verts[i][:2], 6).tolist()) for i in face]
+        if not all(low[0] <= x <= high[0] and low[1] <= y <= high[1] for x, y in coords):
+            continue
+        cycles = []
+        for cycle in (coords, coords[::-1]):
+            start = cycle.index(min(cycle))
+            cycles.append(tuple(cycle[start:] + cycle[:start]))
+        keys.add(min(cycles))
+    return keys
+
+
+def polygon_area(verts):
+    xs, ys = verts[:, 0], verts[:, 1]
+    return 0.5 * (xs * np.roll(ys, -1) - np.roll(xs, -1) * ys).sum()
+
+
+@requires(scipy)
+class VoronoiScipyTests(SverchokTestCase):
+    def make_sites(self, n, seed=1):
+        rng = np.random.default_rng(seed)
+        return [(x, y, 0.0) for x, y in rng.random((n, 2))]
+
+    def test_box_faces(self):
+        sites = self.make_sites(50)
+        verts, edges, faces = voronoi_bounded(sites, bound_mode='BOX', clip=0.5,
+                make_faces=True, ordered_faces=True, max_sides=20, algorithm='SCIPY')
+        self.assertEqual(len(faces), len(sites))
+        verts = np.array(verts)
+        xs, ys = np.array(sites)[:, 0], np.array(sites)[:, 1]
+        box_area = (xs.max() - xs.min() + 1.0) * (ys.max() - ys.min() + 1.0)
+        areas = [polygon_area(verts[face]) for face in faces]
+        self.assertTrue(all(area > 0 for area in areas))
+        self.assertAlmostEqual(sum(areas), box_area, places=8)
+        # Euler characteristic of a disk
+        self.assertEqual(len(verts) - len(edges) + len(faces), 1)
+
+    def test_site_in_face(self):
+        sites = self.make_sites(30)
+        verts, edges, faces = voronoi_bounded(sites, bound_mode='CIRCLE', clip=0.5,
+                make_faces=True, ordered_faces=True, max_sides=20, algorithm='SCIPY')
+        verts = np.array(verts)[:, :2]
+        for site, face in zip(sites, faces):
+            poly = verts[face]
+            sides = np.roll(poly, -1, axis=0) - poly
+            to_site = np.array(site[:2]) - poly
+            cross = sides[:, 0] * to_site[:, 1] - sides[:, 1] * to_site[:, 0]
+            self.assertTrue((cross > 0).all())
+
+    def test_no_bounds(self):
+        sites = self.make_sites(30)
+        verts, edges, _ = voronoi_bounded(sites, bound_mode='BOX', clip=0.5,
+                draw_bounds=False, draw_hangs=False, algorithm='SCIPY')
+        xs, ys = np.array(sites)[:, 0], np.array(sites)[:, 1]
+        for x, y, z in verts:
+            self.assertTrue(xs.min() - 0.5 < x < xs.max() + 0.5)
+            self.assertTrue(ys.min() - 0.5 < y < ys.max() + 0.5)
+
+    def test_compare_python(self):
+        sites = self.make_sites(40, seed=2)
+        # cells near the bounds are clipped differently by two implementations,
+        # so only cells inside of the bounding box of sites are compared
+        low, high = np.array(sites).min(axis=0), np.array(sites).max(axis=0)
+        for bound_mode in ['BOX', 'CIRCLE']:
+            with self.subTest(bound_mode=bound_mode):
+                expected = voronoi_bounded(sites, bound_mode=bound_mode, clip=0.5,
+                        make_faces=True, max_sides=20, algorithm='PYTHON')
+                result = voronoi_bounded(sites, bound_mode=bound_mode, clip=0.5,
+                        make_faces=True, max_sides=20, algorithm='SCIPY')
+                expected_faces = face_keys(expected[0], expected[2], low, high)
+                self.assertGreater(len(expected_faces), 10)
+                self.assertEqual(face_keys(result[0], result[2], low, high), expected_faces)
+
+    def test_coinciding_sites(self):
+        sites = self.make_sites(20)
+        _, _, faces = voronoi_bounded(sites, clip=0.5, make_faces=True, max_sides=20, algorithm='SCIPY')
+        verts, _, doubled_faces = voronoi_bounded(sites + sites[3:5], clip=0.5,
+                make_faces=True, max_sides=20, algorithm='SCIPY')
+        self.assertEqual(len(doubled_faces), len(faces))
+
+    @manual_only
+    def test_benchmark(self):
+        for n in [1000, 10000, 50000]:
+            sites = self.make_sites(n)
+            start = time.perf_counter()
+            voronoi_bounded(sites, bound_mode='BOX', clip=0.1, make_faces=True,
+                    ordered_faces=True, max_sides=20, algorithm='SCIPY')
+            info("SciPy Voronoi for %s sites: %.3fs", n, time.perf_counter() - start)
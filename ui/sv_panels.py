@@ -19,7 +19,7 @@
 import bpy
 
 import sverchok
-from sverchok.utils import profile
+from sverchok.utils import profile, node_stats
 from sverchok.utils.sv_update_utils import version_and_sha
 from sverchok.ui.development import displaying_sverchok_nodes
 from sverchok.core.update_system import process_tree, build_update_list
@@ -40,6 +40,17 @@ class SvRemoveStaleDrawCallbacks(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class SvClearDiskCache(bpy.types.Operator):
+    """Remove all stored outputs of nodes from disk cache"""
+    bl_idname = "node.sv_clear_disk_cache"
+    bl_label = "Clear disk cache"
+
+    def execute(self, context):
+        from sverchok.utils.disk_cache import get_disk_cache
+        get_disk_cache().clear()
+        return {'FINISHED'}
+
+
 class SverchokPanels:
     bl_space_type = 'NODE_EDITOR'
     bl_region_type = 'UI'
@@ -85,6 +96,15 @@ class SV_PT_ActiveTreePanel(SverchokPanels, bpy.types.Panel):
         if ng.sv_show_error_in_tree:
             col.prop(ng, "sv_show_error_details")
         col.prop(ng, "sv_show_socket_menus")
+        col.prop(ng, "sv_parallel_update")
+        if ng.sv_parallel_update:
+            col.prop(ng, "sv_parallel_workers")
+        col.prop(ng, "sv_disk_cache")
+        if ng.sv_disk_cache:
+            col.prop(ng, "sv_disk_cache_min_time")
+            col.operator("node.sv_clear_disk_cache")
+        col.prop(ng, "sv_frame_cache_budget")
+        col.prop(ng, "sv_frame_cache_spill")
 
 
 class SV_PT_ProfilingPanel(SverchokPanels, bpy.types.Panel):
@@ -121,6 +141,16 @@ class SV_PT_ProfilingPanel(SverchokPanels, bpy.types.Panel):
         col_save.operator("node.sverchok_profile_save", text="Save data", icon="FILE_TICK")
         col_save.operator("node.sverchok_profile_reset", text="Reset data", icon="X")
 
+        col.separator()
+        col.label(text="Node statistics:")
+        if node_stats.is_enabled:
+            col.operator("node.sverchok_node_stats_toggle", text="Stop recording", icon="CANCEL")
+        else:
+            col.operator("node.sverchok_node_stats_toggle", text="Start recording", icon="TIME")
+        col.operator("node.sverchok_node_stats_report", text="Slowest nodes", icon="SORTTIME")
+        col.operator("node.sverchok_node_stats_export", text="Export", icon="EXPORT")
+        col.operator("node.sverchok_node_stats_reset", text="Reset", icon="X")
+
 
 class SV_PT_SverchokUtilsPanel(SverchokPanels, bpy.types.Panel):
     bl_idname = "SV_PT_SverchokUtilsPanel"
@@ -298,6 +328,7 @@ def view3d_show_live_mode(self, context):
 sv_tools_classes = [
     SV_PT_ToolsMenu,
     SvRemoveStaleDrawCallbacks,
+    SvClearDiskCache,
     SV_PT_ActiveTreePanel,
     SV_PT_ProfilingPanel,
     SV_PT_SverchokUtilsPanel,
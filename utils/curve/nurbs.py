@@ -17,7 +17,8 @@ from sverchok.utils.curve.algorithms import unify_curves_degree
 from sverchok.utils.curve.nurbs_algorithms import interpolate_nurbs_curve, unify_two_curves, unify_curves
 from sverchok.utils.nurbs_common import (
         SvNurbsMaths,SvNurbsBasisFunctions,
-        nurbs_divide, elevate_bezier_degree, from_homogenous
+        nurbs_divide, elevate_bezier_degree, from_homogenous,
+        basis_function_derivatives, span_control_indexes
     )
 from sverchok.utils.surface.nurbs import SvNativeNurbsSurface, SvGeomdlSurface
 from sverchok.utils.surface.algorithms import nurbs_revolution_surface
@@ -700,31 +701,32 @@ class SvNativeNurbsCurve(SvNurbsCurve):
         else:
             return numerator / denominator
 
-    def fraction(self, deriv_order, ts):
-        n = len(ts)
+    def fractions(self, max_order, ts):
+        """
+        Calculate numerator and denominator of the rational curve
+        expression, together with their derivatives of orders 0..max_order.
+        Only degree+1 basis functions, which are non-zero at each t,
+        are evaluated; see basis_function_derivatives().
+
+        returns: list of max_order+1 tuples (numerator, denominator),
+                 numerator of shape (n, 3), denominator of shape (n, 1).
+        """
+        ts = np.asarray(ts)
         p = self.degree
         k = len(self.control_points)
-        ns = np.array([self.basis.derivative(i, p, deriv_order)(ts) for i in range(k)]) # (k, n)
-        coeffs = ns * self.weights[np.newaxis].T # (k, n)
-        coeffs_t = coeffs[np.newaxis].T # (n, k, 1)
-        numerator = (coeffs_t * self.control_points) # (n, k, 3)
-        numerator = numerator.sum(axis=1) # (n, 3)
-        denominator = coeffs.sum(axis=0) # (n,)
+        spans, ns = basis_function_derivatives(self.knotvector, p, ts, order=max_order) # (order+1, n, p+1)
+        indexes = span_control_indexes(spans, p, k) # (n, p+1)
+        coeffs = ns * self.weights[indexes] # (order+1, n, p+1)
+        numerators = np.einsum('onj,njc->onc', coeffs, self.control_points[indexes]) # (order+1, n, 3)
+        denominators = coeffs.sum(axis=2)[..., np.newaxis] # (order+1, n, 1)
+        return list(zip(numerators, denominators))
 
-        return numerator, denominator[np.newaxis].T
+    def fraction(self, deriv_order, ts):
+        return self.fractions(deriv_order, ts)[deriv_order]
 
     def fraction_single(self, deriv_order, t):
-        p = self.degree
-        k = len(self.control_points)
-        ts = np.array([t])
-        ns = np.array([self.basis.derivative(i, p, deriv_order)(ts)[0] for i in range(k)]) # (k,)
-        coeffs = ns * self.weights # (k, )
-        coeffs_t = coeffs[np.newaxis].T
-        numerator = (coeffs_t * self.control_points) # (k, 3)
-        numerator = numerator.sum(axis=0) # (3,)
-        denominator = coeffs.sum(axis=0) # ()
-
-        return numerator, denominator
+        numerator, denominator = self.fraction(deriv_order, np.array([t]))
+        return numerator[0], denominator[0][0]
 
     def evaluate_array(self, ts):
         numerator, denominator = self.fraction(0, ts)
@@ -737,6 +739,18 @@ class SvNativeNurbsCurve(SvNurbsCurve):
         return self.tangent_array(np.array([t]))[0]
 
     def tangent_array(self, ts):
+        return self.derivatives_array(1, ts)[0]
+
+    def second_derivative(self, t):
+        return self.second_derivative_array(np.array([t]))[0]
+
+    def second_derivative_array(self, ts):
+        return self.derivatives_array(2, ts)[1]
+
+    def third_derivative_array(self, ts):
+        return self.derivatives_array(3, ts)[2]
+
+    def derivatives_array(self, n, ts):
         # curve = numerator / denominator
         # ergo:
         # numerator = curve * denominator
@@ -744,54 +758,27 @@ class SvNativeNurbsCurve(SvNurbsCurve):
         # numerator' = curve' * denominator + curve * denominator'
         # ergo:
         # curve' = (numerator' - curve*denominator') / denominator
-        numerator, denominator = self.fraction(0, ts)
-        curve = numerator / denominator
-        numerator1, denominator1 = self.fraction(1, ts)
-        curve1 = (numerator1 - curve*denominator1) / denominator
-        return curve1
-
-    def second_derivative(self, t):
-        return self.second_derivative_array(np.array([t]))[0]
-
-    def second_derivative_array(self, ts):
+        #
         # numerator'' = (curve * denominator)'' =
         #  = curve'' * denominator + 2 * curve' * denominator' + curve * denominator''
-        numerator, denominator = self.fraction(0, ts)
-        curve = numerator / denominator
-        numerator1, denominator1 = self.fraction(1, ts)
-        curve1 = (numerator1 - curve*denominator1) / denominator
-        numerator2, denominator2 = self.fraction(2, ts)
-        curve2 = (numerator2 - 2*curve1*denominator1 - curve*denominator2) / denominator
-        return curve2
-
-    def third_derivative_array(self, ts):
+        #
         # numerator''' = (curve * denominator)''' = 
-        #  = curve''' * denominator + 3 * curve'' * denominator' + 3 * curve' * denominator'' + denominator'''
-        numerator, denominator = self.fraction(0, ts)
+        #  = curve''' * denominator + 3 * curve'' * denominator' + 3 * curve' * denominator'' + curve * denominator'''
+        result = []
+        if n < 1:
+            return result
+        fractions = self.fractions(min(n, 3), ts)
+        numerator, denominator = fractions[0]
         curve = numerator / denominator
-        numerator1, denominator1 = self.fraction(1, ts)
+        numerator1, denominator1 = fractions[1]
         curve1 = (numerator1 - curve*denominator1) / denominator
-        numerator2, denominator2 = self.fraction(2, ts)
-        curve2 = (numerator2 - 2*curve1*denominator1 - curve*denominator2) / denominator
-        numerator3, denominator3 = self.fraction(3, ts)
-
-        curve3 = (numerator3 - 3*curve2*denominator1 - 3*curve1*denominator2 - curve*denominator3) / denominator
-        return curve3
-
-    def derivatives_array(self, n, ts):
-        result = []
-        if n >= 1:
-            numerator, denominator = self.fraction(0, ts)
-            curve = numerator / denominator
-            numerator1, denominator1 = self.fraction(1, ts)
-            curve1 = (numerator1 - curve*denominator1) / denominator
-            result.append(curve1)
+        result.append(curve1)
         if n >= 2:
-            numerator2, denominator2 = self.fraction(2, ts)
+            numerator2, denominator2 = fractions[2]
             curve2 = (numerator2 - 2*curve1*denominator1 - curve*denominator2) / denominator
             result.append(curve2)
         if n >= 3:
-            numerator3, denominator3 = self.fraction(3, ts)
+            numerator3, denominator3 = fractions[3]
             curve3 = (numerator3 - 3*curve2*denominator1 - 3*curve1*denominator2 - curve*denominator3) / denominator
             result.append(curve3)
         return result
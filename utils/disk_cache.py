@@ -0,0 +1,232 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Persistent content-addressed cache of node outputs.
+
+Outputs of a node are stored in a pickle file named by a key, which is
+a digest of everything the node's result depends on: node type and
+properties, values of unlinked input sockets, and digests of the data
+in linked inputs. So a node with unchanged properties and inputs can load
+its outputs instead of processing, also after the .blend file is reopened.
+
+Total size of files is limited; least recently used entries are removed
+first. Order of use is kept in modification times of the files, so it
+survives restarts too.
+
+Entries are loaded with pickle, so files are trusted only in a directory
+which belongs to the current user and can not be written by others; see
+prepare_directory(). By default the directory is in Blender's user data
+folder.
+
+This module does not depend on Blender API, though it asks Blender for
+the default directory when it is available.
+"""
+
+import collections
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
+# Protocol is fixed, so digests of the same data do not depend on Python version
+PICKLE_PROTOCOL = 4
+FILE_EXTENSION = ".pickle"
+
+# Directory of the shared cache, empty string means default_directory()
+cache_directory = ""
+# Maximum total size of files of the shared cache, in megabytes
+cache_size = 1024
+
+_shared_cache = None
+
+
+def data_digest(data):
+    """
+    Digest (hex string) of the data which can be sent between sockets.
+    Returns None if the data can not be serialized, e.g. if it contains
+    Blender objects.
+    """
+    try:
+        payload = pickle.dumps(data, protocol=PICKLE_PROTOCOL)
+    except Exception:
+        return None
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def combine_digests(*parts):
+    """Digest of a sequence of digests and plain values (strings, numbers, tuples)"""
+    return hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def default_directory():
+    """
+    Per-user directory for the shared cache: a folder in Blender's user
+    data directory, or a folder named by user in system temp directory
+    outside of Blender.
+    """
+    try:
+        import bpy
+        return bpy.utils.user_resource('DATAFILES', path="sverchok_cache")
+    except Exception:
+        pass
+    user = str(os.getuid()) if hasattr(os, 'getuid') else os.environ.get('USERNAME', "user")
+    return os.path.join(tempfile.gettempdir(), "sverchok_cache_" + user)
+
+
+def prepare_directory(directory):
+    """
+    Create the directory (readable only by the current user) if it does not
+    exist. Returns False if the directory can not be trusted: it is owned by
+    another user or can be written by other users, so somebody else could
+    put files there which would be unpickled.
+    """
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        stat = os.stat(directory)
+    except OSError:
+        return False
+    if hasattr(os, 'getuid'):
+        if stat.st_uid != os.getuid():
+            return False
+        if stat.st_mode & 0o022:
+            return False
+    return True
+
+
+class SvDiskCache():
+    """
+    Cache of picklable values in a directory, one file per key.
+    Methods can be called from several threads.
+    If the directory can not be trusted (see prepare_directory()),
+    the cache is disabled: nothing is loaded or stored.
+    """
+    def __init__(self, directory, max_size=1024 ** 3):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()  # key -> file size, least recently used first
+        self._total_size = 0
+        self._lock = threading.Lock()
+        self.enabled = prepare_directory(directory)
+        if self.enabled:
+            self._scan()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + FILE_EXTENSION)
+
+    def _scan(self):
+        if not os.path.isdir(self.directory):
+            return
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(FILE_EXTENSION):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name[:-len(FILE_EXTENSION)], stat.st_size))
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_size += size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def total_size(self):
+        """Total size of stored files in bytes"""
+        return self._total_size
+
+    def _drop(self, key):
+        self._total_size -= self._entries.pop(key)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            path = self._path(key)
+            try:
+                with open(path, 'rb') as f:
+                    value = pickle.load(f)
+                os.utime(path)
+            except Exception:
+                # broken or removed file
+                self._drop(key)
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Store the value. Returns False if it can not be pickled
+        or if it is larger than the size limit of the cache.
+        """
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+        if len(payload) > self.max_size or not self.enabled:
+            return False
+        with self._lock:
+            path = self._path(key)
+            # written into temporary file first, so other Blender instances never read half of the file
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return False
+            if key in self._entries:
+                self._total_size -= self._entries[key]
+            self._entries[key] = len(payload)
+            self._entries.move_to_end(key)
+            self._total_size += len(payload)
+            self._evict()
+            return True
+
+    def _evict(self):
+        while self._total_size > self.max_size and self._entries:
+            self._drop(next(iter(self._entries)))
+
+    def resize(self, max_size):
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+            self.hits = self.misses = 0
+
+
+def get_disk_cache():
+    """
+    Cache shared by all node trees, in the directory and with size limit
+    defined by cache_directory and cache_size.
+    """
+    global _shared_cache
+    directory = cache_directory or default_directory()
+    max_size = cache_size * 1024 * 1024
+    if _shared_cache is None or _shared_cache.directory != directory:
+        _shared_cache = SvDiskCache(directory, max_size)
+    elif _shared_cache.max_size != max_size:
+        _shared_cache.resize(max_size)
+    return _shared_cache
@@ -0,0 +1,141 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Helpers for derivatives of fields.
+
+Finite differences need field values at several points around each point
+(a stencil). Instead of calling evaluate_grid() once per stencil point,
+all of them are evaluated in one call, so nested fields are walked once.
+
+Fields which know their derivatives analytically combine them by the chain
+rule. Gradients are tuples of three arrays (d/dx, d/dy, d/dz); Hessians
+are tuples of six arrays (dxx, dyy, dzz, dxy, dyz, dxz).
+
+This module does not depend on Blender API.
+"""
+
+import numpy as np
+
+# Offsets (in steps) of stencil points for central differences of the first order
+GRADIENT_STENCIL = [(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)]
+# The same and the point itself
+LAPLACIAN_STENCIL = GRADIENT_STENCIL + [(0, 0, 0)]
+# Points used for derivatives of the second order
+HESSIAN_STENCIL = GRADIENT_STENCIL + [(1, 1, 0), (0, 1, 1), (1, 0, 1), (0, 0, 0)]
+
+
+def stencil_evaluate(field, xs, ys, zs, stencil, step):
+    """
+    Values of the field at points shifted by step * offset for each offset
+    in the stencil, calculated by one call of field.evaluate_grid().
+    Returns array of shape (len(stencil), n) for scalar field,
+    or (3, len(stencil), n) for vector field.
+    """
+    xs, ys, zs = np.asarray(xs), np.asarray(ys), np.asarray(zs)
+    n = len(xs)
+    offsets = np.asarray(stencil, dtype=np.float64) * step
+    all_xs = (xs[np.newaxis] + offsets[:, 0, np.newaxis]).ravel()
+    all_ys = (ys[np.newaxis] + offsets[:, 1, np.newaxis]).ravel()
+    all_zs = (zs[np.newaxis] + offsets[:, 2, np.newaxis]).ravel()
+    values = np.asarray(field.evaluate_grid(all_xs, all_ys, all_zs))
+    return values.reshape(values.shape[:-1] + (len(stencil), n))
+
+
+def finite_gradient(field, xs, ys, zs, step):
+    """Gradient of scalar field by central differences"""
+    v = stencil_evaluate(field, xs, ys, zs, GRADIENT_STENCIL, step)
+    dv_dx = (v[0] - v[1]) / (2*step)
+    dv_dy = (v[2] - v[3]) / (2*step)
+    dv_dz = (v[4] - v[5]) / (2*step)
+    return dv_dx, dv_dy, dv_dz
+
+
+def finite_derivatives(field, xs, ys, zs, step):
+    """
+    Values, gradient and Hessian of scalar field by finite differences.
+    Ref.: Curvature formulas for implicit curves and surfaces // Ron Goldman // doi:10.1016/j.cagd.2005.06.005
+    """
+    step2 = step*step
+    v_dx_plus, v_dx_minus, v_dy_plus, v_dy_minus, v_dz_plus, v_dz_minus, \
+        v_dxy_plus, v_dyz_plus, v_dxz_plus, v0 = stencil_evaluate(field, xs, ys, zs, HESSIAN_STENCIL, step)
+
+    dx = (v_dx_plus - v0) / step
+    dy = (v_dy_plus - v0) / step
+    dz = (v_dz_plus - v0) / step
+
+    dxx = (v_dx_plus - 2*v0 + v_dx_minus) / step2
+    dyy = (v_dy_plus - 2*v0 + v_dy_minus) / step2
+    dzz = (v_dz_plus - 2*v0 + v_dz_minus) / step2
+
+    dxy = (v_dxy_plus - v_dx_plus - v_dy_plus + v0) / step2
+    dyz = (v_dyz_plus - v_dy_plus - v_dz_plus + v0) / step2
+    dxz = (v_dxz_plus - v_dx_plus - v_dz_plus + v0) / step2
+
+    return v0, (dx, dy, dz), (dxx, dyy, dzz, dxy, dyz, dxz)
+
+
+def function_derivatives(function, values, step):
+    """
+    Values, first and second derivatives of a function of one variable
+    (such as falloff), by central differences.
+    """
+    f0 = function(values)
+    f_plus = function(values + step)
+    f_minus = function(values - step)
+    return f0, (f_plus - f_minus) / (2*step), (f_plus - 2*f0 + f_minus) / (step*step)
+
+
+def zero_hessian(xs):
+    zeros = np.zeros(np.shape(xs))
+    return (zeros,) * 6
+
+
+def outer_hessian(g1, g2):
+    """Symmetric part of outer product of two gradients, g1 g2^T + g2 g1^T, divided by 2"""
+    x1, y1, z1 = g1
+    x2, y2, z2 = g2
+    return (x1*x2, y1*y2, z1*z2,
+            (x1*y2 + y1*x2) / 2, (y1*z2 + z1*y2) / 2, (x1*z2 + z1*x2) / 2)
+
+
+def chain_gradient(df, gradient):
+    """Gradient of f(v), given f'(v) and gradient of v"""
+    return tuple(df * g for g in gradient)
+
+
+def chain_hessian(df, d2f, gradient, hessian):
+    """Hessian of f(v), given f'(v), f''(v), gradient and Hessian of v"""
+    outer = outer_hessian(gradient, gradient)
+    return tuple(df * h + d2f * o for h, o in zip(hessian, outer))
+
+
+def binary_chain_gradient(partials, gradient1, gradient2):
+    """Gradient of f(a, b), given partial derivatives (fa, fb, ...) of f and gradients of a and b"""
+    fa, fb = partials[:2]
+    return tuple(fa * g1 + fb * g2 for g1, g2 in zip(gradient1, gradient2))
+
+
+def binary_chain_hessian(partials, gradient1, gradient2, hessian1, hessian2):
+    """
+    Hessian of f(a, b), given partial derivatives (fa, fb, faa, fab, fbb)
+    of f, gradients and Hessians of a and b.
+    """
+    fa, fb, faa, fab, fbb = partials
+    outer11 = outer_hessian(gradient1, gradient1)
+    outer22 = outer_hessian(gradient2, gradient2)
+    outer12 = outer_hessian(gradient1, gradient2)
+    return tuple(fa*h1 + fb*h2 + faa*o11 + fbb*o22 + 2*fab*o12
+                 for h1, h2, o11, o22, o12 in zip(hessian1, hessian2, outer11, outer22, outer12))
+
+
+def safe_divide(a, b):
+    """a / b, or 0 where b is 0 (e.g. direction to the point itself)"""
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=np.float64), b)
+    result = np.zeros(a.shape)
+    np.divide(a, b, out=result, where=(b != 0))
+    return result
@@ -0,0 +1,160 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Evaluation of fields at large numbers of points.
+
+Fields are nested objects (a formula of a binary operation of a distance
+field and so on), and evaluate_grid() of each of them allocates arrays
+of the full size for its results. For millions of points, the memory
+needed for such temporaries of the whole tree is too large. Here the
+points are split into chunks, which are evaluated one by one (or by a
+pool of threads) and written into preallocated output arrays, so the
+memory used by temporaries is bounded by the chunk size.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from sverchok.utils.field.scalar import SvScalarField
+from sverchok.utils.field.vector import SvVectorField
+
+# Memory which can be used by temporary arrays of one chunk, in bytes
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+MIN_CHUNK_SIZE = 4096
+
+FIELD_TYPES = (SvScalarField, SvVectorField)
+
+
+def field_children(field):
+    """Fields which the field is made of, e.g. operands of a binary operation"""
+    for value in vars(field).values():
+        if isinstance(value, FIELD_TYPES):
+            yield value
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                if isinstance(item, FIELD_TYPES):
+                    yield item
+
+
+def walk_field(field):
+    """All fields of the tree, starting with the field itself; each one is given once"""
+    seen = set()
+    stack = [field]
+    while stack:
+        field = stack.pop()
+        if id(field) in seen:
+            continue
+        seen.add(id(field))
+        yield field
+        stack.extend(field_children(field))
+
+
+def get_chunk_size(field, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    Number of points per chunk, such that temporary arrays of all fields
+    of the tree fit into memory_budget. Each field is supposed to keep a few
+    arrays of float64 per point (3 components for vector fields).
+    """
+    bytes_per_point = 0
+    for subfield in walk_field(field):
+        components = 3 if isinstance(subfield, SvVectorField) else 1
+        bytes_per_point += 4 * components * 8
+    return max(MIN_CHUNK_SIZE, memory_budget // max(bytes_per_point, 1))
+
+
+def _chunks(n, chunk_size):
+    # chunks of nearly equal size, so that the last one is not too small
+    count = -(-n // chunk_size)
+    bounds = np.linspace(0, n, count + 1).astype(np.int64).tolist()
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _run_chunks(function, chunks, threads):
+    """Call function(start, end) for each chunk, in a thread pool if threads > 1"""
+    if threads is None or threads > 1:
+        # NumPy releases GIL in most of operations, so threads can work in parallel
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for _ in executor.map(lambda chunk: function(*chunk), chunks):
+                pass
+    else:
+        for start, end in chunks:
+            function(start, end)
+
+
+def _prepare(xs, ys, zs):
+    xs, ys, zs = np.asarray(xs), np.asarray(ys), np.asarray(zs)
+    shape = xs.shape
+    return shape, xs.ravel(), ys.ravel(), zs.ravel()
+
+
+def evaluate_scalar_field(field, xs, ys, zs, chunk_size=None, threads=1, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    The same as field.evaluate_grid(xs, ys, zs), but evaluated by chunks
+    of chunk_size points (by default it is calculated from memory_budget).
+    threads: number of threads evaluating chunks; None means
+    the default of ThreadPoolExecutor. Fields have to be thread-safe then.
+    Returns array of the same shape as xs.
+    """
+    shape, xs, ys, zs = _prepare(xs, ys, zs)
+    n = len(xs)
+    if chunk_size is None:
+        chunk_size = get_chunk_size(field, memory_budget)
+    if n <= chunk_size:
+        return np.asarray(field.evaluate_grid(xs, ys, zs)).reshape(shape)
+
+    chunks = _chunks(n, chunk_size)
+    # the first chunk is evaluated before others to know the type of values
+    start, end = chunks[0]
+    first = np.asarray(field.evaluate_grid(xs[start:end], ys[start:end], zs[start:end]))
+    result = np.empty(n, dtype=first.dtype)
+    result[start:end] = first
+    del first
+
+    def evaluate(start, end):
+        result[start:end] = field.evaluate_grid(xs[start:end], ys[start:end], zs[start:end])
+
+    _run_chunks(evaluate, chunks[1:], threads)
+    return result.reshape(shape)
+
+
+def evaluate_vector_field(field, xs, ys, zs, chunk_size=None, threads=1, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    The same as field.evaluate_grid(xs, ys, zs), but evaluated by chunks,
+    see evaluate_scalar_field(). Returns three arrays of the same shape as xs.
+    """
+    shape, xs, ys, zs = _prepare(xs, ys, zs)
+    n = len(xs)
+    if chunk_size is None:
+        chunk_size = get_chunk_size(field, memory_budget)
+    if n <= chunk_size:
+        rxs, rys, rzs = field.evaluate_grid(xs, ys, zs)
+        return np.asarray(rxs).reshape(shape), np.asarray(rys).reshape(shape), np.asarray(rzs).reshape(shape)
+
+    chunks = _chunks(n, chunk_size)
+    start, end = chunks[0]
+    first = [np.asarray(r) for r in field.evaluate_grid(xs[start:end], ys[start:end], zs[start:end])]
+    result = np.empty((3, n), dtype=np.result_type(*first))
+    result[:, start:end] = first
+    del first
+
+    def evaluate(start, end):
+        rxs, rys, rzs = field.evaluate_grid(xs[start:end], ys[start:end], zs[start:end])
+        result[0, start:end] = rxs
+        result[1, start:end] = rys
+        result[2, start:end] = rzs
+
+    _run_chunks(evaluate, chunks[1:], threads)
+    return result[0].reshape(shape), result[1].reshape(shape), result[2].reshape(shape)
+
+
+def evaluate_field(field, xs, ys, zs, **kwargs):
+    """Chunked evaluation of scalar or vector field"""
+    if isinstance(field, SvVectorField):
+        return evaluate_vector_field(field, xs, ys, zs, **kwargs)
+    return evaluate_scalar_field(field, xs, ys, zs, **kwargs)
@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+import threading
 import numpy as np
 from math import copysign, sqrt, sin, cos, atan2, acos, pi
 
@@ -15,6 +16,10 @@ from mathutils import bvhtree
 from sverchok.utils.math import from_cylindrical, from_spherical, to_cylindrical, to_spherical
 from sverchok.utils.geom import LineEquation, CircleEquation3D
 from sverchok.utils.kdtree import SvKdTree
+from sverchok.utils.field.differential import (
+        stencil_evaluate, finite_gradient, finite_derivatives, function_derivatives,
+        zero_hessian, chain_gradient, chain_hessian, binary_chain_gradient, binary_chain_hessian,
+        safe_divide, LAPLACIAN_STENCIL, GRADIENT_STENCIL)
 
 ##################
 #                #
@@ -22,6 +27,20 @@ from sverchok.utils.kdtree import SvKdTree
 #                #
 ##################
 
+def _distance_gradient(vectors, lengths, falloff, step, distances=None):
+    """
+    Gradient of distance field (optionally with falloff), given vectors
+    of shape (n, 3) from the nearest points of the attractor;
+    distances are lengths of vectors, if not given.
+    """
+    gradient = safe_divide(vectors, lengths[:, np.newaxis])
+    if falloff is not None:
+        if distances is None:
+            distances = lengths
+        _, df, _ = function_derivatives(falloff, distances, step)
+        gradient = df[:, np.newaxis] * gradient
+    return gradient[:, 0], gradient[:, 1], gradient[:, 2]
+
 class SvScalarField(object):
 
     def __repr__(self):
@@ -52,19 +71,28 @@ class SvScalarField(object):
         return np.array([dv_dx, dv_dy, dv_dz])
 
     def gradient_grid(self, xs, ys, zs, step=0.001):
-        v_dx_plus = self.evaluate_grid(xs+step, ys,zs)
-        v_dx_minus = self.evaluate_grid(xs-step,ys,zs)
-        v_dy_plus = self.evaluate_grid(xs, ys+step, zs)
-        v_dy_minus = self.evaluate_grid(xs, ys-step, zs)
-        v_dz_plus = self.evaluate_grid(xs, ys, zs+step)
-        v_dz_minus = self.evaluate_grid(xs, ys, zs-step)
-
-        dv_dx = (v_dx_plus - v_dx_minus) / (2*step)
-        dv_dy = (v_dy_plus - v_dy_minus) / (2*step)
-        dv_dz = (v_dz_plus - v_dz_minus) / (2*step)
-
-        R = np.stack((dv_dx, dv_dy, dv_dz))
-        return R[0], R[1], R[2]
+        """
+        Gradient at given points, as three arrays. Fields which know
+        their derivatives override this; by default, central differences
+        are used, with all stencil points evaluated in one call.
+        """
+        return finite_gradient(self, xs, ys, zs, step)
+
+    def value_gradient_grid(self, xs, ys, zs, step=0.001):
+        """
+        Values and gradient at given points. Fields which calculate
+        derivatives by chain rule override this, so that values of
+        nested fields are not calculated twice.
+        """
+        return self.evaluate_grid(xs, ys, zs), self.gradient_grid(xs, ys, zs, step)
+
+    def derivatives_grid(self, xs, ys, zs, step=0.001):
+        """
+        Values, gradient (three arrays) and Hessian (six arrays: dxx, dyy,
+        dzz, dxy, dyz, dxz) at given points. By default, finite differences
+        are used, with all stencil points evaluated in one call.
+        """
+        return finite_derivatives(self, xs, ys, zs, step)
 
 class SvConstantScalarField(SvScalarField):
     def __init__(self, value):
@@ -78,6 +106,13 @@ class SvConstantScalarField(SvScalarField):
         result = np.full_like(xs, self.value, dtype=np.float64)
         return result
 
+    def gradient_grid(self, xs, ys, zs, step=0.001):
+        zeros = np.zeros(np.shape(xs))
+        return zeros, zeros, zeros
+
+    def derivatives_grid(self, xs, ys, zs, step=0.001):
+        return self.evaluate_grid(xs, ys, zs), self.gradient_grid(xs, ys, zs), zero_hessian(xs)
+
 class SvVectorFieldDecomposed(SvScalarField):
     def __init__(self, vfield, coords, axis):
         self.vfield = vfield
@@ -182,9 +217,66 @@ class SvScalarFieldPointDistance(SvScalarField):
         else:
             return norm
 
+    def _norm_gradient(self, xs, ys, zs):
+        x0, y0, z0 = tuple(self.center)
+        points = np.stack((xs - x0, ys - y0, zs - z0))
+        if self.metric == 'EUCLIDEAN':
+            norms = np.linalg.norm(points, axis=0)
+            gradient = safe_divide(points, norms)
+        elif self.metric == 'CHEBYSHEV':
+            abs_points = np.abs(points)
+            norms = np.max(abs_points, axis=0)
+            gradient = np.zeros_like(points)
+            idx = np.argmax(abs_points, axis=0)
+            columns = np.arange(points.shape[1])
+            gradient[idx, columns] = np.sign(points[idx, columns])
+        elif self.metric == 'MANHATTAN':
+            norms = np.sum(np.abs(points), axis=0)
+            gradient = np.sign(points)
+        elif self.metric == 'CUSTOM':
+            p = self.power
+            norms = np.linalg.norm(points, axis=0, ord=p)
+            gradient = safe_divide(np.sign(points) * np.abs(points) ** (p - 1), norms ** (p - 1))
+        else:
+            raise Exception('Unknown metric')
+        return norms, points, gradient
+
+    def value_gradient_grid(self, xs, ys, zs, step=0.001):
+        norms, _, gradient = self._norm_gradient(xs, ys, zs)
+        if self.falloff is not None:
+            values, df, _ = function_derivatives(self.falloff, norms, step)
+            gradient = df * gradient
+        else:
+            values = norms
+        return values, (gradient[0], gradient[1], gradient[2])
+
+    def gradient_grid(self, xs, ys, zs, step=0.001):
+        return self.value_gradient_grid(xs, ys, zs, step)[1]
+
+    def derivatives_grid(self, xs, ys, zs, step=0.001):
+        if self.metric != 'EUCLIDEAN':
+            return super().derivatives_grid(xs, ys, zs, step)
+        norms, points, gradient = self._norm_gradient(xs, ys, zs)
+        # Hessian of distance: (I - n n^T) / r
+        nx, ny, nz = gradient
+        inv_norms = safe_divide(1.0, norms)
+        hessian = ((1 - nx*nx) * inv_norms, (1 - ny*ny) * inv_norms, (1 - nz*nz) * inv_norms,
+                   -nx*ny * inv_norms, -ny*nz * inv_norms, -nx*nz * inv_norms)
+        gradient = (nx, ny, nz)
+        if self.falloff is not None:
+            values, df, d2f = function_derivatives(self.falloff, norms, step)
+            return values, chain_gradient(df, gradient), chain_hessian(df, d2f, gradient, hessian)
+        return norms, gradient, hessian
+
 class SvScalarFieldBinOp(SvScalarField):
-    def __init__(self, field1, field2, function):
+    """
+    partials: optional function, which for values a, b of two fields returns
+    partial derivatives of the function: (fa, fb, faa, fab, fbb); it is used
+    to calculate derivatives by the chain rule.
+    """
+    def __init__(self, field1, field2, function, partials=None):
         self.function = function
+        self.partials = partials
         self.field1 = field1
         self.field2 = field2
 
@@ -196,9 +288,36 @@ class SvScalarFieldBinOp(SvScalarField):
         #func = lambda xs, ys, zs : self.function(self.field1.evaluate_grid(xs, ys, zs), self.field2.evaluate_grid(xs, ys, zs))
         #return np.vectorize(func, signature="(m),(m),(m)->(m)")(xs, ys, zs)
 
+    def value_gradient_grid(self, xs, ys, zs, step=0.001):
+        if self.partials is None:
+            return super().value_gradient_grid(xs, ys, zs, step)
+        a, gradient1 = self.field1.value_gradient_grid(xs, ys, zs, step)
+        b, gradient2 = self.field2.value_gradient_grid(xs, ys, zs, step)
+        return self.function(a, b), binary_chain_gradient(self.partials(a, b), gradient1, gradient2)
+
+    def gradient_grid(self, xs, ys, zs, step=0.001):
+        if self.partials is None:
+            return super().gradient_grid(xs, ys, zs, step)
+        return self.value_gradient_grid(xs, ys, zs, step)[1]
+
+    def derivatives_grid(self, xs, ys, zs, step=0.001):
+        if self.partials is None:
+            return super().derivatives_grid(xs, ys, zs, step)
+        a, gradient1, hessian1 = self.field1.derivatives_grid(xs, ys, zs, step)
+        b, gradient2, hessian2 = self.field2.derivatives_grid(xs, ys, zs, step)
+        partials = self.partials(a, b)
+        return (self.function(a, b),
+                binary_chain_gradient(partials, gradient1, gradient2),
+                binary_chain_hessian(partials, gradient1, gradient2, hessian1, hessian2))
+
 class SvScalarFieldVectorizedFunction(SvScalarField):
-    def __init__(self, field, function):
+    """
+    derivatives: optional function, which for values v of the field
+    returns first and second derivatives of the function: (f'(v), f''(v)).
+    """
+    def __init__(self, field, function, derivatives=None):
         self.function = function
+        self.derivatives = derivatives
         self.field = field
         self.__description__ = function.__name__
 
@@ -208,6 +327,25 @@ class SvScalarFieldVectorizedFunction(SvScalarField):
     def evaluate_grid(self, xs, ys, zs):
         return self.function(self.field.evaluate_grid(xs,ys,zs))
 
+    def value_gradient_grid(self, xs, ys, zs, step=0.001):
+        if self.derivatives is None:
+            return super().value_gradient_grid(xs, ys, zs, step)
+        v, gradient = self.field.value_gradient_grid(xs, ys, zs, step)
+        df, _ = self.derivatives(v)
+        return self.function(v), chain_gradient(df, gradient)
+
+    def gradient_grid(self, xs, ys, zs, step=0.001):
+        if self.derivatives is None:
+            return super().gradient_grid(xs, ys, zs, step)
+        return self.value_gradient_grid(xs, ys, zs, step)[1]
+
+    def derivatives_grid(self, xs, ys, zs, step=0.001):
+        if self.derivatives is None:
+            return super().derivatives_grid(xs, ys, zs, step)
+        v, gradient, hessian = self.field.derivatives_grid(xs, ys, zs, step)
+        df, d2f = self.derivatives(v)
+        return self.function(v), chain_gradient(df, gradient), chain_hessian(df, d2f, gradient, hessian)
+
 class SvCoordinateScalarField(SvScalarField):
     def __init__(self, coordinate):
         self.coordinate = coordinate
@@ -251,6 +389,37 @@ class SvCoordinateScalarField(SvScalarField):
         else:
             raise Exception("Unknown variable: " + self.coordinate)
 
+    def gradient_grid(self, xs, ys, zs, step=0.001):
+        zeros = np.zeros(np.shape(xs))
+        ones = np.ones(np.shape(xs))
+        if self.coordinate == 'X':
+            return ones, zeros, zeros
+        elif self.coordinate == 'Y':
+            return zeros, ones, zeros
+        elif self.coordinate == 'Z':
+            return zeros, zeros, ones
+        elif self.coordinate == 'CYL_RHO':
+            rho = np.sqrt(xs*xs + ys*ys)
+            return safe_divide(xs, rho), safe_divide(ys, rho), zeros
+        elif self.coordinate == 'PHI':
+            rho2 = xs*xs + ys*ys
+            return safe_divide(-ys, rho2), safe_divide(xs, rho2), zeros
+        elif self.coordinate == 'SPH_RHO':
+            rho = np.sqrt(xs*xs + ys*ys + zs*zs)
+            return safe_divide(xs, rho), safe_divide(ys, rho), safe_divide(zs, rho)
+        elif self.coordinate == 'SPH_THETA':
+            cyl_rho = np.sqrt(xs*xs + ys*ys)
+            rho2 = xs*xs + ys*ys + zs*zs
+            c = safe_divide(zs, rho2 * cyl_rho)
+            return xs * c, ys * c, safe_divide(-cyl_rho, rho2)
+        else:
+            raise Exception("Unknown variable: " + self.coordinate)
+
+    def derivatives_grid(self, xs, ys, zs, step=0.001):
+        if self.coordinate not in {'X', 'Y', 'Z'}:
+            return super().derivatives_grid(xs, ys, zs, step)
+        return self.evaluate_grid(xs, ys, zs), self.gradient_grid(xs, ys, zs), zero_hessian(xs)
+
 class SvNegatedScalarField(SvScalarField):
     def __init__(self, field):
         self.field = field
@@ -263,6 +432,17 @@ class SvNegatedScalarField(SvScalarField):
     def evaluate_grid(self, xs, ys, zs):
         return (- self.field.evaluate_grid(xs, ys, zs))
 
+    def value_gradient_grid(self, xs, ys, zs, step=0.001):
+        v, gradient = self.field.value_gradient_grid(xs, ys, zs, step)
+        return -v, tuple(-d for d in gradient)
+
+    def gradient_grid(self, xs, ys, zs, step=0.001):
+        return tuple(-d for d in self.field.gradient_grid(xs, ys, zs, step))
+
+    def derivatives_grid(self, xs, ys, zs, step=0.001):
+        v, gradient, hessian = self.field.derivatives_grid(xs, ys, zs, step)
+        return -v, tuple(-d for d in gradient), tuple(-d for d in hessian)
+
 class SvAbsScalarField(SvScalarField):
     def __init__(self, field):
         self.field = field
@@ -275,6 +455,18 @@ class SvAbsScalarField(SvScalarField):
     def evaluate_grid(self, xs, ys, zs):
         return np.abs(self.field.evaluate_grid(xs, ys, zs))
 
+    def value_gradient_grid(self, xs, ys, zs, step=0.001):
+        v, gradient = self.field.value_gradient_grid(xs, ys, zs, step)
+        return np.abs(v), chain_gradient(np.sign(v), gradient)
+
+    def gradient_grid(self, xs, ys, zs, step=0.001):
+        return self.value_gradient_grid(xs, ys, zs, step)[1]
+
+    def derivatives_grid(self, xs, ys, zs, step=0.001):
+        v, gradient, hessian = self.field.derivatives_grid(xs, ys, zs, step)
+        signs = np.sign(v)
+        return np.abs(v), chain_gradient(signs, gradient), chain_hessian(signs, 0, gradient, hessian)
+
 class SvVectorFieldsScalarProduct(SvScalarField):
     def __init__(self, field1, field2):
         self.field1 = field1
@@ -412,6 +604,17 @@ class SvLineAttractorScalarField(SvScalarField):
         else:
             return norms
 
+    def gradient_grid(self, xs, ys, zs, step=0.001):
+        direction = self.direction
+        direction2 = np.dot(direction, direction)
+        points = np.stack((xs, ys, zs)).T
+        to_center = self.center - points
+        dot = (to_center * direction).sum(axis=1)
+        vectors = to_center - (dot * direction[np.newaxis].T / direction2).T
+        norms = np.linalg.norm(vectors, axis=1)
+        # distance grows in the direction from the line
+        return _distance_gradient(-vectors, norms, self.falloff, step)
+
 class SvPlaneAttractorScalarField(SvScalarField):
     __description__ = "Plane Attractor"
 
@@ -431,19 +634,27 @@ class SvPlaneAttractorScalarField(SvScalarField):
         direction = self.direction
         direction2 = np.dot(direction, direction)
 
-        def func(vertex):
-            to_center = self.center - vertex
-            projection = np.dot(to_center, direction) * direction / direction2
-            return np.linalg.norm(projection)
-
         points = np.stack((xs, ys, zs)).T
-        norms = np.vectorize(func, signature='(3)->()')(points)
+        to_center = self.center - points
+        dot = to_center @ direction
+        norms = np.abs(dot) / sqrt(direction2)
         if self.falloff is not None:
             result = self.falloff(norms)
             return result
         else:
             return norms
 
+    def gradient_grid(self, xs, ys, zs, step=0.001):
+        direction = np.asarray(self.direction, dtype=np.float64)
+        points = np.stack((xs, ys, zs)).T
+        to_center = self.center - points
+        dot = to_center @ direction
+        length = np.linalg.norm(direction)
+        norms = np.abs(dot) / length
+        # unit vectors from the plane; zero on the plane itself
+        vectors = - np.sign(dot)[:, np.newaxis] * direction / length
+        return _distance_gradient(vectors, np.ones(len(norms)), self.falloff, step, norms)
+
 class SvCircleAttractorScalarField(SvScalarField):
     __description__ = "Circle Attractor"
 
@@ -469,6 +680,12 @@ class SvCircleAttractorScalarField(SvScalarField):
         else:
             return distances
 
+    def gradient_grid(self, xs, ys, zs, step=0.001):
+        vs = np.stack((xs, ys, zs)).T
+        vectors = vs - self.circle.get_projections(vs)
+        distances = np.linalg.norm(vectors, axis=1)
+        return _distance_gradient(vectors, distances, self.falloff, step)
+
 class SvBvhAttractorScalarField(SvScalarField):
     __description__ = "BVH Attractor"
 
@@ -621,12 +838,10 @@ class SvVectorFieldDivergence(SvScalarField):
     
     def evaluate_grid(self, xs, ys, zs):
         step = self.step
-        xs_dx_plus, _, _ = self.field.evaluate_grid(xs+step, ys,zs)
-        xs_dx_minus, _, _ = self.field.evaluate_grid(xs-step,ys,zs)
-        _, ys_dy_plus, _ = self.field.evaluate_grid(xs, ys+step, zs)
-        _, ys_dy_minus, _ = self.field.evaluate_grid(xs, ys-step, zs)
-        _, _, zs_dz_plus = self.field.evaluate_grid(xs, ys, zs+step)
-        _, _, zs_dz_minus = self.field.evaluate_grid(xs, ys, zs-step)
+        vectors = stencil_evaluate(self.field, xs, ys, zs, GRADIENT_STENCIL, step)
+        xs_dx_plus, xs_dx_minus = vectors[0, 0], vectors[0, 1]
+        ys_dy_plus, ys_dy_minus = vectors[1, 2], vectors[1, 3]
+        zs_dz_plus, zs_dz_minus = vectors[2, 4], vectors[2, 5]
 
         dx_dx = (xs_dx_plus - xs_dx_minus) / (2*step)
         dy_dy = (ys_dy_plus - ys_dy_minus) / (2*step)
@@ -656,13 +871,8 @@ class SvScalarFieldLaplacian(SvScalarField):
     
     def evaluate_grid(self, xs, ys, zs):
         step = self.step
-        v_dx_plus = self.field.evaluate_grid(xs+step, ys,zs)
-        v_dx_minus = self.field.evaluate_grid(xs-step,ys,zs)
-        v_dy_plus = self.field.evaluate_grid(xs, ys+step, zs)
-        v_dy_minus = self.field.evaluate_grid(xs, ys-step, zs)
-        v_dz_plus = self.field.evaluate_grid(xs, ys, zs+step)
-        v_dz_minus = self.field.evaluate_grid(xs, ys, zs-step)
-        v0 = self.field.evaluate_grid(xs, ys, zs)
+        v_dx_plus, v_dx_minus, v_dy_plus, v_dy_minus, v_dz_plus, v_dz_minus, v0 = \
+                stencil_evaluate(self.field, xs, ys, zs, LAPLACIAN_STENCIL, step)
 
         sides = v_dx_plus + v_dx_minus + v_dy_plus + v_dy_minus + v_dz_plus + v_dz_minus
         result = (sides - 6*v0) / (8 * step * step * step)
@@ -670,47 +880,70 @@ class SvScalarFieldLaplacian(SvScalarField):
 
 class ScalarFieldCurvatureCalculator(object):
     # Ref.: Curvature formulas for implicit curves and surfaces // Ron Goldman // doi:10.1016/j.cagd.2005.06.005
+    """
+    Derivatives of the field, shared by curvature fields made for the same
+    field (Gauss, mean and principal curvatures): when they are evaluated
+    at the same points, derivatives are calculated only once.
+    """
     def __init__(self, field, step):
         self.field = field
         self.step = step
         self.prev_xs = self.prev_ys = self.prev_zs = None
+        self._gauss = self._mean = None
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def evaluate(self, xs, ys, zs, function):
+        """
+        prepare() and function() as one step. Curvature fields can be evaluated
+        by several threads at once (see sverchok.utils.field.evaluation), while
+        cached derivatives are shared, so they are used under a lock.
+        """
+        with self._lock:
+            self.prepare(xs, ys, zs)
+            return function()
+
+    def _same_points(self, xs, ys, zs):
+        if self.prev_xs is None:
+            return False
+        for new, prev in zip((xs, ys, zs), (self.prev_xs, self.prev_ys, self.prev_zs)):
+            if new is not prev and not np.array_equal(new, prev):
+                return False
+        return True
 
     def prepare(self, xs, ys, zs):
-        #if (xs == self.prev_xs).all() and (ys == self.prev_ys).all() and (zs == self.prev_zs).all():
-        #    return
-        self.prev_xs = xs
-        self.prev_ys = ys
-        self.prev_zs = zs
+        if self._same_points(xs, ys, zs):
+            return
+        # copies, so that changes of arrays by caller do not break the comparison
+        self.prev_xs = np.array(xs)
+        self.prev_ys = np.array(ys)
+        self.prev_zs = np.array(zs)
+        self._gauss = self._mean = None
+
+        self.n = len(xs)
+        self.v0, gradient, hessian = self.field.derivatives_grid(xs, ys, zs, step=self.step)
+        self.dx, self.dy, self.dz = gradient
+        self.dxx, self.dyy, self.dzz, self.dxy, self.dyz, self.dxz = hessian
 
-        step = self.step
-        step2 = step*step
-        n = self.n = len(xs)
-        v_dx_plus = self.field.evaluate_grid(xs+step, ys,zs)
-        v_dx_minus = self.field.evaluate_grid(xs-step,ys,zs)
-        v_dy_plus = self.field.evaluate_grid(xs, ys+step, zs)
-        v_dy_minus = self.field.evaluate_grid(xs, ys-step, zs)
-        v_dz_plus = self.field.evaluate_grid(xs, ys, zs+step)
-        v_dz_minus = self.field.evaluate_grid(xs, ys, zs-step)
-
-        v_dxy_plus = self.field.evaluate_grid(xs+step, ys+step, zs)
-        v_dyz_plus = self.field.evaluate_grid(xs, ys+step, zs+step)
-        v_dxz_plus = self.field.evaluate_grid(xs+step, ys, zs+step)
-
-        v0 = self.v0 = self.field.evaluate_grid(xs, ys, zs)
-
-        self.dx = (v_dx_plus - v0) / step
-        self.dy = (v_dy_plus - v0) / step
-        self.dz = (v_dz_plus - v0) / step
-
-        self.dxx = (v_dx_plus - 2*v0 + v_dx_minus) / step2
-        self.dyy = (v_dy_plus - 2*v0 + v_dy_minus) / step2
-        self.dzz = (v_dz_plus - 2*v0 + v_dz_minus) / step2
+    def gauss(self):
+        if self._gauss is None:
+            self._gauss = self._calc_gauss()
+        return self._gauss
 
-        self.dxy = (v_dxy_plus - v_dx_plus - v_dy_plus + v0) / step2
-        self.dyz = (v_dyz_plus - v_dy_plus - v_dz_plus + v0) / step2
-        self.dxz = (v_dxz_plus - v_dx_plus - v_dz_plus + v0) / step2
+    def mean(self):
+        if self._mean is None:
+            self._mean = self._calc_mean()
+        return self._mean
 
-    def gauss(self):
+    def _calc_gauss(self):
         n = self.n
         M = np.empty((n, 4, 4))
         M[:, 0, 0] = self.dxx
@@ -735,7 +968,7 @@ class ScalarFieldCurvatureCalculator(object):
 
         return numerator / denominator
 
-    def mean(self):
+    def _calc_mean(self):
         n = self.n
         grad = np.empty((n, 1, 3))
         grad[:,0,0] = self.dx
@@ -780,8 +1013,7 @@ class SvScalarFieldGaussCurvature(SvScalarField):
         return self.evaluate_grid(np.array([x]), np.array([y]), np.array([z]))[0]
 
     def evaluate_grid(self, xs, ys, zs):
-        self.calculator.prepare(xs, ys, zs)
-        return self.calculator.gauss()
+        return self.calculator.evaluate(xs, ys, zs, self.calculator.gauss)
 
 class SvScalarFieldMeanCurvature(SvScalarField):
     def __init__(self, field, calculator):
@@ -792,8 +1024,7 @@ class SvScalarFieldMeanCurvature(SvScalarField):
         return self.evaluate_grid(np.array([x]), np.array([y]), np.array([z]))[0]
 
     def evaluate_grid(self, xs, ys, zs):
-        self.calculator.prepare(xs, ys, zs)
-        return self.calculator.mean()
+        return self.calculator.evaluate(xs, ys, zs, self.calculator.mean)
 
 class SvScalarFieldPrincipalCurvature(SvScalarField):
     def __init__(self, field, calculator, i):
@@ -805,8 +1036,7 @@ class SvScalarFieldPrincipalCurvature(SvScalarField):
         return self.evaluate_grid(np.array([x]), np.array([y]), np.array([z]))[0]
 
     def evaluate_grid(self, xs, ys, zs):
-        self.calculator.prepare(xs, ys, zs)
-        return self.calculator.value(self.i)
+        return self.calculator.evaluate(xs, ys, zs, lambda: self.calculator.value(self.i))
 
 class SvVoronoiScalarField(SvScalarField):
     __description__ = "Voronoi"
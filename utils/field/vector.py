@@ -17,6 +17,7 @@ from sverchok.utils.geom import LineEquation, CircleEquation3D
 from sverchok.utils.math import from_cylindrical, from_spherical, np_dot
 from sverchok.utils.kdtree import SvKdTree
 from sverchok.utils.field.voronoi import SvVoronoiFieldData
+from sverchok.utils.field.differential import stencil_evaluate, GRADIENT_STENCIL
 
 ##################
 #                #
@@ -816,12 +817,14 @@ class SvVectorFieldRotor(SvVectorField):
 
     def evaluate_grid(self, xs, ys, zs):
         step = self.step
-        _, y_dx_plus, z_dx_plus = self.field.evaluate_grid(xs+step,ys,zs)
-        _, y_dx_minus, z_dx_minus = self.field.evaluate_grid(xs-step,ys,zs)
-        x_dy_plus, _, z_dy_plus = self.field.evaluate_grid(xs, ys+step, zs)
-        x_dy_minus, _, z_dy_minus = self.field.evaluate_grid(xs, ys-step, zs)
-        x_dz_plus, y_dz_plus, _ = self.field.evaluate_grid(xs, ys, zs+step)
-        x_dz_minus, y_dz_minus, _ = self.field.evaluate_grid(xs, ys, zs-step)
+        # all shifted points are evaluated in one call
+        vx, vy, vz = stencil_evaluate(self.field, xs, ys, zs, GRADIENT_STENCIL, step)
+        y_dx_plus, z_dx_plus = vy[0], vz[0]
+        y_dx_minus, z_dx_minus = vy[1], vz[1]
+        x_dy_plus, z_dy_plus = vx[2], vz[2]
+        x_dy_minus, z_dy_minus = vx[3], vz[3]
+        x_dz_plus, y_dz_plus = vx[4], vy[4]
+        x_dz_minus, y_dz_minus = vx[5], vy[5]
 
         dy_dx = (y_dx_plus - y_dx_minus) / (2*step)
         dz_dx = (z_dx_plus - z_dx_minus) / (2*step)
@@ -0,0 +1,128 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Cache of fitness values for genetic algorithms (see the Evolver node).
+
+Agents are identified by their gene vectors: two agents with equal genes
+have the same fitness, as long as the rest of the node tree is not changed.
+The cache keeps at most max_size values and evicts least recently used ones.
+It can be saved to a JSON file:
+
+    {"signature": "...", "entries": [["<genes as JSON>", fitness], ...]}
+
+where entries are ordered from least to most recently used. The signature
+describes the genotype (gene names and limits); a file with different
+signature is ignored on load.
+
+This module does not depend on Blender API.
+"""
+
+import json
+import os
+from collections import OrderedDict
+
+
+def _to_builtin(obj):
+    # numpy scalars and arrays
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} can not be used as a gene value")
+
+
+def gene_key(genes):
+    """
+    Hashable key of gene vector (list of gene values, which can be nested lists).
+    """
+    return json.dumps(genes, default=_to_builtin, separators=(',', ':'))
+
+
+class SvFitnessCache(object):
+    """
+    LRU cache: gene vector -> fitness.
+    """
+    def __init__(self, max_size=10000, signature=""):
+        self.max_size = max_size
+        self.signature = signature
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, genes):
+        return gene_key(genes) in self.entries
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self.entries.clear()
+        self.reset_stats()
+
+    def get(self, genes, default=None):
+        key = gene_key(genes)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, genes, fitness):
+        key = gene_key(genes)
+        self.entries[key] = fitness
+        self.entries.move_to_end(key)
+        self.evict()
+
+    def evict(self):
+        while len(self.entries) > max(self.max_size, 0):
+            self.entries.popitem(last=False)
+
+    def resize(self, max_size):
+        self.max_size = max_size
+        self.evict()
+
+    def save(self, path):
+        entries = []
+        for key, fitness in self.entries.items():
+            try:
+                entries.append([key, float(fitness)])
+            except (TypeError, ValueError):
+                # Fitness values which can not be stored are only kept in memory
+                continue
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(dict(signature = self.signature, entries = entries), f)
+
+    def load(self, path):
+        """
+        Add entries from the file. Returns number of loaded entries;
+        0 if the file does not exist, can not be read or was saved for
+        another genotype.
+        """
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("signature") != self.signature:
+                return 0
+            entries = data["entries"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            return 0
+        for key, fitness in reversed(entries):
+            if key not in self.entries:
+                self.entries[key] = fitness
+                # entries which were used in this session stay the most recent
+                self.entries.move_to_end(key, last=False)
+        self.evict()
+        return len(entries)
@@ -0,0 +1,219 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Data of nodes recorded for animation frames (see Cache node).
+
+Each node tree has one SvFrameCache with a memory budget. When the size of
+data kept in memory exceeds the budget, least recently used frames are
+either forgotten or, if spilling is enabled, written into files in a private
+temporary directory; NumPy arrays of spilled frames are loaded back as
+read-only memory-mapped arrays, so long sequences do not have to fit into memory.
+
+This module does not depend on Blender API.
+"""
+
+import collections
+import os
+import pickle
+import shutil
+import tempfile
+
+import numpy as np
+
+from sverchok.utils.node_stats import estimate_size
+
+_tree_caches = {}
+
+
+class _ArrayRef():
+    """Placeholder of an array saved into separate .npy file"""
+    def __init__(self, index):
+        self.index = index
+
+
+def _extract_arrays(data, arrays):
+    if isinstance(data, np.ndarray):
+        if data.dtype == object:
+            return data
+        arrays.append(data)
+        return _ArrayRef(len(arrays) - 1)
+    if isinstance(data, (list, tuple)):
+        # lists of plain values (coordinates, indices) are not walked through
+        if not data or not isinstance(data[0], (list, tuple, dict, np.ndarray)):
+            return data
+        items = [_extract_arrays(item, arrays) for item in data]
+        return items if isinstance(data, list) else tuple(items)
+    if isinstance(data, dict):
+        return {key: _extract_arrays(value, arrays) for key, value in data.items()}
+    return data
+
+
+def _restore_arrays(data, arrays):
+    if isinstance(data, _ArrayRef):
+        return arrays[data.index]
+    if isinstance(data, (list, tuple)):
+        if not data or not isinstance(data[0], (list, tuple, dict, _ArrayRef)):
+            return data
+        items = [_restore_arrays(item, arrays) for item in data]
+        return items if isinstance(data, list) else tuple(items)
+    if isinstance(data, dict):
+        return {key: _restore_arrays(value, arrays) for key, value in data.items()}
+    return data
+
+
+class SvFrameCache():
+    """
+    Storage of data per (key, frame), where key is usually node_id.
+    budget is maximum size of data kept in memory, in bytes.
+    If spill_directory is None, frames over the budget are forgotten.
+    """
+    def __init__(self, budget=512 * 1024 * 1024, spill_directory=None):
+        self.budget = budget
+        self.spill_directory = spill_directory
+        self._memory = collections.OrderedDict()  # (key, frame) -> (data, size), least recently used first
+        self._memory_size = 0
+        self._spilled = {}  # (key, frame) -> (file path of pickled data, list of .npy paths)
+        self._file_counter = 0
+
+    def __contains__(self, item):
+        return item in self._memory or item in self._spilled
+
+    def __len__(self):
+        return len(self._memory) + len(self._spilled)
+
+    @property
+    def memory_size(self):
+        """Estimated size of data kept in memory, in bytes"""
+        return self._memory_size
+
+    @property
+    def spilled_count(self):
+        return len(self._spilled)
+
+    def frames(self, key):
+        """Sorted list of frames stored for the key"""
+        return sorted(frame for k, frame in self if k == key)
+
+    def __iter__(self):
+        yield from self._memory
+        yield from self._spilled
+
+    def get(self, key, frame, default=None):
+        item = (key, frame)
+        if item in self._memory:
+            self._memory.move_to_end(item)
+            return self._memory[item][0]
+        if item in self._spilled:
+            return self._load_spilled(item)
+        return default
+
+    def put(self, key, frame, data):
+        item = (key, frame)
+        self._forget(item)
+        size = estimate_size(data)
+        self._memory[item] = (data, size)
+        self._memory_size += size
+        self._enforce_budget()
+
+    def remove(self, key=None):
+        """Forget frames of the key, or all frames if key is None"""
+        for item in list(self):
+            if key is None or item[0] == key:
+                self._forget(item)
+
+    def resize(self, budget, spill_directory=None):
+        if spill_directory != self.spill_directory:
+            for item in list(self._spilled):
+                self._forget(item)
+            self.spill_directory = spill_directory
+        self.budget = budget
+        self._enforce_budget()
+
+    def _forget(self, item):
+        if item in self._memory:
+            self._memory_size -= self._memory.pop(item)[1]
+        if item in self._spilled:
+            path, array_paths = self._spilled.pop(item)
+            for p in [path] + array_paths:
+                try:
+                    os.remove(p)
+                except OSError:
+                    pass
+
+    def _enforce_budget(self):
+        # the most recently used frame is kept even if it is larger than the budget
+        while self._memory_size > self.budget and len(self._memory) > 1:
+            item, (data, size) = self._memory.popitem(last=False)
+            self._memory_size -= size
+            if self.spill_directory is not None:
+                self._spill(item, data)
+
+    def _spill(self, item, data):
+        os.makedirs(self.spill_directory, exist_ok=True)
+        self._file_counter += 1
+        base = os.path.join(self.spill_directory, f"frame_{self._file_counter}")
+        arrays = []
+        skeleton = _extract_arrays(data, arrays)
+        array_paths = []
+        try:
+            for i, array in enumerate(arrays):
+                array_path = f"{base}_{i}.npy"
+                np.save(array_path, array, allow_pickle=False)
+                array_paths.append(array_path)
+            path = base + ".pickle"
+            # the file appears only when it is written completely
+            with open(path + ".tmp", 'wb') as f:
+                pickle.dump(skeleton, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(path + ".tmp", path)
+        except Exception:
+            # data can't be saved, it is just forgotten
+            for p in array_paths + [base + ".pickle.tmp"]:
+                try:
+                    os.remove(p)
+                except OSError:
+                    pass
+            return
+        self._spilled[item] = (path, array_paths)
+
+    def _load_spilled(self, item):
+        path, array_paths = self._spilled[item]
+        with open(path, 'rb') as f:
+            skeleton = pickle.load(f)
+        arrays = [np.load(p, mmap_mode='r') for p in array_paths]
+        return _restore_arrays(skeleton, arrays)
+
+
+def get_tree_frame_cache(tree_id, budget, spill=False):
+    """
+    Frame cache of the tree with given memory budget (in bytes).
+    With spill=True, frames over the budget are written into a new directory
+    in system temp, which is readable only by the current user and is not
+    shared with other caches or other Blender instances.
+    """
+    cache = _tree_caches.get(tree_id)
+    if cache is None:
+        cache = _tree_caches[tree_id] = SvFrameCache(budget)
+    old_directory = cache.spill_directory
+    if spill:
+        spill_directory = old_directory or tempfile.mkdtemp(prefix="sverchok_frames_")
+    else:
+        spill_directory = None
+    if cache.budget != budget or old_directory != spill_directory:
+        cache.resize(budget, spill_directory)
+        if old_directory is not None and old_directory != spill_directory:
+            shutil.rmtree(old_directory, ignore_errors=True)
+    return cache
+
+
+def clear_frame_caches():
+    """Forget frames of all trees and remove spilled files"""
+    for cache in _tree_caches.values():
+        cache.remove()
+        if cache.spill_directory is not None:
+            shutil.rmtree(cache.spill_directory, ignore_errors=True)
+    _tree_caches.clear()
@@ -19,6 +19,8 @@
 import itertools
 from collections import defaultdict
 
+import numpy as np
+
 import bmesh
 from mathutils import Vector
 
@@ -32,6 +34,86 @@ from sverchok.utils.cad_module_class import CAD_ops
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
 from sverchok.utils.geom_2d.intersections import intersect_sv_edges
 
+def candidate_edge_pairs(verts, edges, padding=0.0):
+    """
+    Broad phase of edges intersection: find pairs of edges whose bounding
+    boxes overlap, by use of uniform grid (spatial hash), so that not all
+    N*(N-1)/2 pairs have to be checked.
+
+    verts: array-like of shape (n, d), where d is 2 or 3.
+    edges: array-like of shape (m, 2) of vertex indexes.
+    padding: bounding boxes of edges are enlarged by this value.
+
+    Returns: integer array of shape (k, 2) of pairs (i, j) of edge indexes, i < j,
+    sorted lexicographically. Pairs of edges sharing a vertex, and degenerate edges
+    (with the same vertex at both ends), are not included.
+    """
+    verts = np.asarray(verts, dtype=np.float64)
+    edges = np.asarray(edges, dtype=np.int64).reshape((-1, 2))
+    n_edges = len(edges)
+    if n_edges < 2:
+        return np.zeros((0, 2), dtype=np.int64)
+
+    ends = verts[edges]  # (m, 2, d)
+    box_min = ends.min(axis=1) - padding
+    box_max = ends.max(axis=1) + padding
+
+    # Cell size: about one edge per cell, but not less than typical edge size,
+    # so that most edges cover only a few cells.
+    lower = box_min.min(axis=0)
+    size = box_max.max(axis=0) - lower
+    axes = size > 0
+    if axes.any():
+        extents = (box_max - box_min)[:, axes].max(axis=1)
+        density_size = (np.prod(size[axes]) / n_edges) ** (1.0 / axes.sum())
+        cell_size = max(np.median(extents), density_size)
+    if not axes.any() or cell_size <= 0:
+        cell_size = 1.0
+
+    cell_min = np.floor((box_min - lower) / cell_size).astype(np.int64)
+    cell_max = np.floor((box_max - lower) / cell_size).astype(np.int64)
+    cell_min[:, ~axes] = 0
+    cell_max[:, ~axes] = 0
+    n_cells = cell_max.max(axis=0) + 1
+    spans = cell_max - cell_min + 1
+    counts = np.prod(spans, axis=1)
+
+    # One record (cell key, edge index) for each cell covered by each edge
+    edge_ids = np.repeat(np.arange(n_edges), counts)
+    local = np.arange(len(edge_ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+    keys = np.zeros(len(edge_ids), dtype=np.int64)
+    for axis in range(verts.shape[1]):
+        span = spans[edge_ids, axis]
+        cell = cell_min[edge_ids, axis] + local % span
+        local //= span
+        keys = keys * n_cells[axis] + cell
+
+    order = np.lexsort((edge_ids, keys))
+    keys = keys[order]
+    edge_ids = edge_ids[order]
+
+    # All pairs of records within each cell
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    group_sizes = np.diff(np.r_[starts, len(keys)])
+    group_ends = np.repeat(starts + group_sizes, group_sizes)
+    n_after = group_ends - np.arange(len(keys)) - 1
+    first = np.repeat(np.arange(len(keys)), n_after)
+    second = first + 1 + np.arange(len(first)) - np.repeat(np.cumsum(n_after) - n_after, n_after)
+    first = edge_ids[first]
+    second = edge_ids[second]
+
+    pairs = np.unique(first * n_edges + second)
+    first, second = np.divmod(pairs, n_edges)
+
+    # Exact check of bounding boxes
+    good = np.all((box_max[first] >= box_min[second]) & (box_max[second] >= box_min[first]), axis=1)
+    # Edges sharing a vertex are not checked
+    e1, e2 = edges[first], edges[second]
+    shared = ((e1[:, 0] == e2[:, 0]) | (e1[:, 0] == e2[:, 1]) | (e1[:, 1] == e2[:, 0]) | (e1[:, 1] == e2[:, 1])
+              | (e1[:, 0] == e1[:, 1]) | (e2[:, 0] == e2[:, 1]))
+    good &= ~shared
+    return np.stack((first[good], second[good]), axis=1)
+
 def order_points(edge, point_list):
     ''' order these edges from distance to v1, then
     sandwich the sorted list with v1, v2 '''
@@ -73,30 +155,42 @@ def can_skip(cm, closest_points, vert_vectors):
     cpa, cpb = closest_points
     return (cpa-cpb).length > cm.VTX_PRECISION
 
+def get_candidate_permutations(cm, bm, edge_indices):
+    """
+    Pairs of edges which can intersect, in the same order as
+    get_valid_permutations() gives them; edge_indices must be sorted.
+    Bounding boxes are checked on a grid, and edges which obviously
+    do not lie in the same plane are rejected at once for all pairs.
+    """
+    verts = np.array([v.co[:] for v in bm.verts])
+    edge_indices = np.asarray(edge_indices, dtype=np.int64)
+    edges = np.array([[v.index for v in bm.edges[i].verts] for i in edge_indices]).reshape((-1, 2))
+    pairs = candidate_edge_pairs(verts, edges)
+    if not len(pairs):
+        return []
+
+    points = verts[edges[pairs].reshape((-1, 4))]  # (k, 4, 3)
+    flat = np.all(np.abs(points[:, :, 2]) < cm.VTX_PRECISION, axis=1)
+    v1, v2, v3 = (points[:, i] - points[:, 0] for i in (1, 2, 3))
+    dot = np.abs(np.einsum('ij,ij->i', np.cross(v1, v2), v3))
+    # cm.is_coplanar works in single precision, so this test is
+    # made looser, to never reject a pair that is_coplanar accepts
+    scale = np.linalg.norm(v1, axis=1) * np.linalg.norm(v2, axis=1) * np.linalg.norm(v3, axis=1)
+    good = flat | (dot < 2 * cm.VTX_PRECISION + 1e-5 * scale)
+    return [tuple(pair) for pair in edge_indices[pairs[good]].tolist()]
+
 def get_intersection_dictionary(cm, bm, edge_indices):
 
     bm.verts.ensure_lookup_table()
     bm.edges.ensure_lookup_table()
 
-    permutations = get_valid_permutations(cm, bm, edge_indices)
+    permutations = get_candidate_permutations(cm, bm, sorted(edge_indices))
 
     k = defaultdict(list)
     d = defaultdict(list)
 
     for edges in permutations:
         vert_vectors = cm.vectors_from_edges_tuple(bm, edges)
-        v1, v2, v3, v4 = vert_vectors
-
-        # Edges obviously can not intersect if their bounding
-        # boxes do not intersect
-        if (max(v1.x, v2.x) < min(v3.x, v4.x) or
-            max(v1.y, v2.y) < min(v3.y, v4.y) or
-            max(v1.z, v2.z) < min(v3.z, v4.z)):
-                continue
-        if (max(v3.x, v4.x) < min(v1.x, v2.x) or
-            max(v3.y, v4.y) < min(v1.y, v2.y) or
-            max(v3.z, v4.z) < min(v1.z, v2.z)):
-                continue
 
         # Edges can not intersect if they do not lie in
         # the same plane
@@ -179,65 +273,78 @@ def intersect_edges_3d(verts_in, edges_in, s_epsilon):
 def edges_from_ed_inter(ed_inter):
     '''create edges from intersections library'''
     edges_out = []
+    edges_set = set()
     for e in ed_inter:
         # sort by first element of tuple (distances)
         e_s = sorted(e)
         e_s = [e for i,e in enumerate(e_s) if e[1]!= e_s[i-1][1]] 
         for i in range(1, len(e_s)):
             # if e_s[i-1][1] != e_s[i][1]:
-            if(e_s[i-1][1], e_s[i][1])not in edges_out:
-                edges_out.append((e_s[i-1][1], e_s[i][1]))
+            edge = (e_s[i-1][1], e_s[i][1])
+            if edge not in edges_set:
+                edges_set.add(edge)
+                edges_out.append(edge)
     return edges_out
 
 def intersect_edges_2d(verts, edges, epsilon):
-    '''Iterate through edges  and expose them to intersect_line_line_2d'''
+    '''Iterate through pairs of edges which can intersect and expose them to intersect_line_line_2d'''
     verts_in = [Vector(v) for v in verts]
     ed_lengths = [(verts_in[e[1]] - verts_in[e[0]]).length for e in edges]
     verts_out = verts
-    edges_out = []
+    # first index of each new vertex in verts_out
+    verts_index = {}
+    for idx, v in enumerate(verts_out):
+        if isinstance(v, tuple):
+            verts_index.setdefault(v, idx)
     ed_inter = [[] for e in edges]
-    for e, d, i in zip(edges, ed_lengths, range(len(edges))):
+    for i, (e, d) in enumerate(zip(edges, ed_lengths)):
         # if there is no intersections this will create a normal edge
         ed_inter[i].append([0.0, e[0]])
         ed_inter[i].append([d, e[1]])
-        v1 = verts_in[e[0]]
-        v2 = verts_in[e[1]]
-        if d == 0:
-            continue
 
-        for e2, d2, j in zip(edges, ed_lengths, range(len(edges))):
-
-            if i <= j or d2 == 0:
-                continue
-            if (e2[0] in e) or (e2[1] in e):
-                continue
-
-            v3 = verts_in[e2[0]]
-            v4 = verts_in[e2[1]]
-            vx = intersect_line_line_2d(v1, v2, v3, v4)
-            if vx:
-                d_to_1 = (vx - v1.to_2d()).length
-                d_to_2 = (vx - v3.to_2d()).length
-
-                new_id = len(verts_out)
-                if ((vx.x, vx.y, v1.z)) in verts_out:
-                    new_id = verts_out.index((vx.x, vx.y, v1.z))
-                else:
-                    if d_to_1 < epsilon:
-                        new_id = e[0]
-                    elif d_to_1 > d - epsilon:
-                        new_id = e[1]
-                    elif d_to_2 < epsilon:
-                        new_id = e2[0]
-                    elif d_to_2 > d2 - epsilon:
-                        new_id = e2[1]
-                    if new_id == len(verts_out):
-                        verts_out.append((vx.x, vx.y, v1.z))
-                
-                # first item stores distance to origin, second the vertex id
-                ed_inter[i].append([d_to_1, new_id])
-                ed_inter[j].append([d_to_2, new_id])
+    if len(edges) > 1:
+        verts_2d = [v.to_2d()[:] for v in verts_in]
+        pairs = candidate_edge_pairs(verts_2d, edges, padding=epsilon)
+        # the same order as in loop over i, then over j < i
+        pairs = pairs[np.lexsort((pairs[:, 0], pairs[:, 1]))].tolist()
+    else:
+        pairs = []
+
+    for j, i in pairs:
+        e, d = edges[i], ed_lengths[i]
+        e2, d2 = edges[j], ed_lengths[j]
+        if d == 0 or d2 == 0:
+            continue
 
+        v1 = verts_in[e[0]]
+        v2 = verts_in[e[1]]
+        v3 = verts_in[e2[0]]
+        v4 = verts_in[e2[1]]
+        vx = intersect_line_line_2d(v1, v2, v3, v4)
+        if vx:
+            d_to_1 = (vx - v1.to_2d()).length
+            d_to_2 = (vx - v3.to_2d()).length
+
+            new_vert = (vx.x, vx.y, v1.z)
+            new_id = len(verts_out)
+            if new_vert in verts_index:
+                new_id = verts_index[new_vert]
+            else:
+                if d_to_1 < epsilon:
+                    new_id = e[0]
+                elif d_to_1 > d - epsilon:
+                    new_id = e[1]
+                elif d_to_2 < epsilon:
+                    new_id = e2[0]
+                elif d_to_2 > d2 - epsilon:
+                    new_id = e2[1]
+                if new_id == len(verts_out):
+                    verts_index[new_vert] = new_id
+                    verts_out.append(new_vert)
+
+            # first item stores distance to origin, second the vertex id
+            ed_inter[i].append([d_to_1, new_id])
+            ed_inter[j].append([d_to_2, new_id])
 
     edges_out = edges_from_ed_inter(ed_inter)
 
@@ -18,6 +18,8 @@
 
 
 from functools import reduce
+
+import numpy as np
 from numpy import ndarray
 #####################################################
 #################### lists magic ####################
@@ -27,10 +29,63 @@ from numpy import ndarray
 def create_list(x, y):
     if type(y) in [list, tuple]:
         return reduce(create_list, y, x)
+    elif type(y) == ndarray:
+        return x.extend(y.ravel()) or x
     else:
         return x.append(y) or x
 
 
+def joined_array(items):
+    """
+    Items of the list joined into one array, as extending a list by them
+    would do, if they are NumPy arrays with equal shapes of items;
+    if items is an array itself, its items are joined.
+    Returns None if items can not be joined this way.
+    """
+    if type(items) == ndarray:
+        if items.ndim < 2:
+            return items
+        return items.reshape((-1,) + items.shape[2:])
+    if items and all(type(item) == ndarray and item.ndim for item in items):
+        if len(set(item.shape[1:] for item in items)) == 1:
+            return np.concatenate(items)
+    return None
+
+
+def zip_arrays(arrays):
+    """
+    Items of the arrays grouped by index, like zip() does with lists, but
+    into one array: [[1,2,3], [10,20]] -> [[1,10], [2,20]].
+    Returns None if shapes of items of the arrays are different.
+    """
+    if len(set(array.shape[1:] for array in arrays)) != 1:
+        return None
+    min_len = min(len(array) for array in arrays)
+    return np.stack([array[:min_len] for array in arrays], axis=1)
+
+
+def array_levels(array, levels, level2=1):
+    """
+    The same as preobrazovatel for an array, which is considered as
+    nested lists: axis i of the array keeps items of lists of level level2+i.
+    """
+    shape = list(array.shape)
+    axis = 0
+    while axis < len(shape) - 1:
+        level = levels[0]
+        if level > level2:
+            # lists of the next level are joined
+            shape[axis:axis+2] = [shape[axis] * shape[axis+1]]
+        elif level == level2:
+            axis += 1
+            if len(levels) > 1:
+                levels = levels[1:]
+        else:
+            shape[axis:] = [int(np.prod(shape[axis:]))]
+        level2 += 1
+    return array.reshape(shape)
+
+
 
 
 
@@ -39,12 +94,20 @@ def preobrazovatel(list_a, levels, level2=1):
     list_tmp = []
     level = levels[0]
 
+    if type(list_a) == ndarray:
+        return array_levels(list_a, levels, level2)
+
     if level > level2:
-        if type(list_a)in [list, tuple]:
+        if type(list_a) in [list, tuple]:
+            if list_a and all(type(l) == ndarray for l in list_a):
+                joined = joined_array([array_levels(l, levels, level2+1) for l in list_a])
+                if joined is not None:
+                    # top level is always a list
+                    return joined if level2 > 1 else list(joined)
             for l in list_a:
-                if type(l) in [list, tuple]:
+                if type(l) in [list, tuple, ndarray]:
                     tmp = preobrazovatel(l, levels, level2+1)
-                    if type(tmp) in [list, tuple]:
+                    if type(tmp) in [list, tuple, ndarray]:
                         list_tmp.extend(tmp)
                     else:
                         list_tmp.append(tmp)
@@ -58,10 +121,15 @@ def preobrazovatel(list_a, levels, level2=1):
                     tmp = preobrazovatel(l, levels, level2+1)
                 else:
                     tmp = preobrazovatel(l, levels[1:], level2+1)
-                list_tmp.append(tmp if tmp else l)
+                if type(tmp) == ndarray:
+                    list_tmp.append(tmp)
+                else:
+                    list_tmp.append(tmp if tmp else l)
 
     else:
         if type(list_a) in [list, tuple]:
+            if list_a and all(type(l) == ndarray for l in list_a) and level2 > 1:
+                return np.concatenate([l.ravel() for l in list_a])
             list_tmp = reduce(create_list, list_a, [])
 
     return list_tmp
@@ -116,12 +184,14 @@ def myZip(list_all, level, level2=0):
 def myZip_2(list_all, level, level2=1):
     def create_listDown(list_all, level):
         def subDown(list_a, level):
-            list_b = []
-            for l2 in list_a:
-                if type(l2) in [list, tuple, ndarray]:
-                    list_b.extend(l2)
-                else:
-                    list_b.append(l2)
+            list_b = joined_array(list_a)
+            if list_b is None:
+                list_b = []
+                for l2 in list_a:
+                    if type(l2) in [list, tuple, ndarray]:
+                        list_b.extend(l2)
+                    else:
+                        list_b.append(l2)
             if level > 1:
                 list_b = subDown(list_b, level-1)
             return list_b
@@ -151,9 +221,15 @@ def myZip_2(list_all, level, level2=1):
     if l_min == []:
         l_min = [0]
     lm = min(l_min)
-    for elm in range(lm):
-        for el in list_tmp:
-            list_r.append(el[elm])
+    zipped = None
+    if level > 1 and list_tmp and all(type(el) == ndarray and el.ndim for el in list_tmp):
+        zipped = zip_arrays(list_tmp)
+    if zipped is not None:
+        list_r = zipped.reshape((-1,) + zipped.shape[2:])
+    else:
+        for elm in range(lm):
+            for el in list_tmp:
+                list_r.append(el[elm])
 
     list_tmp = list_r
 
@@ -168,11 +244,15 @@ def joiner(list_all, level, level2=1):
 
     if level > level2:
         if type(list_all) in [list, tuple, ndarray]:
-            for list_a in list_all:
-                if type(list_a) in [list, tuple, ndarray]:
-                    list_tmp.extend(list_a)
-                else:
-                    list_tmp.append(list_a)
+            joined = joined_array(list_all)
+            if joined is not None:
+                list_tmp = joined
+            else:
+                for list_a in list_all:
+                    if type(list_a) in [list, tuple, ndarray]:
+                        list_tmp.extend(list_a)
+                    else:
+                        list_tmp.append(list_a)
         else:
             list_tmp = list_all
 
@@ -181,8 +261,11 @@ def joiner(list_all, level, level2=1):
 
     if level == level2:
         if type(list_all) in [list, tuple, ndarray]:
+            joined = joined_array(list_all) if level2 > 1 else None
             if isinstance(list_all[0], str):
                 list_tmp = ''.join(list_all)
+            elif joined is not None:
+                list_tmp = joined
             else:
                 for list_a in list_all:
                     if type(list_a) in [list, tuple, ndarray]:
@@ -209,6 +292,9 @@ def wrapper_2(l_etalon, list_a, level):
             if len(list_a) == count:
                 for l in list_a:
                     list_b.append([l])
+            elif type(list_a) == ndarray:
+                dc = len(list_a)//count
+                list_b = [list_a[l*dc:(l+1)*dc] for l in range(count)]
             else:
                 dc = len(list_a)//count
                 for l in range(count):
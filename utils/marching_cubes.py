@@ -1,5 +1,5 @@
 """
-Pure Python implementation of marching cubes algorithm
+Pure Python (NumPy) implementation of marching cubes algorithm
 Adapted from https://github.com/mutantbob/blender-marching-cubes/blob/master/marching-cube.py
 """
 """
@@ -457,32 +457,167 @@ def cornerloop(x,y,z):
         for cy,cx in zip((0,y,y,0),(0,0,x,x)):
              yield cx,cy,cz
 
-def isosurface_np(data, isolevel):
-    triangles = []
-    z_a = 0
-    z_plane_a = data[:,:,z_a]
+# For each of 12 cube edges: axis along which the edge goes (0 = X, 1 = Y, 2 = Z),
+# and offset of the edge's first (lower) corner from the cube's base corner.
+edge_axes = np.array([1, 0, 1, 0, 1, 0, 1, 0, 2, 2, 2, 2])
+edge_offsets = np.array([
+        (0,0,0), (0,1,0), (1,0,0), (0,0,0),
+        (0,0,1), (0,1,1), (1,0,1), (0,0,1),
+        (0,0,0), (0,1,0), (1,1,0), (1,0,0)
+    ])
+# Offsets of 8 cube corners from the cube's base corner, in order used by edgetable and tritable.
+corner_offsets = np.array([
+        (0,0,0), (0,1,0), (1,1,0), (1,0,0),
+        (0,0,1), (0,1,1), (1,1,1), (1,0,1)
+    ])
+tritable_np = np.array(tritable)
+triangle_counts = (tritable_np != -1).sum(axis=1) // 3
+
+class GridEdges(object):
+    """
+    Global numbering of grid edges. Edges along X go first,
+    then edges along Y, then edges along Z; within each group,
+    edges are numbered by their lower corner in C order.
+    """
+    def __init__(self, shape):
+        self.shape = np.array(shape)
+        self.axis_shapes = []
+        self.axis_offsets = []
+        offset = 0
+        for axis in range(3):
+            axis_shape = self.shape.copy()
+            axis_shape[axis] -= 1
+            self.axis_shapes.append(tuple(axis_shape))
+            self.axis_offsets.append(offset)
+            offset += np.prod(axis_shape)
+        self.axis_offsets = np.array(self.axis_offsets)
+
+    def edge_ids(self, axes, corners):
+        """
+        input: axes: (n,) array of axis indexes; corners: (n, 3) array of lower edge corners.
+        output: (n,) array of global edge indexes.
+        """
+        result = np.empty(len(axes), dtype=np.int64)
+        for axis in range(3):
+            good = (axes == axis)
+            result[good] = self.axis_offsets[axis] + np.ravel_multi_index(corners[good].T, self.axis_shapes[axis])
+        return result
+
+    def edge_corners(self, ids):
+        """
+        input: (n,) array of global edge indexes.
+        output: tuple: (n,) array of edge axes; (n, 3) array of lower edge corners.
+        """
+        axes = np.searchsorted(self.axis_offsets, ids, side='right') - 1
+        corners = np.empty((len(ids), 3), dtype=np.int64)
+        for axis in range(3):
+            good = (axes == axis)
+            corners[good] = np.array(np.unravel_index(ids[good] - self.axis_offsets[axis], self.axis_shapes[axis])).T
+        return axes, corners
+
+def vertexinterp_np(isolevel, p1, p2, valp1, valp2):
+    """
+    Vectorized version of vertexinterp().
+    p1, p2: (n, 3) arrays; valp1, valp2: (n,) arrays.
+    """
+    denominator = valp2 - valp1
+    good = abs(denominator) >= 0.00001
+    mu = np.zeros_like(valp1, dtype=np.float64)
+    mu[good] = (isolevel - valp1[good]) / denominator[good]
+    mu[abs(isolevel - valp2) < 0.00001] = 1.0
+    mu[abs(isolevel - valp1) < 0.00001] = 0.0
+    mu = mu[np.newaxis].T
+    return p1 + mu * (p2 - p1)
+
+def _polygonise_slab(data, isolevel, edges, z_min, z_max):
+    # Calculate global edge indexes for all triangle vertices
+    # generated by cubes with base corners with z in [z_min, z_max).
+    slab = data[:, :, z_min : z_max+1]
+    inside = slab < isolevel
+    sx, sy, sz = inside.shape
+    cubeindex = np.zeros((sx-1, sy-1, sz-1), dtype=np.int64)
+    for bit, (ox, oy, oz) in enumerate(corner_offsets):
+        cubeindex |= inside[ox : sx-1+ox, oy : sy-1+oy, oz : sz-1+oz].astype(np.int64) << bit
+
+    cubeindex = cubeindex.ravel()
+    active = np.nonzero(triangle_counts[cubeindex])[0]
+    if len(active) == 0:
+        return np.zeros((0,), dtype=np.int64)
+    cubeindex = cubeindex[active]
+    cubes = np.array(np.unravel_index(active, (sx-1, sy-1, sz-1))).T # (n, 3)
+    cubes[:,2] += z_min
+
+    local_edges = tritable_np[cubeindex] # (n, 16)
+    good = local_edges != -1
+    cube_numbers = np.broadcast_to(np.arange(len(cubes))[np.newaxis].T, local_edges.shape)[good]
+    local_edges = local_edges[good]
+    corners = cubes[cube_numbers] + edge_offsets[local_edges]
+    return edges.edge_ids(edge_axes[local_edges], corners)
+
+def isosurface_np(data, isolevel, chunk_size=None):
+    """
+    Vectorized marching cubes.
+    Cube indexes for the whole grid are calculated at once, and edgetable /
+    tritable are looked up with array indexing. Each grid edge crossed by
+    the surface produces exactly one vertex, so the resulting mesh is welded.
+    The grid is processed in slabs of chunk_size layers along Z, so that
+    memory usage stays bounded for big grids.
+
+    input:
+        * data: np.array of shape (sx, sy, sz) - scalar field values
+        * isolevel: iso value
+        * chunk_size: number of grid layers along Z to process at once.
+          By default, chosen so that each slab contains about 4M cubes.
+    output: tuple:
+        * vertices: np.array of shape (n, 3), in grid coordinates
+        * faces: np.array of shape (m, 3)
+    """
+    data = np.asarray(data)
     sx, sy, sz = data.shape
+    if chunk_size is None:
+        chunk_size = max(1, (4 * 1024 * 1024) // max(1, sx * sy))
+    edges = GridEdges(data.shape)
+
+    verts_out = []
+    faces_out = []
+    n_verts = 0
+    # Edges on the border between slabs, already turned into vertices:
+    # global edge indexes (sorted) and vertex indexes.
+    prev_ids = np.zeros((0,), dtype=np.int64)
+    prev_verts = np.zeros((0,), dtype=np.int64)
+    for z_min in range(0, sz-1, chunk_size):
+        z_max = min(z_min + chunk_size, sz-1)
+        ids = _polygonise_slab(data, isolevel, edges, z_min, z_max)
+        if len(ids) == 0:
+            prev_ids = np.zeros((0,), dtype=np.int64)
+            prev_verts = np.zeros((0,), dtype=np.int64)
+            continue
+        unique_ids, inverse = np.unique(ids, return_inverse=True)
+
+        vert_idxs = np.empty(len(unique_ids), dtype=np.int64)
+        found_idxs = np.searchsorted(prev_ids, unique_ids)
+        found_idxs[found_idxs >= len(prev_ids)] = 0
+        found = (prev_ids[found_idxs] == unique_ids) if len(prev_ids) else np.zeros(len(unique_ids), dtype=bool)
+        vert_idxs[found] = prev_verts[found_idxs[found]]
+        new = ~found
+        n_new = np.count_nonzero(new)
+        vert_idxs[new] = np.arange(n_verts, n_verts + n_new)
+        n_verts += n_new
+
+        axes, p1 = edges.edge_corners(unique_ids[new])
+        p2 = p1.copy()
+        p2[np.arange(len(p2)), axes] += 1
+        v1 = data[tuple(p1.T)]
+        v2 = data[tuple(p2.T)]
+        verts_out.append(vertexinterp_np(isolevel, p1, p2, v1, v2))
+        faces_out.append(vert_idxs[inverse.ravel()].reshape((-1, 3)))
+
+        axes, corners = edges.edge_corners(unique_ids)
+        on_border = (axes != 2) & (corners[:,2] == z_max)
+        prev_ids = unique_ids[on_border]
+        prev_verts = vert_idxs[on_border]
 
-    polygoniser = Polygoniser(isolevel)
-    for z in range(sz-1):
-        z2 = z+1
-        z_plane_b = data[:,:,z2]
-        for y in range(sy-1):
-            y2 = y+1
-            for x in range(sx-1):
-                x2 = x+1
-                cornervalues = [
-                    z_plane_a[x][y],
-                    z_plane_a[x][y+1],
-                    z_plane_a[x+1][y+1],
-                    z_plane_a[x+1][y],
-                    z_plane_b[x][y],
-                    z_plane_b[x][y+1],
-                    z_plane_b[x+1][y+1],
-                    z_plane_b[x+1][y],
-                ]
-                triangles.extend(polygoniser.polygonise(cornervalues, x,y,z, x2, y2, z2))
-        z_plane_a = z_plane_b
-
-    return np.array(polygoniser.vertices), triangles
+    if not verts_out:
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+    return np.concatenate(verts_out), np.concatenate(faces_out)
 
@@ -0,0 +1,417 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Geometry buffers for drawing meshes in 3D view (see Viewer Draw node).
+
+All objects are merged into contiguous NumPy arrays, which can be passed to
+gpu_extras.batch.batch_for_shader directly: float32 arrays of coordinates
+(n x 3) and colors (n x 4), uint32 arrays of indices (n x 3 for triangles,
+n x 2 for edges).
+
+Polygons are handled in "loops" representation (one item per polygon corner,
+like in Blender meshes), so meshes with polygons of different sizes are
+processed without Python loops. Convex polygons are triangulated as fans;
+only concave ones are triangulated one by one, by ear clipping.
+
+This module does not depend on Blender API.
+"""
+
+import itertools
+
+import numpy as np
+
+
+class PolygonLoops():
+    """
+    Polygons as flat arrays of corners. Polygons with less than 3 vertices are skipped.
+    vert: vertex index of each corner
+    total: number of corners of each polygon
+    start: index of the first corner of each polygon
+    face: polygon (index in this structure) of each corner
+    face_index: index of each polygon in the original list
+    """
+    def __init__(self, vert, total, face_index):
+        self.vert = vert
+        self.total = total
+        self.face_index = face_index
+        self.start = np.cumsum(total) - total
+        self.face = np.repeat(np.arange(len(total)), total)
+        idx = np.arange(len(vert))
+        last = self.start + total - 1
+        self.next = idx + 1
+        self.next[last] = self.start
+        self.prev = idx - 1
+        self.prev[self.start] = last
+
+    def __len__(self):
+        return len(self.total)
+
+    @classmethod
+    def from_polygons(cls, polygons, offset=0, face_offset=0):
+        '''
+        polygons: list of lists of vertex indexes or 2D array;
+        offset is added to vertex indexes, face_offset to polygon indexes.
+        '''
+        if isinstance(polygons, np.ndarray) and polygons.ndim == 2:
+            n, k = polygons.shape
+            vert = polygons.astype(np.int64).ravel()
+            total = np.full(n, k, dtype=np.int64)
+        else:
+            total = np.fromiter(map(len, polygons), dtype=np.int64, count=len(polygons))
+            vert = np.fromiter(itertools.chain.from_iterable(polygons), dtype=np.int64, count=total.sum())
+        valid = total >= 3
+        face_index = np.flatnonzero(valid)
+        if not valid.all():
+            vert = vert[np.repeat(valid, total)]
+            total = total[valid]
+        return cls(vert + offset, total, face_index + face_offset)
+
+    @classmethod
+    def concatenate(cls, loops_list):
+        if not loops_list:
+            empty = np.zeros((0,), dtype=np.int64)
+            return cls(empty, empty, empty)
+        return cls(np.concatenate([loops.vert for loops in loops_list]),
+                   np.concatenate([loops.total for loops in loops_list]),
+                   np.concatenate([loops.face_index for loops in loops_list]))
+
+
+def _sum_by_index(index, values, length):
+    result = np.empty((length, values.shape[1]))
+    for axis in range(values.shape[1]):
+        result[:, axis] = np.bincount(index, weights=values[:, axis], minlength=length)
+    return result
+
+
+def _normalize(vectors):
+    lengths = np.linalg.norm(vectors, axis=1)
+    non_zero = lengths > 0
+    vectors[non_zero] /= lengths[non_zero, np.newaxis]
+    return non_zero
+
+
+def face_normals(verts, loops):
+    '''unit normals of polygons (Newell method); zero vectors for degenerate polygons'''
+    first = verts[loops.vert[loops.start]][loops.face]
+    co = verts[loops.vert] - first
+    co_next = verts[loops.vert[loops.next]] - first
+    normals = _sum_by_index(loops.face, np.cross(co, co_next), len(loops))
+    _normalize(normals)
+    return normals
+
+
+def vertex_normals(verts, loops, f_normals):
+    '''
+    unit normals of vertices: face normals weighted by corner angles (as in Blender);
+    normals of vertices not used by polygons are directed from the origin.
+    '''
+    co = verts[loops.vert]
+    to_prev = verts[loops.vert[loops.prev]] - co
+    to_next = verts[loops.vert[loops.next]] - co
+    _normalize(to_prev)
+    _normalize(to_next)
+    angles = np.arccos(np.clip(np.einsum('ij,ij->i', to_prev, to_next), -1.0, 1.0))
+    normals = _sum_by_index(loops.vert, f_normals[loops.face] * angles[:, np.newaxis], len(verts))
+    non_zero = _normalize(normals)
+    normals[~non_zero] = verts[~non_zero]
+    _normalize(normals)
+    return normals
+
+
+def convex_faces(verts, loops, f_normals):
+    '''mask of convex polygons (degenerate polygons are considered convex)'''
+    co = verts[loops.vert]
+    to_prev = co - verts[loops.vert[loops.prev]]
+    to_next = verts[loops.vert[loops.next]] - co
+    turn = np.einsum('ij,ij->i', np.cross(to_prev, to_next), f_normals[loops.face])
+    tolerance = 1e-9 * np.linalg.norm(to_prev, axis=1) * np.linalg.norm(to_next, axis=1)
+    concave_corners = np.bincount(loops.face, weights=turn < -tolerance, minlength=len(loops))
+    return concave_corners == 0
+
+
+def _cross_2d(a, b, c):
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+
+
+def ear_clip(points):
+    '''
+    Triangulate a simple polygon given by counter-clockwise 2D points.
+    Returns list of triangles as tuples of point indexes.
+    '''
+    idx = list(range(len(points)))
+    tris = []
+    while len(idx) > 3:
+        m = len(idx)
+        for i in range(m):
+            a, b, c = idx[i - 1], idx[i], idx[(i + 1) % m]
+            pa, pb, pc = points[a], points[b], points[c]
+            if _cross_2d(pa, pb, pc) <= 0:
+                continue
+            for other in idx:
+                if other in (a, b, c):
+                    continue
+                p = points[other]
+                if _cross_2d(pa, pb, p) >= 0 and _cross_2d(pb, pc, p) >= 0 and _cross_2d(pc, pa, p) >= 0:
+                    break
+            else:
+                tris.append((a, b, c))
+                del idx[i]
+                break
+        else:
+            # self-intersecting or degenerate polygon
+            tris.extend((idx[0], idx[j], idx[j + 1]) for j in range(1, len(idx) - 1))
+            return tris
+    tris.append(tuple(idx))
+    return tris
+
+
+def _project_to_plane(points, normal):
+    axis = np.zeros(3)
+    axis[np.argmin(np.abs(normal))] = 1.0
+    u = np.cross(normal, axis)
+    u /= np.linalg.norm(u)
+    v = np.cross(normal, u)
+    return np.stack((points @ u, points @ v), axis=-1).tolist()
+
+
+def triangulate(verts, loops, f_normals=None, handle_concave_quads=False):
+    '''
+    Triangulate polygons. Triangles and quads are split as fans, as well as
+    convex polygons with more vertices; concave polygons with more than 4
+    vertices (or more than 3, if handle_concave_quads is set) are triangulated
+    by ear clipping.
+    Returns triangles (m x 3 array of vertex indexes) and index of polygon
+    (in loops) for each triangle. Triangles are ordered by polygons.
+    '''
+    n_tris = loops.total - 2
+    tri_face = np.repeat(np.arange(len(loops)), n_tris)
+    first = np.repeat(loops.start, n_tris)
+    shift = np.arange(len(tri_face)) - np.repeat(np.cumsum(n_tris) - n_tris, n_tris) + 1
+    tris = np.stack((loops.vert[first], loops.vert[first + shift], loops.vert[first + shift + 1]), axis=-1)
+
+    candidates = loops.total >= (4 if handle_concave_quads else 5)
+    if not candidates.any():
+        return tris, tri_face
+    if f_normals is None:
+        f_normals = face_normals(verts, loops)
+    concave = candidates & ~convex_faces(verts, loops, f_normals)
+    if not concave.any():
+        return tris, tri_face
+
+    new_tris, new_face = [], []
+    for face in np.flatnonzero(concave).tolist():
+        start = loops.start[face]
+        face_verts = loops.vert[start: start + loops.total[face]]
+        points = _project_to_plane(verts[face_verts], f_normals[face])
+        for tri in ear_clip(points):
+            new_tris.append(face_verts[list(tri)])
+            new_face.append(face)
+    keep = ~concave[tri_face]
+    tris = np.concatenate((tris[keep], np.array(new_tris, dtype=np.int64).reshape((-1, 3))))
+    tri_face = np.concatenate((tri_face[keep], np.array(new_face, dtype=np.int64)))
+    order = np.argsort(tri_face, kind='stable')
+    return tris[order], tri_face[order]
+
+
+def as_colors(colors):
+    return np.asarray(colors, dtype=np.float64).reshape((-1, 4))
+
+
+def cycle_colors(colors, count):
+    '''count colors, taking given colors cyclically'''
+    return np.resize(as_colors(colors), (count, 4))
+
+
+def per_object_colors(colors, counts):
+    '''one color per object (taken cyclically) repeated for each of its elements'''
+    return np.repeat(cycle_colors(colors, len(counts)), counts, axis=0)
+
+
+def cyclic_per_object_colors(colors_list, counts):
+    '''colors of elements of each object, taken cyclically from colors of the object'''
+    if not len(counts):
+        return np.zeros((0, 4))
+    return np.concatenate([cycle_colors(colors_list[i % len(colors_list)], count)
+                           for i, count in enumerate(counts)])
+
+
+def points_colors(vector_color, counts, color_per_point, random_colors, random=None):
+    '''colors of vertices of all objects'''
+    if random_colors:
+        if random is None:
+            random = np.random.random
+        if color_per_point:
+            total = int(np.sum(counts))
+            rgb = np.array([random() for _ in range(3 * total)]).reshape((total, 3))
+        else:
+            rgb = np.array([random() for _ in range(3 * len(counts))]).reshape((-1, 3))
+            rgb = np.repeat(rgb, counts, axis=0)
+        return np.concatenate((rgb, np.ones((len(rgb), 1))), axis=1)
+    if color_per_point:
+        return cyclic_per_object_colors(vector_color, counts)
+    return per_object_colors(vector_color[0], counts)
+
+
+def shade(colors, normals, light):
+    '''multiply RGB by a factor depending on the angle between normal and light direction'''
+    factor = (normals @ np.asarray(light, dtype=np.float64)) * 0.5 + 0.5
+    colors = colors.copy()
+    colors[:, :3] *= factor[:, np.newaxis]
+    return colors
+
+
+def _float_buffer(data, width):
+    return np.ascontiguousarray(np.asarray(data).reshape((-1, width)), dtype=np.float32)
+
+
+def _index_buffer(data, width):
+    return np.ascontiguousarray(np.asarray(data).reshape((-1, width)), dtype=np.uint32)
+
+
+class SvMeshDrawBuffers():
+    """
+    Buffers of points (v_*), edges (e_*) and polygons (p_*).
+    """
+    def __init__(self):
+        self.v_vertices = np.zeros((0, 3), dtype=np.float32)
+        self.points_color = np.zeros((0, 4), dtype=np.float32)
+        self.e_vertices = np.zeros((0, 3), dtype=np.float32)
+        self.e_vertex_colors = np.zeros((0, 4), dtype=np.float32)
+        self.e_indices = np.zeros((0, 2), dtype=np.uint32)
+        self.p_vertices = np.zeros((0, 3), dtype=np.float32)
+        self.p_vertex_colors = np.zeros((0, 4), dtype=np.float32)
+        self.p_indices = np.zeros((0, 3), dtype=np.uint32)
+
+
+def apply_matrices(verts, counts, matrices):
+    '''apply one 4x4 matrix to the vertices of each object'''
+    verts = verts.copy()
+    offsets = np.cumsum(counts) - counts
+    for offset, count, matrix in zip(offsets, counts, matrices):
+        matrix = np.asarray(matrix, dtype=np.float64)
+        part = verts[offset: offset + count]
+        verts[offset: offset + count] = part @ matrix[:3, :3].T + matrix[:3, 3]
+    return verts
+
+
+def build_mesh_buffers(config, vecs_in, matrices=None, random=None):
+    """
+    Build drawing buffers of all objects.
+
+    config: object with options of Viewer Draw node (draw_verts, draw_edges,
+        draw_polys, shade_mode, color_per_point, color_per_edge,
+        color_per_polygon, edges_use_vertex_color, polygon_use_vertex_color,
+        random_colors, handle_concave_quads, vector_light, vector_color,
+        edge_color, poly_color, edges, polygons). Flags uniform_verts,
+        uniform_edges and uniform_pols are set on it.
+    vecs_in: vertices of each object.
+    matrices: matrix of each object (the same length as vecs_in) or None.
+    random: function returning random numbers for random colors.
+    """
+    geom = SvMeshDrawBuffers()
+
+    config.uniform_verts = not config.color_per_point and len(config.vector_color) == 1 and len(config.vector_color[0]) == 1
+
+    config.uniform_pols = False
+    if config.color_per_polygon:
+        pol_color = config.poly_color
+    else:
+        if config.shade_mode == 'facet':
+            pol_color = [[c] for c in config.poly_color[0]]
+        else:
+            pol_color = config.poly_color[0]
+            if config.shade_mode == 'flat' and len(pol_color) == 1:
+                config.uniform_pols = True
+
+    config.uniform_edges = False
+    if config.color_per_edge:
+        edge_color = config.edge_color
+    else:
+        edge_color = config.edge_color[0]
+        if len(edge_color) == 1:
+            config.uniform_edges = True
+
+    verts_list = [np.asarray(vecs, dtype=np.float64).reshape((-1, 3)) for vecs in vecs_in]
+    counts = np.array([len(vecs) for vecs in verts_list], dtype=np.int64)
+    offsets = np.cumsum(counts) - counts
+    verts = np.concatenate(verts_list) if verts_list else np.zeros((0, 3))
+    if matrices is not None:
+        verts = apply_matrices(verts, counts, matrices)
+    geom.v_vertices = _float_buffer(verts, 3)
+
+    need_points_color = ((config.draw_verts and not config.uniform_verts)
+                         or (config.draw_edges and config.edges_use_vertex_color)
+                         or (config.draw_polys and config.polygon_use_vertex_color))
+    if need_points_color:
+        points_color = points_colors(config.vector_color, counts, config.color_per_point, config.random_colors, random)
+    else:
+        points_color = np.zeros((0, 4))
+    geom.points_color = _float_buffer(points_color, 4)
+
+    if config.draw_edges:
+        edges_s = config.edges
+        edges = [np.asarray(edges_s[i % len(edges_s)], dtype=np.int64).reshape((-1, 2)) + offset
+                 for i, offset in enumerate(offsets)]
+        edges = np.concatenate(edges) if edges else np.zeros((0, 2), dtype=np.int64)
+        if config.color_per_edge and not config.edges_use_vertex_color:
+            geom.e_vertices = _float_buffer(verts[edges.ravel()], 3)
+            colors = cyclic_per_object_colors(edge_color, [len(edges_s[i % len(edges_s)]) for i in range(len(counts))])
+            geom.e_vertex_colors = _float_buffer(np.repeat(colors, 2, axis=0), 4)
+            geom.e_indices = _index_buffer(np.arange(2 * len(edges)), 2)
+        else:
+            geom.e_vertices = geom.v_vertices
+            if not config.edges_use_vertex_color or not config.uniform_edges:
+                geom.e_vertex_colors = _float_buffer(per_object_colors(edge_color, counts), 4)
+            geom.e_indices = _index_buffer(edges, 2)
+        if config.edges_use_vertex_color and len(geom.e_vertices):
+            geom.e_vertex_colors = geom.points_color
+
+    if config.draw_polys:
+        polygons_s = config.polygons
+        objects_polygons = [polygons_s[i % len(polygons_s)] for i in range(len(counts))]
+        polygon_counts = [len(polygons) for polygons in objects_polygons]
+        face_offsets = np.cumsum(polygon_counts, dtype=np.int64) - polygon_counts
+        loops = PolygonLoops.concatenate([PolygonLoops.from_polygons(polygons, offset, face_offset)
+                                          for polygons, offset, face_offset in zip(objects_polygons, offsets, face_offsets)])
+        shade_mode = config.shade_mode
+        f_normals = face_normals(verts, loops) if len(loops) else np.zeros((0, 3))
+        tris, tri_face = triangulate(verts, loops, f_normals, config.handle_concave_quads)
+
+        if (config.color_per_polygon and not config.polygon_use_vertex_color) or shade_mode == 'facet':
+            # each triangle gets its own vertices, to be colored separately
+            tri_verts = tris.ravel()
+            corner_face = np.repeat(tri_face, 3)
+            geom.p_vertices = _float_buffer(verts[tri_verts], 3)
+            if shade_mode == 'facet' and config.polygon_use_vertex_color:
+                colors = shade(points_color[tri_verts], f_normals[corner_face], config.vector_light)
+            else:
+                face_colors = cyclic_per_object_colors(pol_color, polygon_counts)
+                colors = face_colors[loops.face_index[corner_face]]
+                if shade_mode == 'facet':
+                    colors = shade(colors, f_normals[corner_face], config.vector_light)
+                elif shade_mode == 'smooth':
+                    v_normals = vertex_normals(verts, loops, f_normals)
+                    colors = shade(colors, v_normals[tri_verts], config.vector_light)
+            geom.p_vertex_colors = _float_buffer(colors, 4)
+            geom.p_indices = _index_buffer(np.arange(len(tri_verts)), 3)
+        else:
+            geom.p_vertices = geom.v_vertices
+            if shade_mode == 'smooth':
+                v_normals = vertex_normals(verts, loops, f_normals)
+                if config.polygon_use_vertex_color:
+                    colors = points_color
+                else:
+                    colors = per_object_colors(pol_color, counts)
+                geom.p_vertex_colors = _float_buffer(shade(colors, v_normals, config.vector_light), 4)
+            elif config.polygon_use_vertex_color and shade_mode != 'fragment':
+                geom.p_vertex_colors = geom.points_color
+            elif not config.uniform_pols:
+                geom.p_vertex_colors = _float_buffer(per_object_colors(pol_color, counts), 4)
+            geom.p_indices = _index_buffer(tris, 3)
+
+    return geom
@@ -0,0 +1,298 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Classification of many points as inside or outside of a closed mesh.
+
+A point is inside if a ray from it crosses the surface an odd number of
+times. Faces are split into triangles, which are projected onto a plane
+orthogonal to the ray direction and put into cells of a regular grid on
+that plane. A ray can cross only triangles of the cell its point projects
+to, so rays of all points are tested at once, by arrays of (point,
+triangle) pairs.
+
+Points which project exactly onto an edge or a vertex of projected
+triangles are counted once, by the rule used for rasterization: such point
+belongs to triangles for which the edge is a "top" or "left" one. Edge
+functions are calculated in the same order of vertices for both triangles
+sharing an edge, so the two triangles always agree.
+
+Ray parity is meaningful only for closed meshes, where each edge is shared
+by an even number of faces; see SvMeshInsideTester.is_closed.
+
+Grids are built once per mesh and ray direction; testers of recently
+used meshes are cached, see get_mesh_inside_tester().
+
+This module does not depend on Blender API.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from sverchok.utils.ragged import SvRaggedArray
+
+# Number of (point, triangle) pairs tested at once
+PAIRS_CHUNK_SIZE = 1 << 22
+# Limit of grid cells along one axis
+MAX_GRID_SIZE = 2048
+# Number of meshes which testers are cached for
+MAX_CACHED_TESTERS = 8
+
+X_DIRECTION = (1.0, 0.0, 0.0)
+
+
+def triangulate_faces(faces):
+    """Fan triangulation of faces; returns array of shape (n, 3) and index of face for each triangle"""
+    faces = SvRaggedArray.from_data(faces, dtype=np.int64)
+    counts = np.maximum(faces.lengths - 2, 0)
+    face_index = np.repeat(np.arange(len(faces)), counts)
+    first = faces.offsets[:-1][face_index]
+    local = np.arange(len(face_index)) - np.repeat(np.cumsum(counts) - counts, counts)
+    triangles = np.empty((len(face_index), 3), dtype=np.int64)
+    triangles[:, 0] = faces.values[first]
+    triangles[:, 1] = faces.values[first + local + 1]
+    triangles[:, 2] = faces.values[first + local + 2]
+    return triangles, face_index
+
+
+def _ray_frame(direction):
+    """Orthonormal basis (direction, u, w) with u x w = direction"""
+    direction = np.asarray(direction, dtype=np.float64)
+    direction = direction / np.linalg.norm(direction)
+    helper = np.zeros(3)
+    helper[np.argmin(np.abs(direction))] = 1.0
+    u = np.cross(helper, direction)
+    u /= np.linalg.norm(u)
+    w = np.cross(direction, u)
+    return direction, u, w
+
+
+class SvRayGrid():
+    """
+    Triangles of a mesh projected along one direction and bucketed into a grid.
+    """
+    def __init__(self, vertices, triangles, direction):
+        direction, u, w = _ray_frame(direction)
+        self.frame = np.stack((direction, u, w))
+        coords = vertices @ self.frame.T
+        self.along = coords[:, 0]
+        self.plane = coords[:, 1:]
+
+        a, b, c = self.plane[triangles[:, 0]], self.plane[triangles[:, 1]], self.plane[triangles[:, 2]]
+        area = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+        # triangles seen edge-on can not be crossed
+        good = np.isfinite(area) & (area != 0)
+        self.triangle_index = np.flatnonzero(good)
+        self.triangles = triangles[good]
+        self.orientation = np.sign(area[good])
+        self._setup_edges()
+
+        corners = self.plane[self.triangles]
+        tri_min, tri_max = corners.min(axis=1), corners.max(axis=1)
+        self._setup_grid(tri_min, tri_max)
+
+    def _setup_edges(self):
+        """
+        Edges opposite to each vertex of triangles: origin and direction
+        (counterclockwise around the triangle), and whether the edge owns
+        points lying on it.
+        """
+        starts = self.triangles[:, [1, 2, 0]]
+        ends = self.triangles[:, [2, 0, 1]]
+        # calculate in the same order of vertices for both triangles sharing the edge
+        swap = starts > ends
+        low, high = np.where(swap, ends, starts), np.where(swap, starts, ends)
+        sign = np.where(swap, -1.0, 1.0) * self.orientation[:, np.newaxis]
+        self.edge_origins = self.plane[low]
+        self.edge_directions = (self.plane[high] - self.plane[low]) * sign[:, :, np.newaxis]
+        du, dv = self.edge_directions[:, :, 0], self.edge_directions[:, :, 1]
+        self.edge_owned = (dv < 0) | ((dv == 0) & (du > 0))
+        self.triangle_along = self.along[self.triangles]
+
+    def _setup_grid(self, tri_min, tri_max):
+        n = len(tri_min)
+        if n == 0:
+            self.low = np.zeros(2)
+            self.cell_size = np.ones(2)
+            self.shape = np.ones(2, dtype=np.int64)
+            self.cell_offsets = np.zeros(2, dtype=np.int64)
+            self.cell_triangles = np.empty(0, dtype=np.int64)
+            return
+        self.low = tri_min.min(axis=0)
+        extent = np.maximum(tri_max.max(axis=0) - self.low, 1e-12)
+        # about one cell per triangle
+        cells = np.sqrt(n * extent / extent[::-1])
+        self.shape = np.clip(np.ceil(cells), 1, MAX_GRID_SIZE).astype(np.int64)
+        self.cell_size = extent / self.shape
+
+        first = self._cell_coords(tri_min)
+        last = self._cell_coords(tri_max)
+        spans = last - first + 1
+        counts = spans[:, 0] * spans[:, 1]
+        entry_triangle = np.repeat(np.arange(n), counts)
+        local = np.arange(len(entry_triangle)) - np.repeat(np.cumsum(counts) - counts, counts)
+        span_v = spans[entry_triangle, 1]
+        entry_u = first[entry_triangle, 0] + local // span_v
+        entry_v = first[entry_triangle, 1] + local % span_v
+        entry_cell = entry_u * self.shape[1] + entry_v
+
+        order = np.argsort(entry_cell, kind='stable')
+        self.cell_triangles = entry_triangle[order]
+        self.cell_offsets = np.zeros(self.shape[0] * self.shape[1] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(entry_cell, minlength=len(self.cell_offsets) - 1), out=self.cell_offsets[1:])
+
+    def _cell_coords(self, plane_points):
+        coords = np.floor((plane_points - self.low) / self.cell_size).astype(np.int64)
+        return np.clip(coords, 0, self.shape - 1)
+
+    def _point_cells(self, plane_points):
+        """Cell of each point, or -1 for points out of the grid"""
+        coords = np.floor((plane_points - self.low) / self.cell_size)
+        inside = ((coords >= 0) & (coords < self.shape)).all(axis=1)
+        coords = np.clip(np.nan_to_num(coords), 0, self.shape - 1).astype(np.int64)
+        return np.where(inside, coords[:, 0] * self.shape[1] + coords[:, 1], -1)
+
+    def _point_chunks(self, counts):
+        """Bounds of ranges of points with about PAIRS_CHUNK_SIZE pairs in each"""
+        totals = np.cumsum(counts)
+        start = 0
+        while start < len(counts):
+            base = totals[start - 1] if start else 0
+            end = max(int(np.searchsorted(totals, base + PAIRS_CHUNK_SIZE, side='right')), start + 1)
+            yield start, end
+            start = end
+
+    def hits(self, points):
+        """
+        Crossings of rays from points with triangles.
+        Yields arrays of point indices, indices of triangles (in self.triangles)
+        and distances along the ray to crossings, for chunks of points;
+        all crossings of each point are in one chunk.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        coords = points @ self.frame.T
+        cells = self._point_cells(coords[:, 1:])
+        counts = np.where(cells >= 0, np.diff(self.cell_offsets)[np.maximum(cells, 0)], 0)
+        for start, end in self._point_chunks(counts):
+            chunk_counts = counts[start:end]
+            point_index = np.repeat(np.arange(start, end), chunk_counts)
+            if not len(point_index):
+                continue
+            local = np.arange(len(point_index)) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+            triangle_index = self.cell_triangles[self.cell_offsets[cells[point_index]] + local]
+            hit, distance = self._test(triangle_index, coords[point_index])
+            yield point_index[hit], triangle_index[hit], distance
+
+    def _test(self, triangle_index, point_coords):
+        # edge functions, i.e. doubled areas of triangles made of edges and the point
+        relative = point_coords[:, np.newaxis, 1:] - self.edge_origins[triangle_index]
+        directions = self.edge_directions[triangle_index]
+        values = directions[:, :, 0] * relative[:, :, 1] - directions[:, :, 1] * relative[:, :, 0]
+        inside = ((values > 0) | ((values == 0) & self.edge_owned[triangle_index])).all(axis=1)
+        # barycentric coordinates give position of the crossing along the ray
+        values = values[inside]
+        crossing = (values * self.triangle_along[triangle_index[inside]]).sum(axis=1) / values.sum(axis=1)
+        distance = crossing - point_coords[inside, 0]
+        hit = np.flatnonzero(inside)[distance > 0]
+        return hit, distance[distance > 0]
+
+
+class SvMeshInsideTester():
+    """
+    Tests of points against a mesh, with grids of projected triangles
+    built once for each ray direction.
+    """
+    def __init__(self, vertices, faces):
+        self.vertices = np.asarray(vertices, dtype=np.float64).reshape((-1, 3))
+        self.triangles, self.triangle_faces = triangulate_faces(faces)
+        self._grids = dict()
+        self._is_closed = None
+
+    @property
+    def is_closed(self):
+        """
+        True if each edge of the mesh is shared by an even number of faces,
+        so that rays cross the surface an odd number of times only from inside.
+        """
+        if self._is_closed is None:
+            edges = np.sort(self.triangles[:, [0, 1, 1, 2, 2, 0]].reshape((-1, 2)), axis=1)
+            _, counts = np.unique(edges, axis=0, return_counts=True)
+            self._is_closed = bool((counts % 2 == 0).all())
+        return self._is_closed
+
+    def grid(self, direction=X_DIRECTION):
+        key = tuple(np.asarray(direction, dtype=np.float64).tolist())
+        if key not in self._grids:
+            self._grids[key] = SvRayGrid(self.vertices, self.triangles, key)
+        return self._grids[key]
+
+    def crossings(self, points, direction=X_DIRECTION):
+        """Number of crossings of the surface by rays from points in given direction"""
+        n = len(points)
+        result = np.zeros(n, dtype=np.int64)
+        for point_index, _, _ in self.grid(direction).hits(points):
+            result += np.bincount(point_index, minlength=n)
+        return result
+
+    def contains(self, points, direction=X_DIRECTION):
+        """Boolean array: True for points inside of the mesh"""
+        return self.crossings(points, direction) % 2 == 1
+
+    def first_hits(self, points, direction):
+        """
+        The nearest surface crossing of rays from points: index of the face
+        (-1 if the ray does not cross the surface) and whether the face is
+        seen from behind, i.e. its normal looks along the ray.
+        """
+        n = len(points)
+        grid = self.grid(direction)
+        faces = np.full(n, -1, dtype=np.int64)
+        back_facing = np.zeros(n, dtype=bool)
+        for point_index, triangle_index, distance in grid.hits(points):
+            order = np.lexsort((distance, point_index))
+            point_index, triangle_index = point_index[order], triangle_index[order]
+            first = np.ones(len(point_index), dtype=bool)
+            first[1:] = point_index[1:] != point_index[:-1]
+            point_index, triangle_index = point_index[first], triangle_index[first]
+            faces[point_index] = self.triangle_faces[grid.triangle_index[triangle_index]]
+            back_facing[point_index] = grid.orientation[triangle_index] > 0
+        return faces, back_facing
+
+
+_testers = OrderedDict()
+
+
+def _mesh_key(vertices, faces):
+    faces = SvRaggedArray.from_data(faces, dtype=np.int64)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(vertices, dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(faces.values, dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(faces.offsets).tobytes())
+    return digest.hexdigest(), faces
+
+
+def get_mesh_inside_tester(vertices, faces):
+    """
+    SvMeshInsideTester for the mesh; testers of the last MAX_CACHED_TESTERS
+    meshes are kept, so repeated tests against the same mesh reuse grids.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64).reshape((-1, 3))
+    key, faces = _mesh_key(vertices, faces)
+    tester = _testers.pop(key, None)
+    if tester is None:
+        tester = SvMeshInsideTester(vertices, faces)
+    _testers[key] = tester
+    while len(_testers) > MAX_CACHED_TESTERS:
+        _testers.popitem(last=False)
+    return tester
+
+
+def clear_mesh_inside_testers():
+    """Forget cached testers, for example when another file is loaded"""
+    _testers.clear()
@@ -0,0 +1,303 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Merging of mesh vertices which are closer than given distance (a.k.a.
+"remove doubles" or welding), done on arrays of vertices and indices
+instead of a bmesh.
+
+Close vertices are found by a spatial hash: points are put into cells
+of a regular grid with cells not smaller than the distance, so only
+points of neighbouring cells have to be compared. Vertices are merged
+in the order of their indices: each vertex which is not merged yet
+takes all not merged vertices within the distance, and keeps its
+position. There are no chains of merges, as with bmesh.ops.remove_doubles.
+
+This module does not depend on Blender API.
+"""
+
+import numpy as np
+
+from sverchok.utils.ragged import SvRaggedArray, ragged_polygons_to_edges
+
+# Cells along one axis; with more cells keys of cells would not fit into int64
+MAX_CELLS_PER_AXIS = 1 << 20
+# Number of candidate pairs of points compared at once
+PAIRS_CHUNK_SIZE = 1 << 22
+# Rounds of vectorized resolution of merge order, before falling back to a loop
+MAX_MERGE_ROUNDS = 64
+
+# Offsets of neighbour cells, one of each pair of opposite offsets,
+# so that each pair of neighbour cells is visited once
+_HALF_NEIGHBOURHOOD = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+                       if (dx, dy, dz) > (0, 0, 0)]
+
+
+def _as_vertices(vertices):
+    vertices = np.asarray(vertices, dtype=np.float64)
+    if vertices.size == 0:
+        return vertices.reshape((0, 3))
+    return vertices
+
+
+def _expand_cell_pairs(starts_a, counts_a, starts_b, counts_b):
+    """All pairs of positions (i from cell a, j from cell b) for each pair of cells"""
+    sizes = counts_a * counts_b
+    pair_index = np.repeat(np.arange(len(sizes)), sizes)
+    local = np.arange(len(pair_index)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    counts_b = counts_b[pair_index]
+    return starts_a[pair_index] + local // counts_b, starts_b[pair_index] + local % counts_b
+
+
+def _cell_pair_chunks(sizes):
+    """Bounds of groups of cell pairs with about PAIRS_CHUNK_SIZE candidates in each"""
+    totals = np.cumsum(sizes)
+    bounds = [0]
+    while bounds[-1] < len(sizes):
+        start = bounds[-1]
+        base = totals[start - 1] if start else 0
+        end = int(np.searchsorted(totals, base + PAIRS_CHUNK_SIZE, side='right'))
+        bounds.append(max(end, start + 1))
+    return zip(bounds[:-1], bounds[1:])
+
+
+def find_close_pairs(points, distance):
+    """
+    Pairs of points which are not farther than distance from each other.
+    Returns two arrays of indices, i and j, with i < j.
+    """
+    points = _as_vertices(points)
+    n = len(points)
+    empty = np.empty(0, dtype=np.int64)
+    finite = np.isfinite(points).all(axis=1)
+    if not finite.all():
+        indices = np.flatnonzero(finite)
+        i, j = find_close_pairs(points[finite], distance)
+        return indices[i], indices[j]
+    if n < 2 or distance < 0:
+        return empty, empty
+
+    low = points.min(axis=0)
+    extent = points.max(axis=0) - low
+    cell_size = np.maximum(distance, extent / MAX_CELLS_PER_AXIS)
+    cell_size[cell_size == 0] = 1.0
+    # cells are numbered from 1, so that neighbours of all cells have non-negative numbers
+    cells = ((points - low) / cell_size).astype(np.int64) + 1
+    dims = cells.max(axis=0) + 2
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    is_start = np.empty(n, dtype=bool)
+    is_start[0] = True
+    np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=is_start[1:])
+    cell_starts = np.flatnonzero(is_start)
+    cell_keys = sorted_keys[cell_starts]
+    cell_counts = np.diff(np.append(cell_starts, n))
+
+    # pairs of cells: each cell with itself, and with its neighbours
+    crowded = np.flatnonzero(cell_counts > 1)
+    cells_a, cells_b = [crowded], [crowded]
+    for dx, dy, dz in _HALF_NEIGHBOURHOOD:
+        needed = cell_keys + (dx * dims[1] + dy) * dims[2] + dz
+        found = np.minimum(np.searchsorted(cell_keys, needed), len(cell_keys) - 1)
+        exists = np.flatnonzero(cell_keys[found] == needed)
+        cells_a.append(exists)
+        cells_b.append(found[exists])
+    cells_a = np.concatenate(cells_a)
+    cells_b = np.concatenate(cells_b)
+
+    sorted_points = points[order]
+    distance_sq = distance * distance
+    result_i, result_j = [], []
+    sizes = cell_counts[cells_a] * cell_counts[cells_b]
+    for start, end in _cell_pair_chunks(sizes):
+        a, b = cells_a[start:end], cells_b[start:end]
+        i, j = _expand_cell_pairs(cell_starts[a], cell_counts[a], cell_starts[b], cell_counts[b])
+        # pairs within one cell are given twice, and pairs of a point with itself
+        once = ~np.repeat(a == b, sizes[start:end]) | (i < j)
+        i, j = i[once], j[once]
+        delta = sorted_points[i] - sorted_points[j]
+        close = np.einsum('ij,ij->i', delta, delta) <= distance_sq
+        i, j = order[i[close]], order[j[close]]
+        result_i.append(np.minimum(i, j))
+        result_j.append(np.maximum(i, j))
+    if not result_i:
+        return empty, empty
+    return np.concatenate(result_i), np.concatenate(result_j)
+
+
+def _resolve_merge_targets(n, smaller, larger):
+    """
+    Given pairs of close points (smaller < larger), decide which points are kept:
+    a point is kept if none of close points with smaller indices is kept.
+    Returns boolean array, True for kept points.
+    """
+    UNKNOWN, KEPT, MERGED = 0, 1, 2
+    n_smaller = np.bincount(larger, minlength=n)
+    state = np.where(n_smaller > 0, UNKNOWN, KEPT).astype(np.int8)
+
+    for _ in range(MAX_MERGE_ROUNDS):
+        pending = state[larger] == UNKNOWN
+        smaller, larger = smaller[pending], larger[pending]
+        if not len(larger):
+            break
+        # point which is the first unknown one always gets resolved, so each round makes progress
+        smaller_state = state[smaller]
+        has_kept = np.bincount(larger, weights=(smaller_state == KEPT), minlength=n) > 0
+        n_merged = np.bincount(larger, weights=(smaller_state == MERGED), minlength=n)
+        unknown = state == UNKNOWN
+        state[unknown & has_kept] = MERGED
+        state[unknown & ~has_kept & (n_merged == n_smaller)] = KEPT
+    else:
+        # long chains of close points; finish in order of indices
+        pending = state[larger] == UNKNOWN
+        smaller, larger = smaller[pending], larger[pending]
+        order = np.argsort(larger, kind='stable')
+        smaller, larger = smaller[order], larger[order]
+        bounds = np.searchsorted(larger, np.arange(n + 1))
+        for point in np.flatnonzero(state == UNKNOWN).tolist():
+            neighbours = smaller[bounds[point]:bounds[point + 1]]
+            state[point] = MERGED if (state[neighbours] == KEPT).any() else KEPT
+
+    return state == KEPT
+
+
+def find_doubles(vertices, distance, mask=None):
+    """
+    For each vertex, index of the vertex it is merged into
+    (the vertex itself if it is kept).
+    mask: if given, only vertices with True in mask are merged.
+    """
+    vertices = _as_vertices(vertices)
+    n = len(vertices)
+    targets = np.arange(n)
+    if mask is None:
+        indices = targets
+    else:
+        indices = np.flatnonzero(np.asarray(mask, dtype=bool)[:n])
+    smaller, larger = find_close_pairs(vertices[indices], distance)
+    if not len(smaller):
+        return targets
+
+    kept = _resolve_merge_targets(len(indices), smaller, larger)
+    # merged vertex goes to the kept vertex with the smallest index among close ones
+    into = np.full(len(indices), len(indices))
+    good = kept[smaller] & ~kept[larger]
+    np.minimum.at(into, larger[good], smaller[good])
+    merged = np.flatnonzero(~kept)
+    targets[indices[merged]] = indices[into[merged]]
+    return targets
+
+
+def _unique_first(keys):
+    """Indices of first occurrences of each key, in order, and index of the group of each key"""
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return first[order], rank[inverse.ravel()]
+
+
+def _weld_faces(faces, new_index, touched_vertex):
+    """
+    Faces with remapped vertices. Consecutive repeated vertices are removed;
+    faces which get less than 3 vertices, have a repeated vertex, or
+    repeat another face are dropped.
+    Returns new faces and indices of original faces kept.
+    """
+    values = new_index[faces.values]
+    lengths = faces.lengths
+    face_index = faces.item_indices()
+    starts, ends = faces.offsets[:-1], faces.offsets[1:]
+    not_empty = lengths > 0
+    next_index = np.arange(1, len(values) + 1)
+    next_index[ends[not_empty] - 1] = starts[not_empty]
+    keep = values != values[next_index]
+    values, face_index = values[keep], face_index[keep]
+    new_lengths = np.bincount(face_index, minlength=len(faces))
+    welded = SvRaggedArray.from_lengths(values, new_lengths)
+
+    valid = new_lengths >= 3
+    # only faces which have merged vertices can get broken
+    touched = np.zeros(len(faces), dtype=bool)
+    touched[faces.item_indices()[touched_vertex[faces.values]]] = True
+    touched &= valid
+    if touched.any():
+        in_touched = touched[face_index]
+        touched_values, touched_faces = values[in_touched], face_index[in_touched]
+        order = np.lexsort((touched_values, touched_faces))
+        touched_values, touched_faces = touched_values[order], touched_faces[order]
+        repeated = (touched_values[1:] == touched_values[:-1]) & (touched_faces[1:] == touched_faces[:-1])
+        valid[touched_faces[1:][repeated]] = False
+        for length in np.unique(new_lengths[touched & valid]).tolist():
+            group = np.flatnonzero(valid & (new_lengths == length))
+            rows = np.sort(welded.take(group).to_array(), axis=1)
+            # stable sort keeps the first of equal faces first
+            order = np.lexsort(rows.T[::-1])
+            rows = rows[order]
+            same = (rows[1:] == rows[:-1]).all(axis=1)
+            valid[group[order[1:][same]]] = False
+
+    face_init_index = np.flatnonzero(valid)
+    return welded.take(face_init_index), face_init_index
+
+
+def weld_mesh(vertices, edges, faces, distance, mask=None):
+    """
+    Merge vertices of the mesh which are closer than distance.
+
+    vertices, edges, faces: the mesh, as lists or arrays; faces can also be SvRaggedArray.
+    mask: if given, only vertices with True in mask are merged.
+
+    Edges are given as edges of faces followed by other edges, in the same
+    order as bmesh creates them; edges which connect merged vertices are
+    removed, and each of edges which become equal is given once. Faces are
+    handled by _weld_faces(). Elements keep their original order.
+
+    Returns vertices (array), edges (array of shape (n, 2)), faces
+    (SvRaggedArray) and a dictionary with:
+        * 'vert_init_index': indices of output vertices in the original mesh
+        * 'edge_init_index': indices of output edges in edges argument (-1 for edges of faces)
+        * 'face_init_index': indices of output faces in the original mesh
+        * 'vert_index': index of output vertex for each original vertex
+    """
+    vertices = _as_vertices(vertices)
+    n = len(vertices)
+    targets = find_doubles(vertices, distance, mask)
+    kept = targets == np.arange(n)
+    vert_init_index = np.flatnonzero(kept)
+    new_index = (np.cumsum(kept) - 1)[targets]
+
+    faces = SvRaggedArray.from_data(faces if faces is not None else [], dtype=np.int64)
+    edges = np.asarray(edges if edges is not None else [], dtype=np.int64).reshape((-1, 2))
+    face_edges = ragged_polygons_to_edges(faces)
+    all_edges = np.concatenate((face_edges, edges))
+    edge_origin = np.concatenate((np.full(len(face_edges), -1), np.arange(len(edges))))
+
+    # edges keep the direction they had in the mesh
+    all_edges = new_index[all_edges]
+    good = all_edges[:, 0] != all_edges[:, 1]
+    all_edges, edge_origin = all_edges[good], edge_origin[good]
+    keys = np.minimum(all_edges[:, 0], all_edges[:, 1]) * max(n, 1) + np.maximum(all_edges[:, 0], all_edges[:, 1])
+    first, group = _unique_first(keys)
+    # bmesh keeps index of the last of given edges which coincide
+    edge_init_index = np.full(len(first), -1)
+    np.maximum.at(edge_init_index, group, edge_origin)
+
+    new_faces, face_init_index = _weld_faces(faces, new_index, ~kept)
+    data = dict(vert_init_index=vert_init_index,
+                edge_init_index=edge_init_index,
+                face_init_index=face_init_index,
+                vert_index=new_index)
+    return vertices[kept], all_edges[first], new_faces, data
+
+
+def take_data(data, indices):
+    """Items of per-element data for output elements; None for indices out of data range"""
+    n = len(data)
+    return [data[i] if 0 <= i < n else None for i in np.asarray(indices).tolist()]
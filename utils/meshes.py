@@ -30,6 +30,7 @@ from mathutils import Matrix, Vector
 
 from sverchok.data_structure import fixed_iter
 from sverchok.utils.modules.matrix_utils import matrix_apply_np
+from sverchok.utils.ragged import join_index_lists
 
 
 PyVertex = Tuple[float, float, float]
@@ -53,18 +54,19 @@ def join(meshes: List[Mesh], return_type: Type[Mesh] = None) -> Mesh:
         return_type = type(meshes[0])
 
     out_mesh = return_type([], [], [])
-    added_vertices = 0
+    edges_number, polygons_number = 0, 0
     for mesh in meshes:
-        elements = [(out_mesh.vertices, mesh.vertices), (out_mesh.edges, mesh.edges),
-                    (out_mesh.polygons, mesh.polygons)]
-        for out_elem, elem in elements:
+        elements = [(out_mesh.vertices, mesh.vertices, len(out_mesh.vertices)),
+                    (out_mesh.edges, mesh.edges, edges_number),
+                    (out_mesh.polygons, mesh.polygons, polygons_number)]
+        for out_elem, elem, out_len in elements:
             for attr in out_elem.attributes | elem.attributes:
                 out_data = out_elem.get_attribute(attr)
                 data = elem.get_attribute(attr)
                 if out_data is None:
-                    out_data = [data[0]] * len(out_elem)
+                    out_data = [data[0]] * out_len
                 else:
-                    out_data = fix_len(out_data, len(out_elem))
+                    out_data = fix_len(out_data, out_len)
                 out_data.extend(data or [])
                 out_elem[attr] = out_data
 
@@ -73,9 +75,13 @@ def join(meshes: List[Mesh], return_type: Type[Mesh] = None) -> Mesh:
         else:
             out_mesh.vertices.data.extend(mesh.vertices.data)
 
-        out_mesh.edges.data.extend([i + added_vertices for i in e] for e in mesh.edges)
-        out_mesh.polygons.data.extend([i + added_vertices for i in p] for p in mesh.polygons)
-        added_vertices += len(mesh.vertices)
+        edges_number += len(mesh.edges)
+        polygons_number += len(mesh.polygons)
+
+    # indices of all meshes are shifted in one pass
+    vertex_offsets = np.cumsum([0] + [len(m.vertices) for m in meshes])[:-1]
+    out_mesh.edges.data = join_index_lists([m.edges.data for m in meshes], vertex_offsets).to_lists()
+    out_mesh.polygons.data = join_index_lists([m.polygons.data for m in meshes], vertex_offsets).to_lists()
 
     if return_type == NpMesh:
         out_mesh.vertices.data = np.concatenate([m.vertices.data for m in meshes])
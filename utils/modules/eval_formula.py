@@ -17,8 +17,11 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import ast
+from functools import lru_cache
 
-from sverchok.utils.script_importhelper import safe_names
+import numpy as np
+
+from sverchok.utils.script_importhelper import safe_names, safe_names_np
 from sverchok.utils import logging
 
 class VariableCollector(ast.NodeVisitor):
@@ -136,6 +139,11 @@ def safe_eval_compiled(compiled, variables, allowed_names = None):
         logging.exception(e)
         raise Exception("Invalid expression syntax: " + str(e))
 
+@lru_cache(maxsize=256)
+def _compile_cached(string):
+    root = ast.parse(string, mode='eval')
+    return compile(root, "<expression>", 'eval')
+
 # It could be safer...
 def safe_eval(string, variables):
     """
@@ -147,9 +155,251 @@ def safe_eval(string, variables):
         env.update(safe_names)
         env.update(variables)
         env["__builtins__"] = {}
-        root = ast.parse(string, mode='eval')
-        return eval(compile(root, "<expression>", 'eval'), env)
+        return eval(_compile_cached(string), env)
     except SyntaxError as e:
         logging.exception(e)
         raise Exception("Invalid expression syntax: " + str(e))
 
+
+class NotVectorizable(Exception):
+    pass
+
+def _integer_valued(f):
+    # math.floor and similar return int, while NumPy functions return floats
+    def wrapper(a):
+        a = f(a)
+        if a.dtype.kind == 'f':
+            if not np.isfinite(a).all():
+                raise ValueError("cannot convert non-finite value to integer")
+            a = a.astype(np.int64)
+        return a
+    return wrapper
+
+def _sign(a):
+    return np.where(np.isnan(a), 0, np.sign(a)).astype(np.int64)
+
+# Python's max(a, b) takes b only if b > a, so max(1.0, nan) is 1.0 and max(nan, 1.0) is nan;
+# np.maximum would give nan in both cases
+def _max(a, b):
+    return np.where(b > a, b, a)
+
+def _min(a, b):
+    return np.where(b < a, b, a)
+
+# Functions which can be applied to whole NumPy arrays, and
+# maximum number of their arguments; most of math functions are
+# replaced by their NumPy equivalents from safe_names_np
+vectorized_arity = {
+        'acos': 1, 'acosh': 1, 'asin': 1, 'asinh': 1, 'atan': 1, 'atan2': 2, 'atanh': 1,
+        'ceil': 1, 'copysign': 2, 'cos': 1, 'cosh': 1, 'degrees': 1, 'erf': 1, 'erfc': 1,
+        'exp': 1, 'expm1': 1, 'fabs': 1, 'factorial': 1, 'floor': 1, 'fmod': 2, 'gamma': 1,
+        'hypot': 2, 'isfinite': 1, 'isinf': 1, 'isnan': 1, 'ldexp': 2, 'lgamma': 1,
+        'log': 1, 'log10': 1, 'log1p': 1, 'log2': 1, 'radians': 1, 'sin': 1, 'sinh': 1,
+        'sqrt': 1, 'tan': 1, 'tanh': 1, 'trunc': 1,
+        'abs': 1, 'sign': 1, 'pow': 2
+    }
+
+vectorized_names = {name: safe_names_np[name] for name in vectorized_arity}
+vectorized_names.update({
+        'atan': np.arctan,
+        'ceil': _integer_valued(np.ceil),
+        'floor': _integer_valued(np.floor),
+        'trunc': _integer_valued(np.trunc),
+        'fmod': lambda x, y: np.fmod(np.asarray(x, dtype=np.float64), y),
+        'abs': np.abs,
+        'sign': _sign,
+        'pow': np.power,
+        'max': _max,
+        'min': _min,
+        'e': safe_names['e'],
+        'pi': safe_names['pi'],
+        'np': np,
+        '__where': np.where,
+        '__and': np.logical_and,
+        '__or': np.logical_or,
+        '__not': np.logical_not
+    })
+
+class Vectorizer(ast.NodeTransformer):
+    """
+    Transformer of expression AST, which makes the expression applicable to
+    NumPy arrays of variable values, so it is evaluated for all values at once.
+    Operators work for arrays as they are; math functions are replaced by
+    NumPy ones, conditional expressions - by np.where, boolean operators on
+    comparisons - by np.logical_and etc.
+    Raises NotVectorizable for constructs which can not be evaluated
+    for arrays in the same way as for single values (lists, subscripts,
+    comprehensions, most of Python built-in functions and so on).
+    """
+    # before Python 3.8, numbers are parsed into ast.Num nodes
+    num_node = getattr(ast, 'Num', ast.Constant)
+
+    allowed_nodes = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Load, ast.Constant, num_node,
+                     ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+                     ast.UAdd, ast.USub)
+
+    def __init__(self, variables):
+        self.variables = variables
+        # Python integers do not overflow, NumPy ones do
+        self.can_overflow = False
+
+    @staticmethod
+    def call(name, args):
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[])
+
+    @staticmethod
+    def is_boolean(node):
+        return isinstance(node, (ast.Compare, ast.BoolOp)) or \
+                (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not))
+
+    def generic_visit(self, node):
+        if not isinstance(node, self.allowed_nodes):
+            raise NotVectorizable(type(node).__name__)
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise NotVectorizable("non-numeric constant")
+        if not isinstance(node, ast.Constant) and isinstance(node, self.num_node) and not isinstance(node.n, (int, float)):
+            raise NotVectorizable("complex number")
+        if isinstance(node, (ast.Mult, ast.Pow)):
+            self.can_overflow = True
+        return super().generic_visit(node)
+
+    def visit_Name(self, node):
+        if node.id not in self.variables and node.id not in vectorized_names:
+            raise NotVectorizable(node.id)
+        if node.id in self.variables and node.id in vectorized_names:
+            raise NotVectorizable(f"variable {node.id} shadows a function")
+        return node
+
+    def is_numpy(self, node):
+        return isinstance(node.value, ast.Name) and node.value.id == 'np' and 'np' not in self.variables
+
+    def visit_Attribute(self, node):
+        # constants like np.pi
+        if not self.is_numpy(node) or not isinstance(getattr(np, node.attr, None), float):
+            raise NotVectorizable("attribute")
+        return node
+
+    def visit_UnaryOp(self, node):
+        if isinstance(node.op, ast.Not):
+            if not self.is_boolean(node.operand):
+                raise NotVectorizable("not")
+            return self.call('__not', [self.visit(node.operand)])
+        return self.generic_visit(node)
+
+    def visit_BoolOp(self, node):
+        # "and" / "or" return one of operands, which is the same as
+        # logical operations only for boolean operands
+        if not all(self.is_boolean(value) for value in node.values):
+            raise NotVectorizable("boolean operator")
+        name = '__and' if isinstance(node.op, ast.And) else '__or'
+        values = [self.visit(value) for value in node.values]
+        result = values[0]
+        for value in values[1:]:
+            result = self.call(name, [result, value])
+        return result
+
+    def visit_Compare(self, node):
+        if not all(isinstance(op, (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE)) for op in node.ops):
+            raise NotVectorizable("comparison")
+        # a < b < c means a < b and b < c
+        operands = [self.visit(node.left)] + [self.visit(c) for c in node.comparators]
+        comparisons = [ast.Compare(left=left, ops=[op], comparators=[right])
+                       for left, op, right in zip(operands[:-1], node.ops, operands[1:])]
+        result = comparisons[0]
+        for comparison in comparisons[1:]:
+            result = self.call('__and', [result, comparison])
+        return result
+
+    def visit_IfExp(self, node):
+        return self.call('__where', [self.visit(node.test), self.visit(node.body), self.visit(node.orelse)])
+
+    def visit_Call(self, node):
+        if node.keywords or any(isinstance(arg, ast.Starred) for arg in node.args):
+            raise NotVectorizable("call arguments")
+        func = node.func
+        args = [self.visit(arg) for arg in node.args]
+        if isinstance(func, ast.Attribute):
+            # only element-wise NumPy functions, e.g. np.arctan2(y, x), but not np.sum(x)
+            # (more positional arguments would be taken as output arrays)
+            ufunc = getattr(np, func.attr, None) if self.is_numpy(func) else None
+            if not isinstance(ufunc, np.ufunc) or len(args) > ufunc.nin:
+                raise NotVectorizable("method call")
+            return ast.Call(func=func, args=args, keywords=[])
+        if not isinstance(func, ast.Name) or func.id in self.variables:
+            raise NotVectorizable("call")
+        if func.id in ('max', 'min'):
+            # max(a, b, c) is element-wise, max(lst) is not
+            if len(args) < 2:
+                raise NotVectorizable(func.id)
+            result = args[0]
+            for arg in args[1:]:
+                result = self.call(func.id, [result, arg])
+            return result
+        if len(args) > vectorized_arity.get(func.id, 0):
+            # e.g. log(x, base), or functions which are not vectorized at all
+            raise NotVectorizable(f"function {func.id}")
+        if func.id in ('pow', 'factorial'):
+            self.can_overflow = True
+        return ast.Call(func=func, args=args, keywords=[])
+
+
+class SvCompiledFormula:
+    """
+    Expression compiled once, to be evaluated many times.
+    evaluate() calculates it for one set of variable values,
+    evaluate_vectorized() - for arrays of values of all variables at once,
+    if the expression allows that.
+    """
+    def __init__(self, string, variables=None):
+        self.string = string
+        self.compiled = sv_compile(string)
+        if variables is None:
+            variables = get_variables(string)
+        self.variables = set(variables)
+        try:
+            vectorizer = Vectorizer(self.variables)
+            root = ast.fix_missing_locations(vectorizer.visit(ast.parse(string, mode='eval')))
+            self.vectorized = compile(root, "<vectorized expression>", 'eval')
+            self.can_overflow = vectorizer.can_overflow
+        except NotVectorizable:
+            self.vectorized = None
+            self.can_overflow = False
+
+    @property
+    def is_vectorizable(self):
+        return self.vectorized is not None
+
+    def evaluate(self, variables):
+        return safe_eval_compiled(self.compiled, variables)
+
+    def evaluate_vectorized(self, variables, count):
+        """
+        variables: dictionary of 1D NumPy arrays of numbers of length count.
+        Returns array of length count, or None if the expression can not be
+        evaluated for arrays, or if that would give different results than
+        evaluation for single values (evaluate() is to be used then).
+        """
+        if self.vectorized is None:
+            return None
+        if self.can_overflow and any(values.dtype.kind in 'iu' for values in variables.values()):
+            return None
+        env = dict(vectorized_names)
+        env.update(variables)
+        env["__builtins__"] = {}
+        try:
+            # errors like division by zero are to be raised by evaluation for single values
+            with np.errstate(all='raise', under='ignore'):
+                result = np.asarray(eval(self.vectorized, env))
+        except Exception:
+            return None
+        if result.dtype == object or result.ndim > 1:
+            return None
+        if result.shape != (count,):
+            result = np.broadcast_to(result, (count,))
+        return result
+
+
+@lru_cache(maxsize=256)
+def compile_formula(string):
+    """Compiled formula, cached by its text"""
+    return SvCompiledFormula(string)
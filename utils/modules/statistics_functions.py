@@ -20,6 +20,8 @@ from functools import reduce
 from math import sqrt, floor
 import sys
 
+import numpy as np
+
 
 def get_sum(values):
     return sum(values)
@@ -83,7 +85,6 @@ def get_maximum(values):
 def get_median(values):
     sortedValues = sorted(values)
     index = int(floor(len(values) / 2))
-    print("index=", index)
     if len(values) % 2 == 0:  # even number of values ? => take the average of central values
         median = (sortedValues[index - 1] + sortedValues[index]) / 2
     else:  # odd number of values ? => take the central value
@@ -119,3 +120,115 @@ def get_histogram(values, numBins, normalize=False, normalizedSize=10):
             histogram[i] = histogram[i] / binMax * normalizedSize
 
     return histogram
+
+
+# Versions of the functions above for NumPy arrays, with the same formulas.
+# The arrays are not converted into lists.
+
+def get_sum_np(values):
+    return values.sum()
+
+
+def get_sum_of_squares_np(values):
+    return np.dot(values, values)
+
+
+def get_sum_of_inversions_np(values):
+    return (1.0 / values).sum()
+
+
+def get_product_np(values):
+    if values.dtype.kind in 'iu':
+        # Python integers do not overflow
+        return get_product(values.tolist())
+    return values.prod()
+
+
+def get_average_np(values):
+    return values.sum() / len(values)
+
+
+def get_geometric_mean_np(values):
+    return pow(get_product_np(values), 1.0 / len(values))
+
+
+def get_harmonic_mean_np(values):
+    return len(values) / get_sum_of_inversions_np(values)
+
+
+def get_standard_deviation_np(values):
+    d = values - get_average_np(values)
+    return sqrt(np.dot(d, d))
+
+
+def get_root_mean_square_np(values):
+    return sqrt(get_sum_of_squares_np(values) / len(values))
+
+
+def get_skewness_np(values):
+    d = values - get_average_np(values)
+    s = get_standard_deviation_np(values)
+    return (d ** 3).sum() / len(values) / pow(s, 3)
+
+
+def get_kurtosis_np(values):
+    d = values - get_average_np(values)
+    s = get_standard_deviation_np(values)
+    return (d ** 4).sum() / len(values) / pow(s, 4)
+
+
+def get_minimum_np(values):
+    return values.min()
+
+
+def get_maximum_np(values):
+    return values.max()
+
+
+def get_median_np(values):
+    index = len(values) // 2
+    if len(values) % 2 == 0:
+        central = np.partition(values, (index - 1, index))
+        return (central[index - 1] + central[index]) / 2
+    return np.partition(values, index)[index]
+
+
+def get_percentile_np(values, percentage):
+    index = int(min(int(floor(len(values) * percentage)), len(values) - 1))
+    return np.partition(values, index)[index]
+
+
+def get_histogram_np(values, numBins, normalize=False, normalizedSize=10):
+    minValue = get_minimum_np(values)
+    maxValue = get_maximum_np(values)
+
+    binSize = max((maxValue - minValue) / numBins, sys.float_info.min)
+
+    binIndices = np.minimum(np.floor((values - minValue) / binSize).astype(np.int64), numBins - 1)
+    histogram = np.bincount(binIndices, minlength=numBins).tolist()
+
+    if normalize:
+        binMax = max(histogram)
+        histogram = [h / binMax * normalizedSize for h in histogram]
+
+    return histogram
+
+
+numpy_functions = {
+    get_sum: get_sum_np,
+    get_sum_of_squares: get_sum_of_squares_np,
+    get_sum_of_inversions: get_sum_of_inversions_np,
+    get_product: get_product_np,
+    get_average: get_average_np,
+    get_geometric_mean: get_geometric_mean_np,
+    get_harmonic_mean: get_harmonic_mean_np,
+    get_standard_deviation: get_standard_deviation_np,
+    get_root_mean_square: get_root_mean_square_np,
+    get_skewness: get_skewness_np,
+    get_kurtosis: get_kurtosis_np,
+    get_minimum: get_minimum_np,
+    get_maximum: get_maximum_np,
+    get_median: get_median_np,
+    get_percentile: get_percentile_np,
+    get_histogram: get_histogram_np
+}
@@ -0,0 +1,200 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Per-node execution statistics.
+
+When recording is enabled, the update system adds one record per processed
+node into a ring buffer of the node tree. Each record is a dictionary:
+
+    {"update": index of the tree update,
+     "name": node name, "bl_idname": node type,
+     "start": time.perf_counter() value, "duration": seconds,
+     "items_in": {socket name: number of objects},
+     "items_out": {socket name: number of objects},
+     "bytes_out": estimated size of output data,
+     "cache_hits": number of linked inputs which had data,
+     "cache_misses": number of linked inputs which had no data,
+     "error": exception text or None}
+
+Records can be queried from Python console:
+
+    >>> from sverchok.utils.node_stats import get_tree_stats
+    >>> print(get_tree_stats("NodeTree").report(10))
+
+This module does not depend on Blender API.
+"""
+
+import collections
+import csv
+import json
+import sys
+
+import numpy as np
+
+from sverchok.utils.ragged import SvRaggedArray
+
+# Whether records are collected during updates
+is_enabled = False
+# Maximum number of records kept for each tree
+buffer_size = 10000
+
+_tree_stats = {}
+
+RECORD_FIELDS = ["update", "name", "bl_idname", "start", "duration",
+                 "items_in", "items_out", "bytes_out",
+                 "cache_hits", "cache_misses", "error"]
+
+
+def estimate_size(data, max_depth=8):
+    """
+    Approximate size of data in bytes. For lists, only the first item
+    of each level is inspected and its size is multiplied by the length
+    of the list, so the estimation does not depend on the size of data.
+    """
+    if isinstance(data, np.ndarray):
+        if data.dtype == object:
+            if data.size == 0:
+                return data.nbytes
+            return data.nbytes + data.size * estimate_size(data.flat[0], max_depth - 1)
+        return data.nbytes
+    if isinstance(data, SvRaggedArray):
+        return data.nbytes
+    if isinstance(data, (list, tuple)):
+        size = sys.getsizeof(data)
+        if data and max_depth > 0:
+            size += len(data) * estimate_size(data[0], max_depth - 1)
+        return size
+    return sys.getsizeof(data)
+
+
+def count_items(data):
+    try:
+        return len(data)
+    except TypeError:
+        return 1
+
+
+class SvTreeStats:
+    """
+    Ring buffer of node execution records of one node tree.
+    """
+    def __init__(self, tree_name, size=None):
+        self.tree_name = tree_name
+        self.records = collections.deque(maxlen=size or buffer_size)
+        self.update_index = 0
+
+    def new_update(self):
+        self.update_index += 1
+        return self.update_index
+
+    def add(self, record):
+        record.setdefault("update", self.update_index)
+        self.records.append(record)
+
+    def clear(self):
+        self.records.clear()
+
+    def query(self, name=None, bl_idname=None, last_updates=None, errors_only=False):
+        """
+        List of records, filtered by node name, node type, number of last updates,
+        or only records of failed nodes.
+        """
+        min_update = None
+        if last_updates is not None:
+            min_update = self.update_index - last_updates + 1
+        result = []
+        for record in self.records:
+            if name is not None and record["name"] != name:
+                continue
+            if bl_idname is not None and record["bl_idname"] != bl_idname:
+                continue
+            if min_update is not None and record["update"] < min_update:
+                continue
+            if errors_only and record["error"] is None:
+                continue
+            result.append(record)
+        return result
+
+    def aggregate(self):
+        """
+        Dictionary {node name: statistics}, where statistics is a dictionary with
+        number of calls, total, mean and maximum duration, mean size of output
+        data and number of errors.
+        """
+        result = {}
+        for record in self.records:
+            item = result.get(record["name"])
+            if item is None:
+                item = result[record["name"]] = dict(
+                        name = record["name"], bl_idname = record["bl_idname"],
+                        calls = 0, total = 0.0, max = 0.0, bytes_out = 0, errors = 0)
+            item["calls"] += 1
+            item["total"] += record["duration"]
+            item["max"] = max(item["max"], record["duration"])
+            item["bytes_out"] += record["bytes_out"]
+            if record["error"] is not None:
+                item["errors"] += 1
+        for item in result.values():
+            item["mean"] = item["total"] / item["calls"]
+            item["bytes_out"] = item["bytes_out"] // item["calls"]
+        return result
+
+    def top(self, count=10, key="total"):
+        """
+        List of aggregated statistics (see aggregate()) of `count` slowest nodes.
+        key: "total", "mean" or "max".
+        """
+        items = sorted(self.aggregate().values(), key=lambda item: item[key], reverse=True)
+        return items[:count]
+
+    def report(self, count=10, key="total"):
+        """
+        Text table of `count` slowest nodes.
+        """
+        lines = [f"Slowest nodes of tree {self.tree_name} by {key} time ({len(self.records)} records):",
+                 f"{'Node':<32} {'Type':<32} {'Calls':>6} {'Total, s':>10} {'Mean, s':>10} {'Max, s':>10} {'Out, KB':>10} {'Errors':>6}"]
+        for item in self.top(count, key):
+            lines.append(f"{item['name'][:32]:<32} {item['bl_idname'][:32]:<32} {item['calls']:>6} "
+                         f"{item['total']:>10.4f} {item['mean']:>10.4f} {item['max']:>10.4f} "
+                         f"{item['bytes_out'] / 1024:>10.1f} {item['errors']:>6}")
+        return "\n".join(lines)
+
+    def to_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(dict(tree = self.tree_name, records = list(self.records)), f, indent=1)
+
+    def to_csv(self, path):
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=RECORD_FIELDS)
+            writer.writeheader()
+            for record in self.records:
+                row = dict(record)
+                row["items_in"] = json.dumps(row["items_in"])
+                row["items_out"] = json.dumps(row["items_out"])
+                writer.writerow(row)
+
+
+def get_tree_stats(tree_name):
+    """
+    SvTreeStats object of the tree; it is created if it does not exist yet.
+    """
+    stats = _tree_stats.get(tree_name)
+    if stats is None:
+        stats = _tree_stats[tree_name] = SvTreeStats(tree_name)
+    return stats
+
+
+def all_tree_stats():
+    return list(_tree_stats.values())
+
+
+def reset_tree_stats(tree_name=None):
+    if tree_name is None:
+        _tree_stats.clear()
+    else:
+        _tree_stats.pop(tree_name, None)
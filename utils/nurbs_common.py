@@ -216,3 +216,135 @@ class SvNurbsBasisFunctions(object):
         
         return calc
 
+
+def _safe_divide(numerator, denominator):
+    good = (denominator != 0)
+    result = np.zeros(np.broadcast(numerator, denominator).shape)
+    np.divide(numerator, denominator, out=result, where=good)
+    return result
+
+def find_knot_spans(knotvector, ts):
+    """
+    Find knot span index for each parameter value.
+    Span index s is such that knotvector[s] <= t < knotvector[s+1],
+    with only knot spans of non-zero length taken into account; the last
+    parameter value (t == knotvector[-1]) is assigned to the last
+    non-empty span.
+
+    input:
+        * knotvector: np.array of shape (m+1,)
+        * ts: np.array of shape (n,)
+    returns: np.array of ints of shape (n,)
+    """
+    u = np.asarray(knotvector)
+    s_min = np.searchsorted(u, u[0], side='right') - 1
+    s_max = np.searchsorted(u, u[-1], side='left') - 1
+    spans = np.searchsorted(u, ts, side='right') - 1
+    return np.clip(spans, s_min, s_max)
+
+def basis_function_derivatives(knotvector, degree, ts, order=0, spans=None):
+    """
+    Calculate values and derivatives of B-Spline basis functions, which
+    are not identically zero at each parameter value.
+    At each t, only degree+1 basis functions are non-zero: these are
+    N[s-degree], ..., N[s], where s is the knot span index of t.
+    All parameter values are processed at once, by a vectorized version of
+    Cox - de Boor recurrence; see "The NURBS book" (2nd edition), p.2.5,
+    algorithm A2.3.
+
+    Results are consistent with SvNurbsBasisFunctions: basis functions
+    are zero for parameter values out of [knotvector[0], knotvector[-1]],
+    and functions with indexes out of [0, len(knotvector)-degree-2]
+    are zero.
+
+    input:
+        * knotvector: np.array of shape (m+1,)
+        * degree: degree of basis functions
+        * ts: np.array of shape (n,)
+        * order: maximum order of derivatives to calculate
+        * spans: np.array of shape (n,); if not provided, it will be
+          calculated by find_knot_spans().
+    returns: tuple:
+        * np.array of shape (n,) - knot span indexes;
+        * np.array of shape (order+1, n, degree+1): values of derivatives
+          of orders 0..order of basis functions N[s-degree+j], j = 0..degree.
+    """
+    u = np.asarray(knotvector, dtype=np.float64)
+    ts = np.asarray(ts, dtype=np.float64)
+    p = degree
+    n = len(ts)
+    if spans is None:
+        spans = find_knot_spans(u, ts)
+
+    # Pad knotvector at both ends, so that knot indexes in the
+    # recurrence never get out of bounds; values calculated for
+    # functions with invalid indexes are discarded in the end.
+    pad = p + 1
+    padded = np.concatenate((np.full(pad, u[0]), u, np.full(pad, u[-1])))
+    ts_col = ts[np.newaxis].T
+
+    def knot_diffs(d):
+        # For basis function N[i, d], where i = s-d+j, j = 0..d:
+        # return (t - u[i]), (u[i+d] - u[i]), (u[i+d+1] - t), (u[i+d+1] - u[i+1])
+        i = spans[np.newaxis].T - d + np.arange(d+1) + pad # (n, d+1)
+        u_i = padded[i]
+        u_i1 = padded[i+1]
+        u_id = padded[i+d]
+        u_id1 = padded[i+d+1]
+        return ts_col - u_i, u_id - u_i, u_id1 - ts_col, u_id1 - u_i1
+
+    def shift(values):
+        # values: values of functions N[s-d+1, d-1], ..., N[s, d-1]
+        # returns: arrays of N[i, d-1] and N[i+1, d-1] for i = s-d, ..., s
+        left = np.zeros((n, values.shape[1]+1))
+        right = np.zeros((n, values.shape[1]+1))
+        left[:,1:] = values
+        right[:,:-1] = values
+        return left, right
+
+    # basis[d]: values of N[s-d, d], ..., N[s, d]; shape (n, d+1)
+    basis = [np.ones((n, 1))]
+    diffs = [None]
+    for d in range(1, p+1):
+        left_t, denom1, right_t, denom2 = knot_diffs(d)
+        diffs.append((denom1, denom2))
+        n1, n2 = shift(basis[d-1])
+        value = _safe_divide(left_t, denom1) * n1 + _safe_divide(right_t, denom2) * n2
+        basis.append(value)
+
+    result = np.zeros((order+1, n, p+1))
+    result[0] = basis[p]
+    # prev_ders[d]: derivatives of order k-1 of N[s-d, d], ..., N[s, d]
+    prev_ders = basis
+    for k in range(1, min(order, p)+1):
+        ders = [None] * (p+1)
+        for d in range(k, p+1):
+            denom1, denom2 = diffs[d]
+            n1, n2 = shift(prev_ders[d-1])
+            ders[d] = d * (_safe_divide(n1, denom1) - _safe_divide(n2, denom2))
+        result[k] = ders[p]
+        prev_ders = ders
+
+    k = len(u) - p - 1
+    indexes = spans[np.newaxis].T - p + np.arange(p+1)
+    invalid = (indexes < 0) | (indexes >= k)
+    out_of_bounds = (ts < u[0]) | (ts > u[-1])
+    invalid = invalid | out_of_bounds[np.newaxis].T
+    result[:, invalid] = 0.0
+    return spans, result
+
+def span_control_indexes(spans, degree, count):
+    """
+    Indexes of control points affecting the curve at each span.
+
+    input:
+        * spans: np.array of shape (n,)
+        * degree: curve degree
+        * count: number of control points
+    returns: np.array of ints of shape (n, degree+1); indexes are clipped
+        to [0, count-1], so they can be used for indexing directly. Basis
+        functions with invalid indexes are zero anyway.
+    """
+    indexes = spans[np.newaxis].T - degree + np.arange(degree+1)
+    return np.clip(indexes, 0, count-1)
+
@@ -0,0 +1,281 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Background grid for Poisson-disk sampling ("dart throwing") in 3D space.
+
+Accepted points are registered in a uniform hash grid, with cell size not
+smaller than the maximum distance at which two points can conflict; so for
+each candidate point only 27 neighbouring cells have to be checked. Candidates
+are processed in batches: the check against already accepted points is fully
+vectorized, and only candidates of one batch which conflict with each other
+are resolved one by one, in the order in which they were generated.
+
+SvSamplingRandom provides random numbers for candidate points.
+
+This module does not depend on Blender API.
+"""
+
+import itertools
+import random
+
+import numpy as np
+
+# Multipliers for spatial hashing of integer cell coordinates
+# (Teschner et al, "Optimized Spatial Hashing for Collision Detection of Deformable Objects")
+_HASH_PRIMES = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+_NEIGHBOUR_OFFSETS = np.array(list(itertools.product((-1, 0, 1), repeat=3)), dtype=np.int64)
+
+
+def _cell_keys(cells):
+    # Different cells can have equal keys; this only means that some
+    # extra points will be checked for distance.
+    keys = cells * _HASH_PRIMES
+    return keys[:,0] ^ keys[:,1] ^ keys[:,2]
+
+
+class _HashGrid(object):
+    """
+    Static hash grid: point indexes sorted by cell key.
+    """
+    def __init__(self, points, cell_size):
+        self.cell_size = cell_size
+        keys = _cell_keys(np.floor(points / cell_size).astype(np.int64))
+        self.order = np.argsort(keys, kind='stable')
+        self.keys = keys[self.order]
+
+    def insert(self, points, first_index):
+        """
+        Add points, which will have indexes starting with first_index.
+        """
+        if len(points) == 0:
+            return
+        keys = _cell_keys(np.floor(points / self.cell_size).astype(np.int64))
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        positions = np.searchsorted(self.keys, keys, side='right')
+        self.keys = np.insert(self.keys, positions, keys)
+        self.order = np.insert(self.order, positions, order + first_index)
+
+    def candidate_pairs(self, points):
+        """
+        Pairs (index of point in `points`, index of registered point), for all
+        registered points which are in the same or neighbouring cells.
+        """
+        n = len(points)
+        if n == 0 or len(self.keys) == 0:
+            empty = np.zeros((0,), dtype=np.int64)
+            return empty, empty
+        cells = np.floor(points / self.cell_size).astype(np.int64)
+        own_idxs = []
+        other_idxs = []
+        for offset in _NEIGHBOUR_OFFSETS:
+            keys = _cell_keys(cells + offset)
+            starts = np.searchsorted(self.keys, keys, side='left')
+            counts = np.searchsorted(self.keys, keys, side='right') - starts
+            total = counts.sum()
+            if total == 0:
+                continue
+            own = np.repeat(np.arange(n), counts)
+            # position of each pair inside the run of equal keys
+            shifts = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            own_idxs.append(own)
+            other_idxs.append(self.order[starts[own] + shifts])
+        if not own_idxs:
+            empty = np.zeros((0,), dtype=np.int64)
+            return empty, empty
+        return np.concatenate(own_idxs), np.concatenate(other_idxs)
+
+
+class SvPoissonDiskGrid(object):
+    """
+    Set of accepted points, which checks that new points are not too close to them.
+
+    Two modes are supported:
+
+    * Minimum distance: a point is accepted if the distance from it to any
+      other point is not less than min_r.
+    * Radiuses: each point is the center of an empty sphere of its own
+      radius; a point is accepted if its sphere does not touch spheres of
+      other points.
+    """
+    def __init__(self, min_r=0.0, use_radiuses=False):
+        self.min_r = min_r
+        self.use_radiuses = use_radiuses
+        self.points = np.zeros((0, 3))
+        self.radiuses = np.zeros((0,))
+        self.max_radius = 0.0
+        self._grid = None
+
+    def __len__(self):
+        return len(self.points)
+
+    def _interaction_distance(self, max_radius):
+        if self.use_radiuses:
+            return 2.0 * max_radius
+        return self.min_r
+
+    def _ensure_grid(self, max_radius):
+        distance = self._interaction_distance(max(max_radius, self.max_radius))
+        if distance <= 0:
+            distance = 1.0
+        if self._grid is None or self._grid.cell_size < distance:
+            # In radiuses mode, cell size grows when bigger spheres appear.
+            self._grid = _HashGrid(self.points, distance)
+
+    def _conflicts(self, points, radiuses, other_points, other_radiuses, own, other):
+        deltas = points[own] - other_points[other]
+        sq_distances = (deltas * deltas).sum(axis=1)
+        if self.use_radiuses:
+            limits = radiuses[own] + other_radiuses[other]
+            return sq_distances <= limits * limits
+        else:
+            return sq_distances < self.min_r * self.min_r
+
+    def filter(self, points, radiuses=None):
+        """
+        Mask of points which are not too close to already accepted ones.
+        Points are not compared with each other.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        n = len(points)
+        ok = np.ones((n,), dtype=bool)
+        if n == 0 or len(self.points) == 0:
+            return ok
+        if self.use_radiuses:
+            radiuses = np.asarray(radiuses, dtype=np.float64)
+            self._ensure_grid(radiuses.max())
+        else:
+            self._ensure_grid(0.0)
+        own, other = self._grid.candidate_pairs(points)
+        conflicts = self._conflicts(points, radiuses, self.points, self.radiuses, own, other)
+        ok[own[conflicts]] = False
+        return ok
+
+    def add(self, points, radiuses=None, predicate=None):
+        """
+        Try to add a batch of candidate points. Candidates are accepted in
+        order, so a candidate is rejected if it is too close to an accepted
+        point or to an earlier accepted candidate of the same batch.
+
+        predicate: optional function, which takes an array of indexes of
+            candidates (which passed the check against already accepted
+            points) and returns a boolean mask of ones which can be accepted.
+
+        Returns: boolean mask of accepted candidates.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        n = len(points)
+        if self.use_radiuses:
+            radiuses = np.asarray(radiuses, dtype=np.float64).reshape((n,))
+        else:
+            radiuses = np.zeros((n,))
+        if n == 0:
+            return np.zeros((0,), dtype=bool)
+
+        ok = self.filter(points, radiuses)
+        if predicate is not None and ok.any():
+            idxs = np.where(ok)[0]
+            ok[idxs[~np.asarray(predicate(idxs), dtype=bool)]] = False
+
+        idxs = np.where(ok)[0]
+        if len(idxs) > 1 and (self.use_radiuses or self.min_r > 0):
+            batch_points = points[idxs]
+            batch_radiuses = radiuses[idxs]
+            max_radius = batch_radiuses.max()
+            distance = self._interaction_distance(max(max_radius, self.max_radius))
+            batch_grid = _HashGrid(batch_points, distance if distance > 0 else 1.0)
+            own, other = batch_grid.candidate_pairs(batch_points)
+            earlier = other < own
+            own, other = own[earlier], other[earlier]
+            conflicts = self._conflicts(batch_points, batch_radiuses, batch_points, batch_radiuses, own, other)
+            own, other = own[conflicts], other[conflicts]
+            if len(own):
+                accepted = np.ones((len(idxs),), dtype=bool)
+                order = np.argsort(own, kind='stable')
+                own, other = own[order], other[order]
+                splits = np.searchsorted(own, np.arange(len(idxs) + 1))
+                for i in np.unique(own).tolist():
+                    if accepted[other[splits[i]:splits[i+1]]].any():
+                        accepted[i] = False
+                ok[idxs[~accepted]] = False
+
+        self.insert(points[ok], radiuses[ok])
+        return ok
+
+    def insert(self, points, radiuses=None):
+        """
+        Register points without any checks (for example, points which
+        were generated earlier and must be avoided).
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        if len(points) == 0:
+            return
+        if radiuses is None:
+            radiuses = np.zeros((len(points),))
+        radiuses = np.asarray(radiuses, dtype=np.float64).reshape((len(points),))
+        if self.use_radiuses:
+            self._ensure_grid(radiuses.max())
+            self.max_radius = max(self.max_radius, radiuses.max())
+        else:
+            self._ensure_grid(0.0)
+        self._grid.insert(points, len(self.points))
+        self.points = np.concatenate((self.points, points))
+        self.radiuses = np.concatenate((self.radiuses, radiuses))
+
+
+class SvSamplingRandom(object):
+    """
+    Source of random numbers for generation of candidate points.
+
+    By default (legacy=True), numbers are taken one by one from Python's
+    `random` module seeded with the given seed, so that existing seeds give
+    the same points as before. With legacy=False, a NumPy generator is
+    used, which is faster for large batches but gives other points.
+    Seed None means continue the sequence of the global `random` generator.
+    """
+    def __init__(self, seed, legacy=True):
+        self.legacy = legacy
+        if legacy:
+            if seed is not None:
+                random.seed(seed)
+            self.rng = None
+        else:
+            if seed is None:
+                seed = random.getrandbits(32)
+            self.rng = np.random.default_rng(seed)
+
+    def points(self, low, high, count):
+        """
+        Array of shape (count, len(low)), uniformly distributed between low and high.
+        """
+        if self.rng is not None:
+            return self.rng.uniform(low, high, size=(count, len(low)))
+        bounds = list(zip(low, high))
+        points = [[random.uniform(l, h) for l, h in bounds] for i in range(count)]
+        return np.array(points, dtype=np.float64).reshape((count, len(bounds)))
+
+    def values(self, low, high, count=None):
+        """
+        Array of numbers uniformly distributed between elements of low and high;
+        count is the length of the array when both low and high are numbers.
+        """
+        low, high = np.broadcast_arrays(low, high)
+        if count is not None:
+            low, high = np.broadcast_to(low, count), np.broadcast_to(high, count)
+        if self.rng is not None:
+            return self.rng.uniform(low, high)
+        return np.array([random.uniform(l, h) for l, h in zip(low.tolist(), high.tolist())], dtype=np.float64)
+
+    def batch_size(self, batch_size, done, left):
+        """
+        Number of candidates to generate. Legacy mode keeps batches of constant
+        size, since the sequence of random numbers depends on it.
+        """
+        if self.legacy:
+            return min(batch_size, left)
+        return min(max(batch_size, done), left)
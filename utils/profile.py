@@ -27,6 +27,7 @@ from bpy.props import BoolProperty, EnumProperty
 
 from sverchok.utils.logging import info, debug
 from sverchok.utils.context_managers import sv_preferences
+from sverchok.utils import node_stats
 
 # Global cProfile.Profile singleton
 _global_profile = None
@@ -283,7 +284,90 @@ class SvProfileReset(bpy.types.Operator):
         info("Profiling statistics data cleared.")
         return {'FINISHED'}
     
-classes = [SvProfilingToggle, SvProfileDump, SvProfileSave, SvProfileReset]
+class SvNodeStatsToggle(bpy.types.Operator):
+    """Toggle recording of per-node execution statistics on/off"""
+    bl_idname = "node.sverchok_node_stats_toggle"
+    bl_label = "Toggle node statistics"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        node_stats.is_enabled = not node_stats.is_enabled
+        info("Recording of node statistics is set to %s", node_stats.is_enabled)
+        return {'FINISHED'}
+
+class SvNodeStatsReport(bpy.types.Operator):
+    """Write report about slowest nodes of the active tree to log"""
+    bl_idname = "node.sverchok_node_stats_report"
+    bl_label = "Report slowest nodes"
+    bl_options = {'INTERNAL'}
+
+    sort_methods = [
+            ("total", "Total time", "Total time of all updates", 0),
+            ("mean", "Mean time", "Mean time of one update", 1),
+            ("max", "Max time", "Maximum time of one update", 2)
+        ]
+
+    sort: EnumProperty(name = "Sort by",
+            description = "How to sort nodes",
+            items = sort_methods,
+            default = "total")
+
+    count: bpy.props.IntProperty(name = "Nodes",
+            description = "Number of nodes to report",
+            default = 10, min = 1)
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.node_tree is not None
+
+    def execute(self, context):
+        stats = node_stats.get_tree_stats(context.space_data.node_tree.name)
+        info(stats.report(self.count, self.sort))
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        wm = context.window_manager
+        return wm.invoke_props_dialog(self)
+
+class SvNodeStatsExport(bpy.types.Operator):
+    """Export node statistics of the active tree to JSON or CSV file"""
+    bl_idname = "node.sverchok_node_stats_export"
+    bl_label = "Export node statistics"
+    bl_options = {'INTERNAL'}
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.node_tree is not None
+
+    def execute(self, context):
+        stats = node_stats.get_tree_stats(context.space_data.node_tree.name)
+        if self.filepath.lower().endswith(".csv"):
+            stats.to_csv(self.filepath)
+        else:
+            stats.to_json(self.filepath)
+        info("Node statistics are written to %s", self.filepath)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        self.filepath = "node_stats.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+class SvNodeStatsReset(bpy.types.Operator):
+    """Reset node statistics of all trees"""
+    bl_idname = "node.sverchok_node_stats_reset"
+    bl_label = "Reset node statistics"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        node_stats.reset_tree_stats()
+        info("Node statistics cleared.")
+        return {'FINISHED'}
+
+classes = [SvProfilingToggle, SvProfileDump, SvProfileSave, SvProfileReset,
+           SvNodeStatsToggle, SvNodeStatsReport, SvNodeStatsExport, SvNodeStatsReset]
 
 def register():
     for class_name in classes:
@@ -15,6 +15,7 @@ if FreeCAD is not None:
 from sverchok.utils.surface.freecad import is_solid_face_surface
 from sverchok.dependencies import scipy
 from sverchok.utils.sv_mesh_utils import polygons_to_edges_np
+from sverchok.utils.mesh_inside import SvMeshInsideTester
 from sverchok.utils.modules.edge_utils import adjacent_faces_number
 
 def np_dot(u, v, axis=1):
@@ -42,6 +43,124 @@ def cross_indices3(n):
     return ind
 
 
+def add_at(target, indices, values):
+    '''target[indices] += values accumulating repeated indices (like np.add.at but using np.bincount)'''
+    if len(indices) == 0:
+        return
+    values = np.broadcast_to(values, (len(indices), target.shape[1]))
+    for axis in range(target.shape[1]):
+        target[:, axis] += np.bincount(indices, weights=values[:, axis], minlength=len(target))
+
+
+# cell offsets of the half neighbourhood: every pair of different neighbouring cells is visited once
+HALF_NEIGHBOURHOOD = np.array([(i, j, k) for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)
+                               if (i, j, k) > (0, 0, 0)], dtype=np.int64)
+
+class SvNeighbourList():
+    '''
+    Verlet list: pairs of particles closer than cutoff + skin, found with a uniform grid (cell list).
+    The list is only rebuilt when particles moved so much that a pair closer than
+    the current cutoff could be missing.
+    '''
+    def __init__(self, skin=0.3):
+        # skin as a factor of the cutoff distance
+        self.skin = skin
+        self.radius = 0.0
+        self.ref_verts = None
+        self.indexes = np.zeros((0, 2), dtype=np.int64)
+        self.id0 = self.id1 = np.zeros((0,), dtype=np.int64)
+        self.builds = 0
+
+    def needs_build(self, verts, cutoff):
+        if self.ref_verts is None or len(self.ref_verts) != len(verts):
+            return True
+        if cutoff > self.radius:
+            return True
+        displacement = verts - self.ref_verts
+        max_displacement = np.sqrt(np.max(np.einsum('ij,ij->i', displacement, displacement)))
+        # two particles approach each other at most by twice the maximum displacement
+        return 2 * max_displacement > self.radius - cutoff
+
+    def update(self, verts, cutoff):
+        if self.needs_build(verts, cutoff):
+            self.build(verts, cutoff)
+        return self.indexes
+
+    def build(self, verts, cutoff):
+        self.builds += 1
+        self.ref_verts = verts.copy()
+        self.radius = cutoff * (1 + self.skin)
+        v_len = len(verts)
+        if self.radius <= 0 or v_len < 2:
+            self.indexes = np.zeros((0, 2), dtype=np.int64)
+            self.id0 = self.id1 = np.zeros((0,), dtype=np.int64)
+            return
+
+        # cells bigger than the radius are also correct, limit their number to avoid overflows
+        extent = np.max(np.ptp(verts, axis=0))
+        cell_size = max(self.radius, extent / 2**20)
+        cells = np.floor((verts - np.min(verts, axis=0)) / cell_size).astype(np.int64) + 1
+        dims = np.max(cells, axis=0) + 2
+        strides = np.array([dims[1] * dims[2], dims[2], 1], dtype=np.int64)
+        keys = cells.dot(strides)
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        # runs of particles in the same cell
+        run_starts = np.flatnonzero(np.diff(sorted_keys, prepend=-1))
+        run_counts = np.diff(run_starts, append=v_len)
+        cell_keys = sorted_keys[run_starts]
+
+        n_cells = np.prod(dims)
+        if n_cells <= 8 * v_len:
+            # dense table: start and number of particles of every cell
+            cell_start = np.zeros(n_cells, dtype=np.int64)
+            cell_count = np.zeros(n_cells, dtype=np.int64)
+            cell_start[cell_keys] = run_starts
+            cell_count[cell_keys] = run_counts
+            def lookup(n_keys):
+                return cell_start[n_keys], cell_count[n_keys]
+        else:
+            def lookup(n_keys):
+                idx = np.clip(np.searchsorted(cell_keys, n_keys), 0, len(cell_keys) - 1)
+                found = cell_keys[idx] == n_keys
+                return run_starts[idx], np.where(found, run_counts[idx], 0)
+
+        radius_sq = self.radius * self.radius
+        id0, id1 = [], []
+        def add_pairs(i0, i1):
+            dif_v = verts[i0] - verts[i1]
+            close = np_dot(dif_v, dif_v) <= radius_sq
+            id0.append(i0[close])
+            id1.append(i1[close])
+
+        # pairs inside the same cell
+        starts = np.repeat(run_starts, run_counts)
+        counts = np.repeat(run_counts, run_counts)
+        later = counts - (np.arange(v_len) - starts) - 1
+        total = later.sum()
+        if total:
+            own = np.repeat(np.arange(v_len), later)
+            offsets = np.arange(total) - np.repeat(np.cumsum(later) - later, later) + 1
+            add_pairs(order[own], order[own + offsets])
+        # pairs in neighbouring cells
+        for offset in HALF_NEIGHBOURHOOD.dot(strides):
+            starts, counts = lookup(keys + offset)
+            total = counts.sum()
+            if total == 0:
+                continue
+            own = np.repeat(np.arange(v_len), counts)
+            shifts = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            add_pairs(own, order[starts[own] + shifts])
+
+        if not id0:
+            self.indexes = np.zeros((0, 2), dtype=np.int64)
+            self.id0 = self.id1 = np.zeros((0,), dtype=np.int64)
+            return
+        self.id0 = np.concatenate(id0)
+        self.id1 = np.concatenate(id1)
+        self.indexes = np.stack((self.id0, self.id1), axis=-1)
+
+
 def numpy_match_long_repeat(p):
     '''match list length by repeating last one'''
     q = []
@@ -444,6 +563,7 @@ class SvBoundingMeshForce():
         self.bvh = BVHTree.FromPolygons(vertices, polygons, all_triangles=False, epsilon=0.0)
 
         if volume:
+            self.tester = SvMeshInsideTester(vertices, polygons)
             self.add = self.add_volume
         else:
             self.add = self.add_surface
@@ -452,18 +572,16 @@ class SvBoundingMeshForce():
         self.nearest = np.zeros(ps.verts.shape, dtype=np.float64)
         self.normals = np.zeros(ps.verts.shape, dtype=np.float64)
 
-    def find_nearest(self, verts):
+    def find_nearest(self, verts, idxs=None):
+        """Nearest points of the mesh and their normals, for all verts or for verts[idxs]"""
         v_nearest = self.nearest
         v_normals = self.normals
-        for v, near, norm in zip(verts, v_nearest, v_normals):
-            nearest, normal, _, _ = self.bvh.find_nearest(v)
-
-            near[0] = nearest[0]
-            near[1] = nearest[1]
-            near[2] = nearest[2]
-            norm[0] = normal[0]
-            norm[1] = normal[1]
-            norm[2] = normal[2]
+        if idxs is None:
+            idxs = range(len(verts))
+        for i in idxs:
+            nearest, normal, _, _ = self.bvh.find_nearest(verts[i])
+            v_nearest[i] = nearest
+            v_normals[i] = normal
 
     def add_surface(self, ps):
 
@@ -473,8 +591,16 @@ class SvBoundingMeshForce():
         ps.force_resultant = project_on_plane(ps.force_resultant, self.normals)
 
     def add_volume(self, ps):
-        self.find_nearest(ps.verts)
-        outer_mask = np_dot(self.nearest - ps.verts, self.normals) <= 0
+        if self.tester.is_closed:
+            # only points which left the mesh need the nearest point of the surface
+            outer_mask = ~self.tester.contains(ps.verts)
+            if not outer_mask.any():
+                return
+            self.find_nearest(ps.verts, np.flatnonzero(outer_mask))
+        else:
+            # ray parity does not work for open meshes, points outside are in front of the nearest face
+            self.find_nearest(ps.verts)
+            outer_mask = np_dot(self.nearest - ps.verts, self.normals) <= 0
         ps.verts[outer_mask] = self.nearest[outer_mask]
 
         ps.vel[outer_mask] = project_on_plane(ps.vel[outer_mask], self.normals[outer_mask])
@@ -624,7 +750,7 @@ class SvRandomForce():
 
 
 class SvCollisionForce():
-    def __init__(self, magnitude, use_kdtree=False):
+    def __init__(self, magnitude, use_kdtree=False, use_cell_list=False):
 
         self.magnitude = np.array(magnitude)
         self.uniform_magnitude = len(magnitude) < 2
@@ -633,6 +759,9 @@ class SvCollisionForce():
         if self.use_kdtree:
             self.needs = ['kd_tree', 'max_radius', 'kd_collisions']
             self.add = self.add_kdt
+        elif use_cell_list:
+            self.needs = ['neighbours', 'nb_sum_rad', 'nb_collisions']
+            self.add = self.add_neighbours
         else:
             self.needs = ['indexes', 'sum_rad', 'dif_v', 'dist', 'dist_cor', 'collide', 'normal_v']
             self.add = self.add_brute_force
@@ -657,8 +786,8 @@ class SvCollisionForce():
         sf = self.f_magnitude[:, np.newaxis]
         len0, len1 = [sf, sf] if self.uniform_magnitude else [sf[id1], sf[id0]]
 
-        np.add.at(ps.force_resultant, id0, -no * le * len0)
-        np.add.at(ps.force_resultant, id1, no * le * len1)
+        add_at(ps.force_resultant, id0, -no * le * len0)
+        add_at(ps.force_resultant, id1, no * le * len1)
 
     def add_kdt(self, ps):
         relations = ps.relations
@@ -683,12 +812,26 @@ class SvCollisionForce():
             len0, len1 = [sf[id1[mask]], sf[id0[mask]]] if variable_coll else [sf, sf]
 
 
-            np.add.at(ps.force_resultant, id0[mask], -normal_v * le * len0)
-            np.add.at(ps.force_resultant, id1[mask], normal_v * le * len1)
+            add_at(ps.force_resultant, id0[mask], -normal_v * le * len0)
+            add_at(ps.force_resultant, id1[mask], normal_v * le * len1)
+
+    def add_neighbours(self, ps):
+        relations = ps.relations
+        mask = relations.nb_mask
+        id0 = relations.nb_id0[mask]
+        id1 = relations.nb_id1[mask]
+        normal_v = relations.nb_dif_v[mask] / relations.nb_dist_cor[mask, np.newaxis]
+        le = (relations.nb_dist[mask] - relations.nb_sum_rad[mask])[:, np.newaxis]
+
+        sf = self.f_magnitude[:, np.newaxis]
+        len0, len1 = [sf, sf] if self.uniform_magnitude else [sf[id1], sf[id0]]
+
+        add_at(ps.force_resultant, id0, -normal_v * le * len0)
+        add_at(ps.force_resultant, id1, normal_v * le * len1)
 
 
 class SvAttractionForce():
-    def __init__(self, magnitude, decay, max_distance, stop_on_collide=False, use_kdtree=False):
+    def __init__(self, magnitude, decay, max_distance, stop_on_collide=False, use_kdtree=False, use_cell_list=False):
 
         self.magnitude = np.array(magnitude)
         self.uniform_magnitude = len(magnitude) < 2
@@ -700,6 +843,11 @@ class SvAttractionForce():
         if self.use_kdtree:
             self.needs = ['kd_tree']
             self.add = self.add_kdt
+        elif use_cell_list:
+            self.needs = ['neighbours']
+            if self.stop_on_collide:
+                self.needs.append('nb_sum_rad')
+            self.add = self.add_neighbours
         else:
             self.needs = ['indexes', 'sum_rad', 'mass_product', 'dif_v', 'dist', 'dist_cor', 'normal_v']
             if self.stop_on_collide:
@@ -710,6 +858,7 @@ class SvAttractionForce():
         ps.aware = True
         for need in self.needs:
             ps.relations.needed[need] = True
+        ps.relations.neighbour_distance = max(ps.relations.neighbour_distance, self.max_distance)
         if self.uniform_magnitude:
             self.f_magnitude = self.magnitude
         else:
@@ -732,8 +881,8 @@ class SvAttractionForce():
         att = self.f_magnitude
         len0, len1 = [att, att] if self.uniform_magnitude else [att[id1], att[id0]]
 
-        np.add.at(ps.force_resultant, id0, -direction * len0)
-        np.add.at(ps.force_resultant, id1, direction * len1)
+        add_at(ps.force_resultant, id0, -direction * len0)
+        add_at(ps.force_resultant, id1, direction * len1)
 
     def add_kdt(self, ps):
         relations = ps.relations
@@ -764,12 +913,28 @@ class SvAttractionForce():
 
             att = self.f_magnitude
             len0, len1 = [att, att] if self.uniform_magnitude else [att[id1], att[id0]]
-            np.add.at(ps.force_resultant, id0, -direction * len0)
-            np.add.at(ps.force_resultant, id1, direction * len1)
+            add_at(ps.force_resultant, id0, -direction * len0)
+            add_at(ps.force_resultant, id1, direction * len1)
+
+    def add_neighbours(self, ps):
+        relations = ps.relations
+        mask = relations.nb_dist < self.max_distance
+        if self.stop_on_collide:
+            mask &= np.invert(relations.nb_mask)
+        id0 = relations.nb_id0[mask]
+        id1 = relations.nb_id1[mask]
+        dist2 = np.power(relations.nb_dist[mask], self.decay)[:, np.newaxis]
+        normal = relations.nb_dif_v[mask] / relations.nb_dist_cor[mask, np.newaxis]
+        direction = normal / dist2 * (ps.mass[id0] * ps.mass[id1])[:, np.newaxis]
+
+        att = self.f_magnitude
+        len0, len1 = [att, att] if self.uniform_magnitude else [att[id1], att[id0]]
+        add_at(ps.force_resultant, id0, -direction * len0)
+        add_at(ps.force_resultant, id1, direction * len1)
 
 
 class SvAlignForce():
-    def __init__(self, strength, decay, max_distance, use_kdtree=False):
+    def __init__(self, strength, decay, max_distance, use_kdtree=False, use_cell_list=False):
 
         self.strength = np.array(strength)
         self.uniform_strength = len(strength) < 2
@@ -782,6 +947,9 @@ class SvAlignForce():
         if self.use_kdtree:
             self.needs = ['kd_tree']
             self.add = self.add_kdt
+        elif use_cell_list:
+            self.needs = ['neighbours']
+            self.add = self.add_neighbours
         else:
             self.needs = ['indexes', 'dif_v', 'dist', 'dist_cor']
             self.add = self.add_brute_force
@@ -792,6 +960,7 @@ class SvAlignForce():
         ps.aware = True
         for need in self.needs:
             ps.relations.needed[need] = True
+        ps.relations.neighbour_distance = max(ps.relations.neighbour_distance, self.max_distance)
         if self.uniform_strength:
             self.f_strength = self.strength
         else:
@@ -809,14 +978,14 @@ class SvAlignForce():
 
         if self.uniform_strength:
             constant = (self.f_strength / (dist2 * ps.v_len))[:, np.newaxis]
-            np.add.at(ps.force_resultant, id0, ps.vel[id1, :] * constant)
-            np.add.at(ps.force_resultant, id1, ps.vel[id0, :] * constant)
+            add_at(ps.force_resultant, id0, ps.vel[id1, :] * constant)
+            add_at(ps.force_resultant, id1, ps.vel[id0, :] * constant)
 
         else:
             constant0 = (self.f_strength[id0] / (dist2 * ps.v_len))[:, np.newaxis]
             constant1 = (self.f_strength[id1] / (dist2 * ps.v_len))[:, np.newaxis]
-            np.add.at(ps.force_resultant, id0, ps.vel[id1, :] * constant0)
-            np.add.at(ps.force_resultant, id1, ps.vel[id0, :] * constant1)
+            add_at(ps.force_resultant, id0, ps.vel[id1, :] * constant0)
+            add_at(ps.force_resultant, id1, ps.vel[id0, :] * constant1)
 
     def add_kdt(self, ps):
 
@@ -833,18 +1002,35 @@ class SvAlignForce():
 
             if self.uniform_strength:
                 constant = (self.f_strength / (dist2 * ps.v_len))[:, np.newaxis]
-                np.add.at(ps.force_resultant, id0, ps.vel[id1, :] * constant)
-                np.add.at(ps.force_resultant, id1, ps.vel[id0, :] * constant)
+                add_at(ps.force_resultant, id0, ps.vel[id1, :] * constant)
+                add_at(ps.force_resultant, id1, ps.vel[id0, :] * constant)
 
             else:
                 constant0 = (self.f_strength[id0] / (dist2 * ps.v_len))[:, np.newaxis]
                 constant1 = (self.f_strength[id1] / (dist2 * ps.v_len))[:, np.newaxis]
-                np.add.at(ps.force_resultant, id0, ps.vel[id1, :] * constant0)
-                np.add.at(ps.force_resultant, id1, ps.vel[id0, :] * constant1)
+                add_at(ps.force_resultant, id0, ps.vel[id1, :] * constant0)
+                add_at(ps.force_resultant, id1, ps.vel[id0, :] * constant1)
+
+    def add_neighbours(self, ps):
+        relations = ps.relations
+        mask = relations.nb_dist_cor < self.max_distance
+        id0 = relations.nb_id0[mask]
+        id1 = relations.nb_id1[mask]
+        dist2 = np.power(relations.nb_dist_cor[mask], self.decay)
+
+        if self.uniform_strength:
+            constant = (self.f_strength / (dist2 * ps.v_len))[:, np.newaxis]
+            add_at(ps.force_resultant, id0, ps.vel[id1, :] * constant)
+            add_at(ps.force_resultant, id1, ps.vel[id0, :] * constant)
+        else:
+            constant0 = (self.f_strength[id0] / (dist2 * ps.v_len))[:, np.newaxis]
+            constant1 = (self.f_strength[id1] / (dist2 * ps.v_len))[:, np.newaxis]
+            add_at(ps.force_resultant, id0, ps.vel[id1, :] * constant0)
+            add_at(ps.force_resultant, id1, ps.vel[id0, :] * constant1)
 
 
 class SvFitForce():
-    def __init__(self, magnitude, min_radius, max_radius, mode, use_kdtree=False):
+    def __init__(self, magnitude, min_radius, max_radius, mode, use_kdtree=False, use_cell_list=False):
 
         self.magnitude = np.array(magnitude)
         self.uniform_magnitude = len(magnitude) < 2
@@ -862,6 +1048,9 @@ class SvFitForce():
         if self.use_kdtree:
             self.needs = ['kd_tree', 'max_radius', 'kd_collisions']
             self.add = self.add_kdt
+        elif use_cell_list:
+            self.needs = ['neighbours', 'nb_sum_rad', 'nb_collisions']
+            self.add = self.add_neighbours
         else:
             self.needs = ['indexes', 'sum_rad', 'dif_v', 'dist', 'collide']
             self.add = self.add_brute_force
@@ -914,6 +1103,20 @@ class SvFitForce():
 
             ps.rads = np.clip(ps.rads, self.min_radius, self.max_radius)
 
+    def add_neighbours(self, ps):
+        rel = ps.relations
+        touch = np.unique(rel.nb_indexes[rel.nb_mask])
+        free = np.setdiff1d(self.all_range, touch)
+        u_grow = self.uniform_magnitude
+        grow_un, grow_tou = [self.f_magnitude, self.f_magnitude] if u_grow else [self.f_magnitude[free], self.f_magnitude[touch]]
+        if self.absolute:
+            ps.rads[free] += grow_un
+            ps.rads[touch] -= grow_tou
+        else:
+            ps.rads[free] += grow_un * ps.rads[free]
+            ps.rads[touch] -= grow_tou * ps.rads[touch]
+        ps.rads = np.clip(ps.rads, self.min_radius, self.max_radius)
+
 
 class SvDragForce():
 
@@ -1142,8 +1345,8 @@ class SvSpringsForce():
         dif_v /= dist[:, np.newaxis]
         force = dif_v * (dif_l * self.spring_k)[:, np.newaxis]
 
-        np.subtract.at(ps.force_resultant, id0, force)
-        np.add.at(ps.force_resultant, id1, force)
+        add_at(ps.force_resultant, id0, -force)
+        add_at(ps.force_resultant, id1, force)
 
 
 class SvPolygonsAngleForce():
@@ -1195,8 +1398,8 @@ class SvPolygonsAngleForce():
 
         force = average_vector * ((self.rest_angles - act_angles) * self.spring_k)[:, np.newaxis]
 
-        np.add.at(ps.force_resultant, self.valid_edges[:, 0], force)
-        np.add.at(ps.force_resultant, self.valid_edges[:, 1], force)
+        add_at(ps.force_resultant, self.valid_edges[:, 0], force)
+        add_at(ps.force_resultant, self.valid_edges[:, 1], force)
 
 
 class SvEdgesAngleForce():
@@ -1262,7 +1465,7 @@ class SvEdgesAngleForce():
 
         average_vector = (v1_u + v2_u)/2
         f = average_vector * ((self.rest_ang - act_ang)*self.spring_k)[:, np.newaxis]
-        np.add.at(ps.force_resultant, self.target_v, f)
+        add_at(ps.force_resultant, self.target_v, f)
 
 
 class SvTimedForce():
@@ -1369,13 +1572,13 @@ class SvInflateForce():
         if p_regular:
             p_area = calc_area(pol_side_max, pol_v, pols_normal)[:, np.newaxis]
             for i in range(pol_side_max):
-                np.add.at(ps.force_resultant, np_pols[:, i], pols_normal * p_area)
+                add_at(ps.force_resultant, np_pols[:, i], pols_normal * p_area)
 
         else:
             p_area = calc_area_var_sides(pol_side_max, pols_sides, pol_v, pols_normal)[:, np.newaxis]
             for i in range(pol_side_max):
                 mask = pols_sides > i
-                np.add.at(ps.force_resultant, np_pols[mask, i], pols_normal[mask] * p_area[mask])
+                add_at(ps.force_resultant, np_pols[mask, i], pols_normal[mask] * p_area[mask])
 
 
 def limit_speed(np_vel, max_vel):
@@ -1404,6 +1607,8 @@ class PulgaSystem():
         self.goal_pins = True
         self.relations = lambda: None
         self.relations.needed = {}
+        # fixed interaction distance of forces using the neighbour list
+        self.relations.neighbour_distance = 0.0
         for force in self.forces:
             if hasattr(force, 'pin_force'):
                 self.pinned = True
@@ -1423,6 +1628,8 @@ class PulgaSystem():
 
 
     def relations_setup(self):
+        if 'neighbours' in self.relations.needed:
+            self.relations.neighbours = SvNeighbourList()
         if 'indexes' in self.relations.needed:
             self.relations.indexes = cross_indices3(self.v_len)
         if 'cross_matrix' in self.relations.needed:
@@ -1446,6 +1653,8 @@ class PulgaSystem():
                 self.relations.kd_sum_rad = self.rads[indexes[:, 0]] + self.rads[indexes[:, 1]]
                 self.relations.kd_dist = np.linalg.norm(self.relations.kd_dif_v, axis=1)
                 self.relations.kd_mask = self.relations.kd_dist < self.relations.kd_sum_rad
+        if 'neighbours' in self.relations.needed:
+            self.neighbours_update()
         if self.size_change:
             if 'sum_rad' in self.relations.needed:
                 self.relations.sum_rad = self.rads[self.relations.indexes[:, 0]] + self.rads[self.relations.indexes[:, 1]]
@@ -1473,6 +1682,24 @@ class PulgaSystem():
         if 'cross_matrix' in self.relations.needed:
             self.relations.result[:] = 0
 
+    def neighbours_update(self):
+        '''pairs of close particles and their distances, shared by all the forces using the neighbour list'''
+        relations = self.relations
+        cutoff = relations.neighbour_distance
+        if 'nb_collisions' in relations.needed:
+            cutoff = max(cutoff, 2 * np.amax(self.rads))
+        indexes = relations.neighbours.update(self.verts, cutoff)
+        id0 = relations.neighbours.id0
+        id1 = relations.neighbours.id1
+        relations.nb_indexes = indexes
+        relations.nb_id0, relations.nb_id1 = id0, id1
+        relations.nb_dif_v = self.verts.take(id0, axis=0) - self.verts.take(id1, axis=0)
+        relations.nb_dist = np.sqrt(np.einsum('ij,ij->i', relations.nb_dif_v, relations.nb_dif_v))
+        relations.nb_dist_cor = np.clip(relations.nb_dist, 1e-6, 1e4)
+        if 'nb_sum_rad' in relations.needed:
+            relations.nb_sum_rad = self.rads[id0] + self.rads[id1]
+            relations.nb_mask = relations.nb_dist < relations.nb_sum_rad
+
     def main_setup(self, local_params):
         '''prepare main data'''
         params = self.params
@@ -0,0 +1,256 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Ragged arrays: sequences of items of different length, such as polygons
+of a mesh, kept as one flat array of values and an array of offsets
+(CSR layout). Item i is values[offsets[i]:offsets[i+1]].
+
+SvRaggedArray can be put into sockets instead of a list of lists (for
+example, polygons of one object). It behaves as a read-only sequence
+of NumPy arrays, so code which iterates over polygons keeps working,
+while vectorized code can work with values and offsets directly.
+
+This module does not depend on Blender API.
+"""
+
+from itertools import chain
+
+import numpy as np
+
+
+class SvRaggedArray():
+    """
+    Read-only sequence of arrays of different length.
+    values: flat array of items values, it can have more dimensions, e.g. (n, 3) for vertices.
+    offsets: array of len(self) + 1 increasing indices into values, starting with 0.
+    """
+    def __init__(self, values, offsets):
+        self.values = np.asarray(values)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+
+    @classmethod
+    def from_lengths(cls, values, lengths):
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(values, offsets)
+
+    @classmethod
+    def from_lists(cls, lists, dtype=None):
+        """[[0, 1, 2], [2, 1, 3, 4]] -> values [0, 1, 2, 2, 1, 3, 4], offsets [0, 3, 7]"""
+        lengths = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+        first = next((item for item in lists if len(item)), None)
+        if first is None:
+            return cls.from_lengths(np.empty(0, dtype=dtype or np.int32), lengths)
+        if dtype is None:
+            dtype = np.asarray(first).dtype
+        if np.ndim(first[0]):
+            values = np.array(list(chain.from_iterable(lists)), dtype=dtype)
+        else:
+            values = np.fromiter(chain.from_iterable(lists), dtype=dtype, count=lengths.sum())
+        return cls.from_lengths(values, lengths)
+
+    @classmethod
+    def from_array(cls, array):
+        """Items of equal length, given as array of shape (n, k, ...); values are not copied"""
+        array = np.asarray(array)
+        n, k = array.shape[:2]
+        values = array.reshape((n * k,) + array.shape[2:])
+        return cls(values, np.arange(0, n * k + 1, k, dtype=np.int64) if k else np.zeros(n + 1, np.int64))
+
+    @classmethod
+    def from_data(cls, data, dtype=None):
+        """Ragged array from nested lists, from regular array, or the ragged array itself"""
+        if isinstance(data, SvRaggedArray):
+            return data
+        if isinstance(data, np.ndarray) and data.dtype != object and data.ndim >= 2:
+            return cls.from_array(data)
+        return cls.from_lists(data, dtype)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + self.offsets.nbytes
+
+    def item_indices(self):
+        """Index of item for each value"""
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(f"Index {index} is out of range of ragged array of length {len(self)}")
+            return self.values[self.offsets[index]:self.offsets[index + 1]]
+        if isinstance(index, slice) and index.step in (None, 1):
+            start, stop, _ = index.indices(len(self))
+            stop = max(start, stop)
+            offsets = self.offsets[start:stop + 1]
+            return SvRaggedArray(self.values[offsets[0]:offsets[-1]], offsets - offsets[0])
+        return self.take(np.arange(len(self))[index])
+
+    def take(self, indices):
+        """Ragged array of items with given indices (or boolean mask)"""
+        indices = np.arange(len(self))[indices]
+        lengths = self.lengths[indices]
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        shift = np.repeat(self.offsets[indices] - offsets[:-1], lengths)
+        return SvRaggedArray(self.values[np.arange(offsets[-1]) + shift], offsets)
+
+    def split(self):
+        """List of items as views of values"""
+        return np.split(self.values, self.offsets[1:-1]) if len(self) else []
+
+    def __iter__(self):
+        return iter(self.split())
+
+    def to_lists(self):
+        """Nested Python lists, the format used by most nodes"""
+        if self.is_regular():
+            return self.to_array().tolist()
+        # items of each length are converted at once, then put back in order
+        lengths = self.lengths
+        order = np.argsort(lengths, kind='stable')
+        sorted_items = []
+        for length in np.unique(lengths):
+            sorted_items.extend(self.take(lengths == length).to_array().tolist())
+        return list(map(sorted_items.__getitem__, np.argsort(order).tolist()))
+
+    def tolist(self):
+        return self.to_lists()
+
+    def is_regular(self):
+        """True if all items have equal length"""
+        lengths = self.lengths
+        return len(lengths) == 0 or (lengths == lengths[0]).all()
+
+    def to_array(self):
+        """Array of shape (n, k, ...) for ragged array of items of equal length k; values are not copied"""
+        if not self.is_regular():
+            raise ValueError("Items of the ragged array have different length")
+        k = int(self.offsets[1]) if len(self) else 0
+        return self.values.reshape((len(self), k) + self.values.shape[1:])
+
+    def reduce(self, ufunc, data=None):
+        """
+        Per item reduction by NumPy ufunc, e.g. np.add, np.maximum.
+        If data is given, values are indices into it, e.g. polygons into vertices.
+        Empty items give the identity of ufunc or NaN.
+        """
+        gathered = self.values if data is None else np.asarray(data)[self.values]
+        lengths = self.lengths
+        not_empty = lengths > 0
+        reduced = ufunc.reduceat(gathered, self.offsets[:-1][not_empty], axis=0)
+        if not_empty.all():
+            return reduced
+        fill = ufunc.identity if ufunc.identity is not None else np.nan
+        result = np.full((len(self),) + gathered.shape[1:], fill,
+                         dtype=np.result_type(reduced.dtype, type(fill)))
+        result[not_empty] = reduced
+        return result
+
+    def sum(self, data=None):
+        return self.reduce(np.add, data)
+
+    def mean(self, data=None):
+        """Per item mean, e.g. centers of polygons: polygons.mean(vertices)"""
+        total = self.sum(data)
+        lengths = self.lengths.reshape((-1,) + (1,) * (total.ndim - 1))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return total / lengths
+
+    def __eq__(self, other):
+        if not isinstance(other, SvRaggedArray):
+            return NotImplemented
+        return np.array_equal(self.offsets, other.offsets) and np.array_equal(self.values, other.values)
+
+    def __repr__(self):
+        return f"<SvRaggedArray of {len(self)} items, {len(self.values)} values of {self.values.dtype}>"
+
+
+def join_ragged(arrays, index_offsets=None):
+    """
+    Concatenate ragged arrays into one.
+    index_offsets: numbers added to values of each array, for example numbers
+    of vertices of preceding meshes when polygons of several meshes are joined.
+    """
+    if not arrays:
+        return SvRaggedArray(np.empty(0, dtype=np.int32), np.zeros(1, dtype=np.int64))
+    values = np.concatenate([a.values for a in arrays])
+    if index_offsets is not None:
+        sizes = [len(a.values) for a in arrays]
+        shift = np.repeat(np.asarray(index_offsets, dtype=values.dtype), sizes)
+        values += shift.reshape((-1,) + (1,) * (values.ndim - 1))
+    return SvRaggedArray.from_lengths(values, np.concatenate([a.lengths for a in arrays]))
+
+
+def join_index_lists(lists_s, index_offsets):
+    """
+    Lists of index lists of several meshes (e.g. their polygons) joined
+    into one ragged array; index_offsets[i] is added to indices of lists_s[i].
+    """
+    counts = [len(lists) for lists in lists_s]
+    if all(isinstance(lists, (list, tuple)) for lists in lists_s):
+        joined = SvRaggedArray.from_lists(list(chain.from_iterable(lists_s)))
+    else:
+        joined = join_ragged([SvRaggedArray.from_data(lists) for lists in lists_s])
+    shift = np.repeat(np.repeat(np.asarray(index_offsets, dtype=np.int64), counts), joined.lengths)
+    return SvRaggedArray(joined.values + shift.reshape((-1,) + (1,) * (joined.values.ndim - 1)), joined.offsets)
+
+
+def sorted_unique_edges(edges):
+    """
+    The same as np.unique(np.sort(edges), axis=0), but each edge is sorted
+    as one integer key, which is much faster than sorting of rows.
+    """
+    edges = np.sort(edges, axis=1)
+    if len(edges) == 0 or edges.dtype.kind not in 'iu' or edges.min() < 0:
+        return np.unique(edges, axis=0)
+    base = int(edges[:, 1].max()) + 1
+    keys = np.sort(edges[:, 0].astype(np.int64) * base + edges[:, 1])
+    keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    result = np.empty((len(keys), 2), dtype=edges.dtype)
+    result[:, 0] = keys // base
+    result[:, 1] = keys % base
+    return result
+
+
+def ragged_polygons_to_edges(polygons, unique_edges=False, backward=False):
+    """
+    Edges of polygons, as array of shape (n, 2): each polygon gives edges
+    between its consecutive vertices and between its last and first vertices.
+    With backward=True, edges go from each vertex to the previous one.
+    With unique_edges=True, edges are sorted and duplicates are removed.
+    """
+    polygons = SvRaggedArray.from_data(polygons)
+    values = polygons.values
+    starts, ends = polygons.offsets[:-1], polygons.offsets[1:]
+    not_empty = polygons.lengths > 0
+    if backward:
+        other_index = np.arange(-1, len(values) - 1)
+        other_index[starts[not_empty]] = ends[not_empty] - 1
+    else:
+        other_index = np.arange(1, len(values) + 1)
+        other_index[ends[not_empty] - 1] = starts[not_empty]
+    edges = np.empty((len(values), 2), dtype=values.dtype)
+    edges[:, 0] = values
+    edges[:, 1] = values[other_index]
+    if unique_edges:
+        return sorted_unique_edges(edges)
+    return edges
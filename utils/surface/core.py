@@ -29,6 +29,28 @@ class SvSurface(object):
     def evaluate_array(self, us, vs):
         raise Exception("not implemented!")
 
+    def evaluate_grid(self, us, vs):
+        """
+        Evaluate the surface at a regular grid of parameters,
+        i.e. at all combinations of given us and vs.
+        Implementations can override this to use grid structure.
+
+        returns: np.array of shape (len(vs), len(us), 3)
+        """
+        grid_us, grid_vs = np.meshgrid(us, vs)
+        points = self.evaluate_array(grid_us.flatten(), grid_vs.flatten())
+        return points.reshape((len(vs), len(us), 3))
+
+    def normal_grid(self, us, vs):
+        """
+        Calculate surface normals at a regular grid of parameters.
+
+        returns: np.array of shape (len(vs), len(us), 3)
+        """
+        grid_us, grid_vs = np.meshgrid(us, vs)
+        normals = self.normal_array(grid_us.flatten(), grid_vs.flatten())
+        return normals.reshape((len(vs), len(us), 3))
+
     def normal(self, u, v):
         h = self.normal_delta
         p = self.evaluate(u, v)
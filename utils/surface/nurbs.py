@@ -5,7 +5,8 @@ from collections import defaultdict
 from sverchok.utils.geom import Spline
 from sverchok.utils.nurbs_common import (
         SvNurbsMaths, SvNurbsBasisFunctions,
-        nurbs_divide, from_homogenous
+        nurbs_divide, from_homogenous,
+        basis_function_derivatives, span_control_indexes
     )
 from sverchok.utils.curve import knotvector as sv_knotvector
 from sverchok.utils.curve.nurbs_algorithms import interpolate_nurbs_curve, unify_curves
@@ -447,6 +448,9 @@ class SvGeomdlSurface(SvNurbsSurface):
         return SurfaceDerivativesData(surf_vertices, du, dv)
 
 class SvNativeNurbsSurface(SvNurbsSurface):
+    # Maximum number of points evaluated at once
+    eval_chunk_size = 10000
+
     def __init__(self, degree_u, degree_v, knotvector_u, knotvector_v, control_points, weights, normalize_knots=False):
         self.degree_u = degree_u
         self.degree_v = degree_v
@@ -565,44 +569,121 @@ class SvNativeNurbsSurface(SvNurbsSurface):
     def evaluate(self, u, v):
         return self.evaluate_array(np.array([u]), np.array([v]))[0]
 
-    def fraction(self, deriv_order_u, deriv_order_v, us, vs):
-        pu = self.degree_u
-        pv = self.degree_v
+    def fractions(self, max_order_u, max_order_v, us, vs):
+        """
+        Calculate numerator and denominator of the rational surface
+        expression, together with their partial derivatives of orders
+        0..max_order_u by U and 0..max_order_v by V, at once.
+        Only the (degree_u+1) x (degree_v+1) patch of control points, which
+        affects the surface at each (u, v), is used; points are processed
+        in chunks of eval_chunk_size to keep memory usage bounded.
+
+        returns: tuple:
+            * numerators: np.array of shape (max_order_u+1, max_order_v+1, n, 3)
+            * denominators: np.array of shape (max_order_u+1, max_order_v+1, n, 1)
+        """
+        us = np.asarray(us)
+        vs = np.asarray(vs)
+        n = len(us)
+        pu, pv = self.degree_u, self.degree_v
         ku, kv, _ = self.control_points.shape
-        nsu = np.array([self.basis_u.derivative(i, pu, deriv_order_u)(us) for i in range(ku)]) # (ku, n)
-        nsv = np.array([self.basis_v.derivative(i, pv, deriv_order_v)(vs) for i in range(kv)]) # (kv, n)
-        nsu = np.transpose(nsu[np.newaxis], axes=(1,0,2)) # (ku, 1, n)
-        nsv = nsv[np.newaxis] # (1, kv, n)
-        ns = nsu * nsv # (ku, kv, n)
-        weights = np.transpose(self.weights[np.newaxis], axes=(1,2,0)) # (ku, kv, 1)
-        coeffs = ns * weights # (ku, kv, n)
-        coeffs = np.transpose(coeffs[np.newaxis], axes=(3,1,2,0)) # (n,ku,kv,1)
-        controls = self.control_points # (ku,kv,3)
-
-        numerator = coeffs * controls # (n,ku,kv,3)
-        numerator = numerator.sum(axis=1).sum(axis=1) # (n,3)
-        denominator = coeffs.sum(axis=1).sum(axis=1)
-
-        return numerator, denominator
+        spans_u, nsu = basis_function_derivatives(self.knotvector_u, pu, us, order=max_order_u) # (ou+1, n, pu+1)
+        spans_v, nsv = basis_function_derivatives(self.knotvector_v, pv, vs, order=max_order_v) # (ov+1, n, pv+1)
+        idxs_u = span_control_indexes(spans_u, pu, ku)[:,:,np.newaxis] # (n, pu+1, 1)
+        idxs_v = span_control_indexes(spans_v, pv, kv)[:,np.newaxis,:] # (n, 1, pv+1)
+        controls = self.get_homogenous_control_points() # (ku, kv, 4)
+
+        result = np.empty((max_order_u+1, max_order_v+1, n, 4))
+        step = self.eval_chunk_size
+        for start in range(0, n, step):
+            chunk = slice(start, start+step)
+            patch = controls[idxs_u[chunk], idxs_v[chunk]] # (c, pu+1, pv+1, 4)
+            by_v = np.einsum('bnl,njlc->bnjc', nsv[:,chunk], patch) # (ov+1, c, pu+1, 4)
+            result[:,:,chunk] = np.einsum('anj,bnjc->abnc', nsu[:,chunk], by_v)
+        return result[...,:3], result[...,3:]
+
+    def fractions_grid(self, max_order_u, max_order_v, us, vs):
+        """
+        Same as fractions(), but for a regular grid of parameters: all
+        combinations of given us and vs. The tensor product structure is
+        used, so basis functions are calculated only len(us)+len(vs) times.
+
+        returns: tuple:
+            * numerators: np.array of shape (max_order_u+1, max_order_v+1, len(vs), len(us), 3)
+            * denominators: np.array of shape (max_order_u+1, max_order_v+1, len(vs), len(us), 1)
+        """
+        us = np.asarray(us)
+        vs = np.asarray(vs)
+        pu, pv = self.degree_u, self.degree_v
+        ku, kv, _ = self.control_points.shape
+        spans_u, nsu = basis_function_derivatives(self.knotvector_u, pu, us, order=max_order_u) # (ou+1, nu, pu+1)
+        spans_v, nsv = basis_function_derivatives(self.knotvector_v, pv, vs, order=max_order_v) # (ov+1, nv, pv+1)
+        idxs_u = span_control_indexes(spans_u, pu, ku) # (nu, pu+1)
+        idxs_v = span_control_indexes(spans_v, pv, kv) # (nv, pv+1)
+        controls = self.get_homogenous_control_points() # (ku, kv, 4)
+
+        # Contract along U first: for each u, this gives control points of
+        # the iso-curve at that u.
+        by_u = np.einsum('anj,njkc->ankc', nsu, controls[idxs_u]) # (ou+1, nu, kv, 4)
+        result = np.empty((max_order_u+1, max_order_v+1, len(vs), len(us), 4))
+        step = max(1, self.eval_chunk_size // max(1, len(vs)))
+        for start in range(0, len(us), step):
+            chunk = slice(start, start+step)
+            patch = by_u[:, chunk][:, :, idxs_v] # (ou+1, c, nv, pv+1, 4)
+            result[..., chunk, :] = np.einsum('bml,anmlc->abmnc', nsv, patch)
+        return result[...,:3], result[...,3:]
+
+    def fraction(self, deriv_order_u, deriv_order_v, us, vs):
+        numerators, denominators = self.fractions(deriv_order_u, deriv_order_v, us, vs)
+        return numerators[deriv_order_u, deriv_order_v], denominators[deriv_order_u, deriv_order_v]
+
+    def _derivatives(self, numerators, denominators, order):
+        # Calculate the surface point and its partial derivatives
+        # from results of fractions().
+        # numerator = surface * denominator, so
+        # numerator_u = surface_u * denominator + surface * denominator_u,
+        # and so on.
+        numerator, denominator = numerators[0,0], denominators[0,0]
+        surface = nurbs_divide(numerator, denominator)
+        surface_u = nurbs_divide(numerators[1,0] - surface*denominators[1,0], denominator)
+        surface_v = nurbs_divide(numerators[0,1] - surface*denominators[0,1], denominator)
+        if order < 2:
+            return surface, surface_u, surface_v
+        surface_uu = (numerators[2,0] - 2*surface_u*denominators[1,0] - surface*denominators[2,0]) / denominator
+        surface_vv = (numerators[0,2] - 2*surface_v*denominators[0,1] - surface*denominators[0,2]) / denominator
+        surface_uv = (numerators[1,1] - surface_v*denominators[1,0] - surface_u*denominators[0,1] - surface*denominators[1,1]) / denominator
+        return surface, surface_u, surface_v, surface_uu, surface_vv, surface_uv
 
     def evaluate_array(self, us, vs):
-        numerator, denominator = self.fraction(0, 0, us, vs)
-        return nurbs_divide(numerator, denominator)
+        numerators, denominators = self.fractions(0, 0, us, vs)
+        return nurbs_divide(numerators[0,0], denominators[0,0])
+
+    def evaluate_grid(self, us, vs):
+        numerators, denominators = self.fractions_grid(0, 0, us, vs)
+        n_v, n_u = len(vs), len(us)
+        points = nurbs_divide(numerators[0,0].reshape((n_v*n_u, 3)), denominators[0,0].reshape((n_v*n_u, 1)))
+        return points.reshape((n_v, n_u, 3))
 
     def normal(self, u, v):
         return self.normal_array(np.array([u]), np.array([v]))[0]
 
-    def normal_array(self, us, vs):
-        numerator, denominator = self.fraction(0, 0, us, vs)
-        surface = nurbs_divide(numerator, denominator)
-        numerator_u, denominator_u = self.fraction(1, 0, us, vs)
-        numerator_v, denominator_v = self.fraction(0, 1, us, vs)
-        surface_u = nurbs_divide(numerator_u - surface*denominator_u, denominator)
-        surface_v = nurbs_divide(numerator_v - surface*denominator_v, denominator)
+    def _normals(self, surface_u, surface_v):
         normal = np.cross(surface_u, surface_v)
         n = np.linalg.norm(normal, axis=1, keepdims=True)
-        normal = nurbs_divide(normal, n)
-        return normal
+        return nurbs_divide(normal, n)
+
+    def normal_array(self, us, vs):
+        numerators, denominators = self.fractions(1, 1, us, vs)
+        _, surface_u, surface_v = self._derivatives(numerators, denominators, 1)
+        return self._normals(surface_u, surface_v)
+
+    def normal_grid(self, us, vs):
+        numerators, denominators = self.fractions_grid(1, 1, us, vs)
+        n_v, n_u = len(vs), len(us)
+        numerators = numerators.reshape((2, 2, n_v*n_u, 3))
+        denominators = denominators.reshape((2, 2, n_v*n_u, 1))
+        _, surface_u, surface_v = self._derivatives(numerators, denominators, 1)
+        return self._normals(surface_u, surface_v).reshape((n_v, n_u, 3))
 
     def iso_curve(self, fixed_direction, param, flip=False):
         controls = self.get_control_points()
@@ -640,35 +721,18 @@ class SvNativeNurbsSurface(SvNurbsSurface):
                 return curve
 
     def derivatives_data_array(self, us, vs):
-        numerator, denominator = self.fraction(0, 0, us, vs)
-        surface = nurbs_divide(numerator, denominator)
-        numerator_u, denominator_u = self.fraction(1, 0, us, vs)
-        numerator_v, denominator_v = self.fraction(0, 1, us, vs)
-        surface_u = (numerator_u - surface*denominator_u) / denominator
-        surface_v = (numerator_v - surface*denominator_v) / denominator
+        numerators, denominators = self.fractions(1, 1, us, vs)
+        surface, surface_u, surface_v = self._derivatives(numerators, denominators, 1)
         return SurfaceDerivativesData(surface, surface_u, surface_v)
 
     def curvature_calculator(self, us, vs, order=True):
-    
-        numerator, denominator = self.fraction(0, 0, us, vs)
-        surface = nurbs_divide(numerator, denominator)
-        numerator_u, denominator_u = self.fraction(1, 0, us, vs)
-        numerator_v, denominator_v = self.fraction(0, 1, us, vs)
-        surface_u = (numerator_u - surface*denominator_u) / denominator
-        surface_v = (numerator_v - surface*denominator_v) / denominator
+        numerators, denominators = self.fractions(2, 2, us, vs)
+        surface, surface_u, surface_v, surface_uu, surface_vv, surface_uv = self._derivatives(numerators, denominators, 2)
 
         normal = np.cross(surface_u, surface_v)
         n = np.linalg.norm(normal, axis=1, keepdims=True)
         normal = normal / n
 
-        numerator_uu, denominator_uu = self.fraction(2, 0, us, vs)
-        surface_uu = (numerator_uu - 2*surface_u*denominator_u - surface*denominator_uu) / denominator
-        numerator_vv, denominator_vv = self.fraction(0, 2, us, vs)
-        surface_vv = (numerator_vv - 2*surface_v*denominator_v - surface*denominator_vv) / denominator
-
-        numerator_uv, denominator_uv = self.fraction(1, 1, us, vs)
-        surface_uv = (numerator_uv - surface_v*denominator_u - surface_u*denominator_v - surface*denominator_uv) / denominator
-
         nuu = (surface_uu * normal).sum(axis=1)
         nvv = (surface_vv * normal).sum(axis=1)
         nuv = (surface_uv * normal).sum(axis=1)
@@ -8,43 +8,16 @@
 import numpy as np
 import random
 
-from mathutils.kdtree import KDTree
-
 from sverchok.utils.surface import SvSurface
 from sverchok.utils.field.scalar import SvScalarField
 from sverchok.utils.logging import error
+from sverchok.utils.poisson_disk import SvPoissonDiskGrid, SvSamplingRandom
 
 def random_point(min_x, max_x, min_y, max_y):
     x = random.uniform(min_x, max_x)
     y = random.uniform(min_y, max_y)
     return x,y
 
-def _check_min_distance(v_new, vs_old, min_r):
-    kdt = KDTree(len(vs_old))
-    for i, v in enumerate(vs_old):
-        kdt.insert(v, i)
-    kdt.balance()
-    nearest, idx, dist = kdt.find(v_new)
-    if dist is None:
-        return True
-    return (dist >= min_r)
-
-#     for v_old in vs_old:
-#         distance = np.linalg.norm(v_new - v_old)
-#         if distance < min_r:
-#             return False
-#    return True
-
-def _check_min_radius(point, old_points, old_radiuses, min_r):
-    if not old_points:
-        return True
-    old_points = np.array(old_points)
-    old_radiuses = np.array(old_radiuses)
-    point = np.array(point)
-    distances = np.linalg.norm(old_points - point, axis=1)
-    ok = (old_radiuses + min_r < distances).all()
-    return ok
-
 BATCH_SIZE = 100
 MAX_ITERATIONS = 1000
 
@@ -53,7 +26,7 @@ def populate_surface(surface, field, count, threshold,
         min_r=0, min_r_field = None,
         random_radius = False,
         avoid_spheres = None,
-        seed=0, predicate=None):
+        seed=0, predicate=None, legacy_random=True):
     """
     Generate random points on the surface, with distribution controlled (optionally) by scalar field.
 
@@ -70,14 +43,28 @@ def populate_surface(surface, field, count, threshold,
     * field_max: (expected) maximum value of scalar field in the area of the
       surface. Mandatory if `proportional` is set to True.
     * min_r: minimum distance between generated points. Set to zero to disable this check.
-    * seed: random generator seed value.
+    * min_r_field: SvScalarField, which defines radius of empty sphere around
+      each point; spheres of generated points do not intersect. Optional.
+    * random_radius: if True, radius of each sphere is random, between 0 and
+      the value of min_r_field.
+    * avoid_spheres: list of (center, radius) of points which were already
+      generated, for example on adjacent surfaces. Optional.
+    * seed: random generator seed value. None means continue the sequence
+      of the global `random` generator.
+    * legacy_random: if True, random numbers are taken from Python's `random`
+      module, so that seeds give the same points as in earlier versions;
+      otherwise a faster NumPy generator is used. See SvSamplingRandom.
     * predicate: additional predicate to check if generated point is valid.
       Takes two arguments: point in UV space and the same point in 3D space.
       Optional.
 
+    Distances are checked in 3D space, by SvPoissonDiskGrid; candidate
+    points are generated in UV space and checked in batches.
+
     outputs: tuple:
     * Coordinates of points in surface's UV space
     * Coordinates of points in 3D space.
+    * Radiuses of empty spheres around points.
     """
     if min_r != 0 and min_r_field is not None:
         raise Exception("min_r and min_r_field can not be specified simultaneously")
@@ -85,17 +72,15 @@ def populate_surface(surface, field, count, threshold,
     u_min, u_max = surface.get_u_min(), surface.get_u_max()
     v_min, v_max = surface.get_v_min(), surface.get_v_max()
 
-    if avoid_spheres is not None:
-        old_points = [s[0] for s in avoid_spheres]
-        old_radiuses = [s[1] for s in avoid_spheres]
-    else:
-        old_points = []
-        old_radiuses = []
-
     if seed == 0:
         seed = 12345
-    if seed is not None:
-        random.seed(seed)
+    rng = SvSamplingRandom(seed, legacy=legacy_random)
+
+    check_distance = min_r != 0 or min_r_field is not None
+    grid = SvPoissonDiskGrid(min_r = min_r, use_radiuses = min_r_field is not None)
+    if avoid_spheres:
+        grid.insert([s[0] for s in avoid_spheres], [s[1] for s in avoid_spheres])
+
     done = 0
     generated_verts = []
     generated_uv = []
@@ -107,86 +92,53 @@ def populate_surface(surface, field, count, threshold,
         if iterations > MAX_ITERATIONS:
             error("Maximum number of iterations (%s) reached, stop.", MAX_ITERATIONS)
             break
-        batch_us = []
-        batch_vs = []
         left = count - done
-        max_size = min(BATCH_SIZE, left)
-        for i in range(max_size):
-            u = random.uniform(u_min, u_max)
-            v = random.uniform(v_min, v_max)
-            batch_us.append(u)
-            batch_vs.append(v)
-        batch_us = np.array(batch_us)
-        batch_vs = np.array(batch_vs)
+        max_size = rng.batch_size(BATCH_SIZE, done, left)
+        batch = rng.points((u_min, v_min), (u_max, v_max), max_size)
+        batch_us, batch_vs = batch[:,0], batch[:,1]
         batch_ws = np.zeros_like(batch_us)
         batch_uvs = np.stack((batch_us, batch_vs, batch_ws)).T
 
         batch_verts = surface.evaluate_array(batch_us, batch_vs)
-        batch_xs = batch_verts[:,0]
-        batch_ys = batch_verts[:,1]
-        batch_zs = batch_verts[:,2]
 
         if field is not None:
-            values = field.evaluate_grid(batch_xs, batch_ys, batch_zs)
-
+            values = field.evaluate_grid(batch_verts[:,0], batch_verts[:,1], batch_verts[:,2])
             good_idxs = values >= threshold
-            if not proportional:
-                candidates = batch_verts[good_idxs]
-                candidate_uvs = batch_uvs[good_idxs]
-            else:
-                candidates = []
-                candidate_uvs = []
-                for uv, vert, value in zip(batch_uvs[good_idxs].tolist(), batch_verts[good_idxs].tolist(), values[good_idxs].tolist()):
-                    probe = random.uniform(field_min, field_max)
-                    if probe <= value:
-                        candidates.append(vert)
-                        candidate_uvs.append(uv)
-                candidates = np.array(candidates)
-                candidate_uvs = np.array(candidate_uvs)
+            if proportional:
+                good_idxs[good_idxs] = rng.values(field_min, field_max, np.count_nonzero(good_idxs)) <= values[good_idxs]
+            candidates = batch_verts[good_idxs]
+            candidate_uvs = batch_uvs[good_idxs]
         else:
             candidates = batch_verts
             candidate_uvs = batch_uvs
 
-        good_radiuses = []
-        if len(candidates) > 0:
-            if min_r == 0 and min_r_field is None:
-                good_verts = candidates.tolist()
-                good_uvs = candidate_uvs.tolist()
-                good_radiuses = [0 for i in range(len(good_verts))]
-            elif min_r_field is not None:
-                xs = np.array([p[0] for p in candidates])
-                ys = np.array([p[1] for p in candidates])
-                zs = np.array([p[2] for p in candidates])
-                min_rs = min_r_field.evaluate_grid(xs, ys, zs).tolist()
-                good_verts = []
-                good_uvs = []
-                for candidate_uv, candidate, min_r in zip(candidate_uvs, candidates, min_rs):
-                    if random_radius:
-                        min_r = random.uniform(0, min_r)
-                    if _check_min_radius(candidate, old_points + generated_verts + good_verts, old_radiuses + generated_radiuses + good_radiuses, min_r):
-                        good_verts.append(candidate)
-                        good_uvs.append(candidate_uv)
-                        good_radiuses.append(min_r)
-            else: # min_r != 0
-                good_verts = []
-                good_uvs = []
-                for candidate_uv, candidate in zip(candidate_uvs, candidates):
-                    distance_ok = _check_min_distance(candidate, old_points + generated_verts + good_verts, min_r)
-                    if distance_ok:
-                        good_verts.append(tuple(candidate))
-                        good_uvs.append(tuple(candidate_uv))
-                        good_radiuses.append(0)
-
-            if predicate is not None:
-                results = [(uv, vert, radius) for uv, vert, radius in zip(good_uvs, good_verts, good_radiuses) if predicate(uv, vert)]
-                good_uvs = [r[0] for r in results]
-                good_verts = [r[1] for r in results]
-                good_radiuses = [r[2] for r in results]
-
-            generated_verts.extend(good_verts)
-            generated_uv.extend(good_uvs)
-            generated_radiuses.extend(good_radiuses)
-            done += len(good_verts)
+        if len(candidates) == 0:
+            continue
 
-    return generated_uv, generated_verts, generated_radiuses
+        if min_r_field is not None:
+            radiuses = min_r_field.evaluate_grid(candidates[:,0], candidates[:,1], candidates[:,2])
+            if random_radius:
+                radiuses = rng.values(0, radiuses)
+        else:
+            radiuses = np.zeros((len(candidates),))
+
+        if predicate is not None:
+            def check(idxs):
+                return [predicate(uv, vert) for uv, vert in zip(candidate_uvs[idxs].tolist(), candidates[idxs].tolist())]
+        else:
+            check = None
 
+        if check_distance:
+            good = grid.add(candidates, radiuses, predicate=check)
+        elif check is not None:
+            good = np.array(check(np.arange(len(candidates))), dtype=bool)
+        else:
+            good = np.ones((len(candidates),), dtype=bool)
+
+        good_verts = candidates[good].tolist()
+        generated_verts.extend(good_verts)
+        generated_uv.extend(candidate_uvs[good].tolist())
+        generated_radiuses.extend(radiuses[good].tolist())
+        done += len(good_verts)
+
+    return generated_uv, generated_verts, generated_radiuses
@@ -30,6 +30,7 @@ import mathutils
 
 from sverchok.data_structure import zip_long_repeat
 from sverchok.utils.logging import debug
+from sverchok.utils.mesh_weld import weld_mesh, take_data
 
 @contextmanager
 def empty_bmesh(use_operators=True):
@@ -371,7 +372,7 @@ def bmesh_join(list_of_bmeshes, normal_update=False):
 
     return bm
 
-def remove_doubles(vertices, edges, faces, d, face_data=None, vert_data=None, edge_data=None):
+def remove_doubles(vertices, edges, faces, d, face_data=None, vert_data=None, edge_data=None, implementation='BMESH'):
     """
     This is a wrapper for bmesh.ops.remove_doubles.
 
@@ -379,6 +380,11 @@ def remove_doubles(vertices, edges, faces, d, face_data=None, vert_data=None, ed
     d: the threshold for the merge procedure.
     face_data: arbitrary data per mesh face.
     vert_data: arbitrary data per mesh vertex.
+    edge_data: arbitrary data per mesh edge.
+    implementation: 'BMESH' to use bmesh.ops.remove_doubles, or 'NUMPY' to
+        merge vertices without building a bmesh (see sverchok.utils.mesh_weld).
+        NUMPY is much faster for big meshes, but the order of output edges and
+        faces, and which of merged vertices is kept, can differ from BMESH.
 
     output:
         if face_data, vert_data or edge_data was specified, this outputs 4-tuple:
@@ -393,6 +399,9 @@ def remove_doubles(vertices, edges, faces, d, face_data=None, vert_data=None, ed
                 * 'edges': correctly reordered edge_data (if present)
                 * 'faces': correctly reordered face_data (if present)
     """
+    if implementation == 'NUMPY':
+        return _remove_doubles_numpy(vertices, edges, faces, d, face_data, vert_data, edge_data)
+
     has_vert_data = bool(vert_data)
     has_edge_data = bool(edge_data)
     has_face_data = bool(face_data)
@@ -428,6 +437,25 @@ def remove_doubles(vertices, edges, faces, d, face_data=None, vert_data=None, ed
     bm.free()
     return verts, edges, faces, data
 
+def _remove_doubles_numpy(vertices, edges, faces, d, face_data, vert_data, edge_data):
+    new_verts, new_edges, new_faces, weld_data = weld_mesh(vertices, edges, faces, d)
+    verts = list(map(tuple, new_verts.tolist()))
+    edges = new_edges.tolist()
+    faces = new_faces.to_lists()
+    if not (face_data or vert_data or edge_data):
+        return verts, edges, faces
+
+    data = dict()
+    data['vert_init_index'] = weld_data['vert_init_index'].tolist()
+    data['edge_init_index'] = weld_data['edge_init_index'].tolist()
+    data['face_init_index'] = weld_data['face_init_index'].tolist()
+    if vert_data:
+        data['verts'] = take_data(vert_data, data['vert_init_index'])
+    if edge_data:
+        data['edges'] = take_data(edge_data, data['edge_init_index'])
+    if face_data:
+        data['faces'] = take_data(face_data, data['face_init_index'])
+    return verts, edges, faces, data
 
 
 def dual_mesh(bm, recalc_normals=True):
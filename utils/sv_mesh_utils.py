@@ -17,7 +17,7 @@
 # ##### END GPL LICENSE BLOCK #####
 
 from sverchok.data_structure import fullList_deep_copy
-from numpy import array, empty, concatenate, unique, sort, int32, ndarray, vectorize
+from numpy import array, empty, argsort, cumsum, repeat, int32, ndarray
 
 from mathutils import Vector
 try:
@@ -27,24 +27,24 @@ except ImportError:
 
 from sverchok.data_structure import fullList_deep_copy
 from sverchok.utils.geom import linear_approximation
+from sverchok.utils.ragged import SvRaggedArray, join_index_lists, ragged_polygons_to_edges, sorted_unique_edges
 
 def mesh_join(vertices_s, edges_s, faces_s):
     '''Given list of meshes represented by lists of vertices, edges and faces,
     produce one joined mesh.'''
 
-    offset = 0
-    result_vertices = []
-    result_edges = []
-    result_faces = []
     if len(edges_s) == 0:
         edges_s = [[]] * len(faces_s)
-    for vertices, edges, faces in zip(vertices_s, edges_s, faces_s):
+    meshes_number = min(len(vertices_s), len(edges_s), len(faces_s))
+    vertices_s, edges_s, faces_s = vertices_s[:meshes_number], edges_s[:meshes_number], faces_s[:meshes_number]
+
+    result_vertices = []
+    for vertices in vertices_s:
         result_vertices.extend(vertices)
-        new_edges = [tuple(i + offset for i in edge) for edge in edges]
-        new_faces = [[i + offset for i in face] for face in faces]
-        result_edges.extend(new_edges)
-        result_faces.extend(new_faces)
-        offset += len(vertices)
+    # indices of all meshes are shifted at once
+    offsets = cumsum([0] + [len(vertices) for vertices in vertices_s])[:-1]
+    result_edges = list(map(tuple, join_index_lists(edges_s, offsets).to_lists()))
+    result_faces = join_index_lists(faces_s, offsets).to_lists()
     return result_vertices, result_edges, result_faces
 
 
@@ -65,26 +65,13 @@ def polygons_to_edges(obj, unique_edges=False):
 
 
 def pols_to_edges_irregular_mesh(pols, unique_edges):
-    np_pols = array(pols)
-    np_len = vectorize(len)
-    lens = np_len(np_pols)
-    pol_types = unique(lens)
-
-    edges = []
-    for sides_number in pol_types:
-        mask = lens == sides_number
-        np_pols_g = array(np_pols[mask].tolist())
-        edges_g = empty(list(np_pols_g.shape)+[2], 'i')
-        edges_g[:, :, 0] = np_pols_g
-        edges_g[:, 1:, 1] = np_pols_g[:, :-1]
-        edges_g[:, 0, 1] = np_pols_g[:, -1]
-
-        edges_g = edges_g.reshape(-1, 2)
-        edges.append(edges_g)
+    polygons = SvRaggedArray.from_data(pols, dtype=int32)
+    edges = ragged_polygons_to_edges(polygons, backward=True)
     if unique_edges:
-        return unique(sort(concatenate([eds for eds in edges])), axis=0)
-
-    return concatenate([eds for eds in edges])
+        return sorted_unique_edges(edges)
+    # edges are grouped by number of sides of polygons
+    sides = repeat(polygons.lengths, polygons.lengths)
+    return edges[argsort(sides, kind='stable')]
 
 def polygons_to_edges_np(obj, unique_edges=False, output_numpy=False):
     result = []
@@ -93,6 +80,10 @@ def polygons_to_edges_np(obj, unique_edges=False, output_numpy=False):
         if len(pols) == 0:
             result.append([])
             continue
+        if isinstance(pols, SvRaggedArray):
+            edges = ragged_polygons_to_edges(pols, unique_edges)
+            result.append(edges if output_numpy else edges.tolist())
+            continue
         regular_mesh = True
         try:
             np_pols = array(pols, dtype=int32)
@@ -115,12 +106,12 @@ def polygons_to_edges_np(obj, unique_edges=False, output_numpy=False):
             edges = edges.reshape(-1, 2)
             if output_numpy:
                 if unique_edges:
-                    result.append(unique(sort(edges), axis=0))
+                    result.append(sorted_unique_edges(edges))
                 else:
                     result.append(edges)
             else:
                 if unique_edges:
-                    result.append(unique(sort(edges), axis=0).tolist())
+                    result.append(sorted_unique_edges(edges).tolist())
                 else:
                     result.append(edges.tolist())
     return result
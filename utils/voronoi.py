@@ -108,6 +108,7 @@ import numpy as np
 
 from math import sqrt, atan2
 from collections import defaultdict
+from itertools import chain
 
 import bmesh
 from mathutils import Vector
@@ -119,6 +120,11 @@ from sverchok.utils.logging import debug, info, error
 from sverchok.utils.geom import center, LineEquation2D, CircleEquation2D
 from sverchok.utils.math import weighted_center
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata
+from sverchok.dependencies import scipy
+
+if scipy is not None:
+    from scipy.spatial import Voronoi
+    QhullError = getattr(scipy.spatial, 'QhullError', Exception)
 
 TOLERANCE = 1e-9
 BIG_FLOAT = 1e38
@@ -895,14 +901,14 @@ class Bounds(object):
         self.y_max = -BIG_FLOAT
         x0, y0, z0 = center(sites)
         self.center = (x0, y0)
-        # creates points in format for voronoi library, throwing away z
-        for x, y, z in sites:
-            r = sqrt((x-x0)**2 + (y-y0)**2)
-            self.r_max = max(r, self.r_max)
-            self.x_max = max(x, self.x_max)
-            self.x_min = min(x, self.x_min)
-            self.y_max = max(y, self.y_max)
-            self.y_min = min(y, self.y_min)
+        points = np.asarray(sites, dtype=np.float64)
+        xs, ys = points[:,0], points[:,1]
+        rs = np.sqrt((xs-x0)**2 + (ys-y0)**2)
+        self.r_max = max(float(rs.max()), self.r_max)
+        self.x_max = max(float(xs.max()), self.x_max)
+        self.x_min = min(float(xs.min()), self.x_min)
+        self.y_max = max(float(ys.max()), self.y_max)
+        self.y_min = min(float(ys.min()), self.y_min)
 
 class Mesh2D(object):
     def __init__(self):
@@ -1111,7 +1117,22 @@ class CircleBounds(Bounds):
         x,y = tuple(v)
         return x,y,0
 
-def voronoi_bounded(sites, bound_mode='BOX', clip=True, draw_bounds=True, draw_hangs=False, make_faces=False, ordered_faces=False, max_sides=10):
+def voronoi_bounded(sites, bound_mode='BOX', clip=True, draw_bounds=True, draw_hangs=False, make_faces=False, ordered_faces=False, max_sides=10, algorithm='PYTHON'):
+    """
+    Calculate Voronoi diagram of 2D points, clipped by the bounds.
+    algorithm: 'PYTHON' for the implementation of Fortune's algorithm above,
+        or 'SCIPY' for voronoi_bounded_scipy; the Python implementation is used
+        if SciPy is not available or can not process the sites.
+    Returns: vertices, edges and faces of the diagram.
+    """
+    if algorithm == 'SCIPY' and scipy is not None:
+        try:
+            return voronoi_bounded_scipy(sites, bound_mode=bound_mode, clip=clip,
+                        draw_bounds=draw_bounds, draw_hangs=draw_hangs,
+                        make_faces=make_faces, ordered_faces=ordered_faces,
+                        max_sides=max_sides)
+        except QhullError as e:
+            debug("SciPy can not build Voronoi diagram, falling back to Python implementation: %s", e)
 
     bounds = Bounds.new(bound_mode)
     bounds.init_from_sites(sites)
@@ -1280,6 +1301,245 @@ def voronoi_bounded(sites, bound_mode='BOX', clip=True, draw_bounds=True, draw_h
 
     return new_vertices, edges, new_faces
 
+def _voronoi_cell_polygons(points, far_radius):
+    """
+    Calculate Voronoi cells of 2D points by scipy.spatial.Voronoi.
+    Infinite cells are closed by points lying at far_radius from
+    their finite vertices. Returns an array of shape (n, m, 2) of
+    counterclockwise polygons, padded by repeating last vertex.
+    """
+    n = len(points)
+    vor = Voronoi(points)
+    regions = [vor.regions[r] for r in vor.point_region]
+    counts = np.array([len(region) for region in regions])
+    is_infinite = np.array([-1 in region for region in regions])
+
+    # Rays of infinite cells: (finite vertex, direction)
+    rays = defaultdict(list)
+    center = points.mean(axis=0)
+    for (p, q), (v1, v2) in zip(vor.ridge_points, vor.ridge_vertices):
+        if v1 >= 0 and v2 >= 0:
+            continue
+        v = max(v1, v2)
+        if v < 0:
+            continue
+        tangent = points[q] - points[p]
+        normal = np.array([-tangent[1], tangent[0]]) / np.linalg.norm(tangent)
+        midpoint = 0.5 * (points[p] + points[q])
+        if np.dot(midpoint - center, normal) < 0:
+            normal = -normal
+        rays[p].append((v, normal))
+        rays[q].append((v, normal))
+
+    size = counts.max() + 2
+    polys = np.empty((n, size, 2))
+
+    finite = np.flatnonzero(~is_infinite)
+    if len(finite):
+        f_counts = counts[finite]
+        indexes = np.fromiter(chain.from_iterable(regions[i] for i in finite), dtype=np.int64, count=f_counts.sum())
+        starts = np.cumsum(f_counts) - f_counts
+        cols = np.arange(size)[np.newaxis, :]
+        cols = np.minimum(cols, f_counts[:, np.newaxis] - 1) + starts[:, np.newaxis]
+        polys[finite] = vor.vertices[indexes[cols]]
+
+    for i in np.flatnonzero(is_infinite):
+        cell = [vor.vertices[v] for v in regions[i] if v >= 0]
+        directions = []
+        for v, direction in rays[i]:
+            radius = far_radius + np.linalg.norm(vor.vertices[v] - center)
+            cell.append(vor.vertices[v] + 2 * radius * direction)
+            directions.append((vor.vertices[v], direction, radius))
+        if len(directions) == 2:
+            # Additional point between two rays, so that the closing
+            # edge surely goes outside of the bounds
+            (v1, d1, r1), (v2, d2, r2) = directions
+            middle = d1 + d2
+            norm = np.linalg.norm(middle)
+            if norm < 1e-6:
+                middle = points[i] - center
+                norm = np.linalg.norm(middle)
+            cell.append(0.5 * (v1 + v2) + 2 * max(r1, r2) * middle / norm)
+        cell = np.array(cell)
+        angles = np.arctan2(cell[:, 1] - points[i][1], cell[:, 0] - points[i][0])
+        cell = cell[np.argsort(angles)]
+        if len(cell) > size:
+            polys = np.concatenate([polys, np.repeat(polys[:, -1:], len(cell) - size, axis=1)], axis=1)
+            size = len(cell)
+        polys[i, :len(cell)] = cell
+        polys[i, len(cell):] = cell[-1]
+
+    # Make all polygons counterclockwise
+    xs, ys = polys[:, :, 0], polys[:, :, 1]
+    area = (xs * np.roll(ys, -1, axis=1) - np.roll(xs, -1, axis=1) * ys).sum(axis=1)
+    polys[area < 0] = polys[area < 0, ::-1]
+    return polys
+
+def _clip_polygons(polys, is_inside, intersect):
+    """
+    Clip padded polygons by convex area (one step of Sutherland-Hodgman algorithm),
+    for all polygons at once.
+    is_inside: function (k, m, 2) -> (k, m) of bool.
+    intersect: function (a, b, a_is_inside) -> points where segments from a to b
+        cross the bound; it must give the same result for (a, b) and (b, a).
+    Returns: polygons padded by repeating last vertex, and numbers of their vertices.
+    """
+    k, m, _ = polys.shape
+    nexts = np.roll(polys, -1, axis=1)
+    inside = is_inside(polys)
+    next_inside = np.roll(inside, -1, axis=1)
+    crossing = inside != next_inside
+
+    # Order ends of segments, so that both polygons sharing an edge
+    # get exactly the same intersection point
+    swap = (polys[:, :, 0] > nexts[:, :, 0]) | ((polys[:, :, 0] == nexts[:, :, 0]) & (polys[:, :, 1] > nexts[:, :, 1]))
+    a = np.where(swap[..., np.newaxis], nexts, polys)
+    b = np.where(swap[..., np.newaxis], polys, nexts)
+    a_inside = np.where(swap, next_inside, inside)
+    intersections = polys.copy()
+    if crossing.any():
+        intersections[crossing] = intersect(a[crossing], b[crossing], a_inside[crossing])
+
+    candidates = np.stack((polys, intersections), axis=2).reshape((k, 2 * m, 2))
+    emit = np.stack((inside, crossing), axis=2).reshape((k, 2 * m))
+    counts = emit.sum(axis=1)
+    order = np.argsort(~emit, axis=1, kind='stable')
+    size = max(counts.max(), 1)
+    cols = np.minimum(np.arange(size)[np.newaxis, :], np.maximum(counts - 1, 0)[:, np.newaxis])
+    result = np.take_along_axis(candidates, order[:, :, np.newaxis], axis=1)
+    result = np.take_along_axis(result, cols[:, :, np.newaxis], axis=1)
+    return result, counts
+
+def _clip_by_bounds(polys, bounds):
+    counts = None
+    if isinstance(bounds, CircleBounds):
+        c = np.array(bounds.center)
+        r = bounds.r_max
+
+        def is_inside(pts):
+            return ((pts - c)**2).sum(axis=-1) <= r*r
+
+        def intersect(a, b, a_inside):
+            d = b - a
+            f = a - c
+            A = (d*d).sum(axis=1)
+            B = 2 * (f*d).sum(axis=1)
+            C = (f*f).sum(axis=1) - r*r
+            sqrt_d = np.sqrt(np.maximum(B*B - 4*A*C, 0))
+            t = np.where(a_inside, -B + sqrt_d, -B - sqrt_d) / (2*A)
+            return a + np.clip(t, 0, 1)[:, np.newaxis] * d
+
+        return _clip_polygons(polys, is_inside, intersect)
+
+    for axis, value, sign in [(0, bounds.x_min, -1), (0, bounds.x_max, 1), (1, bounds.y_min, -1), (1, bounds.y_max, 1)]:
+        def is_inside(pts):
+            return sign * (pts[..., axis] - value) <= 0
+
+        def intersect(a, b, a_inside):
+            t = (value - a[:, axis]) / (b[:, axis] - a[:, axis])
+            result = a + t[:, np.newaxis] * (b - a)
+            result[:, axis] = value
+            return result
+
+        polys, counts = _clip_polygons(polys, is_inside, intersect)
+    return polys, counts
+
+def voronoi_bounded_scipy(sites, bound_mode='BOX', clip=True, draw_bounds=True, draw_hangs=False, make_faces=False, ordered_faces=False, max_sides=10):
+    """
+    The same as voronoi_bounded, but implemented by use of scipy.spatial.Voronoi.
+    Cells of the diagram are clipped by bounds all at once, and the mesh is
+    assembled from clipped cells. Faces are always ordered by sites;
+    coinciding sites are merged, so such sites have one face, at the
+    position of the first of them.
+    """
+    bounds = Bounds.new(bound_mode)
+    bounds.init_from_sites(sites)
+    delta = clip
+    bounds.x_max = bounds.x_max + delta
+    bounds.y_max = bounds.y_max + delta
+    bounds.x_min = bounds.x_min - delta
+    bounds.y_min = bounds.y_min - delta
+    bounds.r_max = bounds.r_max + delta
+
+    points = np.array(sites)[:, :2]
+    # Coinciding sites would produce one more copy of their cell
+    _, first = np.unique(points, axis=0, return_index=True)
+    points = points[np.sort(first)]
+    n = len(points)
+    far_radius = bounds.r_max + max(bounds.x_max - bounds.x_min, bounds.y_max - bounds.y_min) + 1.0
+    polys = _voronoi_cell_polygons(points, far_radius)
+
+    # Only cells, which are not completely inside the bounds, are clipped
+    if isinstance(bounds, CircleBounds):
+        outside = ((polys - np.array(bounds.center))**2).sum(axis=-1) > bounds.r_max**2
+    else:
+        outside = ((polys[:, :, 0] < bounds.x_min) | (polys[:, :, 0] > bounds.x_max) |
+                   (polys[:, :, 1] < bounds.y_min) | (polys[:, :, 1] > bounds.y_max))
+    to_clip = np.flatnonzero(outside.any(axis=1))
+    if len(to_clip):
+        clipped, clipped_counts = _clip_by_bounds(polys[to_clip], bounds)
+    else:
+        clipped, clipped_counts = polys[to_clip], np.zeros(0, dtype=np.int64)
+
+    # Weld vertices shared by neighbouring cells; they are exactly equal
+    size = max(polys.shape[1], clipped.shape[1])
+    polys = np.concatenate([polys, np.repeat(polys[:, -1:], size - polys.shape[1], axis=1)], axis=1)
+    clipped = np.concatenate([clipped, np.repeat(clipped[:, -1:], size - clipped.shape[1], axis=1)], axis=1)
+    polys[to_clip] = clipped
+    coords = polys.reshape((-1, 2)).copy().view(np.complex128).ravel()
+    verts, faces = np.unique(coords, return_inverse=True)
+    verts = np.stack((verts.real, verts.imag), axis=1)
+    faces = faces.reshape((n, size))
+
+    # Remove repeating vertices of faces
+    keep = faces != np.roll(faces, 1, axis=1)
+    keep[to_clip[clipped_counts == 0]] = False
+    face_sizes = keep.sum(axis=1)
+    keep[face_sizes < 3] = False
+    face_sizes[face_sizes < 3] = 0
+
+    # Edges of two faces are edges of the diagram, edges of one face lie on the bounds
+    edge_starts = faces[keep]
+    starts = np.repeat(np.cumsum(face_sizes) - face_sizes, face_sizes)
+    nexts = np.arange(len(edge_starts)) + 1
+    last = nexts == starts + np.repeat(face_sizes, face_sizes)
+    nexts[last] = starts[last]
+    edge_ends = edge_starts[nexts]
+    n_verts = len(verts)
+    edge_keys = np.minimum(edge_starts, edge_ends) * n_verts + np.maximum(edge_starts, edge_ends)
+    edge_keys, edge_count = np.unique(edge_keys, return_counts=True)
+    all_edges = np.stack(np.divmod(edge_keys, n_verts), axis=1)
+    bound_edges = all_edges[edge_count == 1]
+    edges = all_edges[edge_count > 1]
+    if draw_bounds:
+        edges = np.concatenate([edges, bound_edges])
+    elif not draw_hangs:
+        is_bound = np.zeros(len(verts), dtype=bool)
+        is_bound[bound_edges.reshape(-1)] = True
+        edges = edges[~(is_bound[edges[:, 0]] | is_bound[edges[:, 1]])]
+
+    used = np.zeros(len(verts), dtype=bool)
+    used[edges.reshape(-1)] = True
+    if make_faces:
+        used[edge_starts] = True
+    new_index = np.cumsum(used) - 1
+    new_vertices = [(x, y, 0) for x, y in verts[used].tolist()]
+    edges = new_index[edges].tolist()
+
+    if make_faces:
+        new_faces = []
+        face_list = np.split(new_index[edge_starts], np.cumsum(face_sizes)[:-1])
+        for i, (face, face_size) in enumerate(zip(face_list, face_sizes)):
+            if face_size == 0 or face_size > max_sides:
+                if ordered_faces:
+                    raise Exception(f"Can't find a face for site #{i}")
+                continue
+            new_faces.append(face.tolist())
+    else:
+        new_faces = []
+
+    return new_vertices, edges, new_faces
+
 def unique_points(points, eps=1e-4):
     kdt = KDTree(len(points))
     for i, p in enumerate(points):
@@ -1300,7 +1560,7 @@ def unique_points(points, eps=1e-4):
                 repeating.append(p)
     return mask, unique, repeating
 
-def lloyd2d(bound_mode, verts, n_iterations, clip=0.0, weight_field=None):
+def lloyd2d(bound_mode, verts, n_iterations, clip=0.0, weight_field=None, algorithm='PYTHON'):
     bounds = Bounds.new(bound_mode)
     bounds.init_from_sites(verts)
 
@@ -1329,7 +1589,8 @@ def lloyd2d(bound_mode, verts, n_iterations, clip=0.0, weight_field=None):
                     draw_hangs = True,
                     make_faces = True,
                     ordered_faces = True,
-                    max_sides = 20)
+                    max_sides = 20,
+                    algorithm = algorithm)
         centers = []
         for face in voronoi_faces[:n]:
             face_verts = np.array([voronoi_verts[i] for i in face])
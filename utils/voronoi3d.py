@@ -25,7 +25,8 @@ import bmesh
 from mathutils import Vector
 from mathutils.bvhtree import BVHTree
 
-from sverchok.utils.sv_mesh_utils import mask_vertices, polygons_to_edges, point_inside_mesh
+from sverchok.utils.sv_mesh_utils import mask_vertices, polygons_to_edges
+from sverchok.utils.mesh_inside import get_mesh_inside_tester
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata, pydata_from_bmesh, bmesh_clip
 from sverchok.utils.geom import calc_bounds, bounding_sphere, PlaneEquation
 from sverchok.utils.math import project_to_sphere, weighted_center
@@ -448,10 +449,12 @@ def lloyd_in_mesh(verts, faces, sites, n_iterations, thickness=None, weight_fiel
             centers.append(tuple(center))
         return centers
 
+    tester = get_mesh_inside_tester(verts, faces)
+
     def restrict(points):
         result = []
-        for p in points:
-            if point_inside_mesh(bvh, p):
+        for p, inside in zip(points, tester.contains(points).tolist()):
+            if inside:
                 result.append(p)
             else:
                 loc, normal, index, distance = bvh.find_nearest(p)